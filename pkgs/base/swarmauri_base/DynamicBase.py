@@ -10,10 +10,12 @@ All classes and methods in this module use Spacy-style docstrings.
 """
 
 import functools
-from threading import Lock
+from contextlib import contextmanager
+from threading import Lock, local
 from typing import (
     Annotated,
     Any,
+    Callable,
     ClassVar,
     Dict,
     List,
@@ -27,7 +29,7 @@ from typing import (
     get_args,
     get_origin,
 )
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, ValidationError
 
 from swarmauri_base.glogging import glogger
 from swarmauri_typing import UnionFactory
@@ -55,6 +57,14 @@ class DynamicBase(BaseModel):
     _full_union_factory: ClassVar[Optional[UnionFactory]] = None
     _lock: ClassVar[Lock] = Lock()
     _type: ClassVar[str] = "DynamicBase"
+    # Per-thread nesting depth of ``batch_registration`` blocks (``depth``) and
+    # whether a registration inside them still needs the deferred rebuild
+    # (``pending``). A block only defers rebuilds requested by its own thread.
+    _batch_state: ClassVar[local] = local()
+    # Callables that import the component registered under a type name; used
+    # when validation meets a discriminator tag that is not registered yet.
+    _type_resolvers: ClassVar[List[Callable[[str], bool]]] = []
+    _resolved_tags: ClassVar[Set[str]] = set()
 
     # Instance-attribute type (to support deserialization)
     type: Literal["DynamicBase"] = "DynamicBase"
@@ -554,6 +564,134 @@ class DynamicBase(BaseModel):
                 "All models have been successfully recreated following the dependency chain."
             )
 
+    @classmethod
+    def _request_rebuild(cls) -> None:
+        """
+        Rebuild registered models now, or once at the end of the enclosing
+        ``batch_registration`` block.
+        """
+        state = DynamicBase._batch_state
+        if getattr(state, "depth", 0):
+            state.pending = True
+            return
+        DynamicBase._recreate_models()
+
+    @classmethod
+    @contextmanager
+    def batch_registration(cls):
+        """
+        Context manager that coalesces registrations into a single rebuild.
+
+        Every ``register_model``/``register_type`` call normally rebuilds all
+        registered models, so registering N types costs N full rebuilds.
+        Inside this block the registrations only update the registry; the
+        models are rebuilt once when the outermost block exits (also when it
+        exits with an exception). Blocks may be nested.
+
+        The block is scoped to the calling thread: registrations made by other
+        threads meanwhile still rebuild the models immediately. Models created
+        or validated inside the block do not yet see the subtypes registered
+        in it.
+
+        Example:
+            >>> with DynamicBase.batch_registration():
+            ...     import swarmauri_standard.agents.QAAgent
+            ...     import swarmauri_standard.agents.RagAgent
+        """
+        state = DynamicBase._batch_state
+        state.depth = getattr(state, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            state.depth -= 1
+            rebuild = state.depth == 0 and getattr(state, "pending", False)
+            if rebuild:
+                state.pending = False
+                glogger.debug("Rebuilding models after batched registration.")
+                DynamicBase._recreate_models()
+
+    ###############################################################
+    # Lazily loaded types
+    ###############################################################
+
+    @classmethod
+    def register_type_resolver(cls, resolver: Callable[[str], bool]) -> None:
+        """
+        Register a callable that loads the component for a type name.
+
+        Packages that import their components lazily register a resolver so
+        that a discriminated union can still deserialize a type that has not
+        been imported yet. When validation fails because a ``type`` tag is not
+        among the registered subtypes, each resolver is called with the tag;
+        it imports (and thereby registers) the matching component and returns
+        True, and validation is retried.
+
+        Parameters:
+            resolver (Callable[[str], bool]): Called with the missing type name.
+        """
+        if resolver not in cls._type_resolvers:
+            cls._type_resolvers.append(resolver)
+
+    @classmethod
+    def _resolve_missing_types(cls, error: ValidationError) -> bool:
+        """
+        Load the types behind the unknown discriminator tags of ``error``.
+
+        A tag is not tried again once it was loaded, so a retry always makes
+        progress. Tags that failed to load are tried again by a later
+        validation, since their type may have become available since.
+
+        Returns:
+            bool: True if a resolver loaded at least one type.
+        """
+        tags = {
+            detail["ctx"]["tag"]
+            for detail in error.errors()
+            if detail["type"] == "union_tag_invalid"
+        } - DynamicBase._resolved_tags
+        if not tags or not DynamicBase._type_resolvers:
+            return False
+        loaded = False
+        with DynamicBase.batch_registration():
+            for tag in sorted(tags):
+                for resolver in DynamicBase._type_resolvers:
+                    if resolver(tag):
+                        glogger.debug("Lazily loaded type '%s'.", tag)
+                        DynamicBase._resolved_tags.add(tag)
+                        loaded = True
+        return loaded
+
+    def __init__(self, /, **data: Any) -> None:
+        while True:
+            try:
+                super().__init__(**data)
+                return
+            except ValidationError as e:
+                if not DynamicBase._resolve_missing_types(e):
+                    raise
+
+    # Only adds a retry around BaseModel.__init__, so pydantic can keep
+    # validating nested models without calling it.
+    __init__.__pydantic_base_init__ = True
+
+    @classmethod
+    def model_validate(cls, *args, **kwargs):
+        while True:
+            try:
+                return super().model_validate(*args, **kwargs)
+            except ValidationError as e:
+                if not DynamicBase._resolve_missing_types(e):
+                    raise
+
+    @classmethod
+    def model_validate_json(cls, *args, **kwargs):
+        while True:
+            try:
+                return super().model_validate_json(*args, **kwargs)
+            except ValidationError as e:
+                if not DynamicBase._resolve_missing_types(e):
+                    raise
+
     ###############################################################
     # Registration Decorators
     ###############################################################
@@ -578,7 +716,7 @@ class DynamicBase(BaseModel):
 
             cls._registry[model_name] = {"model_cls": model_cls, "subtypes": {}}
             glogger.debug("Registered base model '%s'.", model_name)
-            DynamicBase._recreate_models()
+            DynamicBase._request_rebuild()
             return model_cls
 
         return decorator
@@ -647,7 +785,7 @@ class DynamicBase(BaseModel):
                     base_model_name,
                 )
 
-            DynamicBase._recreate_models()
+            DynamicBase._request_rebuild()
             return subclass
 
         return decorator
@@ -666,3 +804,5 @@ FullUnion = DynamicBase._get_full_union_factory()
 ###########################################
 register_type = DynamicBase.register_type
 register_model = DynamicBase.register_model
+batch_registration = DynamicBase.batch_registration
+register_type_resolver = DynamicBase.register_type_resolver
@@ -0,0 +1,29 @@
+"""Mixin formatting conversation histories with the payloads cached for them."""
+
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+from swarmauri_base.conversations.ConversationBase import ConversationBase
+
+
+class HistoryFormattingMixin(BaseModel):
+    """
+    Formats conversation histories with the ``_format_messages`` of the
+    model, which it must provide.
+
+    Conversations deriving from ``ConversationBase`` cache the payload of
+    each message per provider class and model name, so that a turn only
+    formats the messages added since the last one.
+    """
+
+    def _format_history(self, conversation) -> List[Dict[str, Any]]:
+        """
+        Formats the history of ``conversation`` with ``_format_messages``,
+        reusing the payloads the conversation cached for earlier turns.
+        """
+        if isinstance(conversation, ConversationBase):
+            return conversation.formatted_history(
+                (type(self), getattr(self, "name", None)), self._format_messages
+            )
+        return self._format_messages(conversation.history)
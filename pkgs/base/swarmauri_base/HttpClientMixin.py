@@ -0,0 +1,496 @@
+"""Mixin giving models HTTP clients over pooled, keep-alive transports."""
+
+import asyncio
+import atexit
+import os
+import threading
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import httpx
+
+_response_observer: ContextVar[Optional[Callable[[httpx.Response], None]]] = (
+    ContextVar("swarmauri_response_observer", default=None)
+)
+_timeout_override: ContextVar[Optional[httpx.Timeout]] = ContextVar(
+    "swarmauri_timeout_override", default=None
+)
+
+
+def _origin(url: httpx.URL) -> str:
+    return f"{url.scheme}://{url.netloc.decode('ascii')}"
+
+
+@contextmanager
+def observe_responses(callback: Callable[[httpx.Response], None]) -> Iterator[None]:
+    """
+    Calls ``callback`` with every response received through a pooled client
+    in the current context, before its body is read; for example to read
+    rate-limit headers. Tasks created inside the block inherit the observer.
+    """
+    token = _response_observer.set(callback)
+    try:
+        yield
+    finally:
+        _response_observer.reset(token)
+
+
+@contextmanager
+def override_timeout(timeout: Optional[httpx.Timeout]) -> Iterator[None]:
+    """
+    Applies ``timeout`` to every request sent through a pooled client in
+    the current context, in place of the timeout given by the caller.
+    """
+    token = _timeout_override.set(timeout)
+    try:
+        yield
+    finally:
+        _timeout_override.reset(token)
+
+
+class _NoCookiePolicy(DefaultCookiePolicy):
+    # The pooled clients are shared by every model; cookies are kept by the
+    # views instead.
+    def set_ok(self, cookie: Any, request: Any) -> bool:
+        return False
+
+
+def _notify(response: httpx.Response) -> None:
+    callback = _response_observer.get()
+    if callback is not None:
+        callback(response)
+
+
+class HttpClientPool:
+    """
+    Process-wide ``httpx`` clients, one per origin (scheme, host and port).
+
+    Every model talking to the same origin shares one client, its transport
+    and therefore one connection pool, so requests reuse kept-alive
+    connections instead of paying a new TCP and TLS handshake. The shared
+    clients never store cookies: each ``PooledClient`` keeps its own, so
+    cookies set for one model are never sent with another model's requests.
+    Asynchronous clients are bound to the event loop that created them, so
+    there is one per origin and event loop.
+
+    Attributes:
+        max_connections (int): Connections per transport, in use or idle.
+        max_keepalive_connections (int): Idle connections kept per transport.
+        keepalive_expiry (float): Seconds an idle connection is kept.
+        http2 (bool): Negotiate HTTP/2, which multiplexes concurrent
+            requests over one connection. Needs the ``h2`` package.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+    ):
+        self._lock = threading.Lock()
+        # origin -> (transport, client wrapping it)
+        self._transports: Dict[str, Tuple[httpx.HTTPTransport, httpx.Client]] = {}
+        # event loop -> origin -> (transport, client wrapping it)
+        self._async_transports: weakref.WeakKeyDictionary = (
+            weakref.WeakKeyDictionary()
+        )
+        # Closing tasks scheduled by ``close`` on a running event loop.
+        self._closing: Set[asyncio.Task] = set()
+        self.configure(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
+
+    def configure(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ) -> None:
+        """
+        Changes the pool settings. Transports created before the change keep
+        their settings until ``close`` is called.
+
+        Raises:
+            ImportError: If ``http2`` is requested and ``h2`` is not installed.
+        """
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "HTTP/2 support requires the 'h2' package; "
+                    "install it with `pip install httpx[http2]`."
+                ) from e
+        if max_connections is not None:
+            self.max_connections = max_connections
+        if max_keepalive_connections is not None:
+            self.max_keepalive_connections = max_keepalive_connections
+        if keepalive_expiry is not None:
+            self.keepalive_expiry = keepalive_expiry
+        if http2 is not None:
+            self.http2 = http2
+
+    def _transport_options(self) -> Dict[str, Any]:
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "http2": self.http2,
+        }
+
+    def _bound(
+        self, by_origin: Dict[str, Tuple[Any, Any]], url: httpx.URL, asynchronous: bool
+    ) -> Tuple[Any, Any]:
+        origin = _origin(url)
+        with self._lock:
+            bound = by_origin.get(origin)
+            if bound is None:
+                if asynchronous:
+                    transport = httpx.AsyncHTTPTransport(**self._transport_options())
+                    client_class = httpx.AsyncClient
+                else:
+                    transport = httpx.HTTPTransport(**self._transport_options())
+                    client_class = httpx.Client
+                client = client_class(
+                    transport=transport,
+                    cookies=CookieJar(policy=_NoCookiePolicy()),
+                )
+                bound = by_origin[origin] = (transport, client)
+            return bound
+
+    def transport(self, url: httpx.URL) -> httpx.HTTPTransport:
+        """
+        Returns the shared transport for the origin of ``url``.
+        """
+        return self._bound(self._transports, url, False)[0]
+
+    def client(self, url: httpx.URL) -> httpx.Client:
+        """
+        Returns the shared client for the origin of ``url``.
+        """
+        return self._bound(self._transports, url, False)[1]
+
+    def _async_bound(self, url: httpx.URL) -> Tuple[Any, Any]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            by_origin = self._async_transports.setdefault(loop, {})
+        return self._bound(by_origin, url, True)
+
+    def async_transport(self, url: httpx.URL) -> httpx.AsyncHTTPTransport:
+        """
+        Returns the shared transport for the origin of ``url`` and the
+        running event loop.
+        """
+        return self._async_bound(url)[0]
+
+    def async_client(self, url: httpx.URL) -> httpx.AsyncClient:
+        """
+        Returns the shared client for the origin of ``url`` and the running
+        event loop.
+        """
+        return self._async_bound(url)[1]
+
+    def close(self) -> None:
+        """
+        Closes every client and its transport.
+
+        Asynchronous transports are closed on their own event loop: right
+        away if it is idle, or by a task scheduled on it if it is running.
+        Transports of an event loop that is already closed cannot be closed
+        gracefully; they are dropped and their sockets close when collected.
+        """
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+            async_transports = list(self._async_transports.items())
+            self._async_transports = weakref.WeakKeyDictionary()
+        for _, client in transports:
+            client.close()
+        for loop, by_origin in async_transports:
+            self._close_on_loop(loop, [client for _, client in by_origin.values()])
+
+    def _close_on_loop(self, loop: asyncio.AbstractEventLoop, clients: list) -> None:
+        if loop.is_closed() or not clients:
+            return
+
+        async def aclose_all() -> None:
+            for client in clients:
+                await client.aclose()
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is running:
+            task = loop.create_task(aclose_all())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(aclose_all(), loop)
+        else:
+            loop.run_until_complete(aclose_all())
+
+    async def aclose(self) -> None:
+        """
+        Closes the asynchronous clients of the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            bound = list(self._async_transports.pop(loop, {}).values())
+        for _, client in bound:
+            await client.aclose()
+
+    def _after_fork(self) -> None:
+        # Connections inherited from the parent process must not be reused.
+        self._lock = threading.Lock()
+        self._transports = {}
+        self._async_transports = weakref.WeakKeyDictionary()
+        self._closing = set()
+
+
+class _PooledClientBase:
+    """
+    Per-model view of the shared clients: it resolves relative URLs against
+    ``base_url`` and applies the model's default headers and timeout to each
+    request.
+
+    Cookies set by responses are kept in the view's ``cookies`` and sent with
+    its later requests, while clients and connections are pooled. On a
+    followed redirect they are only sent with the first request.
+    """
+
+    # ``request`` arguments that are given to ``send`` rather than to
+    # ``build_request``.
+    _send_options = ("auth", "follow_redirects")
+
+    def __init__(
+        self,
+        pool: HttpClientPool,
+        base_url: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Any = httpx.USE_CLIENT_DEFAULT,
+    ):
+        self._pool = pool
+        self.base_url = httpx.URL(base_url or "")
+        self.headers = httpx.Headers(headers)
+        self.timeout = timeout
+        self.cookies = httpx.Cookies()
+
+    @property
+    def is_closed(self) -> bool:
+        return False
+
+    def _prepare(self, url: Any, kwargs: Dict[str, Any]) -> httpx.URL:
+        url = httpx.URL(url)
+        if url.is_relative_url:
+            base = str(self.base_url).rstrip("/")
+            url = httpx.URL(f"{base}/{str(url).lstrip('/')}")
+        headers = self.headers.copy()
+        headers.update(kwargs.get("headers") or {})
+        kwargs["headers"] = headers
+        kwargs.setdefault("timeout", self.timeout)
+        timeout = _timeout_override.get()
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return url
+
+    def _build(
+        self,
+        client_for: Callable[[httpx.URL], Any],
+        method: str,
+        url: Any,
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Any, httpx.Request, Dict[str, Any]]:
+        url = self._prepare(url, kwargs)
+        client = client_for(url)
+        send = {key: kwargs.pop(key) for key in self._send_options if key in kwargs}
+        cookies = httpx.Cookies(self.cookies)
+        cookies.update(kwargs.pop("cookies", None) or {})
+        request = client.build_request(method, url, cookies=cookies, **kwargs)
+        return client, request, send
+
+    def _received(self, response: httpx.Response) -> None:
+        for received in (*response.history, response):
+            self.cookies.extract_cookies(received)
+        _notify(response)
+
+
+class PooledClient(_PooledClientBase):
+    """
+    Synchronous view of the shared transports. It can be used in place of an
+    ``httpx.Client``; closing it, or leaving a ``with`` block, leaves the
+    shared connections open.
+    """
+
+    def _send(
+        self, method: str, url: Any, kwargs: Dict[str, Any], stream: bool
+    ) -> httpx.Response:
+        client, request, send = self._build(self._pool.client, method, url, kwargs)
+        response = client.send(request, stream=stream, **send)
+        self._received(response)
+        return response
+
+    def request(self, method: str, url: Any, **kwargs: Any) -> httpx.Response:
+        return self._send(method, url, kwargs, stream=False)
+
+    @contextmanager
+    def stream(
+        self, method: str, url: Any, **kwargs: Any
+    ) -> Iterator[httpx.Response]:
+        response = self._send(method, url, kwargs, stream=True)
+        try:
+            yield response
+        finally:
+            response.close()
+
+    def get(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "PooledClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+class AsyncPooledClient(_PooledClientBase):
+    """
+    Asynchronous counterpart of ``PooledClient``, usable in place of an
+    ``httpx.AsyncClient``. It may be created outside of an event loop; the
+    shared client of the running loop is looked up on each request.
+    """
+
+    async def _send(
+        self, method: str, url: Any, kwargs: Dict[str, Any], stream: bool
+    ) -> httpx.Response:
+        client, request, send = self._build(
+            self._pool.async_client, method, url, kwargs
+        )
+        response = await client.send(request, stream=stream, **send)
+        self._received(response)
+        return response
+
+    async def request(self, method: str, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self._send(method, url, kwargs, stream=False)
+
+    @asynccontextmanager
+    async def stream(
+        self, method: str, url: Any, **kwargs: Any
+    ) -> AsyncIterator[httpx.Response]:
+        response = await self._send(method, url, kwargs, stream=True)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    async def get(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def aclose(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "AsyncPooledClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        pass
+
+
+http_pool = HttpClientPool()
+atexit.register(http_pool.close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=http_pool._after_fork)
+
+
+class HttpClientMixin:
+    """
+    Gives models pooled HTTP clients.
+
+    ``_http_client`` and ``_async_http_client`` return drop-in replacements
+    for ``httpx.Client`` and ``httpx.AsyncClient`` that send requests
+    through the clients of ``http_pool``, shared by every model in the
+    process. Tune it with ``configure_http_pool`` and close it with
+    ``close_http_clients`` (every client, also done at exit) or
+    ``aclose_http_clients`` (async clients of the running event loop).
+    """
+
+    http_pool: ClassVar[HttpClientPool] = http_pool
+
+    def _http_client(
+        self,
+        base_url: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Any = httpx.USE_CLIENT_DEFAULT,
+    ) -> PooledClient:
+        return PooledClient(self.http_pool, base_url, headers, timeout)
+
+    def _async_http_client(
+        self,
+        base_url: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Any = httpx.USE_CLIENT_DEFAULT,
+    ) -> AsyncPooledClient:
+        return AsyncPooledClient(self.http_pool, base_url, headers, timeout)
+
+    @classmethod
+    def configure_http_pool(cls, **settings: Any) -> None:
+        """
+        Changes the settings of the shared pool; see ``HttpClientPool``.
+        """
+        cls.http_pool.configure(**settings)
+
+    @classmethod
+    def close_http_clients(cls) -> None:
+        cls.http_pool.close()
+
+    @classmethod
+    async def aclose_http_clients(cls) -> None:
+        await cls.http_pool.aclose()
@@ -0,0 +1,392 @@
+"""Mixin pacing batches of model requests within a provider's rate limits."""
+
+import asyncio
+import math
+import re
+import time
+import weakref
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+import httpx
+from pydantic import BaseModel, PrivateAttr
+
+from swarmauri_base.HttpClientMixin import observe_responses
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+_scheduled: ContextVar[bool] = ContextVar("swarmauri_scheduled", default=False)
+
+
+def retries_throttled_requests() -> bool:
+    """
+    True while a ``RequestScheduler`` sends the current request. The
+    scheduler retries 429 responses itself, within its pause and window, so
+    other retry layers should leave them to it.
+    """
+    return _scheduled.get()
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parses the reset time of a rate-limit header, given either in seconds
+    (``"7.5"``) or as a duration (``"1m30s"``, ``"20ms"``).
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    parts = _DURATION.findall(value)
+    if not parts or "".join(n + unit for n, unit in parts) != value:
+        return None
+    return sum(float(n) * _DURATION_UNITS[unit] for n, unit in parts)
+
+
+def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Seconds to wait before retrying according to ``retry-after-ms`` or
+    ``retry-after`` (seconds or an HTTP date), or None if neither is set.
+    """
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(float(value) / 1000, 0.0)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(date.timestamp() - time.time(), 0.0)
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class _TokenBucket:
+    """A bucket holding a minute's quota, refilled continuously."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated, 0.0)
+        self.level = min(self.capacity, self.level + elapsed * self.rate)
+        self._updated = now
+
+    def delay(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` can be taken."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+
+    def clamp(self, remaining: float, now: float) -> None:
+        """Lowers the level to what the provider reports as remaining."""
+        self._refill(now)
+        self.level = min(self.level, remaining)
+
+
+class _Run:
+    """Requests of one ``RequestScheduler.run`` call that are being sent."""
+
+    __slots__ = ("limit", "in_flight")
+
+    def __init__(self, limit: Optional[int]):
+        self.limit = limit
+        self.in_flight = 0
+
+
+class RequestScheduler:
+    """
+    Admits concurrent asynchronous requests within a provider's rate limits.
+
+    A request is sent once the requests-per-minute bucket holds a request,
+    the tokens-per-minute bucket holds its estimated tokens, the
+    concurrency window has room and its run is below its own
+    ``max_concurrent``. The window grows by one request for each
+    window of successful responses and halves on a 429 response, at most
+    once per request latency (additive increase, multiplicative decrease).
+    A 429, or an ``x-ratelimit-remaining-*`` header at zero, also pauses
+    admission until ``retry-after`` or the reported reset, and throttled
+    requests are sent again up to ``max_retries`` times. While a request
+    is sent, ``retries_throttled_requests()`` is true, so that a
+    ``RetryPolicy`` around it does not retry the same 429 responses.
+
+    Responses are observed through the pooled clients of
+    ``HttpClientMixin``, so requests must be sent with those clients.
+
+    Attributes:
+        concurrency (float): Current size of the concurrency window.
+        in_flight (int): Requests being sent.
+        throttled (int): 429 responses received.
+        retried (int): Throttled requests sent again.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        concurrency: float = 5,
+        min_concurrency: float = 1,
+        max_concurrency: float = 64,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+    ):
+        self.requests = (
+            _TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self.tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(
+            min(max(concurrency, min_concurrency), max_concurrency)
+        )
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.in_flight = 0
+        self.throttled = 0
+        self.retried = 0
+        self._paused_until = 0.0
+        self._last_decrease = -math.inf
+        self._latency = backoff
+        # event loop -> condition notified when a request completes
+        self._conditions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def run(
+        self,
+        items: Iterable[T],
+        call: Callable[[T], Awaitable[R]],
+        cost: Optional[Callable[[T], float]] = None,
+        max_concurrent: Optional[int] = None,
+    ) -> List[R]:
+        """
+        Awaits ``call`` on every item as the limits allow and returns the
+        results in the order of ``items``. ``cost`` estimates the tokens
+        charged for the request of an item, and ``max_concurrent`` caps the
+        requests of this run in flight, below the shared window.
+        """
+        run = _Run(max_concurrent)
+        tasks = [
+            self._call(item, call, cost(item) if cost else 0.0, run)
+            for item in items
+        ]
+        return list(await asyncio.gather(*tasks))
+
+    def observe(self, response: httpx.Response) -> None:
+        """
+        Adapts the concurrency window and the pause to a response.
+        """
+        now = time.monotonic()
+        if response.status_code == 429:
+            self.throttled += 1
+            wait = retry_after(response.headers)
+            self._pause(now + (self.backoff if wait is None else wait))
+            if now - self._last_decrease >= self._latency:
+                self.concurrency = max(self.min_concurrency, self.concurrency / 2)
+                self._last_decrease = now
+        elif response.is_success:
+            self.concurrency = min(
+                self.max_concurrency, self.concurrency + 1 / self.concurrency
+            )
+        for kind, bucket in (("requests", self.requests), ("tokens", self.tokens)):
+            remaining = _number(response.headers.get(f"x-ratelimit-remaining-{kind}"))
+            if remaining is None:
+                continue
+            if bucket is not None:
+                bucket.clamp(remaining, now)
+            if remaining <= 0:
+                reset = parse_duration(
+                    response.headers.get(f"x-ratelimit-reset-{kind}")
+                )
+                self._pause(now + (self.backoff if reset is None else reset))
+
+    def _pause(self, until: float) -> None:
+        self._paused_until = max(self._paused_until, until)
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        condition = self._conditions.get(loop)
+        if condition is None:
+            condition = self._conditions[loop] = asyncio.Condition()
+        return condition
+
+    def _admission_delay(
+        self, tokens: float, run: Optional[_Run] = None
+    ) -> Optional[float]:
+        """
+        Returns 0 if a request can be sent now, the seconds to wait before
+        trying again, or None to wait for a request to complete.
+        """
+        now = time.monotonic()
+        if self._paused_until > now:
+            return self._paused_until - now
+        if self.in_flight >= max(int(self.concurrency), 1):
+            return None
+        if run is not None and run.limit and run.in_flight >= run.limit:
+            return None
+        delays = [
+            bucket.delay(amount, now)
+            for bucket, amount in ((self.requests, 1), (self.tokens, tokens))
+            if bucket is not None
+        ]
+        return max(delays, default=0.0)
+
+    async def _acquire(self, tokens: float, run: _Run) -> None:
+        condition = self._condition()
+        async with condition:
+            while True:
+                delay = self._admission_delay(tokens, run)
+                if delay == 0.0:
+                    now = time.monotonic()
+                    if self.requests is not None:
+                        self.requests.take(1, now)
+                    if self.tokens is not None:
+                        self.tokens.take(tokens, now)
+                    self.in_flight += 1
+                    run.in_flight += 1
+                    return
+                try:
+                    await asyncio.wait_for(condition.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _release(self, run: _Run) -> None:
+        condition = self._condition()
+        async with condition:
+            self.in_flight -= 1
+            run.in_flight -= 1
+            condition.notify_all()
+
+    async def _call(
+        self, item: T, call: Callable[[T], Awaitable[R]], tokens: float, run: _Run
+    ) -> R:
+        attempt = 0
+        while True:
+            await self._acquire(tokens, run)
+            statuses: List[int] = []
+
+            def observer(response: httpx.Response) -> None:
+                statuses.append(response.status_code)
+                self.observe(response)
+
+            start = time.monotonic()
+            scheduled = _scheduled.set(True)
+            try:
+                with observe_responses(observer):
+                    result = await call(item)
+            except Exception:
+                if not statuses or statuses[-1] != 429 or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                self.retried += 1
+                continue
+            finally:
+                _scheduled.reset(scheduled)
+                await self._release(run)
+            self._latency = 0.8 * self._latency + 0.2 * (time.monotonic() - start)
+            return result
+
+
+class RequestSchedulerMixin(BaseModel):
+    """
+    Paces the requests of ``abatch`` with a ``RequestScheduler``.
+
+    Set ``requests_per_minute`` and ``tokens_per_minute`` to the provider
+    quota to keep batches within it; each request is charged its estimated
+    prompt tokens plus ``max_tokens``. The ``max_concurrent`` argument of
+    each ``abatch`` call caps the requests of that batch in flight. The
+    shared concurrency window starts at the first batch's
+    ``max_concurrent``, adapts to the provider's responses up to
+    ``max_concurrency`` and is kept across batches. The scheduler is
+    created on first use.
+
+    Throttled (429) requests are retried by the scheduler only: a
+    ``RetryPolicy`` around the request, such as the one applied by
+    ``retry_on_status_codes``, leaves them to it.
+    """
+
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    max_concurrency: int = 64
+    _request_scheduler: Optional[RequestScheduler] = PrivateAttr(default=None)
+
+    def request_scheduler(self, concurrency: int = 5) -> RequestScheduler:
+        if self._request_scheduler is None:
+            self._request_scheduler = RequestScheduler(
+                requests_per_minute=self.requests_per_minute,
+                tokens_per_minute=self.tokens_per_minute,
+                concurrency=concurrency,
+                max_concurrency=self.max_concurrency,
+            )
+        return self._request_scheduler
+
+    def _estimate_tokens(self, conversation: Any, max_tokens: Optional[int] = 0) -> int:
+        """
+        Estimates the tokens a provider charges for a request: about four
+        characters per prompt token, plus the completion budget.
+        """
+        chars = 0
+        for message in getattr(conversation, "history", None) or []:
+            content = getattr(message, "content", None)
+            if isinstance(content, str):
+                chars += len(content)
+            elif isinstance(content, list):
+                for part in content:
+                    if isinstance(part, dict) and isinstance(part.get("text"), str):
+                        chars += len(part["text"])
+        return math.ceil(chars / 4) + (max_tokens or 0)
+
+    async def _schedule(
+        self,
+        conversations: Iterable[T],
+        call: Callable[[T], Awaitable[R]],
+        max_concurrent: int = 5,
+        max_tokens: Optional[int] = 0,
+    ) -> List[R]:
+        """
+        Awaits ``call`` on every conversation through the request scheduler
+        and returns the results in order.
+        """
+        return await self.request_scheduler(max_concurrent).run(
+            conversations,
+            call,
+            cost=lambda conversation: self._estimate_tokens(conversation, max_tokens),
+            max_concurrent=max_concurrent,
+        )
@@ -0,0 +1,196 @@
+"""Mixin giving models an opt-in, content-addressed response cache."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def _endpoint(model: Any) -> Optional[str]:
+    for name in ("_BASE_URL", "BASE_URL", "base_url"):
+        url = getattr(model, name, None)
+        if isinstance(url, str) and url:
+            return url
+    return None
+
+
+def _credential_digest(model: Any) -> Optional[str]:
+    credential = getattr(model, "api_key", None)
+    if credential is None:
+        return None
+    if hasattr(credential, "get_secret_value"):
+        credential = credential.get_secret_value()
+    return hashlib.sha256(str(credential).encode()).hexdigest()
+
+
+def request_fingerprint(model: Any, request: Mapping[str, Any]) -> str:
+    """
+    Returns a stable fingerprint of ``request`` sent to the provider, model,
+    endpoint and credential of ``model``. The credential only enters as a
+    digest, so requests of different tenants never share a fingerprint.
+    """
+    payload: Dict[str, Any] = {
+        "provider": getattr(model, "type", type(model).__name__),
+        "model": getattr(model, "name", None),
+        "endpoint": _endpoint(model),
+        "credential": _credential_digest(model),
+        "request": request,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier cache of model responses keyed by request fingerprint.
+
+    Entries live in an in-memory LRU of ``max_entries`` and, when ``path``
+    is given, in a SQLite database shared by every process using the same
+    file, which keeps at most ``max_disk_entries`` least recently used
+    entries. Entries older than ``ttl`` seconds are treated as missing.
+    Values must be JSON-serializable.
+
+    Attributes:
+        hits (int): Lookups answered from either tier.
+        misses (int): Lookups that found no live entry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        path: Optional[str] = None,
+        max_disk_entries: int = 100_000,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # key -> (created, value)
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed "
+                "ON responses (accessed)"
+            )
+            self._db.commit()
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created > self.ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the live value stored under ``key``, or None.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0], now):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._memory[key]
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and not self._expired(row[1], now):
+                    self._db.execute(
+                        "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+                    )
+                    self._db.commit()
+                    value = json.loads(row[0])
+                    self._remember(key, row[1], value)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores ``value`` under ``key`` in both tiers.
+        """
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), now, now),
+                )
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                    "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                )
+                if self.ttl is not None:
+                    self._db.execute(
+                        "DELETE FROM responses WHERE created < ?", (now - self.ttl,)
+                    )
+                self._db.commit()
+
+    def _remember(self, key: str, created: float, value: Any) -> None:
+        self._memory[key] = (created, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._db is not None:
+                return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return len(self._memory)
+
+
+class ResponseCacheMixin(BaseModel):
+    """
+    Lets a model answer repeated requests from a ``ResponseCache``.
+
+    Caching is off until ``response_cache`` is set. Responses sampled with
+    a temperature above zero are not cached unless
+    ``cache_sampled_responses`` is set, since a new request could give a
+    different answer.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    response_cache: Optional[ResponseCache] = Field(default=None, exclude=True)
+    cache_sampled_responses: bool = False
+
+    def _response_cache_key(self, request: Mapping[str, Any]) -> str:
+        return request_fingerprint(self, request)
+
+    def _cacheable(self, temperature: Optional[float]) -> bool:
+        if self.response_cache is None:
+            return False
+        return not temperature or self.cache_sampled_responses
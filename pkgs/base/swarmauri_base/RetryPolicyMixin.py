@@ -0,0 +1,371 @@
+"""Mixin giving models a shared retry policy with budgets and circuit breaking."""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import (
+    Awaitable,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+from swarmauri_base.HttpClientMixin import override_timeout
+from swarmauri_base.RequestSchedulerMixin import (
+    parse_duration,
+    retries_throttled_requests,
+    retry_after,
+)
+
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(
+            f"Circuit for {host or 'the provider'} is open; "
+            f"next attempt allowed in {retry_in:.1f}s"
+        )
+        self.host = host
+        self.retry_in = retry_in
+
+
+def _http_error(error: BaseException) -> BaseException:
+    """
+    Returns the ``httpx`` error that ``error`` was raised from, if any, as
+    providers often re-raise them as other exceptions.
+    """
+    seen = set()
+    cause: Optional[BaseException] = error
+    while cause is not None and id(cause) not in seen:
+        if isinstance(cause, httpx.HTTPError):
+            return cause
+        seen.add(id(cause))
+        cause = cause.__cause__ or cause.__context__
+    return error
+
+
+class _Circuit:
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+
+
+class _Budget:
+    def __init__(self):
+        self.requests: Deque[float] = deque()
+        self.retries: Deque[float] = deque()
+
+    def trim(self, now: float, window: float) -> None:
+        for stamps in (self.requests, self.retries):
+            while stamps and stamps[0] <= now - window:
+                stamps.popleft()
+
+
+class RetryPolicy:
+    """
+    Retries failed provider requests without amplifying an outage.
+
+    Failed attempts answered with one of ``retry_statuses``, or lost to a
+    transport error such as a connect or read timeout while
+    ``retry_transport_errors`` is set, are retried up to ``max_retries``
+    times. Each retry waits for the ``Retry-After`` or
+    rate-limit reset the provider asked for, or else for a decorrelated
+    jitter delay between ``base_delay`` and three times the previous delay,
+    capped at ``max_delay``, so that workers do not retry in lockstep.
+    Exceptions raised while handling an ``httpx`` error are classified by
+    that error. A 429 is not retried while a ``RequestScheduler`` sends the
+    request, since the scheduler retries it after its own pause.
+
+    State is kept per host:
+
+    * a retry budget allows, within any ``budget_window`` seconds, at most
+      ``budget_min_retries`` retries plus ``budget_ratio`` of the requests
+      made, so a brownout cannot multiply the load by ``max_retries``;
+    * a circuit breaker opens after ``failure_threshold`` consecutive
+      server errors or transport failures and then fails fast with
+      ``CircuitOpenError`` for ``recovery_time`` seconds. After that one
+      probe request is let through (half-open): its success closes the
+      circuit, its failure opens it again. ``failure_threshold=None``
+      disables it.
+
+    ``connect_timeout`` and ``read_timeout``, when set, replace the timeouts
+    of requests sent through pooled HTTP clients during a call.
+
+    Attributes:
+        attempts (int): Attempts made, first tries and retries.
+        retries (int): Attempts that were retries.
+        successes (int): Calls that eventually succeeded.
+        failures (int): Calls that failed after their last attempt.
+        budget_exhausted (int): Retries refused by the retry budget.
+        short_circuited (int): Calls refused while a circuit was open.
+        circuits_opened (int): Times a circuit opened.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        retry_statuses: Iterable[int] = (408, 429, 500, 502, 503, 504, 529),
+        retry_transport_errors: bool = True,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        budget_ratio: float = 0.2,
+        budget_min_retries: int = 10,
+        budget_window: float = 10.0,
+        failure_threshold: Optional[int] = 5,
+        recovery_time: float = 30.0,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_transport_errors = retry_transport_errors
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.budget_ratio = budget_ratio
+        self.budget_min_retries = budget_min_retries
+        self.budget_window = budget_window
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.attempts = 0
+        self.retries = 0
+        self.successes = 0
+        self.failures = 0
+        self.budget_exhausted = 0
+        self.short_circuited = 0
+        self.circuits_opened = 0
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._budgets: Dict[str, _Budget] = {}
+
+    @property
+    def timeout(self) -> Optional[httpx.Timeout]:
+        """The timeout applied to requests, or None to keep the caller's."""
+        if self.connect_timeout is None and self.read_timeout is None:
+            return None
+        return httpx.Timeout(
+            None,
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            pool=self.connect_timeout,
+        )
+
+    def circuit_state(self, host: str = "") -> str:
+        """Returns ``"closed"``, ``"open"`` or ``"half_open"``."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            return circuit.state if circuit else CLOSED
+
+    def _timeouts(self) -> ContextManager[None]:
+        timeout = self.timeout
+        return override_timeout(timeout) if timeout is not None else nullcontext()
+
+    def _admit(self, host: str, first: bool) -> None:
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            if circuit.state == OPEN:
+                retry_in = circuit.opened_at + self.recovery_time - now
+                if retry_in > 0:
+                    self.short_circuited += 1
+                    raise CircuitOpenError(host, retry_in)
+                circuit.state = HALF_OPEN
+            if circuit.state == HALF_OPEN:
+                if circuit.probing:
+                    self.short_circuited += 1
+                    raise CircuitOpenError(host, 0.0)
+                circuit.probing = True
+            self.attempts += 1
+            if first:
+                budget = self._budgets.setdefault(host, _Budget())
+                budget.trim(now, self.budget_window)
+                budget.requests.append(now)
+
+    def _succeeded(self, host: str) -> None:
+        with self._lock:
+            self.successes += 1
+            self._close(host)
+
+    def _close(self, host: str) -> None:
+        circuit = self._circuits[host]
+        circuit.state = CLOSED
+        circuit.failures = 0
+        circuit.probing = False
+
+    def _abandoned(self, host: str) -> None:
+        with self._lock:
+            self._circuits[host].probing = False
+
+    def _hint(self, response: Optional[httpx.Response]) -> Optional[float]:
+        if response is None:
+            return None
+        hint = retry_after(response.headers)
+        if hint is None and response.status_code == 429:
+            resets = [
+                parse_duration(response.headers.get(name))
+                for name in (
+                    "x-ratelimit-reset-requests",
+                    "x-ratelimit-reset-tokens",
+                )
+            ]
+            resets = [reset for reset in resets if reset is not None]
+            hint = max(resets) if resets else None
+        return hint
+
+    def _failed(
+        self, host: str, error: Exception, attempt: int, previous: float
+    ) -> Tuple[Optional[float], float]:
+        """
+        Records a failed attempt and returns the delay before retrying, or
+        None to give up, with the jitter delay to build the next one on.
+        """
+        error = _http_error(error)
+        response = None
+        if isinstance(error, httpx.HTTPStatusError):
+            response = error.response
+        transport = isinstance(error, httpx.TransportError)
+        status = response.status_code if response is not None else None
+        outage = transport or (status is not None and status >= 500)
+        retryable = status in self.retry_statuses or (
+            transport and self.retry_transport_errors
+        )
+        if status == 429 and retries_throttled_requests():
+            retryable = False
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits[host]
+            if not outage:
+                self._close(host)
+            else:
+                circuit.failures += 1
+                if circuit.state == HALF_OPEN or (
+                    self.failure_threshold is not None
+                    and circuit.failures >= self.failure_threshold
+                ):
+                    circuit.state = OPEN
+                    circuit.opened_at = now
+                    circuit.probing = False
+                    self.circuits_opened += 1
+                    retryable = False
+            hint = self._hint(response)
+            if hint is not None and hint > self.max_delay:
+                retryable = False
+            if retryable and attempt < self.max_retries:
+                budget = self._budgets[host]
+                budget.trim(now, self.budget_window)
+                allowed = (
+                    self.budget_min_retries + self.budget_ratio * len(budget.requests)
+                )
+                if len(budget.retries) < allowed:
+                    budget.retries.append(now)
+                    self.retries += 1
+                    jitter = min(
+                        self.max_delay,
+                        random.uniform(self.base_delay, max(previous, 0.0) * 3),
+                    )
+                    return (hint if hint is not None else jitter), jitter
+                self.budget_exhausted += 1
+            self.failures += 1
+            return None, previous
+
+    def _log_retry(self, host: str, error: Exception, attempt: int, delay: float):
+        logger.warning(
+            f"Retry attempt {attempt + 1}/{self.max_retries} for {host}: {error}. "
+            f"Retrying in {delay:.2f} seconds."
+        )
+
+    def call(self, fn: Callable[[], R], host: str = "") -> R:
+        """
+        Returns ``fn()``, retrying it according to the policy for ``host``.
+        The last failure is raised unchanged.
+        """
+        previous = self.base_delay
+        attempt = 0
+        with self._timeouts():
+            while True:
+                self._admit(host, attempt == 0)
+                try:
+                    result = fn()
+                except Exception as e:
+                    delay, previous = self._failed(host, e, attempt, previous)
+                    if delay is None:
+                        raise
+                    self._log_retry(host, e, attempt, delay)
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                except BaseException:
+                    self._abandoned(host)
+                    raise
+                self._succeeded(host)
+                return result
+
+    async def acall(self, fn: Callable[[], Awaitable[R]], host: str = "") -> R:
+        """Asynchronous counterpart of ``call``."""
+        previous = self.base_delay
+        attempt = 0
+        with self._timeouts():
+            while True:
+                self._admit(host, attempt == 0)
+                try:
+                    result = await fn()
+                except Exception as e:
+                    delay, previous = self._failed(host, e, attempt, previous)
+                    if delay is None:
+                        raise
+                    self._log_retry(host, e, attempt, delay)
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+                except BaseException:
+                    self._abandoned(host)
+                    raise
+                self._succeeded(host)
+                return result
+
+
+class RetryPolicyMixin(BaseModel):
+    """
+    Lets a model retry its provider requests with a shared ``RetryPolicy``.
+
+    When ``retry_policy`` is set it replaces the retry settings each method
+    declares, so one policy, and its budgets, circuits and counters, can be
+    shared by every model calling the same provider.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    retry_policy: Optional[RetryPolicy] = Field(default=None, exclude=True)
+
+    def _retry_host(self) -> str:
+        for name in ("_BASE_URL", "BASE_URL", "base_url"):
+            url = getattr(self, name, None)
+            if isinstance(url, str) and url:
+                host = httpx.URL(url).host
+                if host:
+                    return host
+        return getattr(self, "type", type(self).__name__)
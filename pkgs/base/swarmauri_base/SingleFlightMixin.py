@@ -0,0 +1,184 @@
+"""Mixin coalescing concurrent identical requests into one upstream call."""
+
+import asyncio
+import threading
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from swarmauri_base.ResponseCacheMixin import request_fingerprint
+
+R = TypeVar("R")
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        # Set when the leader stopped without a result or an ``Exception``,
+        # e.g. on ``KeyboardInterrupt``; a waiting caller then takes over.
+        self.abandoned = False
+
+
+def _cancelling() -> bool:
+    """True if the current task has been asked to cancel."""
+    task = asyncio.current_task()
+    cancelling = getattr(task, "cancelling", None)
+    return bool(cancelling and cancelling())
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time.
+
+    A caller arriving while a call with its key is in flight waits for that
+    call and receives its result, or its exception, instead of starting
+    another. Synchronous calls are shared between threads; asynchronous
+    calls between tasks of the same event loop. Nothing is kept once a call
+    completes.
+
+    If the caller making the call is cancelled (or, for threads, stops on a
+    ``BaseException`` that is not an ``Exception``), its waiters are not
+    failed with it: one of them makes the call again and the others wait
+    for that one.
+
+    Attributes:
+        calls (int): Calls requested.
+        deduplicated (int): Calls answered by another caller's call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        # event loop -> key -> future
+        self._futures: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.calls = 0
+        self.deduplicated = 0
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls) + sum(len(f) for f in self._futures.values())
+
+    def do(self, key: str, fn: Callable[[], R]) -> R:
+        """
+        Returns ``fn()``, or the result of the call in flight for ``key``.
+        """
+        with self._lock:
+            self.calls += 1
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+            if leader:
+                break
+            call.done.wait()
+            if call.abandoned:
+                continue
+            with self._lock:
+                self.deduplicated += 1
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        except BaseException:
+            call.abandoned = True
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[R]]) -> R:
+        """
+        Returns ``await fn()``, or the result of the call in flight for
+        ``key`` in the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.calls += 1
+        while True:
+            with self._lock:
+                futures = self._futures.setdefault(loop, {})
+                future = futures.get(key)
+                leader = future is None
+                if leader:
+                    future = futures[key] = loop.create_future()
+            if leader:
+                break
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The leader was cancelled, not this caller: take over.
+                if future.cancelled() and not _cancelling():
+                    continue
+                raise
+            except BaseException:
+                with self._lock:
+                    self.deduplicated += 1
+                raise
+            with self._lock:
+                self.deduplicated += 1
+            return result
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else waits for it.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                if futures.get(key) is future:
+                    del futures[key]
+
+
+class SingleFlightMixin(BaseModel):
+    """
+    Coalesces concurrent identical requests of a model.
+
+    Coalescing is off until ``coalesce`` is set. Then calls whose requests
+    have the same fingerprint, from any instance of the same provider,
+    model, endpoint and credential in the process, share one upstream
+    request. Requests sampled with a temperature above zero are only
+    coalesced when ``coalesce_sampled`` is set, since each caller would
+    otherwise expect its own sample. The counters of ``single_flight``
+    report how many calls were deduplicated.
+    """
+
+    coalesce: bool = False
+    coalesce_sampled: bool = False
+
+    single_flight: ClassVar[SingleFlight] = SingleFlight()
+
+    def _request_fingerprint(self, request: Mapping[str, Any]) -> str:
+        return request_fingerprint(self, request)
+
+    def _coalescable(self, temperature: Any = None) -> bool:
+        if not self.coalesce:
+            return False
+        return not temperature or self.coalesce_sampled
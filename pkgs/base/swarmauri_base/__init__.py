@@ -5,6 +5,13 @@ from swarmauri_base.DynamicBase import (
     FullUnion,
     register_model,
     register_type,
+    batch_registration,
 )
 
-__all__ = ["SubclassUnion", "FullUnion", "register_model", "register_type"]
+__all__ = [
+    "SubclassUnion",
+    "FullUnion",
+    "register_model",
+    "register_type",
+    "batch_registration",
+]
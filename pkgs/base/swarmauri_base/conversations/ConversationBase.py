@@ -1,4 +1,4 @@
-from typing import List, Union, Literal
+from typing import Any, Callable, Dict, Hashable, List, Literal, Tuple, Union
 from pydantic import Field, PrivateAttr, ConfigDict
 
 from swarmauri_core.conversations.IConversation import IConversation
@@ -10,9 +10,16 @@ from swarmauri_base.messages.MessageBase import MessageBase
 class ConversationBase(IConversation, ComponentBase):
     """
     Concrete implementation of IConversation, managing conversation history and operations.
+
+    Payloads formatted for a provider through ``formatted_history`` are cached
+    per message, so each turn only formats the messages added since the last.
     """
 
     _history: List[SubclassUnion[MessageBase]] = PrivateAttr(default_factory=list)
+    # key -> {id(message): (message, field values, formatted payloads)}
+    _payloads: Dict[Hashable, Dict[int, Tuple[Any, tuple, List[Any]]]] = PrivateAttr(
+        default_factory=dict
+    )
     resource: ResourceTypes = Field(default=ResourceTypes.CONVERSATION)
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
     type: Literal["ConversationBase"] = "ConversationBase"
@@ -36,6 +43,8 @@ class ConversationBase(IConversation, ComponentBase):
         """
         if self._history and message in self._history:
             self._history.remove(message)
+            for payloads in self._payloads.values():
+                payloads.pop(id(message), None)
         return None
 
     def add_messages(self, messages: List[SubclassUnion[MessageBase]]):
@@ -49,3 +58,47 @@ class ConversationBase(IConversation, ComponentBase):
 
     def clear_history(self):
         self._history.clear()
+        self._payloads.clear()
+
+    def formatted_history(
+        self,
+        key: Hashable,
+        format_messages: Callable[[List[SubclassUnion[MessageBase]]], List[Any]],
+    ) -> List[Any]:
+        """
+        Formats ``history`` with ``format_messages``, one message at a time.
+
+        The payloads of each message are cached under ``key``, typically the
+        provider, and reused until the message leaves the history or one of
+        its fields is reassigned. Changes made in place to a field's value,
+        such as appending to a content list, are not detected.
+
+        @param key: Identifies the formatting, e.g. the provider and model.
+        @param format_messages: Formats a list of messages. It must format
+            each message independently of the others.
+        @return The formatted payloads of the whole history, in order.
+        """
+        history = self.history
+        payloads = self._payloads.setdefault(key, {})
+        formatted = []
+        for message in history:
+            values = tuple(message.__dict__.values())
+            cached = payloads.get(id(message))
+            if (
+                cached is None
+                or cached[0] is not message
+                or len(cached[1]) != len(values)
+                or any(a is not b for a, b in zip(cached[1], values))
+            ):
+                cached = (message, values, format_messages([message]))
+                payloads[id(message)] = cached
+            formatted.extend(
+                dict(item) if isinstance(item, dict) else item for item in cached[2]
+            )
+
+        if len(payloads) > len(history):
+            # Messages dropped from the history by subclasses.
+            current = {id(message) for message in history}
+            for stale in [k for k in payloads if k not in current]:
+                del payloads[stale]
+        return formatted
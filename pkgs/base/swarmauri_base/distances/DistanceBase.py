@@ -1,11 +1,15 @@
 from abc import abstractmethod
-from typing import List, Optional, Literal
+from typing import List, Optional, Literal, Sequence, Tuple, Union
+
+import numpy as np
 from pydantic import Field
 
 from swarmauri_standard.vectors.Vector import Vector
 from swarmauri_core.distances.IDistanceSimilarity import IDistanceSimilarity
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes
 
+VectorBatch = Union[Sequence[Vector], Sequence[Sequence[float]], np.ndarray]
+
 
 @ComponentBase.register_model()
 class DistanceBase(IDistanceSimilarity, ComponentBase):
@@ -34,3 +38,102 @@ class DistanceBase(IDistanceSimilarity, ComponentBase):
     @abstractmethod
     def similarities(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
         pass
+
+    def distances_matrix(
+        self, vectors_a: VectorBatch, vectors_b: VectorBatch
+    ) -> np.ndarray:
+        """
+        Computes the pairwise distances between two batches of vectors.
+
+        Concrete distances override this with a vectorized kernel that works on
+        the stacked inputs (see ``_stack_pair``). This default falls back to one
+        ``distance`` call per pair, which keeps it usable for metrics that are
+        not defined on fixed-length numeric arrays.
+
+        Args:
+            vectors_a: The first batch, as Vectors, value lists or a 2-D array.
+            vectors_b: The second batch, in the same forms.
+
+        Returns:
+            np.ndarray: Array of shape ``(len(vectors_a), len(vectors_b))``.
+        """
+        vectors_a = [self._as_vector(v) for v in vectors_a]
+        vectors_b = [self._as_vector(v) for v in vectors_b]
+        matrix = np.empty((len(vectors_a), len(vectors_b)), dtype=np.float64)
+        for i, vector_a in enumerate(vectors_a):
+            for j, vector_b in enumerate(vectors_b):
+                matrix[i, j] = self.distance(vector_a, vector_b)
+        return matrix
+
+    @staticmethod
+    def _as_vector(vector: Union[Vector, Sequence[float], np.ndarray]) -> Vector:
+        if isinstance(vector, Vector):
+            return vector
+        if isinstance(vector, np.ndarray):
+            vector = vector.tolist()
+        return Vector(value=list(vector))
+
+    @staticmethod
+    def _as_matrix(vectors: VectorBatch) -> np.ndarray:
+        """
+        Stacks a batch of vectors into a 2-D float array, one row per vector.
+        ``float32`` arrays are kept as is; everything else becomes ``float64``.
+        """
+        if isinstance(vectors, np.ndarray):
+            matrix = vectors
+        elif vectors and all(hasattr(vector, "to_numpy") for vector in vectors):
+            # Stack the vectors' own buffers instead of re-parsing value lists.
+            matrix = np.stack([vector.to_numpy() for vector in vectors])
+        else:
+            matrix = np.asarray(
+                [getattr(vector, "value", vector) for vector in vectors],
+                dtype=np.float64,
+            )
+        if matrix.dtype not in (np.float32, np.float64):
+            matrix = matrix.astype(np.float64)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(0, 0) if matrix.size == 0 else matrix[None, :]
+        return matrix
+
+    @classmethod
+    def _stack_pair(
+        cls, vectors_a: VectorBatch, vectors_b: VectorBatch
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stacks both batches once and checks that their dimensionality matches.
+        """
+        matrix_a = cls._as_matrix(vectors_a)
+        matrix_b = cls._as_matrix(vectors_b)
+        if matrix_a.shape[0] == 0:
+            matrix_a = matrix_a.reshape(0, matrix_b.shape[1])
+        if matrix_b.shape[0] == 0:
+            matrix_b = matrix_b.reshape(0, matrix_a.shape[1])
+        if matrix_a.shape[1] != matrix_b.shape[1]:
+            raise ValueError("Vectors must have the same dimensionality.")
+        return matrix_a, matrix_b
+
+    @staticmethod
+    def _rowwise(matrix_a: np.ndarray, matrix_b: np.ndarray, kernel) -> np.ndarray:
+        """
+        Applies ``kernel(row_a, matrix_b) -> (len(matrix_b),)`` to every row of
+        ``matrix_a``, broadcasting over ``matrix_b`` in a single NumPy call.
+        """
+        result = np.empty(
+            (matrix_a.shape[0], matrix_b.shape[0]),
+            dtype=np.result_type(matrix_a, matrix_b),
+        )
+        for i, row in enumerate(matrix_a):
+            result[i] = kernel(row, matrix_b)
+        return result
+
+    @staticmethod
+    def _squared_euclidean(matrix_a: np.ndarray, matrix_b: np.ndarray) -> np.ndarray:
+        """
+        Pairwise squared Euclidean distances via ``|a|^2 + |b|^2 - 2 a.b``, with
+        the cross term as one matrix product. Rounding can push identical pairs
+        slightly below zero, so the result is clipped at 0.
+        """
+        sq_a = np.einsum("ij,ij->i", matrix_a, matrix_a)
+        sq_b = np.einsum("ij,ij->i", matrix_b, matrix_b)
+        squared = sq_a[:, None] + sq_b[None, :] - 2 * (matrix_a @ matrix_b.T)
+        return np.maximum(squared, 0)
@@ -2,12 +2,21 @@ from typing import Literal, Optional
 
 from pydantic import Field
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes
+from swarmauri_base.RetryPolicyMixin import RetryPolicyMixin
+from swarmauri_base.SingleFlightMixin import SingleFlightMixin
 from swarmauri_core.embeddings.IFeature import IFeature
 from swarmauri_core.embeddings.ISaveModel import ISaveModel
 from swarmauri_core.embeddings.IVectorize import IVectorize
 
 
 @ComponentBase.register_model()
-class EmbeddingBase(IVectorize, IFeature, ISaveModel, ComponentBase):
+class EmbeddingBase(
+    IVectorize,
+    IFeature,
+    ISaveModel,
+    SingleFlightMixin,
+    RetryPolicyMixin,
+    ComponentBase,
+):
     resource: Optional[str] = Field(default=ResourceTypes.EMBEDDING.value, frozen=True)
     type: Literal["EmbeddingBase"] = "EmbeddingBase"
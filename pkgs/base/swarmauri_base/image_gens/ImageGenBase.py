@@ -4,10 +4,11 @@ from pydantic import ConfigDict, model_validator, Field
 
 from swarmauri_core.image_gens.IGenImage import IGenImage
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes
+from swarmauri_base.HttpClientMixin import HttpClientMixin
 
 
 @ComponentBase.register_model()
-class ImageGenBase(IGenImage, ComponentBase):
+class ImageGenBase(IGenImage, HttpClientMixin, ComponentBase):
     allowed_models: List[str] = []
     resource: Optional[str] = Field(default=ResourceTypes.IMAGE_GEN.value, frozen=True)
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
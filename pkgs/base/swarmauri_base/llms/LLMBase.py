@@ -5,10 +5,25 @@ from pydantic import Field, PrivateAttr, SecretStr, model_validator
 from swarmauri_core.llms.IPredict import IPredict
 
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes
+from swarmauri_base.HistoryFormattingMixin import HistoryFormattingMixin
+from swarmauri_base.HttpClientMixin import HttpClientMixin
+from swarmauri_base.RequestSchedulerMixin import RequestSchedulerMixin
+from swarmauri_base.RetryPolicyMixin import RetryPolicyMixin
+from swarmauri_base.ResponseCacheMixin import ResponseCacheMixin
+from swarmauri_base.SingleFlightMixin import SingleFlightMixin
 
 
 @ComponentBase.register_model()
-class LLMBase(IPredict, ComponentBase):
+class LLMBase(
+    IPredict,
+    HistoryFormattingMixin,
+    HttpClientMixin,
+    RequestSchedulerMixin,
+    ResponseCacheMixin,
+    SingleFlightMixin,
+    RetryPolicyMixin,
+    ComponentBase,
+):
     allowed_models: List[str] = []
     resource: Optional[str] = Field(default=ResourceTypes.LLM.value, frozen=True)
     type: Literal["LLMBase"] = "LLMBase"
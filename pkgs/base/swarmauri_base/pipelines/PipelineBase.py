@@ -1,14 +1,91 @@
-from typing import Any, Callable, List, Optional, Dict
-from pydantic import ConfigDict, Field
+import asyncio
+import inspect
+import queue
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional
+from pydantic import ConfigDict, Field, PrivateAttr
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes
 from swarmauri_core.pipelines.IPipeline import IPipeline, PipelineStatus
 
+Backend = Literal["inline", "thread", "process", "async"]
+
+_END = object()
+
+
+class TaskOutput:
+    """
+    Reference to the output of a pipeline task, returned by ``add_task``.
+
+    Passing it as an argument of a later task makes that task depend on
+    this one and receive its result in place of the reference.
+    """
+
+    __slots__ = ("index", "_entry")
+
+    def __init__(self, index: int, entry: Dict[str, Any]):
+        self.index = index
+        self._entry = entry
+
+    def on(self, backend: Backend) -> "TaskOutput":
+        """
+        Runs the task on ``backend``: the calling thread (``"inline"``), the
+        pipeline's thread or process pool, or its event loop (``"async"``).
+        """
+        self._entry["backend"] = backend
+        return self
+
+    def stream(self, maxsize: Optional[int] = None) -> "StreamOutput":
+        """
+        References the items the task yields, to be consumed while the task
+        is still producing them. At most ``maxsize`` items are buffered.
+        """
+        return StreamOutput(self.index, self._entry, maxsize)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.index})"
+
+
+class StreamOutput(TaskOutput):
+    """
+    Reference to the items yielded by a pipeline task, received by the
+    consuming task as an iterator.
+    """
+
+    __slots__ = ("maxsize",)
+
+    def __init__(self, index: int, entry: Dict[str, Any], maxsize: Optional[int]):
+        super().__init__(index, entry)
+        self.maxsize = maxsize
+
+
+def _iter_queue(buffer: queue.Queue) -> Iterator[Any]:
+    while True:
+        item = buffer.get()
+        if item is _END:
+            return
+        yield item
+
 
 @ComponentBase.register_model()
 class PipelineBase(IPipeline, ComponentBase):
     """
     Base class providing default behavior for task orchestration,
     error handling, and result aggregation.
+
+    Tasks run as a DAG: a task starts as soon as the tasks whose
+    ``TaskOutput`` it takes as arguments have finished, or, for a
+    ``StreamOutput``, have started producing. With ``parallel=True``
+    independent tasks run at the same time on their backend, and the
+    executors are kept for later ``execute()`` calls until ``close()``.
     """
 
     resource: Optional[str] = Field(default=ResourceTypes.PIPELINE.value, frozen=True)
@@ -18,20 +95,28 @@ class PipelineBase(IPipeline, ComponentBase):
     # Pydantic model fields
     tasks: List[Dict[str, Any]] = Field(default_factory=list)
     parallel: bool = Field(default=False)
-    _results: List[Any] = list
-    _status: PipelineStatus = PipelineStatus.PENDING
-    _error_handler: Optional[Callable[[Exception], Any]] = None
+    max_workers: Optional[int] = Field(default=None, gt=0)
+    stream_buffer_size: int = Field(default=16, gt=0)
+    _results: List[Any] = PrivateAttr(default_factory=list)
+    _timings: List[Optional[Dict[str, Any]]] = PrivateAttr(default_factory=list)
+    _status: PipelineStatus = PrivateAttr(default=PipelineStatus.PENDING)
+    _error_handler: Optional[Callable[[Exception], Any]] = PrivateAttr(default=None)
+    _executors: Dict[str, Executor] = PrivateAttr(default_factory=dict)
+    _loop: Optional[asyncio.AbstractEventLoop] = PrivateAttr(default=None)
+    _executors_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
-    def add_task(self, task: Callable, *args: Any, **kwargs: Any) -> None:
+    def add_task(self, task: Callable, *args: Any, **kwargs: Any) -> TaskOutput:
         """
         Add a task to the pipeline.
 
         :param task: Callable task to be executed
         :param args: Positional arguments for the task
         :param kwargs: Keyword arguments for the task
+        :return: Reference to the task's output, to pass to later tasks
         """
         task_entry = {"callable": task, "args": args, "kwargs": kwargs}
         self.tasks.append(task_entry)
+        return TaskOutput(len(self.tasks) - 1, task_entry)
 
     def execute(self, *args: Any, **kwargs: Any) -> List[Any]:
         """
@@ -41,25 +126,16 @@ class PipelineBase(IPipeline, ComponentBase):
         """
         try:
             self._status = PipelineStatus.RUNNING
-            self._results = []
+            self._results = [None] * len(self.tasks)
+            self._timings = [None] * len(self.tasks)
 
             if self.parallel:
-                # Implement parallel execution logic
-                from concurrent.futures import ThreadPoolExecutor
-
-                with ThreadPoolExecutor() as executor:
-                    futures = [
-                        executor.submit(
-                            task["callable"], *task["args"], **task["kwargs"]
-                        )
-                        for task in self.tasks
-                    ]
-                    self._results = [future.result() for future in futures]
+                self._execute_graph()
             else:
                 # Sequential execution
-                for task in self.tasks:
-                    result = task["callable"](*task["args"], **task["kwargs"])
-                    self._results.append(result)
+                for index in range(len(self.tasks)):
+                    self._dependencies(index)
+                    self._run_task(index, self._resolve(index, {}))
 
             self._status = PipelineStatus.COMPLETED
             return self._results
@@ -68,6 +144,239 @@ class PipelineBase(IPipeline, ComponentBase):
             self._status = PipelineStatus.FAILED
             raise RuntimeError(f"Pipeline execution failed: {e}")
 
+    def _dependencies(self, index: int) -> List[TaskOutput]:
+        task = self.tasks[index]
+        refs = [
+            value
+            for value in (*task["args"], *task["kwargs"].values())
+            if isinstance(value, TaskOutput)
+        ]
+        for ref in refs:
+            if not 0 <= ref.index < index:
+                raise ValueError(
+                    f"Task {index} depends on task {ref.index}, which is not "
+                    "an earlier task of the pipeline."
+                )
+        return refs
+
+    def _backend(self, index: int) -> str:
+        task = self.tasks[index]
+        backend = task.get("backend")
+        if backend is None:
+            if inspect.iscoroutinefunction(task["callable"]):
+                backend = "async"
+            else:
+                backend = "thread" if self.parallel else "inline"
+        return backend
+
+    def _resolve(self, index: int, streams: Dict[int, queue.Queue]):
+        """
+        Returns the arguments of a task with its references replaced by
+        results, and its stream references by iterators over their buffers.
+        Without a buffer, a stream reference iterates the producer's result.
+        """
+        task = self.tasks[index]
+
+        def value(arg: Any) -> Any:
+            if isinstance(arg, StreamOutput):
+                if id(arg) in streams:
+                    return _iter_queue(streams[id(arg)])
+                return iter(self._results[arg.index])
+            if isinstance(arg, TaskOutput):
+                return self._results[arg.index]
+            return arg
+
+        args = tuple(value(arg) for arg in task["args"])
+        kwargs = {key: value(arg) for key, arg in task["kwargs"].items()}
+        return args, kwargs
+
+    def _run_task(self, index: int, arguments) -> Any:
+        """
+        Runs a task to completion on its backend, outside of the DAG.
+        """
+        args, kwargs = arguments
+        future = self._submit(index, self._backend(index), args, kwargs)
+        try:
+            self._results[index] = future.result()
+        finally:
+            self._record(index)
+        return self._results[index]
+
+    def _submit(
+        self, index: int, backend: str, args: tuple, kwargs: Dict[str, Any]
+    ) -> Future:
+        func = self.tasks[index]["callable"]
+        self._timings[index] = {"backend": backend, "started": time.perf_counter()}
+        if backend == "inline":
+            future: Future = Future()
+            try:
+                result = func(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = self._submit_coroutine(result).result()
+                future.set_result(result)
+            except BaseException as e:
+                future.set_exception(e)
+        elif backend == "async":
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                future = self._submit_coroutine(result)
+            else:
+                future = Future()
+                future.set_result(result)
+        elif backend in ("thread", "process"):
+            future = self._executor(backend).submit(func, *args, **kwargs)
+        else:
+            raise ValueError(f"Unknown pipeline backend: {backend}")
+        return future
+
+    def _record(self, index: int) -> None:
+        # Called where the result is stored, not from a done callback:
+        # futures run their callbacks after waking the callers waiting for
+        # them, so ``execute`` could return before the timing is recorded.
+        timing = self._timings[index]
+        timing["finished"] = time.perf_counter()
+        timing["duration"] = timing["finished"] - timing["started"]
+
+    def _execute_graph(self) -> None:
+        """
+        Runs the tasks as soon as their dependencies allow it.
+        """
+        count = len(self.tasks)
+        dependents: List[List[int]] = [[] for _ in range(count)]
+        waiting = [0] * count
+        streamed: Dict[int, List[StreamOutput]] = {}
+        for index in range(count):
+            for ref in self._dependencies(index):
+                if isinstance(ref, StreamOutput):
+                    streamed.setdefault(ref.index, []).append(ref)
+                    if self._backend(index) not in ("thread", "inline"):
+                        raise ValueError(
+                            f"Task {index} consumes a stream and must run on "
+                            "the 'thread' backend."
+                        )
+                else:
+                    dependents[ref.index].append(index)
+                    waiting[index] += 1
+        for producer in streamed:
+            if dependents[producer]:
+                raise ValueError(
+                    f"The output of task {producer} is streamed, so it cannot "
+                    "also be used as a whole."
+                )
+
+        streams: Dict[int, queue.Queue] = {}
+        stop = threading.Event()
+        pending: Dict[Future, int] = {}
+        ready = [index for index in range(count) if not waiting[index]]
+        try:
+            while ready or pending:
+                # Stream producers go first so that their consumers can start.
+                ready.sort(key=lambda i: i not in streamed)
+                for index in ready:
+                    if index in streamed:
+                        for ref in streamed[index]:
+                            streams[id(ref)] = queue.Queue(
+                                maxsize=ref.maxsize or self.stream_buffer_size
+                            )
+                        buffers = [streams[id(ref)] for ref in streamed[index]]
+                        future = self._start_stream(index, buffers, stop)
+                    else:
+                        args, kwargs = self._resolve(index, streams)
+                        backend = self._backend(index)
+                        if backend == "inline":
+                            backend = "thread"
+                        future = self._submit(index, backend, args, kwargs)
+                    pending[future] = index
+                ready = []
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    self._record(index)
+                    self._results[index] = future.result()
+                    for dependent in dependents[index]:
+                        waiting[dependent] -= 1
+                        if not waiting[dependent]:
+                            ready.append(dependent)
+        except BaseException:
+            stop.set()
+            for future in pending:
+                future.cancel()
+            raise
+
+    def _start_stream(
+        self, index: int, buffers: List[queue.Queue], stop: threading.Event
+    ) -> Future:
+        """
+        Runs a producing task in its own thread, copying each item it yields
+        into the bounded buffer of every consumer.
+        """
+        args, kwargs = self._resolve(index, {})
+        func = self.tasks[index]["callable"]
+        future: Future = Future()
+        self._timings[index] = {"backend": "stream", "started": time.perf_counter()}
+
+        def put(buffer: queue.Queue, item: Any) -> None:
+            # Gives up once the execution failed and nothing consumes anymore.
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def pump():
+            try:
+                for item in func(*args, **kwargs):
+                    for buffer in buffers:
+                        put(buffer, item)
+                    if stop.is_set():
+                        break
+                future.set_result(None)
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                for buffer in buffers:
+                    put(buffer, _END)
+
+        threading.Thread(target=pump, daemon=True).start()
+        return future
+
+    def _executor(self, backend: str) -> Executor:
+        with self._executors_lock:
+            executor = self._executors.get(backend)
+            if executor is None:
+                if backend == "process":
+                    executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                self._executors[backend] = executor
+            return executor
+
+    def _submit_coroutine(self, coroutine) -> Future:
+        with self._executors_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def close(self) -> None:
+        """
+        Shut down the executors and event loop kept between executions.
+        """
+        with self._executors_lock:
+            for executor in self._executors.values():
+                executor.shutdown(wait=True)
+            self._executors = {}
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+
+    def __enter__(self) -> "PipelineBase":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def get_status(self) -> PipelineStatus:
         """
         Get the current status of the pipeline.
@@ -81,12 +390,21 @@ class PipelineBase(IPipeline, ComponentBase):
         Reset the pipeline to its initial state.
         """
         self._results = []
+        self._timings = []
         self._status = PipelineStatus.PENDING
 
-    def get_results(self) -> List[Any]:
+    def get_results(self, with_timings: bool = False) -> List[Any]:
         """
         Get the results of the pipeline execution.
 
+        :param with_timings: Return, for each task, a dictionary holding its
+            ``result`` with the ``backend`` it ran on and its ``started``,
+            ``finished`` and ``duration`` times in seconds.
         :return: List of results
         """
-        return self._results
+        if not with_timings:
+            return self._results
+        return [
+            {"result": result, **(timing or {})}
+            for result, timing in zip(self._results, self._timings)
+        ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
 from typing import Optional, Literal
 from pydantic import Field, PrivateAttr, ConfigDict
@@ -16,6 +18,7 @@ class RateLimitBase(IRateLimit, ComponentBase):
     refill_rate: float = 1.0
     _tokens: float = PrivateAttr(0.0)
     _last_refill: float = PrivateAttr(default_factory=time.time)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     resource: Optional[str] = Field(default=ResourceTypes.RATE_LIMIT.value, frozen=True)
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
@@ -30,13 +33,72 @@ class RateLimitBase(IRateLimit, ComponentBase):
 
     def allow(self, tokens: int = 1) -> bool:
         """Attempt to consume tokens and return whether the request is allowed."""
-        self.refill()
-        if self._tokens >= tokens:
-            self._tokens -= tokens
-            return True
-        return False
+        with self._lock:
+            self.refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
 
     def available_tokens(self) -> int:
         """Return the number of currently available tokens."""
-        self.refill()
-        return int(self._tokens)
+        with self._lock:
+            self.refill()
+            return max(0, int(self._tokens))
+
+    def _reserve(self, tokens: int, timeout: Optional[float]) -> Optional[float]:
+        """
+        Takes ``tokens`` from the bucket, letting it go into debt, and returns
+        the seconds until that debt is repaid. Returns None, taking nothing,
+        when that would be longer than ``timeout``.
+        """
+        with self._lock:
+            self.refill()
+            wait = max(0.0, (tokens - self._tokens) / self.refill_rate)
+            if timeout is not None and wait > timeout:
+                return None
+            self._tokens -= tokens
+            return wait
+
+    async def _areserve(
+        self, tokens: int, timeout: Optional[float]
+    ) -> Optional[float]:
+        """
+        Asynchronous counterpart of ``_reserve``. The in-memory bucket only
+        holds its lock briefly, so it reserves on the event loop; subclasses
+        whose reservation can block, e.g. on I/O, run it off the loop.
+        """
+        return self._reserve(tokens, timeout)
+
+    def _check_request(self, tokens: int) -> None:
+        if tokens > self.capacity:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens from a bucket of {self.capacity}"
+            )
+
+    def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Block until ``tokens`` are available and consume them.
+
+        Callers are served in the order they ask: each reserves its tokens
+        immediately and sleeps once, exactly until the bucket has refilled
+        them. Returns False without consuming anything when that would take
+        longer than ``timeout`` seconds.
+        """
+        self._check_request(tokens)
+        wait = self._reserve(tokens, timeout)
+        if wait is None:
+            return False
+        if wait:
+            time.sleep(wait)
+        return True
+
+    async def aacquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """Asynchronous counterpart of ``acquire``."""
+        self._check_request(tokens)
+        wait = await self._areserve(tokens, timeout)
+        if wait is None:
+            return False
+        if wait:
+            await asyncio.sleep(wait)
+        return True
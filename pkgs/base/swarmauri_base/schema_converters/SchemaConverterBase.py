@@ -1,5 +1,7 @@
+import threading
+import weakref
 from abc import abstractmethod
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, ClassVar, List, Literal, Tuple
 from pydantic import ConfigDict, Field
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes
 from swarmauri_core.schema_converters.ISchemaConvert import ISchemaConvert
@@ -14,6 +16,47 @@ class SchemaConverterBase(ISchemaConvert, ComponentBase):
     )
     type: Literal["SchemaConverterBase"] = "SchemaConverterBase"
 
+    # id(toolkit) -> {(converter class, tools version): converted tools}
+    _payloads: ClassVar[
+        Dict[int, Dict[Tuple[type, int], List[Dict[str, Any]]]]
+    ] = {}
+    _payloads_lock: ClassVar[threading.Lock] = threading.Lock()
+
     @abstractmethod
     def convert(self, tool: ITool) -> Dict[str, Any]:
         raise NotImplementedError("Subclasses must implement the convert method.")
+
+    def convert_tools(self, tools: Any) -> List[Dict[str, Any]]:
+        """
+        Converts every tool of ``tools``, a toolkit or a dictionary of tools
+        keyed by name.
+
+        The result for a toolkit is memoized per converter and
+        ``tools_version``, so it is only rebuilt after tools are added or
+        removed.
+        """
+        version = getattr(tools, "tools_version", None)
+        if not isinstance(version, int):
+            return [self.convert(tools[name]) for name in tools]
+
+        key = (type(self), version)
+        with self._payloads_lock:
+            payloads = self._payloads.get(id(tools))
+            payload = payloads.get(key) if payloads is not None else None
+        if payload is None:
+            payload = [self.convert(tool) for tool in tools.tools.values()]
+            with self._payloads_lock:
+                if id(tools) not in self._payloads:
+                    self._payloads[id(tools)] = {}
+                    weakref.finalize(tools, self._forget, id(tools))
+                payloads = self._payloads[id(tools)]
+                # Conversions for earlier versions are no longer needed.
+                for stale in [k for k in payloads if k[0] is key[0]]:
+                    del payloads[stale]
+                payloads[key] = payload
+        return list(payload)
+
+    @classmethod
+    def _forget(cls, toolkit_id: int) -> None:
+        with cls._payloads_lock:
+            cls._payloads.pop(toolkit_id, None)
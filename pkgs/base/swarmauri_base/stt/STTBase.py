@@ -4,10 +4,11 @@ from pydantic import ConfigDict, model_validator, Field
 
 from swarmauri_core.llms.IPredict import IPredict
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes
+from swarmauri_base.HttpClientMixin import HttpClientMixin
 
 
 @ComponentBase.register_model()
-class STTBase(IPredict, ComponentBase):
+class STTBase(IPredict, HttpClientMixin, ComponentBase):
     allowed_models: List[str] = []
     resource: Optional[str] = Field(default=ResourceTypes.STT.value, frozen=True)
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
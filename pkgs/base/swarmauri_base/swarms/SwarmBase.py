@@ -1,6 +1,9 @@
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
 import asyncio
-from pydantic import ConfigDict, Field
+import functools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pydantic import ConfigDict, Field, PrivateAttr
 from enum import Enum
 
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes
@@ -16,7 +19,15 @@ class SwarmStatus(Enum):
 
 @ComponentBase.register_model()
 class SwarmBase(ISwarm, ComponentBase):
-    """Base class for Swarm implementations"""
+    """
+    Base class for Swarm implementations
+
+    ``exec`` runs one worker per agent. Workers pull tasks from a queue
+    bounded by ``max_queue_size`` as soon as they are free, so tasks are
+    processed concurrently and a slow task never holds up the others.
+    Blocking agent calls made through ``_run_sync`` are offloaded to a thread
+    or a process according to ``sync_offload``.
+    """
 
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
     resource: Optional[str] = Field(default=ResourceTypes.SWARM.value, frozen=True)
@@ -26,10 +37,14 @@ class SwarmBase(ISwarm, ComponentBase):
     agent_timeout: float = Field(default=1.0, gt=0)
     max_retries: int = Field(default=3, ge=0)
     max_queue_size: int = Field(default=10, gt=0)
+    sync_offload: Literal["none", "thread", "process"] = "thread"
 
-    _agents: List[Any] = []
-    _task_queue: Optional[asyncio.Queue] = None
-    _status: Dict[int, SwarmStatus] = {}
+    _agents: List[Any] = PrivateAttr(default_factory=list)
+    _task_queue: Optional[asyncio.Queue] = PrivateAttr(default=None)
+    _status: Dict[int, SwarmStatus] = PrivateAttr(default_factory=dict)
+    _metrics: Dict[int, Dict[str, float]] = PrivateAttr(default_factory=dict)
+    _elapsed: float = PrivateAttr(0.0)
+    _process_pool: Optional[ProcessPoolExecutor] = PrivateAttr(default=None)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -39,6 +54,10 @@ class SwarmBase(ISwarm, ComponentBase):
     def _initialize_agents(self):
         self._agents = [self._create_agent() for _ in range(self.num_agents)]
         self._status = {i: SwarmStatus.IDLE for i in range(self.num_agents)}
+        self._metrics = {
+            i: {"tasks": 0, "failures": 0, "timeouts": 0, "busy_time": 0.0}
+            for i in range(self.num_agents)
+        }
 
     def _create_agent(self) -> Any:
         """create specific agent types"""
@@ -55,49 +74,122 @@ class SwarmBase(ISwarm, ComponentBase):
     def get_swarm_status(self) -> Dict[int, SwarmStatus]:
         return self._status
 
+    def get_agent_metrics(self) -> Dict[int, Dict[str, float]]:
+        """
+        Returns, per agent, the number of tasks processed, failed and timed
+        out, the time spent working, and the share of the time spent in
+        ``exec`` that the agent was busy.
+        """
+        return {
+            agent_id: {
+                **metrics,
+                "utilization": (
+                    metrics["busy_time"] / self._elapsed if self._elapsed else 0.0
+                ),
+            }
+            for agent_id, metrics in self._metrics.items()
+        }
+
+    async def _run_sync(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Calls a blocking ``func`` without blocking the other workers.
+
+        With ``sync_offload="process"`` the function and its arguments must be
+        picklable. A timed out call is abandoned but keeps running until it
+        returns on its own.
+        """
+        if self.sync_offload == "none":
+            return func(*args, **kwargs)
+        if self.sync_offload == "thread":
+            return await asyncio.to_thread(func, *args, **kwargs)
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.num_agents)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._process_pool, functools.partial(func, *args, **kwargs)
+        )
+
     async def _process_task(self, agent_id: int, task: Any, **kwargs) -> Any:
         self._status[agent_id] = SwarmStatus.WORKING
+        metrics = self._metrics[agent_id]
         try:
-            for _ in range(self.max_retries):
+            for _ in range(max(self.max_retries, 1)):
                 try:
                     result = await asyncio.wait_for(
                         self._execute_task(task, agent_id, **kwargs),
                         timeout=self.agent_timeout,
                     )
                     self._status[agent_id] = SwarmStatus.COMPLETED
-                    return result
+                    return {
+                        "agent_id": agent_id,
+                        "status": SwarmStatus.COMPLETED,
+                        "result": result,
+                    }
                 except asyncio.TimeoutError:
+                    metrics["timeouts"] += 1
                     continue
-            self._status[agent_id] = SwarmStatus.FAILED
-            return None
+            error = f"Task timed out after {self.agent_timeout}s"
         except Exception as e:
-            self._status[agent_id] = SwarmStatus.FAILED
-            raise e
+            error = str(e)
+        self._status[agent_id] = SwarmStatus.FAILED
+        metrics["failures"] += 1
+        return {"agent_id": agent_id, "status": SwarmStatus.FAILED, "error": error}
 
     async def _execute_task(self, task: Any, agent_id: int) -> Any:
         """Override this method to implement specific task execution logic"""
         raise NotImplementedError("Task execution method not implemented")
 
+    async def _worker(
+        self, agent_id: int, queue: asyncio.Queue, results: List[Any], **kwargs
+    ) -> None:
+        metrics = self._metrics[agent_id]
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            index, task = item
+            started = time.perf_counter()
+            try:
+                results[index] = await self._process_task(agent_id, task, **kwargs)
+            finally:
+                metrics["tasks"] += 1
+                metrics["busy_time"] += time.perf_counter() - started
+
     async def exec(
         self, input_data: Union[List[str], Any] = [], **kwargs: Optional[Dict]
     ) -> List[Any]:
-        tasks = input_data if isinstance(input_data, list) else [input_data]
-        for task in tasks:
-            await self._task_queue.put(task)
-
-        results = []
-        while not self._task_queue.empty():
-            available_agents = [
-                i for i, status in self._status.items() if status == SwarmStatus.IDLE
-            ]
-            if not available_agents:
-                await asyncio.sleep(0.1)
-                continue
-
-            task = await self._task_queue.get()
-            agent_id = available_agents[0]
-            result = await self._process_task(agent_id, task, **kwargs)
-            if result is not None:
-                results.append(result)
+        """
+        Processes the tasks of ``input_data`` concurrently and returns a
+        result for each of them, in input order.
 
+        Each result holds the ``agent_id`` that processed the task, its
+        ``status``, and either its ``result`` or the ``error`` it failed with.
+        """
+        tasks = input_data if isinstance(input_data, list) else [input_data]
+        if not tasks:
+            return []
+
+        queue = self._task_queue = asyncio.Queue(maxsize=self.max_queue_size)
+        results: List[Any] = [None] * len(tasks)
+        num_workers = min(self.num_agents, len(tasks))
+
+        async def produce():
+            for item in enumerate(tasks):
+                await queue.put(item)
+            for _ in range(num_workers):
+                await queue.put(None)
+
+        started = time.perf_counter()
+        runners = [asyncio.ensure_future(produce())] + [
+            asyncio.ensure_future(self._worker(agent_id, queue, results, **kwargs))
+            for agent_id in range(num_workers)
+        ]
+        try:
+            await asyncio.gather(*runners)
+        finally:
+            for runner in runners:
+                runner.cancel()
+            self._elapsed += time.perf_counter() - started
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = None
         return results
@@ -1,17 +1,33 @@
 from abc import abstractmethod
+import asyncio
+import inspect
 import json
-from typing import Any, Dict, List, Literal, Optional, Type
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type
 
 from pydantic import ConfigDict, Field, PrivateAttr, SecretStr, model_validator
 from swarmauri_core.tool_llms.IToolPredict import IToolPredict
 
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes
+from swarmauri_base.HistoryFormattingMixin import HistoryFormattingMixin
+from swarmauri_base.HttpClientMixin import HttpClientMixin
+from swarmauri_base.RequestSchedulerMixin import RequestSchedulerMixin
+from swarmauri_base.RetryPolicyMixin import RetryPolicyMixin
 from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_base.schema_converters.SchemaConverterBase import SchemaConverterBase
 
 
 @ComponentBase.register_model()
-class ToolLLMBase(IToolPredict, ComponentBase):
+class ToolLLMBase(
+    IToolPredict,
+    HistoryFormattingMixin,
+    HttpClientMixin,
+    RequestSchedulerMixin,
+    RetryPolicyMixin,
+    ComponentBase,
+):
     allowed_models: List[str] = []
     resource: Optional[str] = Field(default=ResourceTypes.TOOL_LLM.value, frozen=True)
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
@@ -20,6 +36,10 @@ class ToolLLMBase(IToolPredict, ComponentBase):
     allowed_models: List[str] = []
     timeout: float = 600.0
     BASE_URL: str = None
+    # Tools may have side effects, so they run one at a time unless callers
+    # opt in to running them concurrently.
+    max_parallel_tools: int = 1
+    tool_timeout: Optional[float] = None
     _headers: Dict[str, str] = PrivateAttr(default=None)
 
     @model_validator(mode="after")
@@ -63,14 +83,151 @@ class ToolLLMBase(IToolPredict, ComponentBase):
 
     def _schema_convert_tools(self, tools) -> List[Dict[str, Any]]:
         converter = self.get_schema_converter()
-        return [converter.convert(tools[tool]) for tool in tools]
+        if isinstance(converter, type):
+            converter = converter()
+        return converter.convert_tools(tools)
 
     def _format_messages(
         self, messages: List[Type[MessageBase]]
     ) -> List[Dict[str, str]]:
         raise NotImplementedError("_format_messages() not implemented in subclass yet.")
 
-    def _process_tool_calls(self, tool_calls, toolkit, messages) -> List[MessageBase]:
+    def _tool_invocations(
+        self, tool_calls, toolkit
+    ) -> List[Tuple[Callable[..., Any], Dict[str, Any]]]:
+        """
+        Returns the tool and the arguments of each of ``tool_calls``, in order.
+        """
+        return [
+            (
+                toolkit.get_tool_by_name(tool_call["function"]["name"]),
+                json.loads(tool_call["function"]["arguments"]),
+            )
+            for tool_call in tool_calls or []
+        ]
+
+    def _tool_timed_out(self, tool: Callable[..., Any]) -> TimeoutError:
+        name = getattr(tool, "name", None) or getattr(tool, "__name__", repr(tool))
+        return TimeoutError(f"Tool {name} timed out after {self.tool_timeout}s")
+
+    @staticmethod
+    def _call_tool(tool: Callable[..., Any], arguments: Dict[str, Any]) -> Any:
+        result = tool(**arguments)
+        if inspect.isawaitable(result):
+            result = asyncio.run(result)
+        return result
+
+    def _run_tools(
+        self,
+        invocations: List[Tuple[Callable[..., Any], Dict[str, Any]]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Runs the tools of ``invocations`` concurrently on up to
+        ``max_parallel_tools`` threads and returns their results in the
+        order of ``invocations``. A tool running longer than
+        ``tool_timeout`` from its own start raises ``TimeoutError``. Errors
+        are raised, or returned in place of the result when
+        ``return_exceptions`` is set.
+
+        A thread cannot be stopped, so a tool that timed out keeps running
+        in the background until it returns, and its result is discarded. It
+        no longer counts towards ``max_parallel_tools``: the next tool is
+        started on another thread.
+        """
+        if len(invocations) == 1 and self.tool_timeout is None:
+            tool, arguments = invocations[0]
+            try:
+                return [self._call_tool(tool, arguments)]
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return [e]
+        if not invocations:
+            return []
+        workers = max(1, min(self.max_parallel_tools, len(invocations)))
+        # Tools are started here, at most ``workers`` at a time, rather than
+        # queued in the executor, so that each one's timeout counts from its
+        # start and a tool that timed out does not hold up the next one.
+        executor = ThreadPoolExecutor(max_workers=len(invocations))
+        results: List[Any] = [None] * len(invocations)
+        queued = deque(range(len(invocations)))
+        running: Dict[Future, Tuple[int, float]] = {}
+        try:
+            while queued or running:
+                while queued and len(running) < workers:
+                    index = queued.popleft()
+                    tool, arguments = invocations[index]
+                    future = executor.submit(self._call_tool, tool, arguments)
+                    running[future] = (index, time.monotonic())
+                timeout = None
+                if self.tool_timeout is not None:
+                    started = min(start for _, start in running.values())
+                    timeout = max(started + self.tool_timeout - time.monotonic(), 0)
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                now = time.monotonic()
+                for future, (index, start) in list(running.items()):
+                    if future in done:
+                        del running[future]
+                        try:
+                            results[index] = future.result()
+                        except Exception as e:
+                            if not return_exceptions:
+                                raise
+                            results[index] = e
+                    elif (
+                        self.tool_timeout is not None
+                        and now - start >= self.tool_timeout
+                    ):
+                        del running[future]
+                        error = self._tool_timed_out(invocations[index][0])
+                        if not return_exceptions:
+                            raise error
+                        results[index] = error
+            return results
+        finally:
+            # Do not wait for tools that timed out.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _arun_tools(
+        self,
+        invocations: List[Tuple[Callable[..., Any], Dict[str, Any]]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Asynchronous counterpart of ``_run_tools``: asynchronous tools are
+        awaited on the running loop, others run in threads.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_parallel_tools))
+
+        async def call(tool: Callable[..., Any], arguments: Dict[str, Any]) -> Any:
+            if inspect.iscoroutinefunction(tool) or inspect.iscoroutinefunction(
+                getattr(tool, "__call__", None)
+            ):
+                result = tool(**arguments)
+            else:
+                result = await asyncio.to_thread(tool, **arguments)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        async def run(tool: Callable[..., Any], arguments: Dict[str, Any]) -> Any:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        call(tool, arguments), self.tool_timeout
+                    )
+                except asyncio.TimeoutError:
+                    raise self._tool_timed_out(tool) from None
+
+        return await asyncio.gather(
+            *(run(tool, arguments) for tool, arguments in invocations),
+            return_exceptions=return_exceptions,
+        )
+
+    def _process_tool_calls(
+        self, tool_calls, toolkit, messages, results: Optional[List[Any]] = None
+    ) -> List[MessageBase]:
         """
         Processes a list of tool calls and appends the results to the messages list.
 
@@ -80,28 +237,34 @@ class ToolLLMBase(IToolPredict, ComponentBase):
                                of the function to be called, and an "id" key for the tool call identifier.
             toolkit (object): An object that provides access to tools via the `get_tool_by_name` method.
             messages (list): A list of message dictionaries to which the results of the tool calls will be appended.
+            results (list, optional): The results of the tool calls, when already run. The tools are run
+                               concurrently otherwise.
 
         Returns:
             List[MessageBase]: The updated list of messages with the results of the tool calls appended.
         """
         if tool_calls:
-            for tool_call in tool_calls:
-                func_name = tool_call["function"]["name"]
-
-                func_call = toolkit.get_tool_by_name(func_name)
-                func_args = json.loads(tool_call["function"]["arguments"])
-                func_result = func_call(**func_args)
-
+            if results is None:
+                results = self._run_tools(self._tool_invocations(tool_calls, toolkit))
+            for tool_call, func_result in zip(tool_calls, results):
                 messages.append(
                     {
                         "tool_call_id": tool_call["id"],
                         "role": "tool",
-                        "name": func_name,
+                        "name": tool_call["function"]["name"],
                         "content": json.dumps(func_result),
                     }
                 )
         return messages
 
+    async def _aprocess_tool_calls(self, tool_calls, toolkit, *args: Any) -> Any:
+        """
+        Asynchronous counterpart of ``_process_tool_calls``, which it calls
+        with the results of the tools run concurrently.
+        """
+        results = await self._arun_tools(self._tool_invocations(tool_calls, toolkit))
+        return self._process_tool_calls(tool_calls, toolkit, *args, results=results)
+
     @abstractmethod
     def predict(self, *args, **kwargs):
         raise NotImplementedError("predict() not implemented in subclass yet.")
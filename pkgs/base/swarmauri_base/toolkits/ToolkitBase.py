@@ -1,5 +1,5 @@
 from typing import Dict, Optional, List, Literal
-from pydantic import Field, ConfigDict
+from pydantic import Field, ConfigDict, PrivateAttr
 
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes, SubclassUnion
 from swarmauri_core.toolkits.IToolkit import IToolkit
@@ -11,12 +11,24 @@ class ToolkitBase(IToolkit, ComponentBase):
     """
     A class representing a toolkit used by Swarm Agents.
     Tools are maintained in a dictionary keyed by the tool's name.
+
+    ``tools_version`` changes whenever tools are added or removed through the
+    toolkit's methods, so derived data such as provider tool schemas can be
+    cached until then. Changing ``tools`` directly does not change it.
     """
 
     tools: Dict[str, SubclassUnion[ToolBase]] = {}
     resource: Optional[str] = Field(default=ResourceTypes.TOOLKIT.value, frozen=True)
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
     type: Literal["ToolkitBase"] = "ToolkitBase"
+    _tools_version: int = PrivateAttr(0)
+
+    @property
+    def tools_version(self) -> int:
+        """
+        Returns a counter that changes each time the toolkit's tools change.
+        """
+        return self._tools_version
 
     def get_tools(
         self,
@@ -57,6 +69,7 @@ class ToolkitBase(IToolkit, ComponentBase):
             tools (Dict[str, Tool]): A dictionary of tool objects keyed by their names.
         """
         self.tools.update(tools)
+        self._tools_version += 1
 
     def add_tool(self, tool: SubclassUnion[ToolBase]) -> None:
         """
@@ -66,6 +79,7 @@ class ToolkitBase(IToolkit, ComponentBase):
             tool (Tool): The tool instance to be added to the toolkit.
         """
         self.tools[tool.name] = tool
+        self._tools_version += 1
 
     def remove_tool(self, tool_name: str) -> None:
         """
@@ -76,6 +90,7 @@ class ToolkitBase(IToolkit, ComponentBase):
         """
         if tool_name in self.tools:
             del self.tools[tool_name]
+            self._tools_version += 1
         else:
             raise ValueError(f"Tool '{tool_name}' not found in the toolkit.")
 
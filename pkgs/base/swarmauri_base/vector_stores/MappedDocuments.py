@@ -0,0 +1,259 @@
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import MutableSequence
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+
+import numpy as np
+
+from swarmauri_base.DynamicBase import DynamicBase
+from swarmauri_standard.documents.Document import Document
+from swarmauri_standard.vectors.Vector import Vector
+
+STORE_FORMAT = "swarmauri.vector_store.binary"
+STORE_FORMAT_VERSION = 1
+
+STORE_FILE = "store.json"
+EMBEDDINGS_FILE = "embeddings.npy"
+EMBEDDED_FILE = "embedded.npy"
+CONTENT_FILE = "content.bin"
+CONTENT_OFFSETS_FILE = "content_offsets.npy"
+RECORDS_FILE = "records.bin"
+RECORDS_OFFSETS_FILE = "records_offsets.npy"
+
+
+def _document_class(type_name: str) -> Type[Document]:
+    """
+    Resolves a document type name through the component registry.
+    """
+    subtypes = DynamicBase._registry.get("DocumentBase", {}).get("subtypes", {})
+    if type_name not in subtypes:
+        for resolver in DynamicBase._type_resolvers:
+            resolver(type_name)
+    document_class = subtypes.get(type_name)
+    if document_class is None:
+        raise ValueError(f"Unknown document type '{type_name}'")
+    return document_class
+
+
+def _write_blob(
+    path: str, offsets_path: str, chunks: Iterable[bytes], count: int
+) -> None:
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    with open(path, "wb") as f:
+        for i, chunk in enumerate(chunks):
+            f.write(chunk)
+            offsets[i + 1] = offsets[i] + len(chunk)
+    np.save(offsets_path, offsets)
+
+
+def _map_blob(path: str) -> Union[np.memmap, bytes]:
+    # np.memmap cannot map an empty file.
+    if os.path.getsize(path) == 0:
+        return b""
+    return np.memmap(path, dtype=np.uint8, mode="r")
+
+
+def write_store(directory_path: str, documents: Iterable[Document]) -> None:
+    """
+    Writes documents in the binary store layout.
+
+    The layout consists of:
+
+    - ``embeddings.npy``: a contiguous ``float32`` matrix with one row per
+      document, and ``embedded.npy`` marking the rows that hold an embedding.
+    - ``content.bin``/``content_offsets.npy``: the UTF-8 document contents
+      concatenated into one blob, and the byte offset where each one starts.
+    - ``records.bin``/``records_offsets.npy``: the same for each document's
+      compact JSON record (id, type index and metadata).
+    - ``store.json``: format version, counts, dimension and type names.
+
+    The files are first written to a staging directory and then moved over
+    the existing ones, ``store.json`` last. Documents that are mapped from
+    ``directory_path`` itself therefore stay readable while they are saved.
+
+    Raises:
+        ValueError: If the embeddings do not all have the same dimension.
+    """
+    os.makedirs(directory_path, exist_ok=True)
+    staging_path = tempfile.mkdtemp(prefix=".staging-", dir=directory_path)
+    try:
+        _write_files(staging_path, documents)
+        names = sorted(os.listdir(staging_path), key=lambda name: name == STORE_FILE)
+        for name in names:
+            os.replace(
+                os.path.join(staging_path, name), os.path.join(directory_path, name)
+            )
+    finally:
+        shutil.rmtree(staging_path, ignore_errors=True)
+
+
+def _write_files(directory_path: str, documents: Iterable[Document]) -> None:
+    documents = list(documents)
+    count = len(documents)
+
+    embedded = np.array([doc.embedding is not None for doc in documents], dtype=bool)
+    dimensions = {len(doc.embedding.value) for doc in documents if doc.embedding}
+    if len(dimensions) > 1:
+        raise ValueError("All embeddings must have the same dimension.")
+    dimension = dimensions.pop() if dimensions else 0
+
+    embeddings_path = os.path.join(directory_path, EMBEDDINGS_FILE)
+    embeddings = np.lib.format.open_memmap(
+        embeddings_path, mode="w+", dtype=np.float32, shape=(count, dimension)
+    )
+    for row, document in enumerate(documents):
+        if embedded[row]:
+            embeddings[row] = document.embedding.to_numpy()
+    embeddings.flush()
+    del embeddings
+    np.save(os.path.join(directory_path, EMBEDDED_FILE), embedded)
+
+    _write_blob(
+        os.path.join(directory_path, CONTENT_FILE),
+        os.path.join(directory_path, CONTENT_OFFSETS_FILE),
+        ((doc.content or "").encode("utf-8") for doc in documents),
+        count,
+    )
+
+    types: Dict[str, int] = {}
+    _write_blob(
+        os.path.join(directory_path, RECORDS_FILE),
+        os.path.join(directory_path, RECORDS_OFFSETS_FILE),
+        (
+            json.dumps(
+                [doc.id, types.setdefault(doc.type, len(types)), doc.metadata],
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            for doc in documents
+        ),
+        count,
+    )
+
+    with open(os.path.join(directory_path, STORE_FILE), "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "format": STORE_FORMAT,
+                "version": STORE_FORMAT_VERSION,
+                "count": count,
+                "dimension": dimension,
+                "dtype": "float32",
+                "types": list(types),
+            },
+            f,
+            indent=4,
+        )
+
+
+class MappedDocuments(MutableSequence):
+    """
+    Documents of a binary vector store, opened without reading them.
+
+    All files are memory-mapped, so opening a store costs the same for any
+    number of documents. A document is only decoded when it is first
+    accessed, and its embedding is built from its row of the ``float32``
+    matrix at that point; untouched rows are never paged in.
+
+    The sequence can be changed like a list. Added documents are kept as
+    they are and the mapped files are never written to.
+    """
+
+    def __init__(self, directory_path: str):
+        with open(os.path.join(directory_path, STORE_FILE), encoding="utf-8") as f:
+            header = json.load(f)
+        if header.get("format") != STORE_FORMAT:
+            raise ValueError(f"'{directory_path}' is not a binary vector store.")
+        if header.get("version", 0) > STORE_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported binary vector store version {header['version']}."
+            )
+
+        def path(name: str) -> str:
+            return os.path.join(directory_path, name)
+
+        self.directory_path = directory_path
+        self.types: List[str] = header["types"]
+        self.embeddings: np.ndarray = np.load(path(EMBEDDINGS_FILE), mmap_mode="r")
+        self.embedded: np.ndarray = np.load(path(EMBEDDED_FILE), mmap_mode="r")
+        self._content = _map_blob(path(CONTENT_FILE))
+        self._content_offsets = np.load(path(CONTENT_OFFSETS_FILE), mmap_mode="r")
+        self._records = _map_blob(path(RECORDS_FILE))
+        self._records_offsets = np.load(path(RECORDS_OFFSETS_FILE), mmap_mode="r")
+        # Each item is either a row of the mapped files or a document that
+        # was added or assigned after opening; decoded rows are cached.
+        self._items: List[Union[int, Document]] = list(range(header["count"]))
+        self._decoded: Dict[int, Document] = {}
+
+    @staticmethod
+    def _slice(blob, offsets: np.ndarray, row: int) -> bytes:
+        return bytes(blob[offsets[row] : offsets[row + 1]])
+
+    def _decode(self, row: int) -> Document:
+        record = self._slice(self._records, self._records_offsets, row)
+        id_, type_index, metadata = json.loads(record)
+        content = self._slice(self._content, self._content_offsets, row)
+        embedding = None
+        if self.embedded[row]:
+            embedding = Vector.from_numpy(self.embeddings[row])
+        document_class = _document_class(self.types[type_index])
+        return document_class.model_construct(
+            id=id_,
+            content=content.decode("utf-8"),
+            metadata=metadata,
+            embedding=embedding,
+        )
+
+    def _get(self, index: int) -> Document:
+        item = self._items[index]
+        if not isinstance(item, int):
+            return item
+        document = self._decoded.get(item)
+        if document is None:
+            document = self._decoded[item] = self._decode(item)
+        return document
+
+    def row(self, index: int) -> Optional[int]:
+        """
+        Returns the row in the mapped files of the document at ``index``, or
+        None for documents that were added or replaced after opening.
+        """
+        item = self._items[index]
+        if isinstance(item, int):
+            return item
+        return None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("document index out of range")
+        return self._get(index)
+
+    def __setitem__(self, index, value) -> None:
+        self._items[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def insert(self, index: int, value: Document) -> None:
+        self._items.insert(index, value)
+
+    def __iter__(self):
+        for i in range(len(self._items)):
+            yield self._get(i)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, MutableSequence)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MappedDocuments({self.directory_path!r}, {len(self)} documents)"
+
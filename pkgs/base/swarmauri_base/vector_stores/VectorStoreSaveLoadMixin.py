@@ -1,18 +1,43 @@
 import glob
-import importlib
 import json
 import os
+import shutil
+from collections import defaultdict
 
 from pydantic import BaseModel
 from swarmauri_core.vector_stores.IVectorStoreSaveLoad import IVectorStoreSaveLoad
 
+from swarmauri_base.vector_stores.MappedDocuments import (
+    STORE_FILE,
+    MappedDocuments,
+    _document_class,
+    write_store,
+)
+
 
 class VectorStoreSaveLoadMixin(IVectorStoreSaveLoad, BaseModel):
     """
     Base class for vector stores with built-in support for saving and loading
     the vectorizer's model and the documents.
+
+    Documents are saved in a binary layout (see ``MappedDocuments``):
+    embeddings as one ``float32`` matrix, contents and records as blobs
+    with offset tables. ``load_store`` memory-maps these files, so a store
+    opens in constant time and only the documents that are accessed are
+    read. Directories written in the older ``documents.json`` format can
+    still be loaded.
     """
 
+    def _store_embedder(self):
+        """
+        Returns the store's vectorizer/embedder, if it has one.
+        """
+        for name in ("_vectorizer", "_embedder"):
+            embedder = getattr(self, name, None)
+            if embedder is not None:
+                return embedder
+        return None
+
     def save_store(self, directory_path: str) -> None:
         """
         Saves both the vectorizer's model and the documents.
@@ -22,18 +47,13 @@ class VectorStoreSaveLoadMixin(IVectorStoreSaveLoad, BaseModel):
             os.makedirs(directory_path)
 
         # Save the vectorizer model
-        model_path = os.path.join(directory_path, "embedding_model")
-        self._vectorizer.save_model(model_path)
+        embedder = self._store_embedder()
+        if hasattr(embedder, "save_model"):
+            model_path = os.path.join(directory_path, "embedding_model")
+            embedder.save_model(model_path)
 
         # Save documents
-        documents_path = os.path.join(directory_path, "documents.json")
-        with open(documents_path, "w", encoding="utf-8") as f:
-            json.dump(
-                [each.to_dict() for each in self.documents],
-                f,
-                ensure_ascii=False,
-                indent=4,
-            )
+        write_store(directory_path, self.documents)
 
     def load_store(self, directory_path: str) -> None:
         """
@@ -41,9 +61,15 @@ class VectorStoreSaveLoadMixin(IVectorStoreSaveLoad, BaseModel):
         """
         # Load the vectorizer model
         model_path = os.path.join(directory_path, "embedding_model")
-        self.vectorizer.load_model(model_path)
+        embedder = self._store_embedder()
+        if hasattr(embedder, "load_model") and os.path.exists(model_path):
+            embedder.load_model(model_path)
 
         # Load documents
+        if os.path.exists(os.path.join(directory_path, STORE_FILE)):
+            self.documents = MappedDocuments(directory_path)
+            return
+
         documents_path = os.path.join(directory_path, "documents.json")
         with open(documents_path, "r", encoding="utf-8") as f:
             self.documents = [self._load_document(each) for each in json.load(f)]
@@ -51,117 +77,70 @@ class VectorStoreSaveLoadMixin(IVectorStoreSaveLoad, BaseModel):
     def _load_document(self, data):
         document_type = data.pop("type")
         if document_type:
-            module = importlib.import_module(
-                f"swarmauri.documents.concrete.{document_type}"
-            )
-            document_class = getattr(module, document_type)
-            document = document_class.from_dict(data)
-            return document
+            document_class = _document_class(document_type)
+            return document_class.model_validate(data)
         else:
             raise ValueError("Unknown document type")
 
     def save_parts(self, directory_path: str, chunk_size: int = 10485760) -> None:
         """
-        Splits the file into parts if it's too large and saves those parts individually.
+        Saves the store and splits every file larger than ``chunk_size`` into
+        parts of at most ``chunk_size`` bytes under ``parts/``.
+
+        Each part is named after the file it belongs to, relative to
+        ``directory_path`` (e.g. ``parts/embeddings.npy.part001``). The
+        split files are removed; ``load_parts`` joins them back. Parts left
+        by an earlier save are removed first.
         """
-        file_number = 1
-        model_path = os.path.join(directory_path, "embedding_model")
+        self.save_store(directory_path)
         parts_directory = os.path.join(directory_path, "parts")
+        shutil.rmtree(parts_directory, ignore_errors=True)
 
-        if not os.path.exists(parts_directory):
-            os.makedirs(parts_directory)
-
-        with open(f"{model_path}/model.safetensors", "rb") as f:
-            chunk = f.read(chunk_size)
-            while chunk:
-                with open(
-                    f"{parts_directory}/model.safetensors.part{file_number:03}", "wb"
-                ) as chunk_file:
-                    chunk_file.write(chunk)
-                file_number += 1
-                chunk = f.read(chunk_size)
+        for file_path in self._stored_files(directory_path):
+            if os.path.getsize(file_path) <= chunk_size:
+                continue
+            relative_path = os.path.relpath(file_path, directory_path)
+            part_prefix = os.path.join(parts_directory, relative_path)
+            os.makedirs(os.path.dirname(part_prefix), exist_ok=True)
 
-        # Split the documents into parts and save them
-        os.path.join(directory_path, "documents")
-
-        self._split_json_file(directory_path, chunk_size=chunk_size)
-
-    def _split_json_file(
-        self, directory_path: str, max_records=100, chunk_size: int = 10485760
-    ):
-        # Read the input JSON file
-        combined_documents_file_path = os.path.join(directory_path, "documents.json")
-
-        # load the master JSON file
-        with open(combined_documents_file_path, "r") as file:
-            data = json.load(file)
-
-        # Set and Create documents parts folder if it does not exist
-        documents_dir = os.path.join(directory_path, "documents")
-        if not os.path.exists(documents_dir):
-            os.makedirs(documents_dir)
-        current_batch = []
-        file_index = 1
-        current_size = 0
-
-        for record in data:
-            current_batch.append(record)
-            current_size = len(json.dumps(current_batch).encode("utf-8"))
-
-            # Check if current batch meets the splitting criteria
-            if len(current_batch) >= max_records or current_size >= chunk_size:
-                # Write current batch to a new file
-                output_file = f"document_part_{file_index}.json"
-                output_file = os.path.join(documents_dir, output_file)
-                with open(output_file, "w") as outfile:
-                    json.dump(current_batch, outfile)
-
-                # Prepare for the next batch
-                current_batch = []
-                current_size = 0
-                file_index += 1
-
-        # Check if there's any remaining data to be written
-        if current_batch:
-            output_file = f"document_part_{file_index}.json"
-            output_file = os.path.join(documents_dir, output_file)
-            with open(output_file, "w") as outfile:
-                json.dump(current_batch, outfile)
+            file_number = 1
+            with open(file_path, "rb") as f:
+                chunk = f.read(chunk_size)
+                while chunk:
+                    with open(f"{part_prefix}.part{file_number:03}", "wb") as part:
+                        part.write(chunk)
+                    file_number += 1
+                    chunk = f.read(chunk_size)
+            os.remove(file_path)
+
+    @staticmethod
+    def _stored_files(directory_path: str):
+        parts_directory = os.path.join(directory_path, "parts")
+        for root, _, files in os.walk(directory_path):
+            if os.path.commonpath([root, parts_directory]) == parts_directory:
+                continue
+            for name in files:
+                yield os.path.join(root, name)
 
     def load_parts(self, directory_path: str, file_pattern: str = "*.part*") -> None:
         """
-        Combines file parts from a directory back into a single file and loads it.
+        Combines file parts from a directory back into the files they were
+        split from and loads the store.
         """
-        model_path = os.path.join(directory_path, "embedding_model")
         parts_directory = os.path.join(directory_path, "parts")
-        output_file_path = os.path.join(model_path, "model.safetensors")
-
-        parts = sorted(glob.glob(os.path.join(parts_directory, file_pattern)))
-        with open(output_file_path, "wb") as output_file:
-            for part in parts:
-                with open(part, "rb") as file_part:
-                    output_file.write(file_part.read())
-
-        # Load the combined_model now
-        model_path = os.path.join(directory_path, "embedding_model")
-        self._vectorizer.load_model(model_path)
-
-        # Load document files
-        self._load_documents(directory_path)
-
-    def _load_documents(self, directory_path: str) -> None:
-        """
-        Loads the documents from parts stored in the given directory.
-        """
-        part_paths = glob.glob(os.path.join(directory_path, "documents/*.json"))
-        for part_path in part_paths:
-            with open(part_path, "r") as f:
-                part_documents = json.load(f)
-                for document_data in part_documents:
-                    document_type = document_data.pop("type")
-                    document_module = importlib.import_module(
-                        f"swarmauri.documents.concrete.{document_type}"
-                    )
-                    document_class = getattr(document_module, document_type)
-                    document = document_class.from_dict(document_data)
-                    self.documents.append(document)
+        pattern = os.path.join(parts_directory, "**", file_pattern)
+
+        grouped = defaultdict(list)
+        for part in glob.glob(pattern, recursive=True):
+            relative_path = os.path.relpath(part, parts_directory)
+            grouped[relative_path.rpartition(".part")[0]].append(part)
+
+        for relative_path, parts in grouped.items():
+            output_file_path = os.path.join(directory_path, relative_path)
+            os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
+            with open(output_file_path, "wb") as output_file:
+                for part in sorted(parts):
+                    with open(part, "rb") as file_part:
+                        shutil.copyfileobj(file_part, output_file)
+
+        self.load_store(directory_path)
@@ -1,27 +1,145 @@
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Type, TypeVar
 
 import numpy as np
-from pydantic import Field
+from pydantic import (
+    Field,
+    PrivateAttr,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
 from swarmauri_core.vectors.IVector import IVector
 
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes
 
+V = TypeVar("V", bound="VectorBase")
+
 
 @ComponentBase.register_model()
 class VectorBase(IVector, ComponentBase):
+    """
+    Base class for vectors.
+
+    The vector's data is held in a single contiguous, read-only NumPy
+    buffer. ``value`` is validated and serialized as a list of floats, but
+    the list is not kept: it is moved into the buffer once the vector is
+    built, and reading ``value`` builds a new list from the buffer. Use
+    ``to_numpy()``, which returns the buffer itself, on hot paths.
+
+    ``value`` should be treated as immutable: assigning a new list replaces
+    the buffer, but edits of a list read from ``value`` are not kept.
+    """
+
     value: List[float]
     resource: Optional[str] = Field(default=ResourceTypes.VECTOR.value, frozen=True)
     type: Literal["VectorBase"] = "VectorBase"
     # model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
+    _array: Optional[np.ndarray] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_numpy(cls: Type[V], array: np.ndarray, **kwargs) -> V:
+        """
+        Builds a vector from a 1-D array without validating each element.
+
+        The array is copied once into the vector's buffer, so later changes
+        to ``array`` do not reach the vector.
+
+        Args:
+            array (np.ndarray): A one-dimensional numeric array.
+            **kwargs: Other field values for the vector.
+
+        Returns:
+            VectorBase: The new vector.
+        """
+        array = np.asarray(array)
+        if array.ndim != 1:
+            raise ValueError("from_numpy expects a one-dimensional array.")
+        dtype = array.dtype if array.dtype in (np.float32, np.float64) else np.float64
+        array = np.array(array, dtype=dtype, order="C", copy=True)
+        vector = cls.model_construct(**kwargs)
+        vector.__pydantic_fields_set__.add("value")
+        vector._array = cls._read_only(array)
+        return vector
+
+    @staticmethod
+    def _read_only(array: np.ndarray) -> np.ndarray:
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._take_value()
+
+    def _take_value(self) -> Optional[np.ndarray]:
+        """
+        Moves a ``value`` list set on the instance into the buffer and
+        returns the buffer.
+        """
+        value = self.__dict__.pop("value", None)
+        if value is not None:
+            self._array = self._read_only(np.array(value, dtype=np.float64))
+        return self._array
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "value":
+            array = self._take_value()
+            if array is not None:
+                return array.tolist()
+        return super().__getattr__(name)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == "value":
+            self._take_value()
+
+    @model_serializer(mode="wrap")
+    def _serialize_value(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Dict[str, Any]:
+        array = self._take_value()
+        data = handler(self)
+        excluded = "value" in (info.exclude or ()) or (
+            info.include is not None and "value" not in info.include
+        )
+        if array is None or excluded:
+            return data
+        # Put ``value`` back in the place of the field.
+        names = list(type(self).model_fields)
+        preceding = set(names[: names.index("value")])
+        items = list(data.items())
+        position = sum(1 for key, _ in items if key in preceding)
+        items.insert(position, ("value", array.tolist()))
+        return dict(items)
+
+    def __repr_args__(self):
+        yield from super().__repr_args__()
+        yield "value", self.value
+
+    def __eq__(self, other: object) -> bool:
+        # The buffer holds the value, which pydantic would otherwise compare
+        # as a private attribute, and arrays do not compare to a bool.
+        if not isinstance(other, VectorBase):
+            return NotImplemented
+        return (
+            type(self) is type(other)
+            and np.array_equal(self.to_numpy(), other.to_numpy())
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
     def to_numpy(self) -> np.ndarray:
         """
-        Converts the vector into a numpy array.
+        Returns the vector as a numpy array.
+
+        The array is a read-only view of the vector's buffer, so no data is
+        copied. Use ``.copy()`` to modify it.
 
         Returns:
             np.ndarray: The numpy array representation of the vector.
         """
-        return np.array(self.value)
+        return self._take_value()
 
     @property
     def shape(self):
@@ -40,4 +158,4 @@ class VectorBase(IVector, ComponentBase):
         return np.dot(self.to_numpy(), other.to_numpy())
 
     def __len__(self):
-        return len(self.value)
+        return len(self.to_numpy())
@@ -3,11 +3,22 @@ from typing import List, Literal, Optional
 
 from pydantic import ConfigDict, Field, model_validator
 from swarmauri_base.ComponentBase import ComponentBase, ResourceTypes
+from swarmauri_base.HistoryFormattingMixin import HistoryFormattingMixin
+from swarmauri_base.HttpClientMixin import HttpClientMixin
+from swarmauri_base.RequestSchedulerMixin import RequestSchedulerMixin
+from swarmauri_base.RetryPolicyMixin import RetryPolicyMixin
 from swarmauri_core.vlms.IPredictVision import IPredictVision
 
 
 @ComponentBase.register_model()
-class VLMBase(IPredictVision, ComponentBase):
+class VLMBase(
+    IPredictVision,
+    HistoryFormattingMixin,
+    HttpClientMixin,
+    RequestSchedulerMixin,
+    RetryPolicyMixin,
+    ComponentBase,
+):
     allowed_models: List[str] = []
     resource: Optional[str] = Field(default=ResourceTypes.VLM.value, frozen=True)
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
@@ -0,0 +1,64 @@
+"""Startup benchmark for batched ``DynamicBase`` registration.
+
+Registering N component types one by one rebuilds every registered model N
+times; inside ``DynamicBase.batch_registration`` they are rebuilt once.
+"""
+
+import time
+from typing import List, Literal, Optional
+
+import pytest
+from swarmauri_base.ComponentBase import ComponentBase, SubclassUnion
+from swarmauri_base.DynamicBase import DynamicBase
+
+NUM_TYPES = 40
+
+
+def _register_types(prefix: str) -> float:
+    """Register a base model, a holder model and ``NUM_TYPES`` subtypes."""
+    start = time.perf_counter()
+
+    base = ComponentBase.register_model()(
+        type(f"{prefix}Base", (ComponentBase,), {"__annotations__": {}})
+    )
+    ComponentBase.register_model()(
+        type(
+            f"{prefix}Holder",
+            (ComponentBase,),
+            {
+                "__annotations__": {"items": List[SubclassUnion[base]]},
+                "items": [],
+            },
+        )
+    )
+    for i in range(NUM_TYPES):
+        name = f"{prefix}Type{i}"
+        ComponentBase.register_type(base, name)(
+            type(
+                name,
+                (base,),
+                {"__annotations__": {"type": Literal[name], "note": Optional[str]},
+                 "type": name,
+                 "note": None},
+            )
+        )
+    return time.perf_counter() - start
+
+
+@pytest.mark.perf
+def test_batched_registration_is_faster():
+    unbatched = _register_types("PerfUnbatched")
+
+    # The single deferred rebuild happens when the block exits.
+    start = time.perf_counter()
+    with DynamicBase.batch_registration():
+        _register_types("PerfBatched")
+    batched = time.perf_counter() - start
+
+    assert batched < unbatched
+
+    holder = DynamicBase._registry["PerfBatchedHolder"]["model_cls"]
+    item = holder.model_validate(
+        {"items": [{"type": f"PerfBatchedType{NUM_TYPES - 1}"}]}
+    ).items[0]
+    assert type(item).__name__ == f"PerfBatchedType{NUM_TYPES - 1}"
@@ -0,0 +1,126 @@
+"""Latency benchmark for the shared HTTP client pool.
+
+Sends chat-completion-sized requests to a local mock server, first with a
+new ``httpx.Client`` per request (as providers used to) and then through
+``HttpClientMixin``, and reports p50/p99 latency and throughput for both.
+The mock server speaks plain HTTP, so the saving measured here is the TCP
+handshake and the cost of building a client (notably its SSL context);
+against a real provider each new client also pays a TLS handshake.
+"""
+
+import asyncio
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from swarmauri_base.HttpClientMixin import HttpClientMixin, HttpClientPool
+
+NUM_REQUESTS = 300
+CONCURRENCY = 10
+RESPONSE = json.dumps(
+    {
+        "choices": [{"message": {"role": "assistant", "content": "x" * 512}}],
+        "usage": {"prompt_tokens": 12, "completion_tokens": 128},
+    }
+).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Model(HttpClientMixin):
+    http_pool = HttpClientPool()
+
+
+def _report(label, latencies, elapsed):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(
+        f"{label:<22} p50 {p50:6.2f} ms  p99 {p99:6.2f} ms  "
+        f"{len(latencies) / elapsed:7.0f} req/s"
+    )
+    return p50
+
+
+def _sync_run(url, payload, send):
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(NUM_REQUESTS):
+        t = time.perf_counter()
+        send(url, payload).raise_for_status()
+        latencies.append(time.perf_counter() - t)
+    return latencies, time.perf_counter() - start
+
+
+async def _async_run(url, payload, send):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            t = time.perf_counter()
+            (await send(url, payload)).raise_for_status()
+            latencies.append(time.perf_counter() - t)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(NUM_REQUESTS)))
+    return latencies, time.perf_counter() - start
+
+
+@pytest.mark.perf
+def test_pooled_clients_are_faster():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+    payload = {"model": "mock", "messages": [{"role": "user", "content": "hi"}]}
+    model = _Model()
+
+    def fresh(url, payload):
+        with httpx.Client(timeout=10) as client:
+            return client.post(url, json=payload)
+
+    def pooled(url, payload):
+        with model._http_client(timeout=10) as client:
+            return client.post(url, json=payload)
+
+    async def afresh(url, payload):
+        async with httpx.AsyncClient(timeout=10) as client:
+            return await client.post(url, json=payload)
+
+    async def apooled(url, payload):
+        async with model._async_http_client(timeout=10) as client:
+            return await client.post(url, json=payload)
+
+    try:
+        print(f"\n{NUM_REQUESTS} requests, async concurrency {CONCURRENCY}")
+        before = _report("sync, client per call", *_sync_run(url, payload, fresh))
+        after = _report("sync, pooled", *_sync_run(url, payload, pooled))
+        for label, send in (
+            ("async, client per call", afresh),
+            ("async, pooled", apooled),
+        ):
+            _report(label, *asyncio.run(_async_run(url, payload, send)))
+    finally:
+        model.close_http_clients()
+        server.shutdown()
+        server.server_close()
+
+    assert after < before
@@ -0,0 +1,170 @@
+"""Unit tests for ``DynamicBase`` registration batching and type resolvers."""
+
+import threading
+from typing import Literal
+
+import pytest
+from pydantic import ValidationError
+from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.DynamicBase import DynamicBase, SubclassUnion
+
+
+@ComponentBase.register_model()
+class BatchedResourceBase(ComponentBase):
+    """Base model whose subtypes are registered in the tests below."""
+
+    type: Literal["BatchedResourceBase"] = "BatchedResourceBase"
+
+
+@pytest.fixture
+def rebuild_counter(monkeypatch):
+    """Count calls to ``DynamicBase._recreate_models``."""
+    calls = []
+    original = DynamicBase._recreate_models.__func__
+
+    def counting(cls):
+        calls.append(cls)
+        return original(cls)
+
+    monkeypatch.setattr(DynamicBase, "_recreate_models", classmethod(counting))
+    return calls
+
+
+@pytest.mark.unit
+def test_registration_rebuilds_immediately(rebuild_counter):
+    """Outside a batch every registration triggers a rebuild."""
+
+    @ComponentBase.register_type(BatchedResourceBase, "UnbatchedOne")
+    class UnbatchedOne(BatchedResourceBase):
+        type: Literal["UnbatchedOne"] = "UnbatchedOne"
+
+    @ComponentBase.register_type(BatchedResourceBase, "UnbatchedTwo")
+    class UnbatchedTwo(BatchedResourceBase):
+        type: Literal["UnbatchedTwo"] = "UnbatchedTwo"
+
+    assert len(rebuild_counter) == 2
+
+
+@pytest.mark.unit
+def test_batch_registration_rebuilds_once(rebuild_counter):
+    """Nested batches coalesce all registrations into one rebuild."""
+    with DynamicBase.batch_registration():
+        with DynamicBase.batch_registration():
+
+            @ComponentBase.register_type(BatchedResourceBase, "BatchedOne")
+            class BatchedOne(BatchedResourceBase):
+                type: Literal["BatchedOne"] = "BatchedOne"
+
+        @ComponentBase.register_type(BatchedResourceBase, "BatchedTwo")
+        class BatchedTwo(BatchedResourceBase):
+            type: Literal["BatchedTwo"] = "BatchedTwo"
+
+        assert rebuild_counter == []
+
+    assert len(rebuild_counter) == 1
+    subtypes = DynamicBase._registry["BatchedResourceBase"]["subtypes"]
+    assert {"BatchedOne", "BatchedTwo"} <= set(subtypes)
+
+
+@pytest.mark.unit
+def test_batch_registration_rebuilds_on_error(rebuild_counter):
+    """The deferred rebuild still runs when the block raises."""
+    with pytest.raises(RuntimeError):
+        with DynamicBase.batch_registration():
+
+            @ComponentBase.register_type(BatchedResourceBase, "BatchedFailing")
+            class BatchedFailing(BatchedResourceBase):
+                type: Literal["BatchedFailing"] = "BatchedFailing"
+
+            raise RuntimeError("boom")
+
+    assert len(rebuild_counter) == 1
+    assert DynamicBase._batch_state.depth == 0
+
+
+@pytest.mark.unit
+def test_batch_registration_does_not_defer_other_threads(rebuild_counter):
+    """A batch open in one thread leaves registrations in others immediate."""
+
+    def register():
+        @ComponentBase.register_type(BatchedResourceBase, "OtherThreadResource")
+        class OtherThreadResource(BatchedResourceBase):
+            type: Literal["OtherThreadResource"] = "OtherThreadResource"
+
+    with DynamicBase.batch_registration():
+        thread = threading.Thread(target=register)
+        thread.start()
+        thread.join()
+        assert len(rebuild_counter) == 1
+
+    assert len(rebuild_counter) == 1
+
+
+@pytest.mark.unit
+def test_type_resolver_loads_missing_subtype(monkeypatch):
+    """An unknown discriminator tag is handed to the resolvers and retried."""
+    monkeypatch.setattr(DynamicBase, "_type_resolvers", [])
+    monkeypatch.setattr(DynamicBase, "_resolved_tags", set())
+
+    @ComponentBase.register_model()
+    class LazyHolder(ComponentBase):
+        item: SubclassUnion[BatchedResourceBase]
+        type: Literal["LazyHolder"] = "LazyHolder"
+
+    @ComponentBase.register_type(BatchedResourceBase, "EagerResource")
+    class EagerResource(BatchedResourceBase):
+        type: Literal["EagerResource"] = "EagerResource"
+
+    requested = []
+
+    def resolver(type_name):
+        requested.append(type_name)
+        if type_name != "LazyResource":
+            return False
+
+        @ComponentBase.register_type(BatchedResourceBase, "LazyResource")
+        class LazyResource(BatchedResourceBase):
+            type: Literal["LazyResource"] = "LazyResource"
+
+        return True
+
+    DynamicBase.register_type_resolver(resolver)
+
+    holder = LazyHolder.model_validate({"item": {"type": "LazyResource"}})
+    assert type(holder.item).__name__ == "LazyResource"
+    assert LazyHolder(item={"type": "LazyResource"}).item.type == "LazyResource"
+
+    with pytest.raises(ValidationError):
+        LazyHolder(item={"type": "MissingResource"})
+    assert requested == ["LazyResource", "MissingResource"]
+
+
+@pytest.mark.unit
+def test_type_resolver_retries_tags_that_failed_to_load(monkeypatch):
+    """A tag that could not be loaded is tried again by a later validation."""
+    monkeypatch.setattr(DynamicBase, "_type_resolvers", [])
+    monkeypatch.setattr(DynamicBase, "_resolved_tags", set())
+
+    @ComponentBase.register_model()
+    class LateHolder(ComponentBase):
+        item: SubclassUnion[BatchedResourceBase]
+        type: Literal["LateHolder"] = "LateHolder"
+
+    available = []
+
+    def resolver(type_name):
+        if type_name != "LateResource" or not available:
+            return False
+
+        @ComponentBase.register_type(BatchedResourceBase, "LateResource")
+        class LateResource(BatchedResourceBase):
+            type: Literal["LateResource"] = "LateResource"
+
+        return True
+
+    DynamicBase.register_type_resolver(resolver)
+
+    with pytest.raises(ValidationError):
+        LateHolder(item={"type": "LateResource"})
+    available.append(True)
+    assert LateHolder(item={"type": "LateResource"}).item.type == "LateResource"
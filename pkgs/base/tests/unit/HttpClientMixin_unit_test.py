@@ -0,0 +1,173 @@
+"""
+Unit tests for HttpClientMixin.
+
+A local HTTP/1.1 server counts the TCP connections it accepts, which shows
+whether requests made through the mixin reuse pooled connections.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from swarmauri_base.HttpClientMixin import HttpClientMixin, HttpClientPool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        data = {"path": self.path, "auth": self.headers.get("Authorization")}
+        if self.headers.get("Cookie"):
+            data["cookie"] = self.headers["Cookie"]
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        if self.path == "/login":
+            self.send_header("Set-Cookie", "session=a; Path=/")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def model():
+    class DummyModel(HttpClientMixin):
+        http_pool = HttpClientPool()
+
+    yield DummyModel()
+    DummyModel.close_http_clients()
+
+
+def _url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@pytest.mark.unit
+def test_requests_reuse_connections(server, model):
+    for _ in range(5):
+        with model._http_client(timeout=5) as client:
+            client.get(f"{_url(server)}/ping").raise_for_status()
+    assert server.connections == 1
+
+
+@pytest.mark.unit
+def test_base_url_and_headers(server, model):
+    client = model._http_client(
+        base_url=f"{_url(server)}/v1", headers={"Authorization": "Bearer a"}
+    )
+    data = client.post("/messages", json={}).json()
+    assert data == {"path": "/v1/messages", "auth": "Bearer a"}
+    data = client.get("models", headers={"Authorization": "Bearer b"}).json()
+    assert data == {"path": "/v1/models", "auth": "Bearer b"}
+
+
+@pytest.mark.unit
+def test_stream(server, model):
+    with model._http_client().stream("GET", f"{_url(server)}/s") as response:
+        assert json.loads(response.read())["path"] == "/s"
+
+
+@pytest.mark.unit
+def test_async_clients_are_per_event_loop(server, model):
+    client = model._async_http_client(base_url=_url(server))
+
+    async def fetch():
+        responses = await asyncio.gather(*(client.get("/a") for _ in range(4)))
+        async with client.stream("GET", "/b") as response:
+            await response.aread()
+        await model.aclose_http_clients()
+        return [response.status_code for response in responses]
+
+    assert asyncio.run(fetch()) == [200] * 4
+    # A second event loop gets its own client instead of a dead one.
+    assert asyncio.run(fetch()) == [200] * 4
+
+
+@pytest.mark.unit
+def test_close_http_clients(server, model):
+    client = model._http_client(base_url=_url(server))
+    client.get("/a")
+    model.close_http_clients()
+    client.get("/b")
+    assert server.connections == 2
+
+
+@pytest.mark.unit
+def test_cookies_are_not_shared_between_clients(server, model):
+    first = model._http_client(base_url=_url(server))
+    second = model._http_client(base_url=_url(server))
+    first.get("/login")
+    assert first.get("/a").json()["cookie"] == "session=a"
+    assert "cookie" not in second.get("/a").json()
+    assert server.connections == 1
+
+
+@pytest.mark.unit
+def test_close_http_clients_closes_async_transports(server, model, monkeypatch):
+    closed = []
+    original = httpx.AsyncHTTPTransport.aclose
+
+    async def aclose(transport):
+        closed.append(transport)
+        await original(transport)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "aclose", aclose)
+    client = model._async_http_client(base_url=_url(server))
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(client.get("/a"))
+        model.close_http_clients()
+        assert len(closed) == 1
+    finally:
+        loop.close()
+
+
+@pytest.mark.unit
+def test_configure_limits(model):
+    model.configure_http_pool(max_connections=7, keepalive_expiry=1.0)
+    assert model.http_pool.max_connections == 7
+    assert model.http_pool.keepalive_expiry == 1.0
+    assert model.http_pool.max_keepalive_connections == 20
+
+
+@pytest.mark.unit
+def test_views_share_one_client_per_origin(server, model, monkeypatch):
+    built = []
+
+    class CountingClient(httpx.Client):
+        def __init__(self, **kwargs):
+            built.append(self)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(httpx, "Client", CountingClient)
+    for _ in range(3):
+        model._http_client(base_url=_url(server)).get("/a").raise_for_status()
+    assert len(built) == 1
+    model.close_http_clients()
+    assert built[0].is_closed
@@ -0,0 +1,240 @@
+"""
+Unit tests for RequestSchedulerMixin.
+
+A local HTTP server accepts a fixed number of concurrent requests and
+answers the rest with 429, which exercises the scheduler's back-off.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import httpx
+import pytest
+from swarmauri_base.HttpClientMixin import HttpClientMixin, HttpClientPool
+from swarmauri_base.RequestSchedulerMixin import (
+    RequestScheduler,
+    RequestSchedulerMixin,
+    parse_duration,
+    retry_after,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        server = self.server
+        with server.lock:
+            admitted = server.active < server.capacity
+            if admitted:
+                server.active += 1
+                server.peak = max(server.peak, server.active)
+        if admitted:
+            time.sleep(0.02)
+            with server.lock:
+                server.active -= 1
+            self._reply(200, {"x-ratelimit-remaining-requests": "100"})
+        else:
+            server.rejected += 1
+            self._reply(429, {"retry-after": "0.05"})
+
+    def _reply(self, status, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.lock = threading.Lock()
+    server.capacity = 4
+    server.active = server.peak = server.rejected = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class DummyModel(RequestSchedulerMixin, HttpClientMixin):
+    http_pool: ClassVar[HttpClientPool] = HttpClientPool()
+
+
+@pytest.mark.unit
+def test_parse_duration():
+    assert parse_duration("7.5") == 7.5
+    assert parse_duration("1m30s") == 90.0
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("1h2m3.5s") == 3723.5
+    assert parse_duration("soon") is None
+    assert parse_duration(None) is None
+
+
+@pytest.mark.unit
+def test_retry_after():
+    assert retry_after(httpx.Headers({"retry-after": "3"})) == 3.0
+    assert retry_after(httpx.Headers({"retry-after-ms": "250"})) == 0.25
+    past = httpx.Headers({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert retry_after(past) == 0.0
+    assert retry_after(httpx.Headers({})) is None
+
+
+@pytest.mark.unit
+def test_results_keep_input_order():
+    async def call(item):
+        await asyncio.sleep(random.random() / 100)
+        return item * 2
+
+    scheduler = RequestScheduler(concurrency=3)
+    results = asyncio.run(scheduler.run(range(30), call))
+    assert results == [item * 2 for item in range(30)]
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.unit
+def test_concurrency_window_is_respected():
+    active = peak = 0
+
+    async def call(item):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    scheduler = RequestScheduler(concurrency=3, max_concurrency=3)
+    asyncio.run(scheduler.run(range(20), call))
+    assert peak == 3
+
+
+@pytest.mark.unit
+def test_each_run_keeps_its_own_max_concurrent():
+    active = peak = 0
+
+    async def call(item):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    model = DummyModel()
+    for max_concurrent, expected in ((8, 8), (2, 2), (6, 6)):
+        peak = 0
+        asyncio.run(model._schedule(range(20), call, max_concurrent=max_concurrent))
+        assert peak == expected
+
+
+@pytest.mark.unit
+def test_tokens_per_minute_paces_requests():
+    # 1200 tokens per minute refill 20 tokens per second: after a burst of
+    # the whole bucket each request of 10 tokens waits half a second.
+    starts = []
+
+    async def call(item):
+        starts.append(time.monotonic())
+
+    scheduler = RequestScheduler(tokens_per_minute=1200, max_concurrency=200)
+    asyncio.run(scheduler.run(range(122), call, cost=lambda item: 10))
+    assert starts[119] - starts[0] < 0.2
+    assert starts[-1] - starts[0] >= 0.9
+
+
+@pytest.mark.unit
+def test_throttled_requests_back_off_and_retry(server):
+    model = DummyModel()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    async def run():
+        client = model._async_http_client()
+
+        async def call(item):
+            response = await client.post(url, json={"item": item})
+            response.raise_for_status()
+            return item
+
+        try:
+            return await model._schedule(range(40), call, max_concurrent=16)
+        finally:
+            await model.aclose_http_clients()
+
+    assert asyncio.run(run()) == list(range(40))
+    scheduler = model.request_scheduler()
+    assert server.rejected > 0
+    assert scheduler.throttled == server.rejected
+    assert scheduler.retried > 0
+    assert scheduler.concurrency < 16
+
+
+@pytest.mark.unit
+def test_throttled_requests_are_retried_by_the_scheduler_only(server):
+    from swarmauri_base.RetryPolicyMixin import RetryPolicy
+
+    model = DummyModel()
+    policy = RetryPolicy(max_retries=3, base_delay=0.0, failure_threshold=None)
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    async def run():
+        client = model._async_http_client()
+
+        async def send(item):
+            response = await client.post(url, json={"item": item})
+            response.raise_for_status()
+            return item
+
+        async def call(item):
+            return await policy.acall(lambda: send(item), "127.0.0.1")
+
+        try:
+            return await model._schedule(range(40), call, max_concurrent=16)
+        finally:
+            await model.aclose_http_clients()
+
+    assert asyncio.run(run()) == list(range(40))
+    assert server.rejected > 0
+    assert model.request_scheduler().retried == server.rejected
+    assert policy.retries == 0
+
+
+@pytest.mark.unit
+def test_exhausted_quota_pauses_admission():
+    scheduler = RequestScheduler(requests_per_minute=100)
+    response = httpx.Response(
+        200,
+        headers={
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "200ms",
+        },
+    )
+    scheduler.observe(response)
+    assert scheduler.requests.level == 0
+    delay = scheduler._admission_delay(0)
+    assert 0.1 < delay <= 0.2
+
+
+@pytest.mark.unit
+def test_estimate_tokens():
+    class Message:
+        def __init__(self, content):
+            self.content = content
+
+    class Conversation:
+        history = [
+            Message("x" * 40),
+            Message([{"type": "text", "text": "y" * 8}, {"type": "image_url"}]),
+        ]
+
+    assert DummyModel()._estimate_tokens(Conversation(), max_tokens=100) == 112
@@ -0,0 +1,69 @@
+import time
+
+import pytest
+from swarmauri_base.ResponseCacheMixin import ResponseCache, ResponseCacheMixin
+
+
+class DummyModel(ResponseCacheMixin):
+    type: str = "DummyModel"
+    name: str = "dummy-1"
+
+
+@pytest.mark.unit
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+@pytest.mark.unit
+def test_entries_expire_after_ttl():
+    cache = ResponseCache(ttl=0.05)
+    cache.set("a", {"content": "x"})
+    assert cache.get("a") == {"content": "x"}
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+
+@pytest.mark.unit
+def test_disk_tier_is_shared_and_bounded(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    first = ResponseCache(path=path, max_disk_entries=3)
+    for i in range(5):
+        first.set(f"k{i}", {"i": i})
+    assert len(first) == 3
+    first.close()
+
+    second = ResponseCache(path=path)
+    assert second.get("k4") == {"i": 4}
+    assert second.get("k0") is None
+    second.clear()
+    assert len(second) == 0
+    second.close()
+
+
+@pytest.mark.unit
+def test_cache_key_is_stable_and_request_specific():
+    model = DummyModel()
+    request = {"messages": [{"role": "user", "content": "hi"}], "params": {"a": 1}}
+    reordered = {"params": {"a": 1}, "messages": [{"content": "hi", "role": "user"}]}
+    assert model._response_cache_key(request) == model._response_cache_key(reordered)
+    other = DummyModel(name="dummy-2")
+    assert model._response_cache_key(request) != other._response_cache_key(request)
+
+
+@pytest.mark.unit
+def test_sampled_responses_are_cached_only_when_forced():
+    model = DummyModel(response_cache=ResponseCache())
+    assert model._cacheable(0.0)
+    assert not model._cacheable(0.7)
+    model.cache_sampled_responses = True
+    assert model._cacheable(0.7)
+    assert not DummyModel()._cacheable(0.0)
+    assert "response_cache" not in model.model_dump()
@@ -0,0 +1,131 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from swarmauri_base.HttpClientMixin import _timeout_override
+from swarmauri_base.RetryPolicyMixin import (
+    CircuitOpenError,
+    RetryPolicy,
+    RetryPolicyMixin,
+)
+
+
+class DummyModel(RetryPolicyMixin):
+    type: str = "DummyModel"
+    base_url: str = "https://api.example.com/v1"
+
+
+def _status_error(status, headers=None):
+    request = httpx.Request("POST", "https://api.example.com/v1/chat")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def _failing(*errors, result="ok"):
+    remaining = list(errors)
+
+    def fn():
+        if remaining:
+            raise remaining.pop(0)
+        return result
+
+    return fn
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(time, "sleep", delays.append)
+    return delays
+
+
+@pytest.mark.unit
+def test_retries_honour_retry_after_then_succeed(sleeps):
+    policy = RetryPolicy(base_delay=0.5)
+    fn = _failing(_status_error(429, {"retry-after": "7"}), _status_error(503))
+    assert policy.call(fn, "host") == "ok"
+    assert sleeps[0] == 7
+    assert 0.5 <= sleeps[1] <= 4.5
+    assert (policy.attempts, policy.retries, policy.successes) == (3, 2, 1)
+
+
+@pytest.mark.unit
+def test_other_errors_are_raised_unchanged(sleeps):
+    policy = RetryPolicy()
+    error = _status_error(400)
+    with pytest.raises(httpx.HTTPStatusError) as raised:
+        policy.call(_failing(error), "host")
+    assert raised.value is error
+    assert sleeps == []
+    assert policy.failures == 1
+
+
+@pytest.mark.unit
+def test_wrapped_transport_errors_are_retried(sleeps):
+    def fn():
+        try:
+            raise httpx.ReadTimeout("slow")
+        except httpx.HTTPError as e:
+            raise ValueError("provider failed") from e
+
+    policy = RetryPolicy(max_retries=2, failure_threshold=None)
+    with pytest.raises(ValueError):
+        policy.call(fn, "host")
+    assert policy.retries == 2
+    assert all(delay <= policy.max_delay for delay in sleeps)
+
+
+@pytest.mark.unit
+def test_retry_budget_limits_retries_per_host(sleeps):
+    policy = RetryPolicy(budget_min_retries=1, budget_ratio=0.0)
+    policy.call(_failing(_status_error(500)), "host")
+    with pytest.raises(httpx.HTTPStatusError):
+        policy.call(_failing(_status_error(500)), "host")
+    assert policy.budget_exhausted == 1
+    assert policy.call(_failing(_status_error(500)), "other") == "ok"
+
+
+@pytest.mark.unit
+def test_circuit_opens_fails_fast_and_recovers_after_a_probe(sleeps):
+    policy = RetryPolicy(max_retries=0, failure_threshold=2, recovery_time=0.05)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            policy.call(_failing(httpx.ConnectError("down")), "host")
+    assert policy.circuit_state("host") == "open"
+    with pytest.raises(CircuitOpenError):
+        policy.call(_failing(), "host")
+    assert policy.short_circuited == 1
+    assert policy.circuit_state("other") == "closed"
+
+    asyncio.run(asyncio.sleep(0.06))
+    with pytest.raises(httpx.ConnectError):
+        policy.call(_failing(httpx.ConnectError("still down")), "host")
+    assert policy.circuit_state("host") == "open"
+    asyncio.run(asyncio.sleep(0.06))
+    assert policy.call(_failing(), "host") == "ok"
+    assert policy.circuit_state("host") == "closed"
+    assert policy.circuits_opened == 2
+
+
+@pytest.mark.unit
+def test_async_calls_apply_the_policy_timeouts():
+    policy = RetryPolicy(base_delay=0.0, connect_timeout=2.0, read_timeout=30.0)
+    seen = []
+
+    async def fn():
+        seen.append(_timeout_override.get())
+        if len(seen) == 1:
+            raise httpx.ConnectTimeout("slow")
+        return "ok"
+
+    assert asyncio.run(policy.acall(fn, "host")) == "ok"
+    assert seen[0].connect == 2.0 and seen[0].read == 30.0
+    assert _timeout_override.get() is None
+
+
+@pytest.mark.unit
+def test_models_retry_per_host_and_keep_the_policy_out_of_dumps():
+    model = DummyModel(retry_policy=RetryPolicy())
+    assert model._retry_host() == "api.example.com"
+    assert "retry_policy" not in model.model_dump()
@@ -0,0 +1,152 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+import pytest
+from pydantic import SecretStr
+from swarmauri_base.SingleFlightMixin import SingleFlight, SingleFlightMixin
+
+
+class DummyModel(SingleFlightMixin):
+    type: str = "DummyModel"
+    name: str = "dummy-1"
+    BASE_URL: str = "https://api.example/v1"
+    api_key: Optional[SecretStr] = None
+
+
+@pytest.mark.unit
+def test_concurrent_threads_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return "result"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", fetch)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert (flight.calls, flight.deduplicated, flight.in_flight) == (5, 4, 0)
+
+
+@pytest.mark.unit
+def test_concurrent_tasks_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.ado("k", fetch) for _ in range(4)), flight.ado("other", fetch)
+        )
+
+    assert asyncio.run(main()) == ["result"] * 5
+    assert len(calls) == 2
+    assert flight.deduplicated == 3
+    assert flight.in_flight == 0
+
+
+@pytest.mark.unit
+def test_errors_reach_every_waiter_and_are_not_kept():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream")
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.ado("k", fail) for _ in range(3)), return_exceptions=True
+        )
+
+    errors = asyncio.run(main())
+    assert all(isinstance(e, ValueError) for e in errors)
+    assert flight.do("k", lambda: 1) == 1
+
+
+@pytest.mark.unit
+def test_cancelled_leader_hands_the_call_to_a_waiter():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.ado("k", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.ado("k", fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        return leader.cancelled(), results
+
+    assert asyncio.run(main()) == (True, ["result"] * 3)
+    assert len(calls) == 2
+    assert flight.in_flight == 0
+
+
+@pytest.mark.unit
+def test_abandoned_thread_call_is_made_again():
+    flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def interrupted():
+        calls.append(1)
+        started.set()
+        time.sleep(0.05)
+        raise KeyboardInterrupt
+
+    def leader():
+        try:
+            flight.do("k", interrupted)
+        except KeyboardInterrupt:
+            pass
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    started.wait()
+    assert flight.do("k", lambda: calls.append(2) or "result") == "result"
+    thread.join()
+    assert calls == [1, 2]
+
+
+@pytest.mark.unit
+def test_sampled_requests_are_coalesced_only_when_opted_in():
+    model = DummyModel(coalesce=True)
+    request = {"messages": [{"role": "user", "content": "hi"}]}
+    assert model._coalescable(0.0)
+    assert not model._coalescable(0.7)
+    model.coalesce_sampled = True
+    assert model._coalescable(0.7)
+    assert not DummyModel()._coalescable(0.0)
+
+
+@pytest.mark.unit
+def test_fingerprint_covers_model_endpoint_and_credential():
+    request = {"messages": [{"role": "user", "content": "hi"}]}
+    fingerprint = DummyModel()._request_fingerprint(request)
+    assert DummyModel()._request_fingerprint(request) == fingerprint
+    for other in (
+        DummyModel(name="dummy-2"),
+        DummyModel(BASE_URL="https://other.example/v1"),
+        DummyModel(api_key=SecretStr("sk-other")),
+    ):
+        assert other._request_fingerprint(request) != fingerprint
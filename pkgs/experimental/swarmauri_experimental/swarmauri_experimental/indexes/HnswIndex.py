@@ -0,0 +1,606 @@
+import copy
+import heapq
+import json
+import math
+import os
+import random
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from swarmauri_experimental.indexes.IndexBase import IndexBase, _as_array
+
+METRICS = ("l2", "cosine", "ip")
+
+DistanceFunction = Callable[[np.ndarray, np.ndarray], float]
+
+
+class HnswIndex(IndexBase):
+    """
+    Hierarchical Navigable Small World (HNSW) graph index over dense vectors,
+    implemented with NumPy.
+
+    Every vector is a node in a stack of proximity graphs: all nodes live on
+    layer 0, and each node also appears on the layers above it up to a level
+    drawn from an exponential distribution. A search descends greedily from
+    the single entry point on the top layer and runs a best-first search of
+    width ``ef_search`` on layer 0, so it visits a number of nodes that grows
+    roughly logarithmically with the size of the index.
+
+    Items are ``(key, vector)`` pairs (see ``IndexBase``). Vectors may be
+    lists, NumPy arrays or ``Vector`` objects.
+
+    Deleting an item only marks it as removed (a tombstone): it keeps routing
+    searches but is never returned. ``rebuild`` compacts the graph without
+    the tombstones.
+
+    Parameters:
+    - M: Number of links per node on the upper layers; layer 0 keeps ``2 * M``.
+    - ef_construction: Width of the candidate list used when inserting.
+    - ef_search: Width of the candidate list used when querying.
+    - metric: ``"l2"``, ``"cosine"`` or ``"ip"`` (negative inner product).
+    - dimension: Vector dimension; taken from the first vector if omitted.
+    - seed: Seed of the level generator, for reproducible graphs.
+    - wal_path: File that ``flush_write_ahead_log`` appends records to.
+    """
+
+    def __init__(
+        self,
+        M: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 50,
+        metric: Union[str, DistanceFunction] = "l2",
+        dimension: Optional[int] = None,
+        seed: Optional[int] = None,
+        wal_path: Optional[str] = None,
+    ):
+        if M < 2:
+            raise ValueError("M must be at least 2")
+        super().__init__(wal_path=wal_path)
+        self.M = M
+        self.max_links0 = 2 * M
+        self.ef_construction = max(ef_construction, M)
+        self.ef_search = ef_search
+        self.dimension = dimension
+        self.seed = seed
+        self._level_multiplier = 1 / math.log(M)
+        self._random = random.Random(seed)
+        self._metric: Optional[str] = None
+        self._distance_fn: Optional[DistanceFunction] = None
+        self._set_metric(metric)
+        self._reset()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+    def _reset(self) -> None:
+        self._vectors = np.zeros((0, self.dimension or 0), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._count = 0
+        self._keys: List[Hashable] = []
+        self._nodes: Dict[Hashable, int] = {}
+        self._levels: List[int] = []
+        # _links[node][layer] lists the neighbours of node on that layer.
+        self._links: List[List[List[int]]] = []
+        self._deleted: set = set()
+        self._entry_point: Optional[int] = None
+        self._max_level = -1
+        self._stats = {"searches": 0, "inserts": 0, "distance_computations": 0}
+
+    def _ensure_capacity(self, count: int) -> None:
+        capacity = len(self._vectors)
+        if count <= capacity:
+            return
+        capacity = max(count, 2 * capacity, 1024)
+        vectors = np.zeros((capacity, self.dimension), dtype=np.float32)
+        vectors[: self._count] = self._vectors[: self._count]
+        norms = np.zeros(capacity, dtype=np.float32)
+        norms[: self._count] = self._norms[: self._count]
+        self._vectors, self._norms = vectors, norms
+
+    def _check_dimension(self, vector: np.ndarray) -> None:
+        if self.dimension is None:
+            self.dimension = len(vector)
+            self._vectors = np.zeros((0, self.dimension), dtype=np.float32)
+        elif len(vector) != self.dimension:
+            raise ValueError(
+                f"Expected a vector of dimension {self.dimension}, got {len(vector)}"
+            )
+
+    # ------------------------------------------------------------------
+    # Distances
+    # ------------------------------------------------------------------
+    def _set_metric(self, metric: Union[str, DistanceFunction]) -> None:
+        if callable(metric):
+            self._metric, self._distance_fn = None, metric
+        elif metric in METRICS:
+            self._metric, self._distance_fn = metric, None
+        else:
+            raise ValueError(
+                f"Unknown metric '{metric}'; expected one of {METRICS} or a callable"
+            )
+
+    def _distances(self, query: np.ndarray, nodes: List[int]) -> np.ndarray:
+        """
+        Distances from ``query`` to each of ``nodes``, in one NumPy operation
+        for the built-in metrics. For ``"l2"`` these are squared distances,
+        which order the nodes the same way; see ``_output_distance``.
+        """
+        self._stats["distance_computations"] += len(nodes)
+        vectors = self._vectors[nodes]
+        if self._metric == "l2":
+            diff = vectors - query
+            return np.einsum("ij,ij->i", diff, diff)
+        if self._metric == "cosine":
+            # Stored vectors and queries are unit length (see ``_prepare``).
+            return 1.0 - vectors @ query
+        if self._metric == "ip":
+            return -(vectors @ query)
+        return np.fromiter(
+            (self._distance_fn(query, vector) for vector in vectors),
+            dtype=np.float64,
+            count=len(nodes),
+        )
+
+    def _pairwise(self, nodes: List[int]) -> np.ndarray:
+        """
+        Matrix of the distances between every two of ``nodes``, on the same
+        scale as ``_distances``.
+        """
+        self._stats["distance_computations"] += len(nodes) * len(nodes)
+        if self._distance_fn is not None:
+            vectors = self._vectors
+            return np.array(
+                [
+                    [self._distance_fn(vectors[a], vectors[b]) for b in nodes]
+                    for a in nodes
+                ]
+            )
+        vectors = self._vectors[nodes]
+        products = vectors @ vectors.T
+        if self._metric == "l2":
+            squared = np.einsum("ij,ij->i", vectors, vectors)
+            return np.maximum(squared[:, None] + squared[None, :] - 2 * products, 0)
+        if self._metric == "cosine":
+            return 1.0 - products
+        return -products
+
+    def _prepare(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Scales ``vector`` to unit length for the cosine metric, so a cosine
+        distance is one dot product. Zero vectors stay zero and are at
+        distance 1 from everything, as with ``CosineDistance``.
+        """
+        if self._metric != "cosine":
+            return vector
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def _stored_vector(self, node: int) -> np.ndarray:
+        """
+        Returns a copy of the vector inserted as ``node``.
+        """
+        if self._metric == "cosine":
+            return self._vectors[node] * self._norms[node]
+        return self._vectors[node].copy()
+
+    def _output_distance(self, distance: float) -> float:
+        return math.sqrt(distance) if self._metric == "l2" else distance
+
+    def _distance(self, a: np.ndarray, b: np.ndarray) -> float:
+        if self._distance_fn is not None:
+            return float(self._distance_fn(a, b))
+        if self._metric == "l2":
+            return float(np.linalg.norm(a - b))
+        if self._metric == "cosine":
+            denominator = float(np.linalg.norm(a) * np.linalg.norm(b))
+            return 1.0 - (float(a @ b) / denominator if denominator else 0.0)
+        return -float(a @ b)
+
+    # ------------------------------------------------------------------
+    # Graph construction and search
+    # ------------------------------------------------------------------
+    def _random_level(self) -> int:
+        return int(-math.log(1.0 - self._random.random()) * self._level_multiplier)
+
+    def _search_layer(
+        self,
+        query: np.ndarray,
+        entry_points: List[Tuple[float, int]],
+        ef: int,
+        layer: int,
+        skip_deleted: bool = False,
+    ) -> List[Tuple[float, int]]:
+        """
+        Best-first search of ``layer`` from ``entry_points`` (``(distance,
+        node)`` pairs). Returns up to ``ef`` ``(distance, node)`` pairs sorted
+        by distance. With ``skip_deleted`` tombstones are traversed but left
+        out of the results.
+        """
+        visited = {node for _, node in entry_points}
+        candidates = list(entry_points)
+        heapq.heapify(candidates)
+        # Max-heap of the best results so far, by negated distance.
+        results = [
+            (-distance, node)
+            for distance, node in entry_points
+            if not (skip_deleted and node in self._deleted)
+        ]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        links = self._links
+        while candidates:
+            distance, node = heapq.heappop(candidates)
+            if len(results) >= ef and distance > -results[0][0]:
+                break
+            neighbours = [n for n in links[node][layer] if n not in visited]
+            if not neighbours:
+                continue
+            visited.update(neighbours)
+            bound = -results[0][0] if len(results) >= ef else math.inf
+            for neighbour_distance, neighbour in zip(
+                self._distances(query, neighbours).tolist(), neighbours
+            ):
+                if neighbour_distance >= bound:
+                    continue
+                heapq.heappush(candidates, (neighbour_distance, neighbour))
+                if skip_deleted and neighbour in self._deleted:
+                    continue
+                heapq.heappush(results, (-neighbour_distance, neighbour))
+                if len(results) > ef:
+                    heapq.heappop(results)
+                if len(results) >= ef:
+                    bound = -results[0][0]
+        return sorted((-negated, node) for negated, node in results)
+
+    def _select_neighbours(
+        self, candidates: List[Tuple[float, int]], limit: int
+    ) -> List[int]:
+        """
+        Neighbour selection heuristic: a candidate is kept only if it is
+        closer to the base element than to every neighbour kept before it,
+        which spreads the links in different directions.
+        """
+        if len(candidates) <= limit:
+            return [node for _, node in candidates]
+        pairwise = self._pairwise([node for _, node in candidates]).tolist()
+        selected: List[int] = []
+        for i, (distance, _) in enumerate(candidates):
+            row = pairwise[i]
+            if any(row[j] < distance for j in selected):
+                continue
+            selected.append(i)
+            if len(selected) == limit:
+                break
+        return [candidates[i][1] for i in selected]
+
+    def _connect(self, node: int, neighbours: List[int], layer: int) -> None:
+        limit = self.max_links0 if layer == 0 else self.M
+        self._links[node][layer] = neighbours
+        for neighbour in neighbours:
+            links = self._links[neighbour][layer]
+            links.append(node)
+            if len(links) > limit:
+                distances = self._distances(self._vectors[neighbour], links).tolist()
+                self._links[neighbour][layer] = self._select_neighbours(
+                    sorted(zip(distances, links)), limit
+                )
+
+    def _insert_vector(self, key: Hashable, vector: np.ndarray) -> int:
+        node = self._count
+        self._ensure_capacity(node + 1)
+        self._vectors[node] = self._prepare(vector)
+        self._norms[node] = np.linalg.norm(vector)
+        self._count += 1
+        self._keys.append(key)
+        self._nodes[key] = node
+        level = self._random_level()
+        self._levels.append(level)
+        self._links.append([[] for _ in range(level + 1)])
+        self._stats["inserts"] += 1
+
+        if self._entry_point is None:
+            self._entry_point, self._max_level = node, level
+            return node
+
+        query = self._vectors[node]
+        entry = self._entry_point
+        nearest = [(float(self._distances(query, [entry])[0]), entry)]
+        for layer in range(self._max_level, level, -1):
+            nearest = self._search_layer(query, nearest, 1, layer)
+        for layer in range(min(level, self._max_level), -1, -1):
+            nearest = self._search_layer(query, nearest, self.ef_construction, layer)
+            self._connect(node, self._select_neighbours(nearest, self.M), layer)
+
+        if level > self._max_level:
+            self._entry_point, self._max_level = node, level
+        return node
+
+    def _search(
+        self, query: Any, k: int, ef: Optional[int] = None
+    ) -> List[Tuple[float, int]]:
+        if self._entry_point is None or k <= 0:
+            return []
+        query = _as_array(query)
+        self._check_dimension(query)
+        query = self._prepare(query)
+        self._stats["searches"] += 1
+        entry = self._entry_point
+        nearest = [(float(self._distances(query, [entry])[0]), entry)]
+        for layer in range(self._max_level, 0, -1):
+            nearest = self._search_layer(query, nearest, 1, layer)
+        ef = max(ef or self.ef_search, k)
+        return self._search_layer(query, nearest, ef, 0, skip_deleted=True)[:k]
+
+    # ------------------------------------------------------------------
+    # Items
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._count - len(self._deleted)
+
+    def _is_deleted(self, node: int) -> bool:
+        return node in self._deleted
+
+    def get_vector(self, key: Hashable) -> np.ndarray:
+        """
+        Returns a copy of the vector stored under ``key``.
+        """
+        return self._stored_vector(self._node(key))
+
+    # ------------------------------------------------------------------
+    # Core build & modify
+    # ------------------------------------------------------------------
+    def insert(self, item: Any) -> None:
+        key, vector = self._split_item(item)
+        self._check_dimension(vector)
+        if key in self:
+            raise KeyError(f"Item '{key}' is already in the index")
+        self._insert_vector(key, vector)
+
+    def delete(self, item: Any) -> None:
+        self._deleted.add(self._node(item))
+
+    def clear(self) -> None:
+        self._reset()
+        self._cache.clear()
+
+    def batch_insert(self, items: Iterable[Any]) -> None:
+        items = list(items)
+        if items and self.dimension is not None:
+            self._ensure_capacity(self._count + len(items))
+        for item in items:
+            self.insert(item)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def knn_search(
+        self, query: Any, k: int, ef: Optional[int] = None
+    ) -> List[Tuple[Any, float]]:
+        """
+        Approximate k nearest neighbours of ``query`` as ``(key, distance)``
+        pairs. ``ef`` overrides ``ef_search`` for this query; it is raised to
+        ``k`` if smaller.
+        """
+        return [
+            (self._keys[node], self._output_distance(d))
+            for d, node in self._search(query, k, ef)
+        ]
+
+    # ------------------------------------------------------------------
+    # Distance function management
+    # ------------------------------------------------------------------
+    def set_distance_function(
+        self, distance_fn: Union[str, DistanceFunction]
+    ) -> None:
+        """
+        Sets the metric to one of ``"l2"``, ``"cosine"``, ``"ip"``, or a
+        callable taking two NumPy vectors. Custom callables are evaluated one
+        pair at a time and are much slower than the built-in metrics. The
+        graph depends on the metric, so a non-empty index is rebuilt.
+        """
+        live = list(self.items())
+        self._set_metric(distance_fn)
+        if self._count:
+            self._reset()
+            self.batch_insert(live)
+
+    def get_distance_function(self) -> DistanceFunction:
+        return self._distance_fn or self._distance
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def rebuild(self) -> None:
+        """
+        Rebuilds the graph from the live items, dropping tombstones.
+        """
+        live = list(self.items())
+        self._reset()
+        self.batch_insert(live)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, filepath: str, index_id: Optional[str] = None) -> None:
+        """
+        Saves the vectors, graph and settings to a single ``.npz`` file.
+
+        Keys must be JSON serializable. With a custom distance function only
+        the graph is saved; the function has to be set again before loading.
+        """
+        count = self._count
+        links = [layer for node_links in self._links for layer in node_links]
+        link_counts = np.fromiter((len(layer) for layer in links), dtype=np.int64)
+        link_data = np.fromiter(
+            (n for layer in links for n in layer),
+            dtype=np.int64,
+            count=int(link_counts.sum()),
+        )
+        header = {
+            "index_id": index_id,
+            "M": self.M,
+            "ef_construction": self.ef_construction,
+            "ef_search": self.ef_search,
+            "metric": self._metric,
+            "dimension": self.dimension,
+            "entry_point": self._entry_point,
+            "max_level": self._max_level,
+            "keys": self._keys,
+        }
+        directory = os.path.dirname(os.path.abspath(filepath))
+        os.makedirs(directory, exist_ok=True)
+        with open(filepath, "wb") as f:
+            np.savez(
+                f,
+                header=np.array(json.dumps(header)),
+                vectors=self._vectors[:count],
+                norms=self._norms[:count],
+                levels=np.asarray(self._levels, dtype=np.int64),
+                link_counts=link_counts,
+                link_data=link_data,
+                deleted=np.fromiter(sorted(self._deleted), dtype=np.int64),
+            )
+
+    def load(self, filepath: str, index_id: Optional[str] = None) -> None:
+        with np.load(filepath, allow_pickle=False) as data:
+            header = json.loads(str(data["header"]))
+            self._check_index_id(filepath, header, index_id)
+            if header["metric"] is None and self._distance_fn is None:
+                raise ValueError(
+                    f"'{filepath}' was built with a custom distance function; "
+                    "set it with set_distance_function before loading"
+                )
+            vectors = data["vectors"]
+            norms = data["norms"]
+            levels = data["levels"].tolist()
+            link_counts = data["link_counts"]
+            link_data = data["link_data"].tolist()
+            deleted = data["deleted"].tolist()
+
+        self.M = header["M"]
+        self.max_links0 = 2 * self.M
+        self.ef_construction = header["ef_construction"]
+        self.ef_search = header["ef_search"]
+        self._level_multiplier = 1 / math.log(self.M)
+        if header["metric"] is not None:
+            self._set_metric(header["metric"])
+        self.dimension = header["dimension"]
+        self._reset()
+
+        count = len(levels)
+        self._ensure_capacity(count)
+        self._vectors[:count] = vectors
+        self._norms[:count] = norms
+        self._count = count
+        self._keys = [
+            tuple(key) if isinstance(key, list) else key for key in header["keys"]
+        ]
+        # A key inserted again after a delete maps to its newest node.
+        self._nodes = {key: node for node, key in enumerate(self._keys)}
+        self._levels = levels
+        offsets = np.concatenate(([0], np.cumsum(link_counts))).tolist()
+        position = 0
+        for level in levels:
+            node_links = []
+            for _ in range(level + 1):
+                node_links.append(link_data[offsets[position] : offsets[position + 1]])
+                position += 1
+            self._links.append(node_links)
+        self._deleted = set(deleted)
+        self._entry_point = header["entry_point"]
+        self._max_level = header["max_level"]
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+    def info(self) -> Dict[str, Any]:
+        links = sum(len(layer) for node_links in self._links for layer in node_links)
+        return {
+            "type": type(self).__name__,
+            "metric": self._metric or "custom",
+            "dimension": self.dimension,
+            "M": self.M,
+            "ef_construction": self.ef_construction,
+            "ef_search": self.ef_search,
+            "size": len(self),
+            "nodes": self._count,
+            "deleted": len(self._deleted),
+            "max_level": self._max_level,
+            "links": links,
+            "vector_bytes": int(self._vectors[: self._count].nbytes),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        searches = stats["searches"] + stats["inserts"]
+        stats["distance_computations_per_operation"] = (
+            stats["distance_computations"] / searches if searches else 0.0
+        )
+        return stats
+
+    def items(self) -> Iterable[Tuple[Any, np.ndarray]]:
+        for node in range(self._count):
+            if node not in self._deleted:
+                yield self._keys[node], self._stored_vector(node)
+
+    # ------------------------------------------------------------------
+    # Sharding & recovery
+    # ------------------------------------------------------------------
+    def _empty_copy(self) -> "HnswIndex":
+        return HnswIndex(
+            M=self.M,
+            ef_construction=self.ef_construction,
+            ef_search=self.ef_search,
+            metric=self._metric or self._distance_fn,
+            dimension=self.dimension,
+            seed=self.seed,
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a copy of the index state that ``restore`` accepts.
+        """
+        return {
+            "dimension": self.dimension,
+            "vectors": self._vectors[: self._count].copy(),
+            "norms": self._norms[: self._count].copy(),
+            "count": self._count,
+            "keys": list(self._keys),
+            "nodes": dict(self._nodes),
+            "levels": list(self._levels),
+            "links": copy.deepcopy(self._links),
+            "deleted": set(self._deleted),
+            "entry_point": self._entry_point,
+            "max_level": self._max_level,
+        }
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Restores the state captured by ``snapshot``.
+        """
+        state = snapshot
+        self.dimension = state["dimension"]
+        self._vectors = state["vectors"].copy()
+        self._norms = state["norms"].copy()
+        self._count = state["count"]
+        self._keys = list(state["keys"])
+        self._nodes = dict(state["nodes"])
+        self._levels = list(state["levels"])
+        self._links = copy.deepcopy(state["links"])
+        self._deleted = set(state["deleted"])
+        self._entry_point = state["entry_point"]
+        self._max_level = state["max_level"]
+        self._cache.clear()
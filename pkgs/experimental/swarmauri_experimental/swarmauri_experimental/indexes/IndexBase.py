@@ -0,0 +1,339 @@
+import json
+import os
+import threading
+from abc import abstractmethod
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from swarmauri_experimental.indexes.IIndex import IIndex
+
+
+def _as_array(vector: Any) -> np.ndarray:
+    """
+    Converts a ``Vector``, NumPy array or list of floats to a flat
+    ``float32`` array.
+    """
+    if hasattr(vector, "to_numpy"):
+        vector = vector.to_numpy()
+    elif hasattr(vector, "value"):
+        vector = vector.value
+    return np.asarray(vector, dtype=np.float32).reshape(-1)
+
+
+class UnsupportedIndexFeatureError(NotImplementedError):
+    """
+    Raised when an ``IIndex`` operation names a storage feature that an index
+    does not provide, such as LSM trees.
+    """
+
+
+class _ReadWriteLock:
+    """
+    A lock that admits many readers or a single writer.
+
+    Each thread remembers which kind of lock it holds, so ``release`` does
+    not need to be told.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._held = threading.local()
+
+    def acquire_read(self) -> None:
+        with self._condition:
+            while self._writer:
+                self._condition.wait()
+            self._readers += 1
+        self._held.__dict__.setdefault("stack", []).append("read")
+
+    def acquire_write(self) -> None:
+        with self._condition:
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._writer = True
+        self._held.__dict__.setdefault("stack", []).append("write")
+
+    def release(self) -> None:
+        stack = self._held.__dict__.get("stack")
+        if not stack:
+            raise RuntimeError("release_lock() called without holding a lock")
+        kind = stack.pop()
+        with self._condition:
+            if kind == "write":
+                self._writer = False
+            else:
+                self._readers -= 1
+            self._condition.notify_all()
+
+
+class IndexBase(IIndex):
+    """
+    Shared implementation of the ``IIndex`` operations that do not depend on
+    how an in-memory vector index is organised.
+
+    Items are ``(key, vector)`` pairs; a bare vector is keyed by its node
+    number. Queries return ``(key, distance)`` pairs. Subclasses keep
+    ``_keys`` (node -> key) and ``_nodes`` (key -> newest node), and
+    implement ``_is_deleted``, ``snapshot``/``restore`` and ``_empty_copy``.
+
+    The index does not lock on its own; callers sharing it between threads
+    coordinate with ``acquire_read_lock``/``acquire_write_lock`` and
+    ``release_lock``.
+
+    Indexes built on this base are in-memory and do not support LSM trees:
+    ``enable_lsm_tree`` raises ``UnsupportedIndexFeatureError``, and
+    ``is_lsm_enabled`` is always False.
+    """
+
+    def __init__(self, wal_path: Optional[str] = None):
+        self.wal_path = wal_path
+        self._keys: List[Hashable] = []
+        self._nodes: Dict[Hashable, int] = {}
+        self._lock = _ReadWriteLock()
+        self._buffer_pool: Any = None
+        self._cache: Dict[Any, Any] = {}
+        self._wal: List[Any] = []
+        self._checkpoint: Optional[Dict[str, Any]] = None
+
+    @abstractmethod
+    def _is_deleted(self, node: int) -> bool:
+        pass
+
+    @abstractmethod
+    def _empty_copy(self) -> "IndexBase":
+        """
+        Returns an empty index with the same settings.
+        """
+        pass
+
+    @abstractmethod
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Restores the state captured by ``snapshot``.
+        """
+        pass
+
+    # ------------------------------------------------------------------
+    # Items
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _is_pair(item: Any) -> bool:
+        return (
+            isinstance(item, tuple)
+            and len(item) == 2
+            and (hasattr(item[1], "to_numpy") or np.ndim(item[1]) > 0)
+        )
+
+    def _split_item(self, item: Any) -> Tuple[Hashable, np.ndarray]:
+        if self._is_pair(item):
+            key, vector = item
+        else:
+            key, vector = len(self._keys), item
+        return key, _as_array(vector)
+
+    def _node(self, item: Any) -> int:
+        key = item[0] if self._is_pair(item) else item
+        node = self._nodes.get(key)
+        if node is None or self._is_deleted(node):
+            raise KeyError(f"Item '{key}' is not in the index")
+        return node
+
+    def __contains__(self, key: Hashable) -> bool:
+        node = self._nodes.get(key)
+        return node is not None and not self._is_deleted(node)
+
+    def size(self) -> int:
+        return len(self)
+
+    # ------------------------------------------------------------------
+    # Build & modify
+    # ------------------------------------------------------------------
+    def build_index(self, data: Iterable[Any]) -> None:
+        self.clear()
+        self.batch_insert(data)
+
+    def update(self, old_item: Any, new_item: Any) -> None:
+        self.delete(old_item)
+        self.insert(new_item)
+
+    def batch_delete(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.delete(item)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def nearest_neighbor(self, query: Any) -> Tuple[Any, float]:
+        results = self.knn_search(query, 1)
+        if not results:
+            raise ValueError("The index is empty")
+        return results[0]
+
+    def range_search(self, query: Any, radius: float) -> List[Any]:
+        return [key for key, _ in self._range(query, radius)]
+
+    def range_count(self, query: Any, radius: float) -> int:
+        return len(self._range(query, radius))
+
+    def knn_within_radius(
+        self, query: Any, k: int, radius: float
+    ) -> List[Tuple[Any, float]]:
+        return [(key, d) for key, d in self.knn_search(query, k) if d <= radius]
+
+    def _range(self, query: Any, radius: float) -> List[Tuple[Any, float]]:
+        # Approximate indexes have no notion of a radius, so widen a k-NN
+        # search until its farthest result falls outside the radius.
+        k = 64
+        while True:
+            results = self.knn_search(query, k)
+            if len(results) < k or results[-1][1] > radius:
+                return [(key, d) for key, d in results if d <= radius]
+            k *= 2
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _check_index_id(
+        filepath: str, header: Dict[str, Any], index_id: Optional[str]
+    ) -> None:
+        if index_id is not None and header.get("index_id") != index_id:
+            raise ValueError(
+                f"'{filepath}' holds index '{header.get('index_id')}', "
+                f"not '{index_id}'"
+            )
+
+    def save_database(self, filepath: str) -> None:
+        self.save(filepath)
+
+    def load_database(self, filepath: str) -> None:
+        self.load(filepath)
+
+    def save_index(self, index_id: str, filepath: str) -> None:
+        self.save(filepath, index_id=index_id)
+
+    def load_index(self, index_id: str, filepath: str) -> None:
+        self.load(filepath, index_id=index_id)
+
+    # ------------------------------------------------------------------
+    # Concurrency
+    # ------------------------------------------------------------------
+    def acquire_read_lock(self) -> None:
+        self._lock.acquire_read()
+
+    def acquire_write_lock(self) -> None:
+        self._lock.acquire_write()
+
+    def release_lock(self) -> None:
+        self._lock.release()
+
+    # ------------------------------------------------------------------
+    # Sharding
+    # ------------------------------------------------------------------
+    def split(self, shard_key: Callable[[Any], int]) -> List["IndexBase"]:
+        """
+        Splits the live items into one index per shard id returned by
+        ``shard_key(item)``, ordered by shard id.
+        """
+        shards: Dict[int, IndexBase] = {}
+        for item in self.items():
+            shard_id = shard_key(item)
+            if shard_id not in shards:
+                shards[shard_id] = self._empty_copy()
+            shards[shard_id].insert(item)
+        return [shards[shard_id] for shard_id in sorted(shards)]
+
+    def merge(self, other: IIndex) -> None:
+        self.batch_insert(other.items())
+
+    # ------------------------------------------------------------------
+    # Recovery
+    # ------------------------------------------------------------------
+    def checkpoint(self) -> None:
+        """
+        Records the current state for ``rollback`` and drops the pending
+        write-ahead log records, which the checkpoint supersedes.
+        """
+        self._checkpoint = self.snapshot()
+        self._wal.clear()
+
+    def rollback(self) -> None:
+        """
+        Restores the state of the last ``checkpoint``.
+        """
+        if self._checkpoint is None:
+            raise RuntimeError("No checkpoint to roll back to")
+        self.restore(self._checkpoint)
+
+    def write_ahead_log(self, record: Any) -> None:
+        self._wal.append(record)
+
+    def flush_write_ahead_log(self) -> None:
+        """
+        Appends the pending records to ``wal_path`` as JSON lines. Without a
+        ``wal_path`` the records are discarded.
+        """
+        if self.wal_path and self._wal:
+            with open(self.wal_path, "a", encoding="utf-8") as f:
+                for record in self._wal:
+                    f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        self._wal.clear()
+
+    def enable_lsm_tree(self) -> None:
+        """
+        Raises ``UnsupportedIndexFeatureError``; see the class docstring.
+        """
+        raise UnsupportedIndexFeatureError(
+            f"{type(self).__name__} does not support LSM trees"
+        )
+
+    def disable_lsm_tree(self) -> None:
+        """
+        Does nothing, since LSM trees are never enabled.
+        """
+
+    def is_lsm_enabled(self) -> bool:
+        return False
+
+    def atomic_write(self, write_operation: Callable[[], None]) -> None:
+        """
+        Runs ``write_operation`` under the write lock and restores the prior
+        state if it raises.
+        """
+        self.acquire_write_lock()
+        try:
+            state = self.snapshot()
+            try:
+                write_operation()
+            except BaseException:
+                self.restore(state)
+                raise
+        finally:
+            self.release_lock()
+
+    # ------------------------------------------------------------------
+    # Buffer pool & cache
+    # ------------------------------------------------------------------
+    def get_buffer_pool(self) -> Any:
+        return self._buffer_pool
+
+    def set_buffer_pool(self, pool: Any) -> None:
+        """
+        Stores ``pool``; the index holds its data in memory and does not use
+        it itself.
+        """
+        self._buffer_pool = pool
+
+    def cache_item(self, key: Any, value: Any) -> None:
+        self._cache[key] = value
+
+    def get_cached_item(self, key: Any) -> Optional[Any]:
+        return self._cache.get(key)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
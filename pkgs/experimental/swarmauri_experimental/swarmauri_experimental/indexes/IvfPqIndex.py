@@ -0,0 +1,898 @@
+import copy
+import json
+import os
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from swarmauri_experimental.indexes.IIndex import IIndex
+from swarmauri_experimental.indexes.IndexBase import IndexBase, _as_array
+
+METRICS = ("l2", "cosine", "ip")
+
+# Rows per block when comparing many vectors with many centroids, to bound
+# the size of the temporary distance matrix.
+_BLOCK_ROWS = 16384
+
+
+def _nearest_centroids(x: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """
+    Index of the nearest (squared Euclidean) centroid of every row of ``x``.
+    """
+    squared = np.einsum("ij,ij->i", centroids, centroids)
+    assignment = np.empty(len(x), dtype=np.int64)
+    for start in range(0, len(x), _BLOCK_ROWS):
+        block = x[start : start + _BLOCK_ROWS]
+        assignment[start : start + len(block)] = np.argmin(
+            squared - 2 * block @ centroids.T, axis=1
+        )
+    return assignment
+
+
+def _kmeans(
+    x: np.ndarray, k: int, iterations: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Lloyd's k-means with ``min(k, len(x))`` centroids initialised from
+    distinct rows of ``x``. Empty clusters are re-seeded with random rows.
+    """
+    k = min(k, len(x))
+    centroids = x[rng.choice(len(x), k, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = _nearest_centroids(x, centroids)
+        counts = np.bincount(assignment, minlength=k)
+        order = np.argsort(assignment, kind="stable")
+        filled = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)))[filled]
+        sums = np.add.reduceat(x[order], starts, axis=0)
+        centroids[filled] = sums / counts[filled, None]
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            centroids[empty] = x[rng.choice(len(x), len(empty), replace=False)]
+    return centroids
+
+
+class IvfPqIndex(IndexBase):
+    """
+    Inverted-file index with product quantization (IVF-PQ) over dense
+    vectors, implemented with NumPy.
+
+    A coarse k-means quantizer splits the space into ``nlist`` cells, and
+    every vector is stored in the inverted list of its nearest cell. The
+    residual between the vector and the cell centroid is cut into ``m``
+    sub-vectors, each replaced by the index of its nearest centroid in a
+    codebook of ``2 ** nbits`` entries, so a vector costs ``m`` bytes of
+    codes plus its node number instead of ``4 * dimension`` bytes.
+
+    A query visits the ``nprobe`` closest cells. For each it builds a table
+    of distances between the query's sub-vectors and every codebook entry,
+    and the distance to an encoded vector is the sum of ``m`` table lookups
+    (asymmetric distance computation). With ``keep_vectors`` the original
+    vectors are kept as well and the best ``rerank`` candidates are
+    re-ranked with exact distances.
+
+    The quantizers are trained on the first ``train_size`` vectors, or
+    explicitly with ``train``. Until then, inserted vectors are held
+    uncompressed and searched exactly.
+
+    Items are ``(key, vector)`` pairs (see ``IndexBase``); keys are kept in
+    Python containers and are not part of the per-vector figures in
+    ``info``. Deleting an item marks it as removed; ``rebuild`` compacts the
+    lists.
+
+    Parameters:
+    - nlist: Number of coarse cells.
+    - m: Number of sub-quantizers; must divide the dimension.
+    - nbits: Bits per code (at most 8).
+    - nprobe: Number of cells visited per query.
+    - metric: ``"l2"``, ``"cosine"`` or ``"ip"`` (negative inner product).
+    - rerank: Number of candidates re-ranked exactly; needs ``keep_vectors``.
+    - keep_vectors: Keep the original vectors next to the codes.
+    - train_size: Vectors to collect before training automatically;
+      defaults to ``39 * max(nlist, 2 ** nbits)``.
+    - iterations: k-means iterations used in training.
+    - dimension: Vector dimension; taken from the first vector if omitted.
+    - seed: Seed for k-means initialisation.
+    - wal_path: File that ``flush_write_ahead_log`` appends records to.
+    """
+
+    # Attributes that make up the state captured by ``snapshot``.
+    _STATE = (
+        "dimension",
+        "_trained",
+        "_centroids",
+        "_codebooks",
+        "_list_codes",
+        "_list_nodes",
+        "_list_sizes",
+        "_keys",
+        "_nodes",
+        "_count",
+        "_deleted",
+        "_node_list",
+        "_vectors",
+        "_pending",
+        "_pending_nodes",
+    )
+
+    def __init__(
+        self,
+        nlist: int = 256,
+        m: int = 8,
+        nbits: int = 8,
+        nprobe: int = 8,
+        metric: str = "l2",
+        rerank: int = 0,
+        keep_vectors: bool = False,
+        train_size: Optional[int] = None,
+        iterations: int = 20,
+        dimension: Optional[int] = None,
+        seed: Optional[int] = None,
+        wal_path: Optional[str] = None,
+    ):
+        if not 1 <= nbits <= 8:
+            raise ValueError("nbits must be between 1 and 8")
+        if rerank and not keep_vectors:
+            raise ValueError("rerank needs keep_vectors=True")
+        if dimension is not None and dimension % m:
+            raise ValueError(f"m={m} does not divide dimension {dimension}")
+        super().__init__(wal_path=wal_path)
+        self.nlist = nlist
+        self.m = m
+        self.nbits = nbits
+        self.nprobe = nprobe
+        self.rerank = rerank
+        self.keep_vectors = keep_vectors
+        self.train_size = train_size or 39 * max(nlist, 2**nbits)
+        self.iterations = iterations
+        self.dimension = dimension
+        self.seed = seed
+        self._set_metric(metric)
+        self._reset()
+
+    @property
+    def ksub(self) -> int:
+        return 2**self.nbits
+
+    @property
+    def is_trained(self) -> bool:
+        return self._trained
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+    def _reset(self) -> None:
+        dimension = self.dimension or 0
+        self._trained = False
+        self._centroids = np.zeros((0, dimension), dtype=np.float32)
+        self._codebooks = np.zeros((self.m, 0, 0), dtype=np.float32)
+        self._list_codes: List[np.ndarray] = []
+        self._list_nodes: List[np.ndarray] = []
+        self._list_sizes = np.zeros(0, dtype=np.int64)
+        self._keys: List[Hashable] = []
+        self._nodes: Dict[Hashable, int] = {}
+        self._count = 0
+        self._deleted = np.zeros(0, dtype=bool)
+        self._node_list = np.zeros(0, dtype=np.int32)
+        self._vectors = np.zeros((0, dimension), dtype=np.float32)
+        # Vectors inserted before training, searched exactly.
+        self._pending = np.zeros((0, dimension), dtype=np.float32)
+        self._pending_nodes: List[int] = []
+        self._stats = {"searches": 0, "lists_scanned": 0, "codes_scanned": 0}
+
+    @staticmethod
+    def _grow(array: np.ndarray, count: int) -> np.ndarray:
+        """
+        Returns ``array`` with room for at least ``count`` rows, doubling its
+        capacity when it has to grow.
+        """
+        if count <= len(array):
+            return array
+        capacity = max(count, 2 * len(array), 16)
+        grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+        grown[: len(array)] = array
+        return grown
+
+    def _check_dimension(self, dimension: int) -> None:
+        if self.dimension is None:
+            if dimension % self.m:
+                raise ValueError(f"m={self.m} does not divide dimension {dimension}")
+            self.dimension = dimension
+            self._reset()
+        elif dimension != self.dimension:
+            raise ValueError(
+                f"Expected a vector of dimension {self.dimension}, got {dimension}"
+            )
+
+    # ------------------------------------------------------------------
+    # Distances
+    # ------------------------------------------------------------------
+    # Internally distances are squared Euclidean distances for "l2" and
+    # "cosine" (on unit vectors) and negative inner products for "ip";
+    # ``_output_distances`` converts them for callers.
+    def _set_metric(self, metric: str) -> None:
+        if callable(metric) or metric not in METRICS:
+            raise ValueError(
+                f"IvfPqIndex supports the metrics {METRICS}; a custom distance "
+                "function cannot be decomposed over sub-vectors"
+            )
+        self.metric = metric
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        if self.metric != "cosine":
+            return vectors
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+    def _exact(self, query: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+        if self.metric == "ip":
+            return -(vectors @ query)
+        diff = vectors - query
+        return np.einsum("ij,ij->i", diff, diff)
+
+    def _output_distances(self, distances: np.ndarray) -> np.ndarray:
+        if self.metric == "l2":
+            return np.sqrt(np.maximum(distances, 0))
+        if self.metric == "cosine":
+            return distances / 2
+        return distances
+
+    def _distance(self, a: Any, b: Any) -> float:
+        a, b = self._prepare(_as_array(a)), self._prepare(_as_array(b))
+        return float(self._output_distances(self._exact(a, b[None, :]))[0])
+
+    # ------------------------------------------------------------------
+    # Training & encoding
+    # ------------------------------------------------------------------
+    def train(self, vectors: Optional[Iterable[Any]] = None) -> None:
+        """
+        Trains the coarse quantizer and the PQ codebooks, then encodes the
+        vectors inserted so far.
+
+        Args:
+            vectors: Training vectors. Defaults to the vectors inserted before
+                training.
+        """
+        if self._trained:
+            raise ValueError("The index is already trained; use rebuild to retrain")
+        if vectors is None:
+            pending = np.asarray(self._pending_nodes, dtype=np.int64)
+            sample = self._pending[: len(pending)][~self._deleted[pending]]
+        else:
+            sample = np.stack([_as_array(vector) for vector in vectors])
+            self._check_dimension(sample.shape[1])
+            sample = self._prepare(sample)
+        if not len(sample):
+            raise ValueError("No vectors to train on")
+
+        rng = np.random.default_rng(self.seed)
+        limit = 256 * max(self.nlist, self.ksub)
+        if len(sample) > limit:
+            sample = sample[rng.choice(len(sample), limit, replace=False)]
+
+        self._centroids = _kmeans(sample, self.nlist, self.iterations, rng)
+        lists = _nearest_centroids(sample, self._centroids)
+        residuals = sample - self._centroids[lists]
+        sub_dimension = self.dimension // self.m
+        codebooks = np.zeros((self.m, self.ksub, sub_dimension), dtype=np.float32)
+        for j in range(self.m):
+            part = residuals[:, j * sub_dimension : (j + 1) * sub_dimension]
+            trained = _kmeans(part, self.ksub, self.iterations, rng)
+            codebooks[j, : len(trained)] = trained
+            # Pad codebooks trained on fewer than ksub points with copies of
+            # the first entry, so codes never point at unset entries.
+            codebooks[j, len(trained) :] = trained[0]
+        self._codebooks = codebooks
+
+        nlist = len(self._centroids)
+        self._list_codes = [np.zeros((0, self.m), dtype=np.uint8)] * nlist
+        self._list_nodes = [np.zeros(0, dtype=np.int64)] * nlist
+        self._list_sizes = np.zeros(nlist, dtype=np.int64)
+        self._trained = True
+
+        pending = np.asarray(self._pending_nodes, dtype=np.int64)
+        vectors = self._pending[: len(pending)]
+        self._pending = np.zeros((0, self.dimension), dtype=np.float32)
+        self._pending_nodes = []
+        live = ~self._deleted[pending]
+        self._add_encoded(pending[live], vectors[live])
+
+    def _encode(self, residuals: np.ndarray) -> np.ndarray:
+        sub_dimension = self.dimension // self.m
+        codes = np.empty((len(residuals), self.m), dtype=np.uint8)
+        for j in range(self.m):
+            part = residuals[:, j * sub_dimension : (j + 1) * sub_dimension]
+            codes[:, j] = _nearest_centroids(part, self._codebooks[j])
+        return codes
+
+    def _decode(self, list_id: int, codes: np.ndarray) -> np.ndarray:
+        parts = self._codebooks[np.arange(self.m), codes]
+        return self._centroids[list_id] + parts.reshape(len(codes), -1)
+
+    def _add_encoded(self, nodes: np.ndarray, vectors: np.ndarray) -> None:
+        if not len(nodes):
+            return
+        lists = _nearest_centroids(vectors, self._centroids)
+        codes = self._encode(vectors - self._centroids[lists])
+        self._node_list[nodes] = lists
+        self._append(lists, nodes, codes)
+
+    def _append(self, lists: np.ndarray, nodes: np.ndarray, codes: np.ndarray) -> None:
+        """
+        Appends encoded vectors to their inverted lists.
+        """
+        order = np.argsort(lists, kind="stable")
+        lists, nodes, codes = lists[order], nodes[order], codes[order]
+        bounds = np.flatnonzero(np.diff(lists)) + 1
+        for start, end in zip(
+            np.concatenate(([0], bounds)), np.concatenate((bounds, [len(lists)]))
+        ):
+            list_id = int(lists[start])
+            size = int(self._list_sizes[list_id])
+            count = size + end - start
+            self._list_codes[list_id] = self._grow(self._list_codes[list_id], count)
+            self._list_nodes[list_id] = self._grow(self._list_nodes[list_id], count)
+            self._list_codes[list_id][size:count] = codes[start:end]
+            self._list_nodes[list_id][size:count] = nodes[start:end]
+            self._list_sizes[list_id] = count
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    def _search(
+        self,
+        query: Any,
+        k: int,
+        nprobe: Optional[int] = None,
+        rerank: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the internal distances and nodes of the ``k`` best live
+        candidates, closest first.
+        """
+        empty = np.zeros(0), np.zeros(0, dtype=np.int64)
+        if k <= 0 or not len(self):
+            return empty
+        query = _as_array(query)
+        self._check_dimension(len(query))
+        query = self._prepare(query)
+        self._stats["searches"] += 1
+        rerank = self.rerank if rerank is None else rerank
+        if rerank and not self.keep_vectors:
+            raise ValueError("rerank needs keep_vectors=True")
+
+        distances: List[np.ndarray] = []
+        nodes: List[np.ndarray] = []
+        if self._pending_nodes:
+            pending_nodes = np.asarray(self._pending_nodes, dtype=np.int64)
+            distances.append(self._exact(query, self._pending[: len(pending_nodes)]))
+            nodes.append(pending_nodes)
+        if self._trained:
+            self._scan_lists(query, nprobe or self.nprobe, distances, nodes)
+        if not distances:
+            return empty
+        distances, nodes = np.concatenate(distances), np.concatenate(nodes)
+        live = ~self._deleted[nodes]
+        distances, nodes = distances[live], nodes[live]
+
+        shortlist = max(k, rerank or 0)
+        if len(nodes) > shortlist:
+            best = np.argpartition(distances, shortlist - 1)[:shortlist]
+            distances, nodes = distances[best], nodes[best]
+        if rerank:
+            distances = self._exact(query, self._vectors[nodes])
+        order = np.argsort(distances, kind="stable")[:k]
+        return distances[order], nodes[order]
+
+    def _scan_lists(
+        self,
+        query: np.ndarray,
+        nprobe: int,
+        distances: List[np.ndarray],
+        nodes: List[np.ndarray],
+    ) -> None:
+        """
+        Appends the approximate distances to every vector in the ``nprobe``
+        closest lists.
+        """
+        nprobe = min(nprobe, len(self._centroids))
+        if self.metric == "ip":
+            coarse = -(self._centroids @ query)
+        else:
+            diff = self._centroids - query
+            coarse = np.einsum("ij,ij->i", diff, diff)
+        probe = np.argpartition(coarse, nprobe - 1)[:nprobe]
+        probe = probe[self._list_sizes[probe] > 0]
+        if not len(probe):
+            return
+
+        sub_dimension = self.dimension // self.m
+        if self.metric == "ip":
+            # -q.(c + r) = -q.c + sum_j -q_j.r_j; the table does not depend
+            # on the list.
+            parts = query.reshape(self.m, 1, sub_dimension)
+            table = -np.matmul(parts, self._codebooks.transpose(0, 2, 1))[:, 0]
+            tables = np.broadcast_to(table, (len(probe),) + table.shape)
+            offsets = coarse[probe]
+        else:
+            # ||q - c - r||^2 = sum_j ||(q - c)_j - r_j||^2
+            residuals = (query - self._centroids[probe]).reshape(
+                len(probe), self.m, sub_dimension
+            )
+            products = np.matmul(
+                residuals.transpose(1, 0, 2), self._codebooks.transpose(0, 2, 1)
+            ).transpose(1, 0, 2)
+            tables = (
+                np.einsum("pmd,pmd->pm", residuals, residuals)[:, :, None]
+                - 2 * products
+                + np.einsum("mkd,mkd->mk", self._codebooks, self._codebooks)[None]
+            )
+            offsets = np.zeros(len(probe))
+
+        columns = np.arange(self.m) * self.ksub
+        for table, offset, list_id in zip(tables, offsets, probe.tolist()):
+            size = int(self._list_sizes[list_id])
+            codes = self._list_codes[list_id][:size]
+            flat = table.reshape(-1)
+            distances.append(flat[codes + columns].sum(axis=1) + offset)
+            nodes.append(self._list_nodes[list_id][:size])
+            self._stats["codes_scanned"] += size
+        self._stats["lists_scanned"] += len(probe)
+
+    # ------------------------------------------------------------------
+    # Items
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._count - int(self._deleted[: self._count].sum())
+
+    def _is_deleted(self, node: int) -> bool:
+        return bool(self._deleted[node])
+
+    def _pending_position(self, node: int) -> Optional[int]:
+        try:
+            return self._pending_nodes.index(node)
+        except ValueError:
+            return None
+
+    def _stored_vector(self, node: int) -> np.ndarray:
+        if self.keep_vectors:
+            return self._vectors[node].copy()
+        position = self._pending_position(node) if self._pending_nodes else None
+        if position is not None:
+            return self._pending[position].copy()
+        list_id = int(self._node_list[node])
+        size = int(self._list_sizes[list_id])
+        slot = np.flatnonzero(self._list_nodes[list_id][:size] == node)[0]
+        return self._decode(list_id, self._list_codes[list_id][slot : slot + 1])[0]
+
+    def get_vector(self, key: Hashable) -> np.ndarray:
+        """
+        Returns the vector stored under ``key``. Without ``keep_vectors``
+        this is the reconstruction from its codes once the index is trained.
+        For the cosine metric vectors are stored at unit length.
+        """
+        return self._stored_vector(self._node(key))
+
+    def _live_items(self) -> Iterable[Tuple[int, np.ndarray]]:
+        """
+        Yields the ``(node, vector)`` pairs of the live items, pending items
+        first and then list by list.
+        """
+        for position, node in enumerate(list(self._pending_nodes)):
+            if not self._deleted[node]:
+                yield node, self._pending[position].copy()
+        for list_id, size in enumerate(self._list_sizes.tolist()):
+            list_nodes = self._list_nodes[list_id][:size]
+            live = ~self._deleted[list_nodes]
+            if self.keep_vectors:
+                vectors = self._vectors[list_nodes[live]]
+            else:
+                vectors = self._decode(list_id, self._list_codes[list_id][:size][live])
+            yield from zip(list_nodes[live].tolist(), vectors)
+
+    def items(self) -> Iterable[Tuple[Any, np.ndarray]]:
+        """
+        Yields the live ``(key, vector)`` pairs; vectors are as returned by
+        ``get_vector``.
+        """
+        for node, vector in self._live_items():
+            yield self._keys[node], vector
+
+    # ------------------------------------------------------------------
+    # Build & modify
+    # ------------------------------------------------------------------
+    def insert(self, item: Any) -> None:
+        self.batch_insert([item])
+
+    def batch_insert(self, items: Iterable[Any]) -> None:
+        """
+        Inserts the items, encoding them together once the index is trained.
+        Collecting ``train_size`` vectors triggers training.
+        """
+        keys, vectors, seen = [], [], set()
+        for item in items:
+            key, vector = self._split_item(item)
+            self._check_dimension(len(vector))
+            if key in seen or key in self:
+                raise KeyError(f"Item '{key}' is already in the index")
+            seen.add(key)
+            keys.append(key)
+            vectors.append(vector)
+        if not keys:
+            return
+
+        vectors = self._prepare(np.stack(vectors))
+        start, end = self._count, self._count + len(keys)
+        nodes = np.arange(start, end, dtype=np.int64)
+        self._deleted = self._grow(self._deleted, end)
+        self._node_list = self._grow(self._node_list, end)
+        if self.keep_vectors:
+            self._vectors = self._grow(self._vectors, end)
+            self._vectors[start:end] = vectors
+        self._keys.extend(keys)
+        self._nodes.update(zip(keys, nodes.tolist()))
+        self._count = end
+
+        if self._trained:
+            self._add_encoded(nodes, vectors)
+            return
+        count = len(self._pending_nodes)
+        self._pending = self._grow(self._pending, count + len(keys))
+        self._pending[count : count + len(keys)] = vectors
+        self._pending_nodes.extend(nodes.tolist())
+        if len(self._pending_nodes) >= self.train_size:
+            self.train()
+
+    def delete(self, item: Any) -> None:
+        self._deleted[self._node(item)] = True
+
+    def clear(self) -> None:
+        self._reset()
+        self._cache.clear()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def knn_search(
+        self,
+        query: Any,
+        k: int,
+        nprobe: Optional[int] = None,
+        rerank: Optional[int] = None,
+    ) -> List[Tuple[Any, float]]:
+        """
+        Approximate k nearest neighbours of ``query`` as ``(key, distance)``
+        pairs. ``nprobe`` and ``rerank`` override the index settings for
+        this query.
+        """
+        distances, nodes = self._search(query, k, nprobe, rerank)
+        return [
+            (self._keys[node], distance)
+            for node, distance in zip(
+                nodes.tolist(), self._output_distances(distances).tolist()
+            )
+        ]
+
+    # ------------------------------------------------------------------
+    # Distance function management
+    # ------------------------------------------------------------------
+    def set_distance_function(self, distance_fn: str) -> None:
+        """
+        Sets the metric to ``"l2"``, ``"cosine"`` or ``"ip"``. The quantizers
+        depend on the metric, so trained codes can only be rebuilt when the
+        original vectors are kept. Vectors stored for the cosine metric are
+        unit length and stay so.
+        """
+        if self._trained and len(self) and not self.keep_vectors:
+            raise ValueError(
+                "Changing the metric needs the original vectors; "
+                "create the index with keep_vectors=True"
+            )
+        live = list(self.items())
+        self._set_metric(distance_fn)
+        self._reset()
+        self.batch_insert(live)
+
+    def get_distance_function(self) -> Callable[[Any, Any], float]:
+        return self._distance
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def rebuild(self) -> None:
+        """
+        Retrains the quantizers on the live vectors when they are kept;
+        otherwise compacts the inverted lists, dropping deleted items.
+        """
+        if self.keep_vectors:
+            live = list(self.items())
+            self._reset()
+            self.batch_insert(live)
+            if live and not self._trained:
+                self.train()
+            return
+
+        alive = ~self._deleted[: self._count]
+        renumber = np.cumsum(alive) - 1
+        self._keys = [key for key, keep in zip(self._keys, alive.tolist()) if keep]
+        self._nodes = {key: node for node, key in enumerate(self._keys)}
+        self._node_list = self._node_list[: self._count][alive]
+        self._count = len(self._keys)
+        self._deleted = np.zeros(self._count, dtype=bool)
+
+        pending = np.asarray(self._pending_nodes, dtype=np.int64)
+        keep = alive[pending]
+        self._pending = self._pending[: len(pending)][keep]
+        self._pending_nodes = renumber[pending[keep]].tolist()
+
+        for list_id, size in enumerate(self._list_sizes.tolist()):
+            list_nodes = self._list_nodes[list_id][:size]
+            keep = alive[list_nodes]
+            self._list_codes[list_id] = self._list_codes[list_id][:size][keep]
+            self._list_nodes[list_id] = renumber[list_nodes[keep]]
+            self._list_sizes[list_id] = int(keep.sum())
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, filepath: str, index_id: Optional[str] = None) -> None:
+        """
+        Saves the quantizers, codes and settings to a single ``.npz`` file.
+        Keys must be JSON serializable.
+        """
+        sizes = self._list_sizes.tolist()
+        header = {
+            "index_id": index_id,
+            "nlist": self.nlist,
+            "m": self.m,
+            "nbits": self.nbits,
+            "nprobe": self.nprobe,
+            "metric": self.metric,
+            "rerank": self.rerank,
+            "keep_vectors": self.keep_vectors,
+            "train_size": self.train_size,
+            "iterations": self.iterations,
+            "dimension": self.dimension,
+            "trained": self._trained,
+            "keys": self._keys,
+        }
+        m = self.m
+        codes = [c[:n] for c, n in zip(self._list_codes, sizes)]
+        list_nodes = [n_[:n] for n_, n in zip(self._list_nodes, sizes)]
+        count = self._count
+        directory = os.path.dirname(os.path.abspath(filepath))
+        os.makedirs(directory, exist_ok=True)
+        with open(filepath, "wb") as f:
+            np.savez(
+                f,
+                header=np.array(json.dumps(header)),
+                centroids=self._centroids,
+                codebooks=self._codebooks,
+                list_sizes=self._list_sizes,
+                codes=np.concatenate(codes) if codes else np.zeros((0, m), np.uint8),
+                list_nodes=(
+                    np.concatenate(list_nodes) if list_nodes else np.zeros(0, np.int64)
+                ),
+                deleted=self._deleted[:count],
+                node_list=self._node_list[:count],
+                vectors=self._vectors[:count] if self.keep_vectors else np.zeros(0),
+                pending=self._pending[: len(self._pending_nodes)],
+                pending_nodes=np.asarray(self._pending_nodes, dtype=np.int64),
+            )
+
+    def load(self, filepath: str, index_id: Optional[str] = None) -> None:
+        with np.load(filepath, allow_pickle=False) as data:
+            header = json.loads(str(data["header"]))
+            self._check_index_id(filepath, header, index_id)
+            arrays = {name: data[name] for name in data.files if name != "header"}
+
+        for name in (
+            "nlist",
+            "m",
+            "nbits",
+            "nprobe",
+            "rerank",
+            "keep_vectors",
+            "train_size",
+            "iterations",
+            "dimension",
+        ):
+            setattr(self, name, header[name])
+        self._set_metric(header["metric"])
+        self._reset()
+
+        self._trained = header["trained"]
+        self._centroids = arrays["centroids"]
+        self._codebooks = arrays["codebooks"]
+        self._list_sizes = arrays["list_sizes"].astype(np.int64)
+        bounds = np.concatenate(([0], np.cumsum(self._list_sizes))).tolist()
+        self._list_codes = [
+            arrays["codes"][start:end] for start, end in zip(bounds, bounds[1:])
+        ]
+        self._list_nodes = [
+            arrays["list_nodes"][start:end] for start, end in zip(bounds, bounds[1:])
+        ]
+        self._keys = [
+            tuple(key) if isinstance(key, list) else key for key in header["keys"]
+        ]
+        # A key inserted again after a delete maps to its newest node.
+        self._nodes = {key: node for node, key in enumerate(self._keys)}
+        self._count = len(self._keys)
+        self._deleted = arrays["deleted"]
+        self._node_list = arrays["node_list"]
+        if self.keep_vectors:
+            self._vectors = arrays["vectors"]
+        self._pending = arrays["pending"]
+        self._pending_nodes = arrays["pending_nodes"].tolist()
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+    def info(self) -> Dict[str, Any]:
+        """
+        Settings and memory use. ``bytes_per_vector`` counts the codes, list
+        entry and per-node arrays of an encoded vector (plus the original
+        when ``keep_vectors`` is set); ``compression`` compares it with a
+        ``float32`` vector.
+        """
+        dimension = self.dimension or 0
+        # Codes, list entry (int64), deleted flag (bool) and list id (int32).
+        bytes_per_vector = self.m + 8 + 1 + 4
+        if self.keep_vectors:
+            bytes_per_vector += 4 * dimension
+        encoded = int(self._list_sizes.sum())
+        return {
+            "type": type(self).__name__,
+            "metric": self.metric,
+            "dimension": self.dimension,
+            "nlist": len(self._centroids) if self._trained else self.nlist,
+            "m": self.m,
+            "nbits": self.nbits,
+            "nprobe": self.nprobe,
+            "rerank": self.rerank,
+            "trained": self._trained,
+            "size": len(self),
+            "nodes": self._count,
+            "deleted": self._count - len(self),
+            "encoded": encoded,
+            "pending": len(self._pending_nodes),
+            "bytes_per_vector": bytes_per_vector,
+            "compression": 4 * dimension / bytes_per_vector if dimension else 0.0,
+            "quantizer_bytes": int(self._centroids.nbytes + self._codebooks.nbytes),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        sizes = self._list_sizes[self._list_sizes > 0]
+        stats["list_size_mean"] = float(sizes.mean()) if len(sizes) else 0.0
+        stats["list_size_max"] = int(sizes.max()) if len(sizes) else 0
+        stats["codes_scanned_per_search"] = (
+            stats["codes_scanned"] / stats["searches"] if stats["searches"] else 0.0
+        )
+        return stats
+
+    # ------------------------------------------------------------------
+    # Sharding & recovery
+    # ------------------------------------------------------------------
+    def _empty_copy(self) -> "IvfPqIndex":
+        index = IvfPqIndex(
+            nlist=self.nlist,
+            m=self.m,
+            nbits=self.nbits,
+            nprobe=self.nprobe,
+            metric=self.metric,
+            rerank=self.rerank,
+            keep_vectors=self.keep_vectors,
+            train_size=self.train_size,
+            iterations=self.iterations,
+            dimension=self.dimension,
+            seed=self.seed,
+        )
+        if self._trained:
+            # Share the trained quantizers so codes can be copied as they are.
+            index._trained = True
+            index._centroids = self._centroids
+            index._codebooks = self._codebooks
+            nlist = len(self._centroids)
+            index._list_codes = [np.zeros((0, self.m), dtype=np.uint8)] * nlist
+            index._list_nodes = [np.zeros(0, dtype=np.int64)] * nlist
+            index._list_sizes = np.zeros(nlist, dtype=np.int64)
+        return index
+
+    def _same_quantizers(self, other: "IvfPqIndex") -> bool:
+        return (
+            self._trained
+            and other._trained
+            and self.metric == other.metric
+            and (other.keep_vectors or not self.keep_vectors)
+            and np.array_equal(self._centroids, other._centroids)
+            and np.array_equal(self._codebooks, other._codebooks)
+        )
+
+    def _copy_encoded(self, other: "IvfPqIndex", keep: Callable[[int], bool]) -> None:
+        """
+        Copies the encoded live items of ``other`` for which ``keep(node)`` is
+        true, without re-encoding them.
+        """
+        for list_id, size in enumerate(other._list_sizes.tolist()):
+            list_nodes = other._list_nodes[list_id][:size]
+            selected = [
+                i
+                for i, node in enumerate(list_nodes.tolist())
+                if not other._deleted[node] and keep(node)
+            ]
+            if not selected:
+                continue
+            keys = [other._keys[node] for node in list_nodes[selected].tolist()]
+            for key in keys:
+                if key in self:
+                    raise KeyError(f"Item '{key}' is already in the index")
+            start, end = self._count, self._count + len(keys)
+            nodes = np.arange(start, end, dtype=np.int64)
+            self._deleted = self._grow(self._deleted, end)
+            self._node_list = self._grow(self._node_list, end)
+            self._node_list[start:end] = list_id
+            if self.keep_vectors:
+                self._vectors = self._grow(self._vectors, end)
+                self._vectors[start:end] = other._vectors[list_nodes[selected]]
+            self._keys.extend(keys)
+            self._nodes.update(zip(keys, nodes.tolist()))
+            self._count = end
+            self._append(
+                np.full(len(keys), list_id),
+                nodes,
+                other._list_codes[list_id][:size][selected],
+            )
+
+    def split(self, shard_key: Callable[[Any], int]) -> List["IvfPqIndex"]:
+        """
+        Splits the live items into one index per shard id returned by
+        ``shard_key(item)``, ordered by shard id. The shards share the
+        trained quantizers and receive the codes without re-encoding.
+        """
+        shard_of = {
+            node: shard_key((self._keys[node], vector))
+            for node, vector in self._live_items()
+        }
+        shards = {shard_id: self._empty_copy() for shard_id in set(shard_of.values())}
+        pending = set(self._pending_nodes)
+        for shard_id, shard in shards.items():
+            pending_items = [
+                (self._keys[node], self._pending[position])
+                for position, node in enumerate(self._pending_nodes)
+                if not self._deleted[node] and shard_of[node] == shard_id
+            ]
+            shard.batch_insert(pending_items)
+            shard._copy_encoded(
+                self,
+                lambda node, shard_id=shard_id: node not in pending
+                and shard_of[node] == shard_id,
+            )
+        return [shards[shard_id] for shard_id in sorted(shards)]
+
+    def merge(self, other: IIndex) -> None:
+        """
+        Merges the items of ``other``. Encoded items of an ``IvfPqIndex``
+        trained with the same quantizers are copied without re-encoding.
+        """
+        if not (isinstance(other, IvfPqIndex) and self._same_quantizers(other)):
+            super().merge(other)
+            return
+        pending = set(other._pending_nodes)
+        self.batch_insert(
+            (other._keys[node], other._pending[position])
+            for position, node in enumerate(other._pending_nodes)
+            if not other._deleted[node]
+        )
+        self._copy_encoded(other, lambda node: node not in pending)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a copy of the index state that ``restore`` accepts.
+        """
+        return copy.deepcopy({name: getattr(self, name) for name in self._STATE})
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        for name, value in copy.deepcopy(snapshot).items():
+            setattr(self, name, value)
+        self._cache.clear()
@@ -0,0 +1,39 @@
+from typing import Any, Dict, Literal
+
+from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.vector_stores.VectorStoreBase import VectorStoreBase
+
+from swarmauri_experimental.indexes.HnswIndex import HnswIndex
+from swarmauri_experimental.vector_stores.VectorStoreIndexMixin import (
+    VectorStoreIndexMixin,
+)
+
+
+@ComponentBase.register_type(VectorStoreBase, "HnswVectorStore")
+class HnswVectorStore(VectorStoreIndexMixin, VectorStoreBase):
+    """
+    In-memory vector store that retrieves through an ``HnswIndex``.
+
+    A query visits a number of documents that grows roughly with the
+    logarithm of the store size, instead of comparing the query with every
+    document. ``M``, ``ef_construction`` and ``ef_search`` trade memory and
+    insert time for recall; see ``HnswIndex``. Documents and embedders are
+    handled as described in ``VectorStoreIndexMixin``.
+    """
+
+    type: Literal["HnswVectorStore"] = "HnswVectorStore"
+    M: int = 16
+    ef_construction: int = 200
+    ef_search: int = 50
+    metric: Literal["cosine", "l2", "ip"] = "cosine"
+
+    def _new_index(self) -> HnswIndex:
+        return HnswIndex(
+            M=self.M,
+            ef_construction=self.ef_construction,
+            ef_search=self.ef_search,
+            metric=self.metric,
+        )
+
+    def _search_options(self) -> Dict[str, Any]:
+        return {"ef": self.ef_search}
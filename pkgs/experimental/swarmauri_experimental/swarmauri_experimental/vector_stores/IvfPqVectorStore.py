@@ -0,0 +1,64 @@
+from typing import Any, Dict, Literal, Optional
+
+from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.vector_stores.VectorStoreBase import VectorStoreBase
+from swarmauri_standard.documents.Document import Document
+
+from swarmauri_experimental.indexes.IvfPqIndex import IvfPqIndex
+from swarmauri_experimental.vector_stores.VectorStoreIndexMixin import (
+    VectorStoreIndexMixin,
+)
+
+
+@ComponentBase.register_type(VectorStoreBase, "IvfPqVectorStore")
+class IvfPqVectorStore(VectorStoreIndexMixin, VectorStoreBase):
+    """
+    In-memory vector store that keeps embeddings compressed in an
+    ``IvfPqIndex``.
+
+    Once indexed, documents are kept without their embedding unless
+    ``keep_embeddings`` is set: the index holds each embedding as ``m``
+    bytes of product-quantization codes, plus a ``float32`` copy when
+    ``rerank`` is enabled. The quantizers are trained automatically after
+    ``train_size`` documents; until then retrieval is exact. Documents and
+    embedders are otherwise handled as described in
+    ``VectorStoreIndexMixin``.
+    """
+
+    type: Literal["IvfPqVectorStore"] = "IvfPqVectorStore"
+    nlist: int = 256
+    m: int = 8
+    nbits: int = 8
+    nprobe: int = 8
+    rerank: int = 0
+    train_size: Optional[int] = None
+    metric: Literal["cosine", "l2", "ip"] = "cosine"
+    keep_embeddings: bool = False
+
+    def _new_index(self) -> IvfPqIndex:
+        return IvfPqIndex(
+            nlist=self.nlist,
+            m=self.m,
+            nbits=self.nbits,
+            nprobe=self.nprobe,
+            metric=self.metric,
+            rerank=self.rerank,
+            keep_vectors=bool(self.rerank),
+            train_size=self.train_size,
+        )
+
+    def _search_options(self) -> Dict[str, Any]:
+        return {"nprobe": self.nprobe, "rerank": self.rerank}
+
+    def _stored_document(self, document: Document) -> Document:
+        if self.keep_embeddings or document.embedding is None:
+            return document
+        return document.model_copy(update={"embedding": None})
+
+    def train(self) -> None:
+        """
+        Trains the index on the documents added so far, instead of waiting
+        for ``train_size`` documents.
+        """
+        self._ensure_index()
+        self._index.train()
@@ -0,0 +1,224 @@
+import json
+import os
+from abc import abstractmethod
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from pydantic import PrivateAttr
+
+from swarmauri_base.vector_stores.VectorStoreRetrieveMixin import (
+    VectorStoreRetrieveMixin,
+)
+from swarmauri_base.vector_stores.VectorStoreSaveLoadMixin import (
+    VectorStoreSaveLoadMixin,
+)
+from swarmauri_standard.documents.Document import Document
+
+from swarmauri_experimental.indexes.IndexBase import IndexBase
+
+INDEX_FILE = "index.npz"
+IDS_FILE = "index_ids.json"
+
+
+class VectorStoreIndexMixin(VectorStoreSaveLoadMixin, VectorStoreRetrieveMixin):
+    """
+    Document management and retrieval for in-memory vector stores that
+    search through an ``IndexBase`` index keyed by document id.
+
+    Documents are indexed by their embedding. Documents without one are
+    embedded with the store's embedder, which is also used to embed
+    queries; a store without an embedder only accepts documents that are
+    already embedded and is queried with ``retrieve_by_vector``.
+
+    ``save_store`` writes the index next to the documents, so ``load_store``
+    does not rebuild it.
+
+    Subclasses implement ``_new_index`` and may override ``_search_options``
+    and ``_stored_document``.
+    """
+
+    _index: IndexBase = PrivateAttr(default=None)
+    _positions: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _indexed_documents: List[Document] = PrivateAttr(default=None)
+
+    def __init__(self, embedder: Optional[Any] = None, **kwargs):
+        super().__init__(**kwargs)
+        self._embedder = embedder
+        self.documents = []
+        self._reset_index()
+
+    @abstractmethod
+    def _new_index(self) -> IndexBase:
+        """
+        Returns an empty index configured from the store's fields.
+        """
+        pass
+
+    def _search_options(self) -> Dict[str, Any]:
+        """
+        Keyword arguments passed to ``knn_search``.
+        """
+        return {}
+
+    def _stored_document(self, document: Document) -> Document:
+        """
+        Returns the document to keep in ``documents`` once it is indexed.
+        """
+        return document
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+    def _reset_index(self) -> None:
+        self._index = self._new_index()
+        self._positions = {}
+        self._indexed_documents = self.documents
+
+    def _ensure_index(self) -> None:
+        """
+        Rebuilds the index if ``documents`` was replaced or modified outside
+        of the store API.
+        """
+        if self.documents is self._indexed_documents and len(self.documents) == len(
+            self._positions
+        ):
+            return
+        documents = self.documents
+        self._reset_index()
+        self._indexed_documents = documents
+        self._index.batch_insert(
+            (document.id, self._embedding(document)) for document in documents
+        )
+        self._positions = {document.id: i for i, document in enumerate(documents)}
+
+    def _embedding(self, document: Document) -> np.ndarray:
+        if document.embedding is None:
+            if self._embedder is None:
+                raise ValueError(
+                    f"Document '{document.id}' has no embedding and the store "
+                    "has no embedder."
+                )
+            document.embedding = self._embedder.transform([document.content])[0]
+        return document.embedding.to_numpy()
+
+    def _embed_documents(self, documents: List[Document]) -> None:
+        """
+        Embeds the documents that have no embedding in a single call.
+        """
+        missing = [document for document in documents if document.embedding is None]
+        if missing and self._embedder is not None:
+            embeddings = self._embedder.transform([doc.content for doc in missing])
+            for document, embedding in zip(missing, embeddings):
+                document.embedding = embedding
+
+    # ------------------------------------------------------------------
+    # Document management
+    # ------------------------------------------------------------------
+    def add_document(self, document: Document) -> None:
+        self.add_documents([document])
+
+    def add_documents(self, documents: List[Document]) -> None:
+        self._ensure_index()
+        self._embed_documents(documents)
+        batch: List[Tuple[str, np.ndarray]] = []
+        for document in documents:
+            if document.id in self._positions:
+                # Index what came before, in case it holds this document.
+                self._index.batch_insert(batch)
+                batch = []
+                self.update_document(document.id, document)
+                continue
+            batch.append((document.id, self._embedding(document)))
+            self._positions[document.id] = len(self.documents)
+            self.documents.append(self._stored_document(document))
+        self._index.batch_insert(batch)
+
+    def get_document(self, id: str) -> Union[Document, None]:
+        self._ensure_index()
+        position = self._positions.get(id)
+        if position is None:
+            return None
+        return self.documents[position]
+
+    def get_all_documents(self) -> List[Document]:
+        return self.documents
+
+    def delete_document(self, id: str) -> None:
+        self._ensure_index()
+        position = self._positions.pop(id, None)
+        if position is None:
+            return
+        del self.documents[position]
+        for document in self.documents[position:]:
+            self._positions[document.id] -= 1
+        self._index.delete(id)
+
+    def update_document(self, id: str, updated_document: Document) -> None:
+        self._ensure_index()
+        position = self._positions.get(id)
+        if position is None:
+            return
+        vector = self._embedding(updated_document)
+        self._index.delete(id)
+        del self._positions[id]
+        self._index.insert((updated_document.id, vector))
+        self._positions[updated_document.id] = position
+        self.documents[position] = self._stored_document(updated_document)
+
+    def clear_documents(self) -> None:
+        super().clear_documents()
+        self._reset_index()
+
+    # ------------------------------------------------------------------
+    # Retrieval
+    # ------------------------------------------------------------------
+    def retrieve(self, query: str, top_k: int = 5) -> List[Document]:
+        if self._embedder is None:
+            raise ValueError(
+                "The store has no embedder; use retrieve_by_vector instead."
+            )
+        return self.retrieve_by_vector(self._embedder.transform([query])[0], top_k)
+
+    def retrieve_by_vector(
+        self, vector: Any, top_k: int = 5, **search_options: Any
+    ) -> List[Document]:
+        """
+        Retrieves the ``top_k`` documents closest to ``vector``.
+
+        Args:
+            vector: A ``Vector``, NumPy array or list of floats.
+            top_k (int): The number of documents to retrieve.
+            **search_options: Overrides of the index search settings.
+
+        Returns:
+            List[Document]: The documents, closest first.
+        """
+        self._ensure_index()
+        options = {**self._search_options(), **search_options}
+        results = self._index.knn_search(vector, top_k, **options)
+        return [self.documents[self._positions[id_]] for id_, _ in results]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save_store(self, directory_path: str) -> None:
+        self._ensure_index()
+        super().save_store(directory_path)
+        self._index.save(os.path.join(directory_path, INDEX_FILE))
+        with open(
+            os.path.join(directory_path, IDS_FILE), "w", encoding="utf-8"
+        ) as f:
+            json.dump(sorted(self._positions, key=self._positions.get), f)
+
+    def load_store(self, directory_path: str) -> None:
+        super().load_store(directory_path)
+        index_path = os.path.join(directory_path, INDEX_FILE)
+        ids_path = os.path.join(directory_path, IDS_FILE)
+        if not (os.path.exists(index_path) and os.path.exists(ids_path)):
+            # Rebuilt from the embeddings on first use.
+            return
+        self._index = self._new_index()
+        self._index.load(index_path)
+        with open(ids_path, "r", encoding="utf-8") as f:
+            self._positions = {id_: i for i, id_ in enumerate(json.load(f))}
+        self._indexed_documents = self.documents
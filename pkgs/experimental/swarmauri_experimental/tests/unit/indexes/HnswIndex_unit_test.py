@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+from swarmauri_experimental.indexes.HnswIndex import HnswIndex
+from swarmauri_experimental.indexes.IndexBase import UnsupportedIndexFeatureError
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).standard_normal((1000, 16)).astype(np.float32)
+
+
+@pytest.fixture
+def index(data):
+    index = HnswIndex(M=8, ef_construction=100, ef_search=50, seed=0)
+    index.build_index((i, vector) for i, vector in enumerate(data))
+    return index
+
+
+def _exact(data, query, k):
+    return np.argsort(np.linalg.norm(data - query, axis=1))[:k].tolist()
+
+
+@pytest.mark.unit
+def test_recall(index, data):
+    queries = np.random.default_rng(1).standard_normal((50, 16)).astype(np.float32)
+    hits = 0
+    for query in queries:
+        found = [key for key, _ in index.knn_search(query, 10)]
+        hits += len(set(found) & set(_exact(data, query, 10)))
+    assert hits / 500 >= 0.9
+
+
+@pytest.mark.unit
+def test_results_are_sorted_distances(index, data):
+    results = index.knn_search(data[3], 5)
+    assert results[0] == (3, pytest.approx(0.0, abs=1e-5))
+    distances = [distance for _, distance in results]
+    assert distances == sorted(distances)
+    second = data[results[1][0]]
+    assert distances[1] == pytest.approx(float(np.linalg.norm(second - data[3])))
+
+
+@pytest.mark.unit
+def test_tombstone_delete_and_reinsert(index, data):
+    index.delete(3)
+    assert 3 not in index
+    assert index.size() == 999
+    assert index.nearest_neighbor(data[3])[0] != 3
+    index.insert((3, data[3]))
+    assert index.nearest_neighbor(data[3])[0] == 3
+    index.rebuild()
+    assert index.info()["deleted"] == 0
+    assert index.nearest_neighbor(data[3])[0] == 3
+
+
+@pytest.mark.unit
+def test_range_search(index, data):
+    radius = 3.0
+    within = np.linalg.norm(data - data[0], axis=1) <= radius
+    expected = set(np.flatnonzero(within).tolist())
+    found = set(index.range_search(data[0], radius))
+    assert found <= expected
+    assert len(found) >= 0.9 * len(expected)
+    assert index.range_count(data[0], radius) == len(found)
+    assert all(d <= radius for _, d in index.knn_within_radius(data[0], 5, radius))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("metric", ["cosine", "ip"])
+def test_metrics(data, metric):
+    index = HnswIndex(M=8, metric=metric, seed=0)
+    index.batch_insert((i, vector) for i, vector in enumerate(data))
+    query = data[10]
+    if metric == "cosine":
+        exact = 1 - data @ query / np.linalg.norm(data, axis=1) / np.linalg.norm(query)
+    else:
+        exact = -(data @ query)
+    assert index.nearest_neighbor(query)[0] == int(np.argmin(exact))
+    np.testing.assert_allclose(index.get_vector(10), data[10], rtol=1e-6)
+
+
+@pytest.mark.unit
+def test_save_and_load(index, data, tmp_path):
+    index.delete(7)
+    path = str(tmp_path / "index.npz")
+    index.save_index("vectors", path)
+
+    loaded = HnswIndex()
+    loaded.load_index("vectors", path)
+    assert loaded.size() == index.size()
+    assert 7 not in loaded
+    query = data[42]
+    assert loaded.knn_search(query, 10) == index.knn_search(query, 10)
+    with pytest.raises(ValueError):
+        HnswIndex().load_index("other", path)
+
+
+@pytest.mark.unit
+def test_split_and_merge(index):
+    shards = index.split(lambda item: item[0] % 2)
+    assert [shard.size() for shard in shards] == [500, 500]
+    shards[0].merge(shards[1])
+    assert shards[0].size() == 1000
+
+
+@pytest.mark.unit
+def test_atomic_write_rolls_back(index):
+    def failing_write():
+        index.delete(1)
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        index.atomic_write(failing_write)
+    assert 1 in index
+    assert index.size() == 1000
+
+
+@pytest.mark.unit
+def test_dimension_mismatch(index):
+    with pytest.raises(ValueError):
+        index.insert(("bad", np.zeros(3)))
+
+
+@pytest.mark.unit
+def test_lsm_tree_is_unsupported(index):
+    with pytest.raises(UnsupportedIndexFeatureError):
+        index.enable_lsm_tree()
+    index.disable_lsm_tree()
+    assert not index.is_lsm_enabled()
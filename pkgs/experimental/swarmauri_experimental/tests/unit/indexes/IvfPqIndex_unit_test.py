@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+from swarmauri_experimental.indexes.IvfPqIndex import IvfPqIndex
+
+
+def _clustered(n, dimension=32, clusters=20, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dimension)) * 4
+    labels = rng.integers(0, clusters, n)
+    return (centers[labels] + rng.standard_normal((n, dimension))).astype(np.float32)
+
+
+@pytest.fixture
+def data():
+    return _clustered(3000)
+
+
+def _index(data, **kwargs):
+    options = dict(nlist=16, m=8, nbits=6, nprobe=4, train_size=2000, seed=0)
+    options.update(kwargs)
+    index = IvfPqIndex(**options)
+    index.build_index((i, vector) for i, vector in enumerate(data))
+    return index
+
+
+def _exact(data, query, k):
+    return np.argsort(np.linalg.norm(data - query, axis=1))[:k].tolist()
+
+
+def _recall(index, data, k=10):
+    queries = data[:50] + 0.1
+    hits = 0
+    for query in queries:
+        found = [key for key, _ in index.knn_search(query, k)]
+        hits += len(set(found) & set(_exact(data, query, k)))
+    return hits / (k * len(queries))
+
+
+@pytest.mark.unit
+def test_pending_vectors_are_searched_exactly(data):
+    index = IvfPqIndex(nlist=16, m=8, train_size=10_000)
+    index.batch_insert((i, vector) for i, vector in enumerate(data[:100]))
+    assert not index.is_trained
+    results = index.knn_search(data[7], 3)
+    assert results[0] == (7, pytest.approx(0.0, abs=1e-5))
+    assert [key for key, _ in results] == _exact(data[:100], data[7], 3)
+
+
+@pytest.mark.unit
+def test_trains_after_train_size(data):
+    index = _index(data)
+    info = index.info()
+    assert index.is_trained
+    assert info["encoded"] == 3000
+    assert info["pending"] == 0
+    assert index.size() == 3000
+
+
+@pytest.mark.unit
+def test_rerank_recall(data):
+    assert _recall(_index(data, keep_vectors=True, rerank=100), data) >= 0.9
+
+
+@pytest.mark.unit
+def test_reranked_distances_are_exact(data):
+    index = _index(data, keep_vectors=True, rerank=50)
+    key, distance = index.knn_search(data[5] + 0.1, 1)[0]
+    assert distance == pytest.approx(
+        float(np.linalg.norm(data[key] - (data[5] + 0.1))), rel=1e-4
+    )
+
+
+@pytest.mark.unit
+def test_compression():
+    info = _index(_clustered(3000, dimension=128), m=16).info()
+    assert info["compression"] >= 16
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("metric", ["cosine", "ip"])
+def test_metrics(data, metric):
+    index = _index(data, metric=metric, keep_vectors=True, rerank=100)
+    query = data[11]
+    if metric == "cosine":
+        norms = np.linalg.norm(data, axis=1) * np.linalg.norm(query)
+        expected = np.argsort(-(data @ query) / norms)[:10]
+    else:
+        expected = np.argsort(-(data @ query))[:10]
+    found = [key for key, _ in index.knn_search(query, 10)]
+    assert len(set(found) & set(expected.tolist())) >= 8
+
+
+@pytest.mark.unit
+def test_delete_and_rebuild(data):
+    index = _index(data)
+    index.delete(5)
+    assert 5 not in index
+    assert 5 not in [key for key, _ in index.knn_search(data[5], 10)]
+    assert index.info()["deleted"] == 1
+    index.rebuild()
+    assert index.info()["deleted"] == 0
+    assert index.size() == 2999
+    assert index.knn_search(data[6], 1)[0][0] == 6
+
+
+@pytest.mark.unit
+def test_save_and_load(data, tmp_path):
+    index = _index(data)
+    path = str(tmp_path / "index.npz")
+    index.save_index("ivf", path)
+    loaded = IvfPqIndex()
+    loaded.load_index("ivf", path)
+    query = data[3] + 0.1
+    assert loaded.knn_search(query, 5) == index.knn_search(query, 5)
+    with pytest.raises(ValueError):
+        IvfPqIndex().load_index("other", path)
+
+
+@pytest.mark.unit
+def test_split_and_merge(data):
+    index = _index(data)
+    shards = index.split(lambda item: item[0] % 2)
+    assert [shard.size() for shard in shards] == [1500, 1500]
+    assert all(shard.is_trained for shard in shards)
+    merged, other = shards
+    merged.merge(other)
+    query = data[9] + 0.1
+    assert merged.knn_search(query, 5) == index.knn_search(query, 5)
+
+
+@pytest.mark.unit
+def test_rerank_requires_vectors():
+    with pytest.raises(ValueError):
+        IvfPqIndex(rerank=10)
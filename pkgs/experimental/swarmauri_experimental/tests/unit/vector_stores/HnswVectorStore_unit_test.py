@@ -0,0 +1,80 @@
+import pytest
+from swarmauri_standard.documents.Document import Document
+from swarmauri_standard.embeddings.TfidfEmbedding import TfidfEmbedding
+
+from swarmauri_experimental.vector_stores.HnswVectorStore import HnswVectorStore
+
+CORPUS = [
+    "the cat sat on the mat",
+    "dogs chase cats in the park",
+    "stock markets fell sharply today",
+    "investors sold shares as markets dropped",
+    "a recipe for chocolate cake",
+    "baking bread needs flour and yeast",
+]
+
+
+@pytest.fixture
+def vector_store():
+    embedder = TfidfEmbedding()
+    embedder.fit(CORPUS)
+    vs = HnswVectorStore(embedder=embedder, M=4, ef_construction=20)
+    vs.add_documents([Document(content=text) for text in CORPUS])
+    return vs
+
+
+@pytest.mark.unit
+def test_ubc_resource(vector_store):
+    assert vector_store.resource == "VectorStore"
+
+
+@pytest.mark.unit
+def test_ubc_type(vector_store):
+    assert vector_store.type == "HnswVectorStore"
+
+
+@pytest.mark.unit
+def test_serialization(vector_store):
+    assert (
+        vector_store.id
+        == HnswVectorStore.model_validate_json(vector_store.model_dump_json()).id
+    )
+
+
+@pytest.mark.unit
+def test_retrieve(vector_store):
+    results = vector_store.retrieve("markets fell", top_k=2)
+    assert len(results) == 2
+    assert results[0].content == "stock markets fell sharply today"
+
+
+@pytest.mark.unit
+def test_update_and_delete(vector_store):
+    first = vector_store.documents[0]
+    vector_store.delete_document(first.id)
+    assert vector_store.get_document(first.id) is None
+    assert vector_store.document_count() == 5
+    assert first not in vector_store.retrieve("cat mat", top_k=5)
+
+    target = vector_store.documents[3]
+    updated = Document(id=target.id, content="the cat sat on the mat")
+    vector_store.update_document(target.id, updated)
+    assert vector_store.retrieve("cat mat", top_k=1)[0].content == updated.content
+
+
+@pytest.mark.unit
+def test_requires_embedding_without_embedder():
+    vs = HnswVectorStore()
+    with pytest.raises(ValueError):
+        vs.add_document(Document(content="no embedding"))
+
+
+@pytest.mark.unit
+def test_save_and_load_store(vector_store, tmp_path):
+    vector_store.save_store(str(tmp_path))
+    loaded = HnswVectorStore(embedder=vector_store.embedder)
+    loaded.load_store(str(tmp_path))
+    query = vector_store.embedder.transform(["chocolate cake"])[0]
+    assert [doc.id for doc in loaded.retrieve_by_vector(query, 3)] == [
+        doc.id for doc in vector_store.retrieve_by_vector(query, 3)
+    ]
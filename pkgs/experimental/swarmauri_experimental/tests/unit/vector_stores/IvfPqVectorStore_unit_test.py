@@ -0,0 +1,83 @@
+import pytest
+from swarmauri_standard.documents.Document import Document
+from swarmauri_standard.embeddings.TfidfEmbedding import TfidfEmbedding
+
+from swarmauri_experimental.vector_stores.IvfPqVectorStore import IvfPqVectorStore
+
+CORPUS = [
+    "the cat sat on the mat",
+    "dogs chase cats in the park",
+    "stock markets fell sharply today",
+    "investors sold shares as markets dropped",
+    "a recipe for chocolate cake",
+    "baking bread needs flour and yeast",
+]
+
+
+@pytest.fixture
+def embedder():
+    embedder = TfidfEmbedding()
+    embedder.fit(CORPUS)
+    return embedder
+
+
+@pytest.fixture
+def vector_store(embedder):
+    vs = IvfPqVectorStore(embedder=embedder, nlist=2, m=1, nbits=2, train_size=4)
+    vs.add_documents([Document(content=text) for text in CORPUS])
+    return vs
+
+
+@pytest.mark.unit
+def test_ubc_resource(vector_store):
+    assert vector_store.resource == "VectorStore"
+
+
+@pytest.mark.unit
+def test_ubc_type(vector_store):
+    assert vector_store.type == "IvfPqVectorStore"
+
+
+@pytest.mark.unit
+def test_serialization(vector_store):
+    assert (
+        vector_store.id
+        == IvfPqVectorStore.model_validate_json(vector_store.model_dump_json()).id
+    )
+
+
+@pytest.mark.unit
+def test_embeddings_are_dropped(vector_store):
+    assert all(doc.embedding is None for doc in vector_store.documents)
+    assert vector_store._index.is_trained
+
+
+@pytest.mark.unit
+def test_retrieve_with_rerank(embedder):
+    vs = IvfPqVectorStore(
+        embedder=embedder, nlist=2, m=1, nbits=2, train_size=4, rerank=6
+    )
+    vs.add_documents([Document(content=text) for text in CORPUS])
+    results = vs.retrieve("markets fell", top_k=2)
+    assert len(results) == 2
+    assert results[0].content == "stock markets fell sharply today"
+
+
+@pytest.mark.unit
+def test_update_and_delete(vector_store):
+    first = vector_store.documents[0]
+    vector_store.delete_document(first.id)
+    assert vector_store.get_document(first.id) is None
+    assert vector_store.document_count() == 5
+    assert first.id not in [doc.id for doc in vector_store.retrieve("cat", 5)]
+
+
+@pytest.mark.unit
+def test_save_and_load_store(vector_store, tmp_path):
+    vector_store.save_store(str(tmp_path))
+    loaded = IvfPqVectorStore(embedder=vector_store.embedder)
+    loaded.load_store(str(tmp_path))
+    query = vector_store.embedder.transform(["chocolate cake"])[0]
+    assert [doc.id for doc in loaded.retrieve_by_vector(query, 3)] == [
+        doc.id for doc in vector_store.retrieve_by_vector(query, 3)
+    ]
@@ -1,17 +1,29 @@
 # File: swarmauri/workflows/base.py
 
+import asyncio
+import hashlib
+import json
+import logging
 import threading
-from typing import Any, Dict, List, Tuple, Optional
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 from swarmauri_workflow_statedriven.node import Node
 from swarmauri_workflow_statedriven.transition import Transition
 from swarmauri_workflow_statedriven.state_manager import StateManager
-from swarmauri_workflow_statedriven.exceptions import InvalidTransitionError
+from swarmauri_workflow_statedriven.exceptions import (
+    InvalidTransitionError,
+    WorkflowError,
+)
+from swarmauri_workflow_statedriven.checkpoints.base import CheckpointStore
 from swarmauri_workflow_statedriven.conditions.base import Condition
 from swarmauri_workflow_statedriven.join_strategies.base import JoinStrategy
 from swarmauri_workflow_statedriven.merge_strategies.base import MergeStrategy
 
+logger = logging.getLogger(__name__)
+
 
 class WorkflowBase:
     """
@@ -19,13 +31,33 @@ class WorkflowBase:
     Class: WorkflowBase
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        reuse_outputs: bool = False,
+    ):
         """
         Method: __init__
         Initialize nodes, transitions, state_manager, and a lock for thread safety.
+        Outgoing transitions are also indexed by source state, so that
+        propagating a result only visits the edges leaving its state.
+
+        With a `checkpoint_store`, run() records every node output and join
+        buffer change so that the run can be resumed. With `reuse_outputs`,
+        it also reuses the output of any earlier invocation of a node with
+        the same fingerprint (see Node.fingerprint) on the same prepared
+        input instead of executing it again. Give each state a `version`,
+        or use pydantic agents and tools, for its outputs to be reused.
+        Only run() and resume() checkpoint: run_parallel() and arun() raise
+        a WorkflowError while a `checkpoint_store` is set.
         """
+        self.checkpoint_store = checkpoint_store
+        self.reuse_outputs = reuse_outputs
+        self.run_id: Optional[str] = None
         self.nodes: Dict[str, Node] = {}
         self.transitions: List[Transition] = []
+        self._outgoing: Dict[str, List[Transition]] = {}
+        self._in_degree: Dict[str, int] = {}
         self.state_manager = StateManager()
         self._lock = threading.Lock()
 
@@ -38,10 +70,12 @@ class WorkflowBase:
         input_mode: Any = None,
         join_strategy: Optional[JoinStrategy] = None,
         merge_strategy: Optional[MergeStrategy] = None,
+        version: Optional[str] = None,
     ) -> None:
         """
         Method: add_state
         Registers a Node with its execution backend, input_mode, join and merge strategies.
+        `version` identifies the backend's configuration for reusing outputs.
         """
         node = Node(
             name=name,
@@ -50,6 +84,7 @@ class WorkflowBase:
             input_mode=input_mode,
             join_strategy=join_strategy,
             merge_strategy=merge_strategy,
+            version=version,
         )
         self.nodes[name] = node
 
@@ -62,54 +97,187 @@ class WorkflowBase:
             raise InvalidTransitionError(
                 f"Cannot add transition: '{source}' → '{target}'"
             )
-        self.transitions.append(Transition(source, target, condition))
+        transition = Transition(source, target, condition)
+        self.transitions.append(transition)
+        self._outgoing.setdefault(source, []).append(transition)
+
+        # Joins waiting on every branch need the in-degree of their state.
+        self._in_degree[target] = self._in_degree.get(target, 0) + 1
+        configure = getattr(self.nodes[target].join_strategy, "configure", None)
+        if callable(configure):
+            configure(self._in_degree[target])
+
+    def _propagate(
+        self,
+        state_name: str,
+        output: Any,
+        results: Dict[str, Any],
+        effects: Optional[List[List[Any]]] = None,
+    ) -> List[Tuple[str, Any]]:
+        """
+        Method: _propagate
+        Buffers `output` for the targets of the triggered transitions leaving
+        `state_name`, and returns the (target, merged input) pairs whose join
+        is satisfied. Buffered targets are noted in `effects` when given.
+        """
+        ready: List[Tuple[str, Any]] = []
+        for t in self._outgoing.get(state_name, ()):
+            if not t.condition.evaluate(results):
+                continue
+
+            with self._lock:
+                self.state_manager.buffer_input(t.target, output)
+            if effects is not None:
+                effects.append(["buffer", t.target])
+
+            buffer = self.state_manager.get_buffer(t.target)
+            if self.nodes[t.target].join_strategy.is_satisfied(buffer):
+                raw = self.state_manager.pop_buffer(t.target)
+                merged = self.nodes[t.target].merge_strategy.merge(raw)
+                ready.append((t.target, merged))
+                if effects is not None:
+                    effects.append(["join", None, t.target, merged])
+        return ready
+
+    def _content_key(self, state_name: str, prepared: Any) -> Optional[str]:
+        """
+        Method: _content_key
+        Hash identifying an invocation of `state_name` on its `prepared`
+        input, so that its output can be reused when the node and its input
+        are unchanged, or None when the node has no fingerprint.
+        """
+        fingerprint = self.nodes[state_name].fingerprint()
+        if fingerprint is None:
+            return None
+        identity = [state_name, fingerprint, prepared]
+        encoded = json.dumps(identity, sort_keys=True, default=repr)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
 
-    def run(self, start: str, initial_input: Any) -> Dict[str, Any]:
+    def run(
+        self, start: str, initial_input: Any, run_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Method: run
-        Single‐threaded execution loop.
+        Single‐threaded execution loop. With a checkpoint store, the run is
+        recorded under `run_id` (a new one by default), kept in self.run_id.
         """
         if start not in self.nodes:
             raise InvalidTransitionError(f"Start state '{start}' is not defined")
 
+        self.run_id = None
+        if self.checkpoint_store is not None:
+            self.run_id = run_id or uuid.uuid4().hex
+            self.checkpoint_store.append(
+                self.run_id, {"kind": "start", "state": start, "input": initial_input}
+            )
+
         results: Dict[str, Any] = {}
-        queue: List[Tuple[str, Any]] = [(start, initial_input)]
+        queue: Deque[Tuple[int, str, Any]] = deque([(0, start, initial_input)])
+        return self._drain(queue, results, next_id=1)
 
-        while queue:
-            state_name, data = queue.pop(0)
-            node = self.nodes[state_name]
+    def resume(self, run_id: str) -> Dict[str, Any]:
+        """
+        Method: resume
+        Continue a run recorded in the checkpoint store. Recorded node
+        outputs and join buffers are restored, and only the invocations that
+        had not completed are executed.
+        """
+        if self.checkpoint_store is None:
+            raise WorkflowError("Resuming a run requires a checkpoint store")
+        checkpoint = self.checkpoint_store.load(run_id)
+        if checkpoint is None:
+            raise WorkflowError(f"No checkpoint recorded for run '{run_id}'")
 
-            # ① Run the node (handles input_mode, split, merge, batch internally)
-            print(
-                f"[DEBUG] Running {node.name} with \n\tdata: {data}\n\tresults: {results}"
-            )
-            output = node.run(self.state_manager, data, results)
+        self.run_id = run_id
+        results = dict(checkpoint.results)
+        with self._lock:
+            self.state_manager.state.update(checkpoint.results)
+            self.state_manager.join_buffers = {
+                target: list(buffer)
+                for target, buffer in checkpoint.join_buffers.items()
+            }
+        if checkpoint.finished:
+            return results
 
-            # ② If split mode returned None, that work was re-enqueued
-            if output is None:
-                continue
+        queue: Deque[Tuple[int, str, Any]] = deque(
+            (invocation, state_name, data)
+            for invocation, (state_name, data) in checkpoint.pending.items()
+        )
+        return self._drain(queue, results, next_id=checkpoint.next_id)
 
-            # ③ Record result
-            results[state_name] = output
-            with self._lock:
-                self.state_manager.update_state(state_name, output)
+    def _drain(
+        self,
+        queue: Deque[Tuple[int, str, Any]],
+        results: Dict[str, Any],
+        next_id: int,
+    ) -> Dict[str, Any]:
+        """
+        Method: _drain
+        Runs queued invocations until none is left, recording each step in
+        the checkpoint store when there is one.
+        """
+        store = self.checkpoint_store
+        while queue:
+            invocation, state_name, data = queue.popleft()
+            node = self.nodes[state_name]
 
-            # ④ Propagate through transitions
-            for t in self.transitions:
-                if t.source != state_name or not t.condition.evaluate(results):
-                    continue
+            # ① Run the node on its prepared input (split mode re-enqueues and
+            # returns None), unless the same invocation was recorded before
+            key = None
+            reused = False
+            output = None
+            prepared = node.prepare_input(self.state_manager, data, results)
+            if prepared is not None:
+                if store is not None:
+                    key = self._content_key(state_name, prepared)
+                    if key is not None and self.reuse_outputs:
+                        reused, output = store.lookup(key)
+                if reused:
+                    logger.debug("Reusing the recorded output of %s", node.name)
+                else:
+                    logger.debug("Running %s", node.name)
+                    output = node.run_prepared(prepared)
 
+            # ② If split mode returned None, that work was re-enqueued
+            effects: List[List[Any]] = []
+            if output is not None:
+                # ③ Record result
+                results[state_name] = output
                 with self._lock:
-                    self.state_manager.buffer_input(t.target, output)
+                    self.state_manager.update_state(state_name, output)
+
+                # ④ Propagate through transitions
+                self._propagate(state_name, output, results, effects)
+                for effect in effects:
+                    if effect[0] == "join":
+                        effect[1] = next_id
+                        queue.append((next_id, effect[2], effect[3]))
+                        next_id += 1
 
-                buffer = self.state_manager.get_buffer(t.target)
-                if self.nodes[t.target].join_strategy.is_satisfied(buffer):
-                    raw = self.state_manager.pop_buffer(t.target)
-                    merged = self.nodes[t.target].merge_strategy.merge(raw)
-                    queue.append((t.target, merged))
+            if store is not None:
+                store.append(
+                    self.run_id,
+                    {
+                        "kind": "step",
+                        "id": invocation,
+                        "state": state_name,
+                        "output": output,
+                        "key": key if output is not None else None,
+                        "effects": effects,
+                    },
+                )
 
+        if store is not None:
+            store.append(self.run_id, {"kind": "finish"})
         return results
 
+    def _require_no_checkpoints(self, method: str) -> None:
+        if self.checkpoint_store is not None:
+            raise WorkflowError(
+                f"{method}() does not record checkpoints; use run() with a "
+                "checkpoint_store, or unset it"
+            )
+
     def run_parallel(
         self, start: str, initial_input: Any, max_workers: int = None
     ) -> Dict[str, Any]:
@@ -117,48 +285,93 @@ class WorkflowBase:
         Method: run_parallel
         Executes ready‐to‐run node invocations in parallel threads.
         """
+        self._require_no_checkpoints("run_parallel")
         if start not in self.nodes:
             raise InvalidTransitionError(f"Start state '{start}' is not defined")
 
         results: Dict[str, Any] = {}
         executor = ThreadPoolExecutor(max_workers=max_workers)
-        futures = []
 
         def _run_node(name: str, payload: Any) -> Tuple[str, Any]:
             node = self.nodes[name]
             return name, node.run(self.state_manager, payload, results)
 
         # Seed with the start state
-        futures.append(executor.submit(_run_node, start, initial_input))
+        futures = {executor.submit(_run_node, start, initial_input)}
 
-        while futures:
-            done, _ = wait(futures, return_when=FIRST_COMPLETED)
-            for fut in done:
-                state_name, output = fut.result()
-                futures.remove(fut)
+        try:
+            while futures:
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    state_name, output = fut.result()
 
-                # If split, skip recording & scheduling (node.run already re-queued)
-                if output is None:
-                    continue
-
-                # Record under lock
-                with self._lock:
-                    results[state_name] = output
-                    self.state_manager.update_state(state_name, output)
-
-                # Schedule downstream work
-                for t in self.transitions:
-                    if t.source != state_name or not t.condition.evaluate(results):
+                    # If split, skip recording & scheduling (node.run already re-queued)
+                    if output is None:
                         continue
 
+                    # Record under lock
                     with self._lock:
-                        self.state_manager.buffer_input(t.target, output)
+                        results[state_name] = output
+                        self.state_manager.update_state(state_name, output)
 
-                    buffer = self.state_manager.get_buffer(t.target)
-                    if self.nodes[t.target].join_strategy.is_satisfied(buffer):
-                        raw = self.state_manager.pop_buffer(t.target)
-                        merged = self.nodes[t.target].merge_strategy.merge(raw)
-                        futures.append(executor.submit(_run_node, t.target, merged))
+                    # Schedule downstream work
+                    for target, merged in self._propagate(state_name, output, results):
+                        futures.add(executor.submit(_run_node, target, merged))
+        finally:
+            executor.shutdown(wait=True)
+        return results
 
-        executor.shutdown(wait=True)
+    async def arun(
+        self, start: str, initial_input: Any, max_concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Method: arun
+        Executes ready‐to‐run node invocations concurrently on the running
+        event loop. Async agents and tools are awaited natively, and at most
+        `max_concurrency` invocations run at once when it is given. When an
+        invocation fails, the others are cancelled and awaited before the
+        error is raised.
+        """
+        self._require_no_checkpoints("arun")
+        if start not in self.nodes:
+            raise InvalidTransitionError(f"Start state '{start}' is not defined")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+
+        results: Dict[str, Any] = {}
+        ready: Deque[Tuple[str, Any]] = deque([(start, initial_input)])
+        running: Dict[asyncio.Task, str] = {}
+        limit = float("inf") if max_concurrency is None else max_concurrency
+
+        try:
+            while ready or running:
+                while ready and len(running) < limit:
+                    name, payload = ready.popleft()
+                    node = self.nodes[name]
+                    task = asyncio.ensure_future(
+                        node.arun(self.state_manager, payload, results)
+                    )
+                    running[task] = name
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    state_name = running.pop(task)
+                    output = task.result()
+
+                    # If split, skip recording & scheduling
+                    if output is None:
+                        continue
+
+                    results[state_name] = output
+                    with self._lock:
+                        self.state_manager.update_state(state_name, output)
+                    ready.extend(self._propagate(state_name, output, results))
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
         return results
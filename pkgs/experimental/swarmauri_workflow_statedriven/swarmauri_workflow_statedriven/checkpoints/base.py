@@ -0,0 +1,116 @@
+# File: swarmauri/workflows/checkpoints/base.py
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class RunCheckpoint:
+    """
+    File: checkpoints/base.py
+    Class: RunCheckpoint
+
+    The state of a workflow run rebuilt from its recorded events.
+    """
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.start: Optional[str] = None
+        self.results: Dict[str, Any] = {}
+        self.join_buffers: Dict[str, List[Any]] = {}
+        # invocation id -> (state name, input), in scheduling order
+        self.pending: Dict[int, Tuple[str, Any]] = {}
+        self.next_id: int = 0
+        self.finished: bool = False
+
+
+class CheckpointStore(ABC):
+    """
+    File: checkpoints/base.py
+    Class: CheckpointStore
+
+    Persists the events of workflow runs so that they can be resumed, and
+    the outputs of node invocations by content hash so that they can be
+    reused across runs.
+
+    A run is recorded as a "start" event, one "step" event per completed
+    invocation, and a "finish" event. A step holds the node output and the
+    join-buffer effects of propagating it, in order: ["buffer", target] for
+    an output buffered on `target`, and ["join", id, target, input] for a
+    satisfied join scheduling invocation `id` of `target`. Each step is
+    written at once, so a crash never leaves half of a step recorded.
+    Events are serialized as JSON, so outputs must be JSON-serializable.
+    """
+
+    @abstractmethod
+    def append(self, run_id: str, event: Dict[str, Any]) -> None:
+        """
+        Method: append
+        Durably record `event` for `run_id`. A "step" event carrying a
+        "key" also records its output for lookup().
+        """
+        ...
+
+    @abstractmethod
+    def events(self, run_id: str) -> Iterable[Dict[str, Any]]:
+        """
+        Method: events
+        Return the events recorded for `run_id`, in order.
+        """
+        ...
+
+    @abstractmethod
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """
+        Method: lookup
+        Return (True, output) for an invocation recorded under content hash
+        `key` in any run, and (False, None) otherwise.
+        """
+        ...
+
+    def dumps(self, value: Any) -> str:
+        """
+        Method: dumps
+        Serialize an event or output.
+        """
+        return json.dumps(value, sort_keys=True)
+
+    def loads(self, data: str) -> Any:
+        """
+        Method: loads
+        Deserialize an event or output.
+        """
+        return json.loads(data)
+
+    def load(self, run_id: str) -> Optional[RunCheckpoint]:
+        """
+        Method: load
+        Replay the events of `run_id`, or return None if it was never started.
+        """
+        checkpoint = RunCheckpoint(run_id)
+        started = False
+        for event in self.events(run_id):
+            kind = event["kind"]
+            if kind == "start":
+                started = True
+                checkpoint.start = event["state"]
+                checkpoint.pending[0] = (event["state"], event["input"])
+                checkpoint.next_id = 1
+            elif kind == "step":
+                checkpoint.pending.pop(event["id"], None)
+                output = event["output"]
+                if output is not None:
+                    checkpoint.results[event["state"]] = output
+                for effect in event["effects"]:
+                    if effect[0] == "buffer":
+                        checkpoint.join_buffers.setdefault(effect[1], []).append(
+                            output
+                        )
+                    else:
+                        _, invocation, target, payload = effect
+                        checkpoint.join_buffers.pop(target, None)
+                        checkpoint.pending[invocation] = (target, payload)
+                        checkpoint.next_id = max(checkpoint.next_id, invocation + 1)
+            elif kind == "finish":
+                checkpoint.finished = True
+        return checkpoint if started else None
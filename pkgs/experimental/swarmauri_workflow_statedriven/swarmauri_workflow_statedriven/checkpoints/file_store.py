@@ -0,0 +1,94 @@
+# File: swarmauri/workflows/checkpoints/file_store.py
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Tuple, Union
+
+from swarmauri_workflow_statedriven.checkpoints.base import CheckpointStore
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    File: checkpoints/file_store.py
+    Class: FileCheckpointStore
+
+    Checkpoint store appending one JSON line per event to a single file.
+    Lines are only ever appended, so a crash can at most truncate the last
+    one, which is ignored when the file is read back. Recorded outputs are
+    not kept in memory: each key is indexed to the offset of its line, which
+    lookup() reads back.
+    """
+
+    def __init__(self, path: Union[str, Path], fsync: bool = False):
+        """
+        Method: __init__
+        Open (creating if needed) the log at `path`. With `fsync`, every
+        event is flushed to disk before append() returns.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        # key -> byte offset of the line recording its output
+        self._offsets: Dict[str, int] = {}
+        for offset, record in self._records():
+            if record.get("kind") == "step" and record.get("key"):
+                self._offsets[record["key"]] = offset
+        self._file = open(self.path, "ab")
+        if self._file.tell():
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # Start after a partially written last line
+                    self._file.write(b"\n")
+        self._reader = open(self.path, "rb")
+
+    def _records(self) -> Iterable[Tuple[int, Dict[str, Any]]]:
+        if not self.path.exists():
+            return
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    yield offset, self.loads(line.decode("utf-8"))
+                except ValueError:
+                    # Partially written last line
+                    pass
+                offset += len(line)
+
+    def append(self, run_id: str, event: Dict[str, Any]) -> None:
+        line = self.dumps({**event, "run_id": run_id}).encode("utf-8") + b"\n"
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            if event.get("kind") == "step" and event.get("key"):
+                self._offsets[event["key"]] = offset
+
+    def events(self, run_id: str) -> Iterable[Dict[str, Any]]:
+        with self._lock:
+            return [
+                record
+                for _, record in self._records()
+                if record["run_id"] == run_id
+            ]
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            offset = self._offsets.get(key)
+            if offset is None:
+                return False, None
+            self._reader.seek(offset)
+            line = self._reader.readline()
+        return True, self.loads(line.decode("utf-8"))["output"]
+
+    def close(self) -> None:
+        """
+        Method: close
+        Close the log file.
+        """
+        self._file.close()
+        self._reader.close()
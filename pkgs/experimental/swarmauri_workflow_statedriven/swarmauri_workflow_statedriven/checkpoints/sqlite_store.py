@@ -0,0 +1,77 @@
+# File: swarmauri/workflows/checkpoints/sqlite_store.py
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Tuple, Union
+
+from swarmauri_workflow_statedriven.checkpoints.base import CheckpointStore
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    File: checkpoints/sqlite_store.py
+    Class: SQLiteCheckpointStore
+
+    Checkpoint store backed by a local SQLite database. Each event is
+    committed in its own transaction, together with the output it records.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """
+        Method: __init__
+        Open (creating if needed) the database at `path`.
+        """
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "run_id TEXT NOT NULL, event TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS events_run ON events (run_id, seq)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS outputs ("
+                "key TEXT PRIMARY KEY, output TEXT NOT NULL)"
+            )
+
+    def append(self, run_id: str, event: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO events (run_id, event) VALUES (?, ?)",
+                (run_id, self.dumps(event)),
+            )
+            if event.get("kind") == "step" and event.get("key"):
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO outputs (key, output) VALUES (?, ?)",
+                    (event["key"], self.dumps(event["output"])),
+                )
+
+    def events(self, run_id: str) -> Iterable[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT event FROM events WHERE run_id = ? ORDER BY seq", (run_id,)
+            ).fetchall()
+        return [self.loads(row[0]) for row in rows]
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT output FROM outputs WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return False, None
+        return True, self.loads(row[0])
+
+    def close(self) -> None:
+        """
+        Method: close
+        Close the database connection.
+        """
+        self._conn.close()
@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 from pyppeteer import launch
 
 from swarmauri_workflow_statedriven.base import WorkflowBase
+from swarmauri_workflow_statedriven.checkpoints.base import CheckpointStore
 
 
 class WorkflowGraph(WorkflowBase):
@@ -16,7 +17,11 @@ class WorkflowGraph(WorkflowBase):
     An executable workflow graph with DOT→text and headless PNG export.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        reuse_outputs: bool = False,
+    ):
         """
         File: workflows/graph.py
         Class: WorkflowGraph
@@ -24,17 +29,22 @@ class WorkflowGraph(WorkflowBase):
 
         Initialize using the WorkflowBase constructor.
         """
-        super().__init__()
+        super().__init__(
+            checkpoint_store=checkpoint_store, reuse_outputs=reuse_outputs
+        )
 
-    def execute(self, start: str, initial_input: Any) -> Dict[str, Any]:
+    def execute(
+        self, start: str, initial_input: Any, run_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         File: workflows/graph.py
         Class: WorkflowGraph
         Method: execute
 
-        Run the workflow from the given start state.
+        Run the workflow from the given start state, recording it under
+        `run_id` when a checkpoint store is configured.
         """
-        return self.run(start, initial_input)
+        return self.run(start, initial_input, run_id=run_id)
 
     def to_dot(self) -> str:
         """
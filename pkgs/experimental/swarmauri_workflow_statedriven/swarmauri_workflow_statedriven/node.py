@@ -1,6 +1,8 @@
 # File: swarmauri/workflows/node.py
 from __future__ import annotations
 from typing import Any, Dict, List, Optional
+import asyncio
+import inspect
 import json
 from swarmauri_workflow_statedriven.input_modes.base import InputMode
 from swarmauri_workflow_statedriven.input_modes.first import FirstInputMode
@@ -21,7 +23,12 @@ class Node:
       - prepare_input: apply InputMode.prepare
       - execute: run the agent.exec or tool.run on a scalar
       - batch: run agent.batch/tool.batch or fallback to execute-per-item
-      - run: orchestrate prepare_input + execute()/batch()
+      - run: orchestrate prepare_input + run_prepared()
+      - run_prepared: dispatch a prepared input to execute()/batch()
+      - fingerprint: identify what the node computes, to reuse its outputs
+      - aexecute / abatch / arun: async counterparts awaiting agent.aexec,
+        tool.acall and their batch methods natively, and running blocking
+        backends in a worker thread
       - validate: sanity‑check output (default always True)
     """
 
@@ -33,6 +40,7 @@ class Node:
         input_mode: "InputMode" = None,
         join_strategy: "JoinStrategy" = None,
         merge_strategy: "MergeStrategy" = None,
+        version: Optional[str] = None,
     ):
         """
         File: workflows/node.py
@@ -46,6 +54,8 @@ class Node:
             input_mode: strategy for shaping raw data
             join_strategy: strategy for gating multi-branch joins
             merge_strategy: strategy for combining buffered inputs
+            version: identifies the agent/tool configuration; change it
+                whenever the node would produce different outputs
         Raises:
             ValueError if neither or both of agent/tool are provided.
         """
@@ -58,6 +68,7 @@ class Node:
         self.input_mode = input_mode or FirstInputMode()
         self.join_strategy = join_strategy or FirstJoinStrategy()
         self.merge_strategy = merge_strategy or ListMergeStrategy()
+        self.version = version
 
     def prepare_input(
         self, state_manager: "StateManager", data: Any, results: Dict[str, Any]
@@ -137,10 +148,108 @@ class Node:
         prepared = self.prepare_input(state_manager, data, results)
         if prepared is None:
             return None
+        return self.run_prepared(prepared)
+
+    def run_prepared(self, prepared: Any) -> Any:
+        """
+        File: workflows/node.py
+        Class: Node
+        Method: run_prepared
+
+        Dispatches an input returned by prepare_input() to batch() if it is
+        a list, else to execute().
+        """
         if isinstance(prepared, list):
             return self.batch(prepared)
         return self.execute(prepared)
 
+    def fingerprint(self) -> Optional[List[Any]]:
+        """
+        File: workflows/node.py
+        Class: Node
+        Method: fingerprint
+
+        Identifies what the node computes: the classes of its backend and
+        input mode with its `version`, or, without one, the configuration
+        of a pydantic agent or tool (`model_dump`). Returns None when the
+        node cannot be identified, in which case its outputs are never
+        reused.
+        """
+        backend = self.agent if self.agent is not None else self.tool
+        identity: List[Any] = [
+            type(backend).__module__,
+            type(backend).__qualname__,
+            type(self.input_mode).__qualname__,
+        ]
+        if self.version is not None:
+            return identity + [self.version]
+        dump = getattr(backend, "model_dump", None)
+        if not callable(dump):
+            return None
+        try:
+            return identity + [dump(mode="json")]
+        except Exception:
+            return None
+
+    async def aexecute(self, input_data: Any) -> Any:
+        """
+        File: workflows/node.py
+        Class: Node
+        Method: aexecute
+
+        Awaits agent.aexec or tool.acall when they are coroutine functions,
+        otherwise runs execute() in a worker thread.
+        """
+        if self.agent:
+            method = getattr(self.agent, "aexec", None)
+            if inspect.iscoroutinefunction(method):
+                if isinstance(input_data, (dict, list)):
+                    try:
+                        input_data = json.dumps(input_data)
+                    except (TypeError, ValueError):
+                        pass
+                return await method(input_data)
+        elif self.tool:
+            method = getattr(self.tool, "acall", None)
+            if inspect.iscoroutinefunction(method):
+                return await method(input_data)
+        return await asyncio.to_thread(self.execute, input_data)
+
+    async def abatch(self, inputs: List[Any]) -> Any:
+        """
+        File: workflows/node.py
+        Class: Node
+        Method: abatch
+
+        Awaits agent.abatch or tool.abatch when they are coroutine functions,
+        runs a synchronous batch() in a worker thread, and otherwise runs
+        aexecute() for all items concurrently.
+        """
+        backend = self.agent or self.tool
+        method = getattr(backend, "abatch", None)
+        if inspect.iscoroutinefunction(method):
+            return await method(inputs)
+        if hasattr(backend, "batch"):
+            return await asyncio.to_thread(self.batch, inputs)
+        return list(await asyncio.gather(*(self.aexecute(item) for item in inputs)))
+
+    async def arun(
+        self, state_manager: "StateManager", data: Any, results: Dict[str, Any]
+    ) -> Any:
+        """
+        File: workflows/node.py
+        Class: Node
+        Method: arun
+
+        Async counterpart of run(), dispatching to abatch() or aexecute().
+        """
+        prepared = self.prepare_input(state_manager, data, results)
+        if prepared is None:
+            return None
+        if isinstance(prepared, list):
+            return await self.abatch(prepared)
+        return await self.aexecute(prepared)
+
     def validate(self, output: Any) -> bool:
         """
         File: workflows/node.py
@@ -0,0 +1,97 @@
+# File: tests/workflows/checkpoints/test_checkpoint_stores.py
+
+import pytest
+from swarmauri_workflow_statedriven.checkpoints.file_store import FileCheckpointStore
+from swarmauri_workflow_statedriven.checkpoints.sqlite_store import (
+    SQLiteCheckpointStore,
+)
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        store = SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+    else:
+        store = FileCheckpointStore(tmp_path / "checkpoints.jsonl")
+    yield store
+    store.close()
+
+
+def _record_fan_in(store, run_id: str) -> None:
+    store.append(run_id, {"kind": "start", "state": "A", "input": "x"})
+    store.append(
+        run_id,
+        {
+            "kind": "step",
+            "id": 0,
+            "state": "A",
+            "output": "a",
+            "key": "key-a",
+            "effects": [
+                ["buffer", "B"],
+                ["join", 1, "B", ["a"]],
+                ["buffer", "C"],
+                ["join", 2, "C", ["a"]],
+            ],
+        },
+    )
+    store.append(
+        run_id,
+        {
+            "kind": "step",
+            "id": 1,
+            "state": "B",
+            "output": "b",
+            "key": "key-b",
+            "effects": [["buffer", "D"]],
+        },
+    )
+
+
+@pytest.mark.unit
+def test_load_replays_results_buffers_and_pending(store):
+    """
+    Test CheckpointStore.load rebuilds a run interrupted mid-way.
+    """
+    _record_fan_in(store, "run-1")
+    checkpoint = store.load("run-1")
+    assert checkpoint.start == "A"
+    assert checkpoint.results == {"A": "a", "B": "b"}
+    assert checkpoint.join_buffers == {"D": ["b"]}
+    assert checkpoint.pending == {2: ("C", ["a"])}
+    assert checkpoint.next_id == 3
+    assert not checkpoint.finished
+
+    store.append("run-1", {"kind": "finish"})
+    assert store.load("run-1").finished
+    assert store.load("unknown") is None
+
+
+@pytest.mark.unit
+def test_lookup_finds_outputs_of_any_run(store):
+    """
+    Test CheckpointStore.lookup returns outputs by content hash.
+    """
+    _record_fan_in(store, "run-1")
+    assert store.lookup("key-b") == (True, "b")
+    assert store.lookup("missing") == (False, None)
+
+
+@pytest.mark.unit
+def test_file_store_ignores_partially_written_line(tmp_path):
+    """
+    Test FileCheckpointStore skips a truncated last line and keeps appending.
+    """
+    path = tmp_path / "checkpoints.jsonl"
+    store = FileCheckpointStore(path)
+    _record_fan_in(store, "run-1")
+    store.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"kind": "st')
+
+    store = FileCheckpointStore(path)
+    store.append("run-1", {"kind": "finish"})
+    store.close()
+    checkpoint = FileCheckpointStore(path).load("run-1")
+    assert checkpoint.finished
+    assert checkpoint.results == {"A": "a", "B": "b"}
@@ -1,11 +1,26 @@
 # File: tests/workflows/test_base.py
 
+import asyncio
+import time
+from typing import ClassVar
+
 import pytest
+from pydantic import BaseModel
 from swarmauri_workflow_statedriven.base import WorkflowBase
 from swarmauri_workflow_statedriven.conditions.function_condition import (
     FunctionCondition,
 )
-from swarmauri_workflow_statedriven.exceptions import InvalidTransitionError
+from swarmauri_workflow_statedriven.checkpoints.file_store import FileCheckpointStore
+from swarmauri_workflow_statedriven.checkpoints.sqlite_store import (
+    SQLiteCheckpointStore,
+)
+from swarmauri_workflow_statedriven.exceptions import (
+    InvalidTransitionError,
+    WorkflowError,
+)
+from swarmauri_workflow_statedriven.input_modes.aggregate import AggregateInputMode
+from swarmauri_workflow_statedriven.input_modes.identity import IdentityInputMode
+from swarmauri_workflow_statedriven.join_strategies.all_join import AllJoinStrategy
 
 
 class DummyAgent:
@@ -113,3 +128,336 @@ def test_run_parallel_equivalence():
     seq = wf.run("X", "foo")
     par = wf.run_parallel("X", "foo", max_workers=2)
     assert seq == par
+
+
+class AsyncAgent:
+    """
+    Agent stub whose aexec sleeps before answering.
+    """
+
+    def __init__(self, suffix: str = "", delay: float = 0.1):
+        self.suffix = suffix
+        self.delay = delay
+
+    def exec(self, input_data):
+        raise AssertionError("arun should await aexec")
+
+    async def aexec(self, input_data):
+        await asyncio.sleep(self.delay)
+        return f"{input_data}{self.suffix}"
+
+
+def _fan_out_fan_in(width: int, agent_factory) -> WorkflowBase:
+    wf = WorkflowBase()
+    wf.add_state("start", agent=agent_factory(""))
+    wf.add_state(
+        "end",
+        agent=agent_factory("_E"),
+        input_mode=IdentityInputMode(),
+        join_strategy=AllJoinStrategy(),
+    )
+    always = FunctionCondition(lambda s: True)
+    for i in range(width):
+        wf.add_state(f"branch{i}", agent=agent_factory(f"_{i}"))
+        wf.add_transition("start", f"branch{i}", always)
+        wf.add_transition(f"branch{i}", "end", always)
+    return wf
+
+
+def test_add_transition_configures_join_in_degree():
+    """
+    Test WorkflowBase.add_transition sets the in-degree of an AllJoinStrategy.
+    """
+    wf = _fan_out_fan_in(3, DummyAgent)
+    assert wf.nodes["end"].join_strategy.expected_count == 3
+    results = wf.run("start", "x")
+    assert results["end"] == ["x_0_E", "x_1_E", "x_2_E"]
+    parallel = wf.run_parallel("start", "x", max_workers=3)
+    assert sorted(parallel["end"]) == results["end"]
+
+
+def test_arun_awaits_async_agents_concurrently():
+    """
+    Test WorkflowBase.arun runs independent branches concurrently (WorkflowBase.arun).
+    """
+    wf = _fan_out_fan_in(10, AsyncAgent)
+    started = time.perf_counter()
+    results = asyncio.run(wf.arun("start", "x"))
+    assert time.perf_counter() - started < 0.6
+    assert sorted(results["end"]) == sorted(f"x_{i}_E" for i in range(10))
+
+    started = time.perf_counter()
+    asyncio.run(wf.arun("start", "x", max_concurrency=2))
+    assert time.perf_counter() - started >= 0.6
+
+
+class FailingAgent:
+    """
+    Agent stub whose aexec raises.
+    """
+
+    async def aexec(self, input_data):
+        raise RuntimeError("boom")
+
+
+class BlockingAgent:
+    """
+    Agent stub whose aexec waits until it is cancelled.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+
+    async def aexec(self, input_data):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+def test_arun_awaits_cancelled_invocations_when_one_fails():
+    """
+    Test WorkflowBase.arun finishes the cancelled invocations before raising.
+    """
+    blocking = BlockingAgent()
+    wf = WorkflowBase()
+    wf.add_state("start", agent=DummyAgent())
+    wf.add_state("fail", agent=FailingAgent())
+    wf.add_state("block", agent=blocking)
+    wf.add_transition("start", "fail", FunctionCondition(lambda s: True))
+    wf.add_transition("start", "block", FunctionCondition(lambda s: True))
+
+    async def main():
+        with pytest.raises(Exception):
+            await wf.arun("start", "x")
+        return blocking.cancelled
+
+    assert asyncio.run(main()) is True
+
+
+def test_arun_rejects_max_concurrency_below_one():
+    """
+    Test WorkflowBase.arun rejects a max_concurrency that would run nothing.
+    """
+    wf = WorkflowBase()
+    wf.add_state("X", agent=DummyAgent())
+    with pytest.raises(ValueError):
+        asyncio.run(wf.arun("X", "foo", max_concurrency=0))
+
+
+def test_arun_runs_sync_agents_in_threads():
+    """
+    Test WorkflowBase.arun falls back to exec() for agents without aexec.
+    """
+    wf = WorkflowBase()
+    wf.add_state("X", agent=DummyAgent(suffix="1"))
+    wf.add_state("Y", agent=DummyAgent(suffix="2"))
+    wf.add_transition("X", "Y", FunctionCondition(lambda s: True))
+    assert asyncio.run(wf.arun("X", "foo")) == wf.run("X", "foo")
+
+
+@pytest.mark.perf
+def test_run_overhead_is_linear_in_fan_out():
+    """
+    Test WorkflowBase.run scales linearly on wide fan-out/fan-in graphs.
+    """
+
+    def timed(width: int) -> float:
+        wf = _fan_out_fan_in(width, DummyAgent)
+        started = time.perf_counter()
+        wf.run("start", "x")
+        return time.perf_counter() - started
+
+    timed(500)
+    small = min(timed(500) for _ in range(3))
+    large = min(timed(4000) for _ in range(3))
+    # 8x the nodes; a quadratic scheduler would take about 64x as long.
+    assert large < small * 24
+
+
+class FlakyAgent:
+    """
+    Agent stub counting its calls, failing while `fail` is set.
+    """
+
+    def __init__(self, suffix: str = ""):
+        self.suffix = suffix
+        self.calls = 0
+        self.fail = False
+
+    def exec(self, input_data):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("crashed")
+        return f"{input_data}{self.suffix}"
+
+
+def test_resume_skips_recorded_nodes_and_rebuilds_joins(tmp_path):
+    """
+    Test WorkflowBase.resume continues a crashed run from its checkpoints.
+    """
+    agents = {}
+
+    def factory(suffix):
+        agents[suffix] = FlakyAgent(suffix)
+        return agents[suffix]
+
+    wf = _fan_out_fan_in(3, factory)
+    wf.checkpoint_store = SQLiteCheckpointStore(tmp_path / "runs.db")
+    agents["_1"].fail = True
+    with pytest.raises(RuntimeError):
+        wf.run("start", "x", run_id="run-1")
+
+    agents["_1"].fail = False
+    resumed = _fan_out_fan_in(3, factory)
+    resumed.checkpoint_store = wf.checkpoint_store
+    results = resumed.resume("run-1")
+    assert results["end"] == ["x_0_E", "x_1_E", "x_2_E"]
+    # Only the crashed branch and the ones after it ran again.
+    assert agents[""].calls == 0
+    assert agents["_0"].calls == 0
+    assert agents["_1"].calls == 1
+    assert resumed.resume("run-1") == results
+    # The join ran once, on its three buffered inputs.
+    assert agents["_E"].calls == 3
+
+
+def test_run_reuses_unchanged_outputs_across_runs(tmp_path):
+    """
+    Test WorkflowBase.run reuses recorded outputs of identical invocations.
+    """
+    store = FileCheckpointStore(tmp_path / "runs.jsonl")
+    wf = WorkflowBase(checkpoint_store=store, reuse_outputs=True)
+    first, second = FlakyAgent("1"), FlakyAgent("2")
+    wf.add_state("X", agent=first, version="1")
+    wf.add_state("Y", agent=second, version="1")
+    wf.add_transition("X", "Y", FunctionCondition(lambda s: True))
+
+    results = wf.run("X", "foo")
+    assert wf.run("X", "foo") == results
+    assert (first.calls, second.calls) == (1, 1)
+    assert wf.run("X", "bar")["Y"] == "bar12"
+    assert (first.calls, second.calls) == (2, 2)
+
+    wf.reuse_outputs = False
+    wf.run("X", "foo")
+    assert (first.calls, second.calls) == (3, 3)
+
+    with pytest.raises(WorkflowError):
+        WorkflowBase().resume("run")
+
+
+class ConfiguredAgent(BaseModel):
+    """
+    Pydantic agent stub whose output depends on its configuration.
+    """
+
+    model: str
+    calls: ClassVar[int] = 0
+
+    def exec(self, input_data):
+        ConfiguredAgent.calls += 1
+        return f"{self.model} {input_data}"
+
+
+def test_outputs_are_reused_only_for_the_same_node_configuration(tmp_path):
+    """
+    Test recorded outputs are keyed on the node's fingerprint, not its class.
+    """
+    store = SQLiteCheckpointStore(tmp_path / "runs.db")
+
+    def workflow(model, reuse_outputs=True):
+        wf = WorkflowBase(checkpoint_store=store, reuse_outputs=reuse_outputs)
+        wf.add_state("summarize", agent=ConfiguredAgent(model=model))
+        return wf
+
+    ConfiguredAgent.calls = 0
+    assert workflow("gpt-4").run("summarize", "hello")["summarize"] == (
+        "gpt-4 hello"
+    )
+    assert workflow("gpt-4o").run("summarize", "hello")["summarize"] == (
+        "gpt-4o hello"
+    )
+    assert ConfiguredAgent.calls == 2
+    assert workflow("gpt-4").run("summarize", "hello")["summarize"] == (
+        "gpt-4 hello"
+    )
+    assert ConfiguredAgent.calls == 2
+
+    # Outputs are not reused by default, nor for nodes without a fingerprint.
+    workflow("gpt-4", reuse_outputs=False).run("summarize", "hello")
+    assert ConfiguredAgent.calls == 3
+    agent = FlakyAgent("!")
+    for _ in range(2):
+        wf = WorkflowBase(checkpoint_store=store, reuse_outputs=True)
+        wf.add_state("summarize", agent=agent)
+        assert wf.run("summarize", "hello")["summarize"] == "hello!"
+    assert agent.calls == 2
+
+
+def test_reused_outputs_are_keyed_on_the_prepared_input(tmp_path):
+    """
+    Test nodes reading earlier results are not reused when those differ.
+    """
+
+    class ConstantAgent:
+        def exec(self, input_data):
+            return "b"
+
+    store = FileCheckpointStore(tmp_path / "runs.jsonl")
+    wf = WorkflowBase(checkpoint_store=store, reuse_outputs=True)
+    source = DummyAgent()
+    report = FlakyAgent()
+    wf.add_state("A", agent=source, version="1")
+    wf.add_state("B", agent=ConstantAgent(), version="1")
+    wf.add_state("C", agent=report, input_mode=AggregateInputMode(), version="1")
+    wf.add_transition("A", "B", FunctionCondition(lambda s: True))
+    wf.add_transition("B", "C", FunctionCondition(lambda s: True))
+
+    wf.run("A", "x")
+    wf.run("A", "x")
+    assert report.calls == 1
+
+    # C receives the same output of B, but aggregates a different one of A.
+    source.suffix = "-changed"
+    wf.nodes["A"].version = "2"
+    assert "x-changed" in wf.run("A", "x")["C"]
+    assert report.calls == 2
+
+
+def test_file_store_reads_outputs_back_from_the_log(tmp_path):
+    """
+    Test FileCheckpointStore indexes outputs by offset instead of holding them.
+    """
+    path = tmp_path / "runs.jsonl"
+    store = FileCheckpointStore(path)
+    store.append("run", {"kind": "step", "key": "a", "output": "café"})
+    store.append("run", {"kind": "step", "key": "b", "output": ["x", 1]})
+    store.append("run", {"kind": "step", "key": "e", "output": "large output"})
+    assert store.lookup("a") == (True, "café")
+    assert store.lookup("b") == (True, ["x", 1])
+    assert store.lookup("c") == (False, None)
+    assert not any("large output" in repr(value) for value in vars(store).values())
+    store.close()
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"kind": "step", "key": "c", "out')
+    reopened = FileCheckpointStore(path)
+    reopened.append("run", {"kind": "step", "key": "d", "output": "d"})
+    assert reopened.lookup("b") == (True, ["x", 1])
+    assert reopened.lookup("c") == (False, None)
+    assert reopened.lookup("d") == (True, "d")
+    reopened.close()
+
+
+def test_concurrent_runs_refuse_a_checkpoint_store(tmp_path):
+    """
+    Test run_parallel and arun raise instead of silently not checkpointing.
+    """
+    wf = WorkflowBase(checkpoint_store=FileCheckpointStore(tmp_path / "r.jsonl"))
+    wf.add_state("X", agent=DummyAgent())
+    with pytest.raises(WorkflowError):
+        wf.run_parallel("X", "foo")
+    with pytest.raises(WorkflowError):
+        asyncio.run(wf.arun("X", "foo"))
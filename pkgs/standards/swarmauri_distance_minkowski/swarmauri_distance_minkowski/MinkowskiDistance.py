@@ -1,4 +1,6 @@
 from typing import List, Literal
+
+import numpy as np
 from scipy.spatial.distance import minkowski
 from swarmauri_standard.vectors.Vector import Vector
 from swarmauri_base.distances.DistanceBase import DistanceBase
@@ -67,9 +69,19 @@ class MinkowskiDistance(DistanceBase):
         return 1 / (1 + dist)  # An example similarity score
 
     def distances(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        distances = [self.distance(vector_a, vector_b) for vector_b in vectors_b]
-        return distances
+        return self.distances_matrix([vector_a], vectors_b)[0].tolist()
+
+    def distances_matrix(self, vectors_a, vectors_b) -> np.ndarray:
+        """
+        Computes all pairwise Minkowski distances of order ``p``, broadcasting
+        each row of ``vectors_a`` against the whole of ``vectors_b``.
+        """
+        matrix_a, matrix_b = self._stack_pair(vectors_a, vectors_b)
+        return self._rowwise(
+            matrix_a,
+            matrix_b,
+            lambda a, b: (np.abs(b - a) ** self.p).sum(axis=1) ** (1 / self.p),
+        )
 
     def similarities(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        similarities = [self.similarity(vector_a, vector_b) for vector_b in vectors_b]
-        return similarities
+        return (1 / (1 + self.distances_matrix([vector_a], vectors_b)[0])).tolist()
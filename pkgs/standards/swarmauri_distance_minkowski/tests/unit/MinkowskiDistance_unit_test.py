@@ -27,3 +27,16 @@ def test_distance():
     assert (
         MinkowskiDistance().distance(Vector(value=[1, 2]), Vector(value=[1, 2])) == 0.0
     )
+
+
+@pytest.mark.unit
+def test_distances_matrix():
+    distance = MinkowskiDistance()
+    vectors_a = [Vector(value=v) for v in [[1, 2, 0], [0, 0, 0]]]
+    vectors_b = [Vector(value=v) for v in [[1, 2, 0], [3, -1, 2], [0, 0, 0], [2, 4, 1]]]
+    matrix = distance.distances_matrix(vectors_a, vectors_b)
+    assert matrix.shape == (len(vectors_a), len(vectors_b))
+    expected = [[distance.distance(a, b) for b in vectors_b] for a in vectors_a]
+    for row, expected_row in zip(matrix.tolist(), expected):
+        assert row == pytest.approx(expected_row)
+    assert distance.distances(vectors_a[0], vectors_b) == pytest.approx(expected[0])
@@ -55,7 +55,7 @@ class NmfEmbedding(EmbeddingBase):
         nmf_features = self._model.transform(tfidf_matrix)
 
         # Wrap NMF features in SimpleVector instances and return
-        return [Vector(value=features.tolist()) for features in nmf_features]
+        return [Vector.from_numpy(features) for features in nmf_features]
 
     def fit_transform(self, data):
         """
@@ -1,7 +1,12 @@
 import sys as _sys
 import logging
-from .importer import SwarmauriImporter
-from .plugin_manager import discover_and_register_plugins
+from swarmauri_base.DynamicBase import DynamicBase
+
+# Importing the interface registry registers every base model; coalesce the
+# resulting model rebuilds into one.
+with DynamicBase.batch_registration():
+    from .importer import SwarmauriImporter
+    from .plugin_manager import discover_and_register_plugins
 
 logger = logging.getLogger(__name__)
 
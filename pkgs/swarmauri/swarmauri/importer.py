@@ -6,6 +6,7 @@ import logging
 from importlib.machinery import ModuleSpec
 from types import ModuleType
 
+from . import plugin_cache
 from .plugin_citizenship_registry import PluginCitizenshipRegistry
 from .interface_registry import InterfaceRegistry
 
@@ -42,6 +43,8 @@ class SwarmauriImporter:
             external_module_path = PluginCitizenshipRegistry.get_external_module_path(
                 fullname
             )
+            if not external_module_path:
+                external_module_path = self._register_from_plugin_cache(fullname)
             if external_module_path:
                 logger.debug(
                     f"Found external module mapping: {fullname} -> {external_module_path}"
@@ -65,6 +68,24 @@ class SwarmauriImporter:
         logger.debug(f"Module '{fullname}' is not in 'swarmauri' namespace.")
         return None
 
+    @staticmethod
+    def _register_from_plugin_cache(fullname):
+        """
+        Looks ``fullname`` up in the on-disk plugin cache, which needs no
+        distribution metadata, and registers the plugin if it is found.
+        """
+        try:
+            cached = plugin_cache.lookup_plugin(fullname)
+        except Exception as e:
+            logger.debug(f"Plugin cache lookup failed for '{fullname}': {e}")
+            return None
+        if not cached:
+            return None
+        citizenship, module_path = cached
+        PluginCitizenshipRegistry.add_to_registry(citizenship, fullname, module_path)
+        logger.debug(f"Resolved '{fullname}' from the plugin cache: {module_path}")
+        return module_path
+
     def create_module(self, spec):
         logger.debug(f"create_module called for: {spec.name}")
 
@@ -0,0 +1,221 @@
+# plugin_cache.py
+
+"""
+plugin_cache.py
+
+Persists the result of plugin discovery between processes.
+
+Scanning every installed distribution for entry points, and importing each
+plugin to classify it, is the most expensive part of a cold start. The
+outcome only changes when distributions are installed, upgraded or removed,
+so it is stored on disk together with a fingerprint of the installed
+distributions and reused for as long as the fingerprint matches.
+
+The cache file location can be set with the ``SWARMAURI_PLUGIN_CACHE``
+environment variable; setting it to ``0``/``off`` disables the cache, e.g. on
+read-only homes or in sandboxes. Reading or writing the cache never raises:
+failures are logged at debug level and discovery falls back to a full scan.
+
+On a warm start the cached plugins are registered without importing them, so
+module-level side effects of eagerly loaded plugins run on first use instead
+of at ``import swarmauri``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from importlib.metadata import EntryPoint
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV_VAR = "SWARMAURI_PLUGIN_CACHE"
+CACHE_FORMAT_VERSION = 1
+
+_DISABLED_VALUES = {"", "0", "off", "false", "no"}
+
+# Fingerprint computed by this process, and the (fingerprint, cache data) of
+# the last cache read or written by it.
+_fingerprint: Optional[str] = None
+_loaded: Optional[Tuple[str, Optional[Dict[str, Any]]]] = None
+
+
+def cache_path() -> Optional[str]:
+    """
+    Returns the path of the cache file, or None if the cache is disabled.
+
+    By default there is one file per Python environment under
+    ``$XDG_CACHE_HOME/swarmauri`` (``~/.cache/swarmauri``).
+    """
+    configured = os.environ.get(CACHE_ENV_VAR)
+    if configured is not None:
+        if configured.strip().lower() in _DISABLED_VALUES:
+            return None
+        return configured
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    environment = hashlib.sha1(sys.prefix.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_home, "swarmauri", f"plugins-{environment}.json")
+
+
+def distributions_fingerprint() -> str:
+    """
+    Fingerprints the installed distributions without reading their metadata.
+
+    The fingerprint covers, for every ``sys.path`` entry, the names of its
+    ``.dist-info``/``.egg-info`` directories (which carry the distribution
+    name and version) and their modification times, so installing,
+    upgrading, reinstalling or removing a distribution changes it.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_FORMAT_VERSION}|{sys.version}".encode("utf-8"))
+    for entry in sys.path:
+        try:
+            with os.scandir(entry or ".") as it:
+                found = sorted(
+                    (item.name, item.stat().st_mtime_ns)
+                    for item in it
+                    if item.name.endswith((".dist-info", ".egg-info"))
+                )
+        except OSError:
+            continue
+        digest.update(f"\0{entry}".encode("utf-8"))
+        for name, mtime in found:
+            digest.update(f"\0{name}:{mtime}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def current_fingerprint() -> str:
+    """
+    Returns the distributions fingerprint, computed once per process.
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        _fingerprint = distributions_fingerprint()
+    return _fingerprint
+
+
+def load(fingerprint: str) -> Optional[Dict[str, Any]]:
+    """
+    Returns the cached discovery data if it was stored for ``fingerprint``.
+    """
+    global _loaded
+    if _loaded is not None and _loaded[0] == fingerprint:
+        return _loaded[1]
+
+    data = None
+    path = cache_path()
+    if path:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if (
+                stored.get("version") == CACHE_FORMAT_VERSION
+                and stored.get("fingerprint") == fingerprint
+            ):
+                data = stored
+                logger.debug(f"Loaded plugin cache from '{path}'.")
+            else:
+                logger.debug(f"Plugin cache at '{path}' is stale; ignoring it.")
+        except FileNotFoundError:
+            logger.debug(f"No plugin cache at '{path}'.")
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable plugin cache '{path}': {e}")
+    _loaded = (fingerprint, data)
+    return data
+
+
+def save(
+    fingerprint: str,
+    entry_points: Dict[str, List[EntryPoint]],
+    plugins: List[Tuple[str, str, str]],
+) -> None:
+    """
+    Stores the grouped entry points and the registered plugins.
+
+    :param fingerprint: Fingerprint of the installed distributions.
+    :param entry_points: Entry points grouped by namespace.
+    :param plugins: (citizenship, resource_path, module_path) of every plugin
+        registered in the PluginCitizenshipRegistry.
+    """
+    global _loaded
+    data = {
+        "version": CACHE_FORMAT_VERSION,
+        "fingerprint": fingerprint,
+        "entry_points": {
+            namespace: [[ep.name, ep.value, ep.group] for ep in eps]
+            for namespace, eps in entry_points.items()
+        },
+        "plugins": [list(plugin) for plugin in plugins],
+    }
+    _loaded = (fingerprint, data)
+
+    path = cache_path()
+    if not path:
+        return
+    try:
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial file.
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        logger.debug(f"Saved plugin cache to '{path}'.")
+    except Exception as e:
+        logger.debug(f"Could not write plugin cache '{path}': {e}")
+
+
+def clear() -> None:
+    """
+    Removes the cache file and forgets the cache and fingerprint computed by
+    this process.
+    """
+    global _fingerprint, _loaded
+    _fingerprint = None
+    _loaded = None
+    path = cache_path()
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug(f"Could not remove plugin cache '{path}': {e}")
+
+
+def entry_points_from_cache(data: Dict[str, Any]) -> Dict[str, List[EntryPoint]]:
+    """
+    Rebuilds the grouped entry points stored in ``data``.
+    """
+    return {
+        namespace: [
+            EntryPoint(name=name, value=value, group=group)
+            for name, value, group in eps
+        ]
+        for namespace, eps in data.get("entry_points", {}).items()
+    }
+
+
+def lookup_plugin(resource_path: str) -> Optional[Tuple[str, str]]:
+    """
+    Returns the (citizenship, module_path) cached for ``resource_path``, e.g.
+    ``'swarmauri.llms.OpenAIModel'``, without reading any distribution
+    metadata.
+    """
+    data = load(current_fingerprint())
+    if not data:
+        return None
+    for citizenship, cached_path, module_path in data.get("plugins", []):
+        if cached_path == resource_path:
+            return citizenship, module_path
+    return None
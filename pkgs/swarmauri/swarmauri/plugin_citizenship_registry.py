@@ -64,6 +64,7 @@ class PluginCitizenshipRegistry:
         "swarmauri.conversations.MaxSizeConversation": "swarmauri_standard.conversations.MaxSizeConversation",
         "swarmauri.conversations.MaxSystemContextConversation": "swarmauri_standard.conversations.MaxSystemContextConversation",
         "swarmauri.conversations.SessionCacheConversation": "swarmauri_standard.conversations.SessionCacheConversation",
+        "swarmauri.conversations.TokenBudgetConversation": "swarmauri_standard.conversations.TokenBudgetConversation",
         "swarmauri.dataconnectors.GoogleDriveDataConnector": "swarmauri_standard.dataconnectors.GoogleDriveDataConnector",
         "swarmauri.distances.CanberraDistance": "swarmauri_standard.distances.CanberraDistance",
         "swarmauri.distances.ChebyshevDistance": "swarmauri_standard.distances.ChebyshevDistance",
@@ -277,6 +278,7 @@ class PluginCitizenshipRegistry:
         "swarmauri.logger_handlers.StreamHandler": "swarmauri_standard.logger_handlers.StreamHandler",
         "swarmauri.logger_formatters.LoggerFormatter": "swarmauri_standard.logger_formatters.LoggerFormatter",
         "swarmauri.rate_limits.TokenBucketRateLimit": "swarmauri_standard.rate_limits.TokenBucketRateLimit",
+        "swarmauri.rate_limits.SharedTokenBucketRateLimit": "swarmauri_standard.rate_limits.SharedTokenBucketRateLimit",
     }
     SECOND_CLASS_REGISTRY: Dict[str, str] = {}
     THIRD_CLASS_REGISTRY: Dict[str, str] = {}
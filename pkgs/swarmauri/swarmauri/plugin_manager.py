@@ -7,10 +7,12 @@ import json
 import logging
 import sys
 from importlib.metadata import EntryPoint, entry_points
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.DynamicBase import DynamicBase
 
+from . import plugin_cache
 from .interface_registry import InterfaceRegistry
 from .plugin_citizenship_registry import PluginCitizenshipRegistry
 
@@ -30,6 +32,11 @@ def _fetch_and_group_entry_points(group_prefix="swarmauri."):
     grouped_entry_points = {}
     try:
         all_entry_points = entry_points()
+        if isinstance(all_entry_points, dict):
+            # Before Python 3.12 entry_points() groups them by group name.
+            all_entry_points = [
+                ep for eps in all_entry_points.values() for ep in eps
+            ]
         logger.debug(f"Raw entry points from environment: {all_entry_points}")
 
         for ep in all_entry_points:
@@ -47,11 +54,19 @@ def _fetch_and_group_entry_points(group_prefix="swarmauri."):
 def get_cached_entry_points(group_prefix="swarmauri."):
     """
     Returns cached entry points if available; otherwise performs a fresh scan.
+
+    For the default prefix the on-disk plugin cache is consulted before
+    scanning, as long as it matches the installed distributions.
     """
     global _cached_entry_points
     if _cached_entry_points is None:
-        logger.debug("Entry points cache is empty; fetching now...")
-        _cached_entry_points = _fetch_and_group_entry_points(group_prefix)
+        cached = _load_plugin_cache() if group_prefix == "swarmauri." else None
+        if cached is not None:
+            logger.debug("Using entry points from the on-disk plugin cache.")
+            _cached_entry_points = plugin_cache.entry_points_from_cache(cached)
+        else:
+            logger.debug("Entry points cache is empty; fetching now...")
+            _cached_entry_points = _fetch_and_group_entry_points(group_prefix)
     return _cached_entry_points
 
 
@@ -62,6 +77,18 @@ def invalidate_entry_point_cache():
     global _cached_entry_points
     logger.debug("Invalidating entry points cache...")
     _cached_entry_points = None
+    plugin_cache.clear()
+
+
+def _load_plugin_cache() -> Optional[Dict[str, Any]]:
+    """
+    Returns the on-disk plugin cache if it matches the installed distributions.
+    """
+    try:
+        return plugin_cache.load(plugin_cache.current_fingerprint())
+    except Exception as e:
+        logger.debug(f"Failed to read the plugin cache: {e}")
+        return None
 
 
 def get_entry_points(group_prefix="swarmauri."):
@@ -401,12 +428,18 @@ def _process_class_plugin(
             if ":" in entry_point.value
             else entry_point.value
         )
-        PluginCitizenshipRegistry.add_to_registry(
-            citizenship, resource_path, module_path
-        )
-        logger.info(
-            f"Registered {citizenship}-class plugin '{plugin_class.__name__}' at '{resource_path}' in PluginCitizenshipRegistry"
-        )
+        if citizenship == "first":
+            # First-class plugins are pre-registered; that mapping has priority.
+            logger.info(
+                f"First-class plugin '{plugin_class.__name__}' is pre-registered at '{resource_path}'"
+            )
+        else:
+            PluginCitizenshipRegistry.add_to_registry(
+                citizenship, resource_path, module_path
+            )
+            logger.info(
+                f"Registered {citizenship}-class plugin '{plugin_class.__name__}' at '{resource_path}' in PluginCitizenshipRegistry"
+            )
 
         # Step 5: Register the plugin class in ComponentBase.TYPE_REGISTRY
         # Extract type_name from resource_path (e.g., 'ExampleAgent' from 'swarmauri.agents.ExampleAgent')
@@ -709,24 +742,95 @@ def discover_and_register_plugins(group_prefix="swarmauri."):
     """
     Discovers all plugins via entry points and processes them based on their classifications and loading strategies.
 
+    For the default prefix the outcome is stored in the on-disk plugin cache.
+    While the installed distributions do not change, later processes register
+    the cached plugins directly: nothing is imported at start-up, the modules
+    are loaded by the SwarmauriImporter on first import and plugin types are
+    loaded when a discriminated union meets them. Module-level side effects
+    of eagerly loaded plugins therefore run on first use rather than at
+    start-up; set ``SWARMAURI_PLUGIN_CACHE=off`` where they must run first.
+
     :param group_prefix: The prefix to filter relevant entry point groups.
     """
+    use_cache = group_prefix == "swarmauri."
+    cached = _load_plugin_cache() if use_cache else None
+    if cached is not None and "plugins" in cached:
+        _register_cached_plugins(cached["plugins"])
+        return
+
     try:
+        before = PluginCitizenshipRegistry.list_all_registries()
         grouped_entry_points = get_entry_points(group_prefix)
-        for namespace, eps in grouped_entry_points.items():
-            for ep in eps:
-                try:
-                    process_plugin(ep)
-                except PluginLoadError as e:
-                    logger.error(f"Skipping plugin '{ep.name}' due to load error: {e}")
-                except PluginValidationError as e:
-                    logger.error(
-                        f"Skipping plugin '{ep.name}' due to validation error: {e}"
-                    )
+        # Each eagerly loaded plugin registers its component types; rebuild the
+        # pydantic models once after all of them instead of once per type.
+        with DynamicBase.batch_registration():
+            for namespace, eps in grouped_entry_points.items():
+                for ep in eps:
+                    try:
+                        process_plugin(ep)
+                    except PluginLoadError as e:
+                        logger.error(
+                            f"Skipping plugin '{ep.name}' due to load error: {e}"
+                        )
+                    except PluginValidationError as e:
+                        logger.error(
+                            f"Skipping plugin '{ep.name}' due to validation error: {e}"
+                        )
+        if use_cache:
+            after = PluginCitizenshipRegistry.list_all_registries()
+            discovered = {
+                f"{ep.group}.{ep.name}"
+                for eps in grouped_entry_points.values()
+                for ep in eps
+            }
+            plugins = [
+                (citizenship, resource_path, module_path)
+                for citizenship in ("first", "second", "third")
+                for resource_path, module_path in after[citizenship].items()
+                if before[citizenship].get(resource_path) != module_path
+                or (citizenship == "first" and resource_path in discovered)
+            ]
+            plugin_cache.save(
+                plugin_cache.current_fingerprint(), grouped_entry_points, plugins
+            )
     except Exception as e:
         logger.exception(f"Failed during plugin discovery and registration: {e}")
 
 
+def _register_cached_plugins(plugins: List[Tuple[str, str, str]]) -> None:
+    """
+    Registers plugins recorded in the plugin cache without importing them.
+
+    :param plugins: (citizenship, resource_path, module_path) entries.
+    """
+    registry_map = {
+        "first": PluginCitizenshipRegistry.FIRST_CLASS_REGISTRY,
+        "second": PluginCitizenshipRegistry.SECOND_CLASS_REGISTRY,
+        "third": PluginCitizenshipRegistry.THIRD_CLASS_REGISTRY,
+    }
+    for citizenship, resource_path, module_path in plugins:
+        registry_map[citizenship].setdefault(resource_path, module_path)
+    DynamicBase.register_type_resolver(_load_cached_plugin_type)
+    logger.info(f"Registered {len(plugins)} plugins from the plugin cache.")
+
+
+def _load_cached_plugin_type(type_name: str) -> bool:
+    """
+    Imports the cached plugins whose resource path ends in ``type_name``.
+    """
+    cached = _load_plugin_cache()
+    loaded = False
+    for _, resource_path, module_path in (cached or {}).get("plugins", []):
+        if resource_path.rpartition(".")[2] != type_name:
+            continue
+        try:
+            importlib.import_module(module_path)
+            loaded = True
+        except ImportError as e:
+            logger.error(f"Failed to import cached plugin '{resource_path}': {e}")
+    return loaded
+
+
 def get_plugin_type_info(resource_path: str) -> Optional[Dict[str, Any]]:
     """
     Retrieves the plugin's type information from the registries without loading the module.
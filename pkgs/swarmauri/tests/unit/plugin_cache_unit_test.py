@@ -0,0 +1,140 @@
+import importlib.machinery
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from swarmauri import plugin_cache, plugin_manager
+from swarmauri.importer import SwarmauriImporter
+from swarmauri.plugin_citizenship_registry import PluginCitizenshipRegistry
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    path = tmp_path / "plugins.json"
+    monkeypatch.setenv(plugin_cache.CACHE_ENV_VAR, str(path))
+    monkeypatch.setattr(plugin_cache, "_fingerprint", None)
+    monkeypatch.setattr(plugin_cache, "_loaded", None)
+    third = PluginCitizenshipRegistry.THIRD_CLASS_REGISTRY.copy()
+    yield path
+    PluginCitizenshipRegistry.THIRD_CLASS_REGISTRY = third
+
+
+def _entry_points():
+    return {
+        "plugins": [
+            EntryPoint(name="math", value="math", group="swarmauri.plugins"),
+        ]
+    }
+
+
+@pytest.mark.unit
+def test_fingerprint_is_stable():
+    assert (
+        plugin_cache.distributions_fingerprint()
+        == plugin_cache.distributions_fingerprint()
+    )
+
+
+@pytest.mark.unit
+def test_save_and_load_roundtrip(isolated_cache):
+    plugins = [("third", "swarmauri.plugins.math", "math")]
+    plugin_cache.save("abc", _entry_points(), plugins)
+    assert isolated_cache.exists()
+
+    # Read it back from disk, not from the copy kept in memory.
+    plugin_cache._loaded = None
+    data = plugin_cache.load("abc")
+    assert data["plugins"] == [list(plugin) for plugin in plugins]
+    entry_points = plugin_cache.entry_points_from_cache(data)
+    assert entry_points["plugins"][0].value == "math"
+    assert entry_points["plugins"][0].group == "swarmauri.plugins"
+
+
+@pytest.mark.unit
+def test_stale_fingerprint_is_ignored():
+    plugin_cache.save("abc", _entry_points(), [])
+    plugin_cache._loaded = None
+    assert plugin_cache.load("other") is None
+
+
+@pytest.mark.unit
+def test_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setenv(plugin_cache.CACHE_ENV_VAR, "off")
+    assert plugin_cache.cache_path() is None
+    plugin_cache.save("abc", _entry_points(), [])
+    plugin_cache._loaded = None
+    assert plugin_cache.load("abc") is None
+
+
+@pytest.mark.unit
+def test_importer_resolves_from_cache():
+    plugin_cache.save(
+        plugin_cache.current_fingerprint(),
+        _entry_points(),
+        [("third", "swarmauri.plugins.cachedmath", "math")],
+    )
+    spec = SwarmauriImporter().find_spec("swarmauri.plugins.cachedmath")
+    assert isinstance(spec, importlib.machinery.ModuleSpec)
+    assert (
+        PluginCitizenshipRegistry.get_external_module_path(
+            "swarmauri.plugins.cachedmath"
+        )
+        == "math"
+    )
+
+
+@pytest.fixture
+def registries():
+    saved = {
+        name: getattr(PluginCitizenshipRegistry, name).copy()
+        for name in (
+            "FIRST_CLASS_REGISTRY",
+            "SECOND_CLASS_REGISTRY",
+            "THIRD_CLASS_REGISTRY",
+        )
+    }
+    yield saved
+    for name, registry in saved.items():
+        setattr(PluginCitizenshipRegistry, name, registry)
+
+
+@pytest.mark.unit
+def test_warm_start_registers_the_same_plugins(registries, monkeypatch):
+    entry_points = {
+        "plugins": [
+            EntryPoint(
+                name="cacheddumps", value="json:dumps", group="swarmauri.plugins"
+            ),
+        ]
+    }
+    monkeypatch.setattr(plugin_manager, "_cached_entry_points", None)
+    monkeypatch.setattr(
+        plugin_manager, "_fetch_and_group_entry_points", lambda prefix: entry_points
+    )
+    plugin_manager.discover_and_register_plugins()
+    cold = PluginCitizenshipRegistry.list_all_registries()
+    assert cold["third"]["swarmauri.plugins.cacheddumps"] == "json"
+
+    # A new process: fresh registries and nothing cached in memory.
+    for name, registry in registries.items():
+        setattr(PluginCitizenshipRegistry, name, registry.copy())
+    plugin_cache._loaded = None
+    plugin_manager._cached_entry_points = None
+
+    def scan(prefix):
+        raise AssertionError("a warm start must not scan the entry points")
+
+    monkeypatch.setattr(plugin_manager, "_fetch_and_group_entry_points", scan)
+    plugin_manager.discover_and_register_plugins()
+    assert PluginCitizenshipRegistry.list_all_registries() == cold
+
+
+@pytest.mark.unit
+def test_unwritable_cache_does_not_raise(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setenv(plugin_cache.CACHE_ENV_VAR, str(blocker / "plugins.json"))
+    plugin_cache.save("abc", _entry_points(), [])
+    plugin_cache._loaded = None
+    assert plugin_cache.load("abc") is None
+    plugin_cache.clear()
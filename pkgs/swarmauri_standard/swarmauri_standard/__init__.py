@@ -42,3 +42,10 @@ try:
 except PackageNotFoundError:
     # If the package is not installed (for example, during development)
     __version__ = "0.0.0"
+
+from swarmauri_base.DynamicBase import DynamicBase
+from swarmauri_standard.utils._lazy_import import _load_type
+
+# Components are imported lazily by their subpackages; let discriminated
+# unions import the ones they meet while validating.
+DynamicBase.register_type_resolver(_load_type)
@@ -1,16 +1,12 @@
-# from swarmauri_standard.utils._lazy_import import _lazy_import
+from swarmauri_standard.utils._lazy_import import _lazy_package
 
-# # List of agent names (file names without the ".py" extension) and corresponding class names
-# agent_files = [
-#     ("swarmauri_standard.agents.QAAgent", "QAAgent"),
-#     ("swarmauri_standard.agents.RagAgent", "RagAgent"),
-#     ("swarmauri_standard.agents.SimpleConversationAgent", "SimpleConversationAgent"),
-#     ("swarmauri_standard.agents.ToolAgent", "ToolAgent"),
-# ]
+# List of agents modules and the class each one exports
+agents_files = [
+    ("swarmauri_standard.agents.QAAgent", "QAAgent"),
+    ("swarmauri_standard.agents.RagAgent", "RagAgent"),
+    ("swarmauri_standard.agents.SimpleConversationAgent", "SimpleConversationAgent"),
+    ("swarmauri_standard.agents.ToolAgent", "ToolAgent"),
+]
 
-# # Lazy loading of agent classes, storing them in variables
-# for module_name, class_name in agent_files:
-#     globals()[class_name] = _lazy_import(module_name, class_name)
-
-# # Adding the lazy-loaded agent classes to __all__
-# __all__ = [class_name for _, class_name in agent_files]
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, agents_files)
@@ -0,0 +1,194 @@
+from collections import deque
+from collections.abc import Sequence
+from typing import Any, Deque, Iterator, List, Literal, Optional, Tuple, Union
+
+from pydantic import ConfigDict, Field, PrivateAttr, field_validator
+from swarmauri_base.ComponentBase import ComponentBase, SubclassUnion
+from swarmauri_base.conversations.ConversationBase import ConversationBase
+from swarmauri_base.measurements.MeasurementBase import MeasurementBase
+from swarmauri_core.messages.IMessage import IMessage
+
+from swarmauri_standard.messages.SystemMessage import SystemMessage
+
+
+class _HistoryWindow(Sequence):
+    """
+    Read-only view of the system context followed by the retained messages.
+    """
+
+    __slots__ = ("_head", "_messages")
+
+    def __init__(self, head: Optional[IMessage], messages: Deque[IMessage]):
+        self._head = head
+        self._messages = messages
+
+    def __len__(self) -> int:
+        return len(self._messages) + (self._head is not None)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if self._head is not None:
+            if index == 0:
+                return self._head
+            index -= 1
+        if not 0 <= index < len(self._messages):
+            raise IndexError("history index out of range")
+        return self._messages[index]
+
+    def __iter__(self) -> Iterator[IMessage]:
+        if self._head is not None:
+            yield self._head
+        yield from self._messages
+
+    def __reversed__(self) -> Iterator[IMessage]:
+        yield from reversed(self._messages)
+        if self._head is not None:
+            yield self._head
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+@ComponentBase.register_type(ConversationBase, "TokenBudgetConversation")
+class TokenBudgetConversation(ConversationBase):
+    """
+    Conversation that keeps the most recent messages fitting in ``max_tokens``.
+
+    Messages are kept in a deque alongside their token counts, so evicting the
+    oldest ones is O(1) per message and the running total never needs to be
+    recomputed. Tokens are counted with ``estimator`` (e.g. a
+    ``TokenCountEstimatorMeasurement``) when one is set, and otherwise
+    estimated at four characters per token. The system context, when set, is
+    always sent first and its tokens count against the budget.
+
+    Counts are taken when a message is added, so later edits to a message do
+    not change them.
+    """
+
+    max_tokens: int = Field(default=4096, gt=0)
+    message_overhead: int = Field(default=4, ge=0)
+    estimator: Optional[SubclassUnion[MeasurementBase]] = None
+    system_context: Optional[SystemMessage] = None
+    model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
+    type: Literal["TokenBudgetConversation"] = "TokenBudgetConversation"
+
+    _history: Deque[IMessage] = PrivateAttr(default_factory=deque)
+    _token_counts: Deque[int] = PrivateAttr(default_factory=deque)
+    _message_tokens: int = PrivateAttr(0)
+    _system_tokens: Tuple[Optional[SystemMessage], int] = PrivateAttr((None, 0))
+
+    @field_validator("system_context", mode="before")
+    def set_system_context(
+        cls, value: Union[str, SystemMessage, None]
+    ) -> Optional[SystemMessage]:
+        if isinstance(value, str):
+            return SystemMessage(content=value)
+        return value
+
+    @property
+    def history(self) -> Sequence:
+        """
+        The system context and the retained messages, as a view that is not
+        copied on access.
+        """
+        return _HistoryWindow(self.system_context, self._history)
+
+    @property
+    def total_tokens(self) -> int:
+        """
+        Tokens of the system context and the retained messages.
+        """
+        return self._message_tokens + self._count_system_tokens()
+
+    def add_message(self, message: IMessage):
+        if isinstance(message, SystemMessage):
+            raise ValueError(
+                f"System context cannot be set through this method on {type(self).__name__}."
+            )
+        tokens = self._count_tokens(message)
+        super().add_message(message)
+        self._token_counts.append(tokens)
+        self._message_tokens += tokens
+        self._enforce_token_budget()
+
+    def add_messages(self, messages: List[IMessage]):
+        for message in messages:
+            self.add_message(message)
+
+    def remove_message(self, message: IMessage):
+        if message in self._history:
+            index = self._history.index(message)
+            self._message_tokens -= self._token_counts[index]
+            del self._token_counts[index]
+        return super().remove_message(message)
+
+    def clear_history(self):
+        super().clear_history()
+        self._token_counts.clear()
+        self._message_tokens = 0
+
+    def _enforce_token_budget(self):
+        """
+        Evicts the oldest messages until the conversation fits in the budget.
+
+        The latest user message and the replies after it are always kept,
+        even when they alone exceed the budget, or the latest message when
+        there is no user message. After an eviction the window is also
+        advanced to the next user message, so that it does not start with a
+        reply to a message that is no longer sent.
+        """
+        budget = self.max_tokens - self._count_system_tokens()
+        kept = 1
+        for message in reversed(self._history):
+            if getattr(message, "role", None) == "user":
+                break
+            kept += 1
+        else:
+            kept = 1
+        evicted = False
+        while len(self._history) > kept and (
+            self._message_tokens > budget
+            or evicted
+            and getattr(self._history[0], "role", None) != "user"
+        ):
+            message = self._history.popleft()
+            self._message_tokens -= self._token_counts.popleft()
+            for payloads in self._payloads.values():
+                payloads.pop(id(message), None)
+            evicted = True
+
+    def _count_system_tokens(self) -> int:
+        context, tokens = self._system_tokens
+        if context is not self.system_context:
+            context = self.system_context
+            tokens = self._count_tokens(context) if context is not None else 0
+            self._system_tokens = (context, tokens)
+        return tokens
+
+    def _count_tokens(self, message: IMessage) -> int:
+        """
+        Estimates the tokens ``message`` takes in a request.
+        """
+        content = getattr(message, "content", None)
+        if isinstance(content, list):
+            text = " ".join(
+                item.get("text", "") if isinstance(item, dict) else str(item)
+                for item in content
+            )
+        else:
+            text = content or ""
+
+        tokens = None
+        if self.estimator is not None:
+            tokens = self.estimator.calculate(text)
+        if tokens is None:
+            tokens = (len(text) + 3) // 4
+        return tokens + self.message_overhead
@@ -41,9 +41,10 @@ class CanberraDistance(DistanceBase):
             raise ValueError("Vectors must have the same dimensionality.")
 
         # Computing Canberra distance
-        distance = np.sum(np.abs(data_a - data_b) / (np.abs(data_a) + np.abs(data_b)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = np.abs(data_a - data_b) / (np.abs(data_a) + np.abs(data_b))
         # Handling the case where both vectors have a zero value for the same dimension
-        distance = np.nan_to_num(distance)
+        distance = np.sum(np.nan_to_num(terms))
         return distance
 
     def similarity(self, vector_a: Vector, vector_b: Vector) -> float:
@@ -70,9 +71,22 @@ class CanberraDistance(DistanceBase):
         return similarity
 
     def distances(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        distances = [self.distance(vector_a, vector_b) for vector_b in vectors_b]
-        return distances
+        return self.distances_matrix([vector_a], vectors_b)[0].tolist()
+
+    def distances_matrix(self, vectors_a, vectors_b) -> np.ndarray:
+        """
+        Computes all pairwise Canberra distances, broadcasting each row of
+        ``vectors_a`` against the whole of ``vectors_b``. Dimensions where both
+        values are zero contribute nothing.
+        """
+        matrix_a, matrix_b = self._stack_pair(vectors_a, vectors_b)
+
+        def kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                terms = np.abs(b - a) / (np.abs(a) + np.abs(b))
+            return np.nan_to_num(terms).sum(axis=1)
+
+        return self._rowwise(matrix_a, matrix_b, kernel)
 
     def similarities(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        similarities = [self.similarity(vector_a, vector_b) for vector_b in vectors_b]
-        return similarities
+        return np.exp(-self.distances_matrix([vector_a], vectors_b)[0]).tolist()
@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List, Literal
 from swarmauri_standard.vectors.Vector import Vector
 from swarmauri_base.distances.DistanceBase import DistanceBase
@@ -51,9 +52,19 @@ class ChebyshevDistance(DistanceBase):
         return 1 / (1 + self.distance(vector_a, vector_b))
 
     def distances(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        distances = [self.distance(vector_a, vector_b) for vector_b in vectors_b]
-        return distances
+        return self.distances_matrix([vector_a], vectors_b)[0].tolist()
+
+    def distances_matrix(self, vectors_a, vectors_b) -> np.ndarray:
+        """
+        Computes all pairwise Chebyshev distances, broadcasting each row of
+        ``vectors_a`` against the whole of ``vectors_b``.
+        """
+        matrix_a, matrix_b = self._stack_pair(vectors_a, vectors_b)
+        if matrix_a.shape[1] == 0:
+            return np.zeros((matrix_a.shape[0], matrix_b.shape[0]))
+        return self._rowwise(
+            matrix_a, matrix_b, lambda a, b: np.abs(b - a).max(axis=1)
+        )
 
     def similarities(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        similarities = [self.similarity(vector_a, vector_b) for vector_b in vectors_b]
-        return similarities
+        return (1 / (1 + self.distances_matrix([vector_a], vectors_b)[0])).tolist()
@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List, Literal
 
 from swarmauri_standard.vectors.Vector import Vector
@@ -41,9 +42,23 @@ class ChiSquaredDistance(DistanceBase):
         return 1 / (1 + self.distance(vector_a, vector_b))
 
     def distances(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        distances = [self.distance(vector_a, vector_b) for vector_b in vectors_b]
-        return distances
+        return self.distances_matrix([vector_a], vectors_b)[0].tolist()
+
+    def distances_matrix(self, vectors_a, vectors_b) -> np.ndarray:
+        """
+        Computes all pairwise Chi-squared distances, broadcasting each row of
+        ``vectors_a`` against the whole of ``vectors_b``. Dimensions where
+        ``a + b == 0`` are skipped.
+        """
+        matrix_a, matrix_b = self._stack_pair(vectors_a, vectors_b)
+
+        def kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            total = a + b
+            safe_total = np.where(total != 0, total, 1)
+            terms = np.where(total != 0, (a - b) ** 2 / safe_total, 0)
+            return 0.5 * terms.sum(axis=1)
+
+        return self._rowwise(matrix_a, matrix_b, kernel)
 
     def similarities(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        similarities = [self.similarity(vector_a, vector_b) for vector_b in vectors_b]
-        return similarities
+        return (1 / (1 + self.distances_matrix([vector_a], vectors_b)[0])).tolist()
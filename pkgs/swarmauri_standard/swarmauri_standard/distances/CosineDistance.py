@@ -69,9 +69,21 @@ class CosineDistance(DistanceBase):
         return 1 - self.distance(vector_a, vector_b)
 
     def distances(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        distances = [self.distance(vector_a, vector_b) for vector_b in vectors_b]
-        return distances
+        return self.distances_matrix([vector_a], vectors_b)[0].tolist()
+
+    def distances_matrix(self, vectors_a, vectors_b) -> np.ndarray:
+        """
+        Computes all pairwise cosine distances with a single matrix product.
+        The norms of each batch are computed once; pairs involving a zero
+        vector get the maximum distance of 1.0, as in ``distance``.
+        """
+        matrix_a, matrix_b = self._stack_pair(vectors_a, vectors_b)
+        norms_a = norm(matrix_a, axis=1)
+        norms_b = norm(matrix_b, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cos_sim = (matrix_a @ matrix_b.T) / np.outer(norms_a, norms_b)
+        zero = (norms_a < 1e-10)[:, None] | (norms_b < 1e-10)[None, :]
+        return np.where(zero, 1.0, 1 - cos_sim)
 
     def similarities(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        similarities = [self.similarity(vector_a, vector_b) for vector_b in vectors_b]
-        return similarities
+        return (1 - self.distances_matrix([vector_a], vectors_b)[0]).tolist()
@@ -1,3 +1,4 @@
+import numpy as np
 from math import sqrt
 from typing import List, Literal
 from swarmauri_standard.vectors.Vector import Vector
@@ -55,9 +56,16 @@ class EuclideanDistance(DistanceBase):
         return 1 / (1 + distance)
 
     def distances(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        distances = [self.distance(vector_a, vector_b) for vector_b in vectors_b]
-        return distances
+        return self.distances_matrix([vector_a], vectors_b)[0].tolist()
+
+    def distances_matrix(self, vectors_a, vectors_b) -> np.ndarray:
+        """
+        Computes all pairwise Euclidean distances using the expansion
+        ``|a - b|^2 = |a|^2 + |b|^2 - 2 a.b`` so that the cross term is a
+        single matrix product.
+        """
+        matrix_a, matrix_b = self._stack_pair(vectors_a, vectors_b)
+        return np.sqrt(self._squared_euclidean(matrix_a, matrix_b))
 
     def similarities(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        similarities = [self.similarity(vector_a, vector_b) for vector_b in vectors_b]
-        return similarities
+        return (1 / (1 + self.distances_matrix([vector_a], vectors_b)[0])).tolist()
@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List, Literal
 from math import radians, cos, sin, sqrt, atan2
 from swarmauri_standard.vectors.Vector import Vector
@@ -54,8 +55,27 @@ class HaversineDistance(DistanceBase):
         raise NotImplementedError("Similarity not implemented for Haversine distance.")
 
     def distances(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        distances = [self.distance(vector_a, vector_b) for vector_b in vectors_b]
-        return distances
+        return self.distances_matrix([vector_a], vectors_b)[0].tolist()
+
+    def distances_matrix(self, vectors_a, vectors_b) -> np.ndarray:
+        """
+        Computes all pairwise Haversine distances (in kilometers) between
+        ``[latitude, longitude]`` points with broadcast trigonometry.
+        """
+        matrix_a, matrix_b = self._stack_pair(vectors_a, vectors_b)
+        if matrix_a.shape[1] != 2:
+            raise ValueError("Vectors must be [latitude, longitude] pairs.")
+        # Earth radius in kilometers
+        R = 6371.0
+
+        lat1, lon1 = np.radians(matrix_a[:, 0])[:, None], np.radians(matrix_a[:, 1])[:, None]
+        lat2, lon2 = np.radians(matrix_b[:, 0])[None, :], np.radians(matrix_b[:, 1])[None, :]
+
+        a = (
+            np.sin((lat2 - lat1) / 2) ** 2
+            + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        )
+        return R * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
 
     def similarities(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
         raise NotImplementedError("Similarity not implemented for Haversine distance.")
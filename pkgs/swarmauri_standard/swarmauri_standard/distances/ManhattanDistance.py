@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List, Literal
 from swarmauri_standard.vectors.Vector import Vector
 from swarmauri_base.distances.DistanceBase import DistanceBase
@@ -56,8 +57,17 @@ class ManhattanDistance(DistanceBase):
         )
 
     def distances(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        distances = [self.distance(vector_a, vector_b) for vector_b in vectors_b]
-        return distances
+        return self.distances_matrix([vector_a], vectors_b)[0].tolist()
+
+    def distances_matrix(self, vectors_a, vectors_b) -> np.ndarray:
+        """
+        Computes all pairwise Manhattan distances, broadcasting each row of
+        ``vectors_a`` against the whole of ``vectors_b``.
+        """
+        matrix_a, matrix_b = self._stack_pair(vectors_a, vectors_b)
+        return self._rowwise(
+            matrix_a, matrix_b, lambda a, b: np.abs(b - a).sum(axis=1)
+        )
 
     def similarities(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
         raise NotImplementedError(
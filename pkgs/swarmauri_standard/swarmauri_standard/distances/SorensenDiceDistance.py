@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List, Literal
 
 from swarmauri_standard.vectors.Vector import Vector
@@ -33,8 +34,8 @@ class SorensenDiceDistance(DistanceBase):
             float: The computed Sörensen-Dice distance between vector_a and vector_b.
         """
         # Convert vectors to binary sets
-        set_a = set([i for i, val in enumerate(vector_a) if val])
-        set_b = set([i for i, val in enumerate(vector_b) if val])
+        set_a = set([i for i, val in enumerate(vector_a.value) if val])
+        set_b = set([i for i, val in enumerate(vector_b.value) if val])
 
         # Calculate the intersection size
         intersection_size = len(set_a.intersection(set_b))
@@ -51,8 +52,21 @@ class SorensenDiceDistance(DistanceBase):
         return distance
 
     def distances(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        distances = [self.distance(vector_a, vector_b) for vector_b in vectors_b]
-        return distances
+        return self.distances_matrix([vector_a], vectors_b)[0].tolist()
+
+    def distances_matrix(self, vectors_a, vectors_b) -> np.ndarray:
+        """
+        Computes all pairwise Sörensen-Dice distances over the sets of non-zero
+        positions, counting intersections with a single matrix product.
+        """
+        matrix_a, matrix_b = self._stack_pair(vectors_a, vectors_b)
+        present_a = (matrix_a != 0).astype(np.float64)
+        present_b = (matrix_b != 0).astype(np.float64)
+        intersection = present_a @ present_b.T
+        sizes = present_a.sum(axis=1)[:, None] + present_b.sum(axis=1)[None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            index = np.where(sizes > 0, 2 * intersection / sizes, 0.0)
+        return 1 - index
 
     def similarity(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
         raise NotImplementedError(
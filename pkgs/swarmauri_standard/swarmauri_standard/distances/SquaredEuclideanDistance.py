@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List, Literal
 from swarmauri_standard.vectors.Vector import Vector
 from swarmauri_base.distances.DistanceBase import DistanceBase
@@ -54,8 +55,15 @@ class SquaredEuclideanDistance(DistanceBase):
         )
 
     def distances(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
-        distances = [self.distance(vector_a, vector_b) for vector_b in vectors_b]
-        return distances
+        return self.distances_matrix([vector_a], vectors_b)[0].tolist()
+
+    def distances_matrix(self, vectors_a, vectors_b) -> np.ndarray:
+        """
+        Computes all pairwise squared Euclidean distances using the expansion
+        ``|a|^2 + |b|^2 - 2 a.b`` so that the cross term is a single matrix product.
+        """
+        matrix_a, matrix_b = self._stack_pair(vectors_a, vectors_b)
+        return self._squared_euclidean(matrix_a, matrix_b)
 
     def similarities(self, vector_a: Vector, vectors_b: List[Vector]) -> List[float]:
         raise NotImplementedError(
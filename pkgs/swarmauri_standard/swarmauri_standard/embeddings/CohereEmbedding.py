@@ -5,6 +5,8 @@ from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.embeddings.EmbeddingBase import EmbeddingBase
 from swarmauri_base.ComponentBase import ComponentBase
 
+from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.single_flight import coalesce_calls
 from swarmauri_standard.vectors.Vector import Vector
 
 
@@ -129,6 +131,8 @@ class CohereEmbedding(EmbeddingBase):
         except httpx.HTTPError as e:
             raise RuntimeError(f"API request failed: {str(e)}")
 
+    @coalesce_calls
+    @retry_on_status_codes((429, 529), max_retries=1)
     def infer_vector(self, data: Union[List[str], List[str]]) -> List[Vector]:
         """
         Generate embeddings for the given list of texts or images.
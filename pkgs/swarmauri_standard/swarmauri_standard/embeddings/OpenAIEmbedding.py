@@ -5,6 +5,8 @@ from pydantic import Field, PrivateAttr, SecretStr
 from swarmauri_base.embeddings.EmbeddingBase import EmbeddingBase
 from swarmauri_base.ComponentBase import ComponentBase
 
+from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.single_flight import coalesce_calls
 from swarmauri_standard.vectors.Vector import Vector
 
 
@@ -60,6 +62,8 @@ class OpenAIEmbedding(EmbeddingBase):
             }
             self._client = httpx.Client()
 
+    @coalesce_calls
+    @retry_on_status_codes((429, 529), max_retries=1)
     def infer_vector(self, data: List[str]) -> List[Vector]:
         """
         Generate embeddings for the given list of strings.
@@ -1,7 +1,9 @@
-from typing import List, Literal
+from typing import Dict, List, Literal, NamedTuple, Tuple
 import joblib
 import math
 from collections import Counter, defaultdict
+
+import numpy as np
 from pydantic import PrivateAttr
 
 from swarmauri_base.embeddings.EmbeddingBase import EmbeddingBase
@@ -9,19 +11,66 @@ from swarmauri_standard.vectors.Vector import Vector
 from swarmauri_base.ComponentBase import ComponentBase
 
 
+class SparseMatrix(NamedTuple):
+    """
+    Compressed sparse row (CSR) matrix backed by NumPy arrays.
+
+    Row ``i`` holds the values ``data[indptr[i]:indptr[i + 1]]`` at the
+    columns ``indices[indptr[i]:indptr[i + 1]]``.
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    shape: Tuple[int, int]
+
+    def row(self, i: int) -> np.ndarray:
+        """
+        Returns row ``i`` as a dense array.
+        """
+        start, end = self.indptr[i], self.indptr[i + 1]
+        dense = np.zeros(self.shape[1], dtype=self.data.dtype)
+        dense[self.indices[start:end]] = self.data[start:end]
+        return dense
+
+    def dot(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Computes the sparse matrix-vector product ``M @ vector``.
+        """
+        vector = np.asarray(vector, dtype=self.data.dtype)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return np.bincount(
+            rows, weights=self.data * vector[self.indices], minlength=self.shape[0]
+        )
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Returns the full matrix as a dense 2-D array.
+        """
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        dense[rows, self.indices] = self.data
+        return dense
+
+
 @ComponentBase.register_type(EmbeddingBase, "TfidfEmbedding")
 class TfidfEmbedding(EmbeddingBase):
     # Private attributes to store our custom model data.
     _fit_matrix = PrivateAttr()
     _features = PrivateAttr()  # Sorted list of vocabulary terms.
+    _vocabulary = PrivateAttr()  # Dict mapping term -> column index.
     _idf = PrivateAttr()  # Dict mapping term -> idf value.
 
     type: Literal["TfidfEmbedding"] = "TfidfEmbedding"
+    # When enabled, the fitted matrix is kept as a SparseMatrix instead of
+    # one dense list per document.
+    sparse: bool = False
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Initialize our internal attributes.
         self._features = []  # This will hold our vocabulary.
+        self._vocabulary = {}  # This will map each term to its column.
         self._idf = {}  # This will hold the computed idf for each token.
         self._fit_matrix = []  # This will hold the TF-IDF vectors.
 
@@ -31,6 +80,62 @@ class TfidfEmbedding(EmbeddingBase):
         """
         return self._features
 
+    @staticmethod
+    def tokenize(document: str) -> List[str]:
+        """
+        Simple tokenization: lowercasing and splitting on whitespace.
+        """
+        return document.lower().split()
+
+    def _set_features(self, features: List[str], idf: Dict[str, float]) -> None:
+        self._features = features
+        self._vocabulary = {token: i for i, token in enumerate(features)}
+        self._idf = idf
+
+    def _check_fitted(self) -> None:
+        if not self._features or not self._idf:
+            raise ValueError(
+                "The model has not been fitted yet. Please call fit first."
+            )
+
+    def _dense_vector(self, tokens: List[str]) -> List[float]:
+        """
+        Builds the TF-IDF vector of a tokenized document over the full vocabulary.
+        Any term not in the vocabulary is ignored.
+        """
+        vector = [0.0] * len(self._features)
+        doc_len = len(tokens)
+        for token, count in Counter(tokens).items():
+            column = self._vocabulary.get(token)
+            if column is not None:
+                vector[column] = count / doc_len * self._idf[token]
+        return vector
+
+    def _sparse_matrix(self, tokenized_docs: List[List[str]]) -> SparseMatrix:
+        """
+        Builds the CSR TF-IDF matrix of tokenized documents. Any term not in the
+        vocabulary is ignored.
+        """
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for tokens in tokenized_docs:
+            doc_len = len(tokens)
+            row = sorted(
+                (self._vocabulary[token], count / doc_len * self._idf[token])
+                for token, count in Counter(tokens).items()
+                if token in self._vocabulary
+            )
+            indices.extend(column for column, _ in row)
+            data.extend(value for _, value in row)
+            indptr.append(len(indices))
+        return SparseMatrix(
+            indptr=np.asarray(indptr, dtype=np.int64),
+            indices=np.asarray(indices, dtype=np.int64),
+            data=np.asarray(data, dtype=np.float64),
+            shape=(len(tokenized_docs), len(self._features)),
+        )
+
     def fit(self, documents: List[str]) -> None:
         """
         Fits the TF-IDF model on the provided documents.
@@ -43,31 +148,23 @@ class TfidfEmbedding(EmbeddingBase):
 
         # Tokenize documents and compute document frequency for each token.
         for doc in documents:
-            # Simple tokenization: lowercasing and splitting on whitespace.
-            tokens = doc.lower().split()
+            tokens = self.tokenize(doc)
             tokenized_docs.append(tokens)
             for token in set(tokens):  # use set() to count each token once per doc
                 df[token] += 1
 
         # Build a sorted vocabulary for consistent vector ordering.
-        self._features = sorted(list(df.keys()))
+        features = sorted(list(df.keys()))
 
         # Compute idf for each term using the formula: log(N / df)
-        self._idf = {token: math.log(N / df[token]) for token in self._features}
+        idf = {token: math.log(N / df[token]) for token in features}
+        self._set_features(features, idf)
 
         # Now compute the TF-IDF vector for each document.
-        self._fit_matrix = []
-        for tokens in tokenized_docs:
-            tf = Counter(tokens)
-            doc_len = len(tokens)
-            vector = []
-            for token in self._features:
-                # Compute term frequency (TF) for the token in this document.
-                tf_value = tf[token] / doc_len if doc_len > 0 else 0.0
-                # Multiply by idf to get the TF-IDF weight.
-                tfidf_value = tf_value * self._idf[token]
-                vector.append(tfidf_value)
-            self._fit_matrix.append(vector)
+        if self.sparse:
+            self._fit_matrix = self._sparse_matrix(tokenized_docs)
+        else:
+            self._fit_matrix = [self._dense_vector(tokens) for tokens in tokenized_docs]
 
     def fit_transform(self, documents: List[str]) -> List[Vector]:
         """
@@ -75,6 +172,11 @@ class TfidfEmbedding(EmbeddingBase):
         of Vector instances.
         """
         self.fit(documents)
+        if self.sparse:
+            return [
+                Vector.from_numpy(self._fit_matrix.row(i))
+                for i in range(self._fit_matrix.shape[0])
+            ]
         return [Vector(value=vec) for vec in self._fit_matrix]
 
     def transform(self, documents: List[str]) -> List[Vector]:
@@ -82,24 +184,27 @@ class TfidfEmbedding(EmbeddingBase):
         Transforms new documents into TF-IDF vectors using the vocabulary and idf values
         computed during fitting. Any term not in the vocabulary is ignored.
         """
-        if not self._features or not self._idf:
-            raise ValueError(
-                "The model has not been fitted yet. Please call fit first."
-            )
+        self._check_fitted()
+        return [
+            Vector(value=self._dense_vector(self.tokenize(doc))) for doc in documents
+        ]
 
-        transformed_vectors = []
-        for doc in documents:
-            tokens = doc.lower().split()
-            tf = Counter(tokens)
-            doc_len = len(tokens)
-            vector = []
-            for token in self._features:
-                tf_value = tf[token] / doc_len if doc_len > 0 else 0.0
-                # If the token is not in the fitted vocabulary, its idf defaults to 0.
-                idf_value = self._idf.get(token, 0.0)
-                vector.append(tf_value * idf_value)
-            transformed_vectors.append(Vector(value=vector))
-        return transformed_vectors
+    def transform_sparse(self, documents: List[str]) -> SparseMatrix:
+        """
+        Transforms new documents into a CSR TF-IDF matrix using the vocabulary and idf
+        values computed during fitting, without building dense vectors.
+        """
+        self._check_fitted()
+        return self._sparse_matrix([self.tokenize(doc) for doc in documents])
+
+    def fit_transform_sparse(self, documents: List[str]) -> SparseMatrix:
+        """
+        Fits the model on the provided documents and returns the CSR TF-IDF matrix.
+        """
+        self.fit(documents)
+        if self.sparse:
+            return self._fit_matrix
+        return self._sparse_matrix([self.tokenize(doc) for doc in documents])
 
     def infer_vector(self, data: str, documents: List[str]) -> Vector:
         """
@@ -129,5 +234,4 @@ class TfidfEmbedding(EmbeddingBase):
         using joblib.
         """
         model_data = joblib.load(path)
-        self._features = model_data.get("features", [])
-        self._idf = model_data.get("idf", {})
+        self._set_features(model_data.get("features", []), model_data.get("idf", {}))
@@ -5,6 +5,8 @@ from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.embeddings.EmbeddingBase import EmbeddingBase
 from swarmauri_base.ComponentBase import ComponentBase
 
+from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.single_flight import coalesce_calls
 from swarmauri_standard.vectors.Vector import Vector
 
 
@@ -44,6 +46,8 @@ class VoyageEmbedding(EmbeddingBase):
         }
         self._client = httpx.Client()
 
+    @coalesce_calls
+    @retry_on_status_codes((429, 529), max_retries=1)
     def transform(self, data: List[str]) -> List[Vector]:
         """
         Transform a list of texts into embeddings using Voyage AI API.
@@ -0,0 +1,9 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of evaluator pools modules and the class each one exports
+evaluator_pools_files = [
+    ("swarmauri_standard.evaluator_pools.EvaluatorPool", "EvaluatorPool"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, evaluator_pools_files)
@@ -0,0 +1,9 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of evaluator results modules and the class each one exports
+evaluator_results_files = [
+    ("swarmauri_standard.evaluator_results.EvalResult", "EvalResult"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, evaluator_results_files)
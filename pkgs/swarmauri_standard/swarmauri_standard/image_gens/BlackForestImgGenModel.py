@@ -1,10 +1,9 @@
 import asyncio
-import contextlib
 import time
 from typing import Dict, List, Literal, Optional
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.image_gens.ImageGenBase import ImageGenBase
 from swarmauri_base.ComponentBase import ComponentBase
 
@@ -19,8 +18,8 @@ class BlackForestImgGenModel(ImageGenBase):
     """
 
     _BASE_URL: str = PrivateAttr("https://api.bfl.ml")
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     _headers: Dict[str, str] = PrivateAttr(default=None)
 
     api_key: SecretStr
@@ -39,12 +38,12 @@ class BlackForestImgGenModel(ImageGenBase):
             "Content-Type": "application/json",
             "X-Key": self.api_key.get_secret_value(),
         }
-        self._client = httpx.Client(headers=self._headers, timeout=self.timeout)
+        self._client = self._http_client(headers=self._headers, timeout=self.timeout)
 
-    async def _get_async_client(self) -> httpx.AsyncClient:
+    async def _get_async_client(self) -> AsyncPooledClient:
         """Gets or creates an async client instance."""
         if self._async_client is None or self._async_client.is_closed:
-            self._async_client = httpx.AsyncClient(
+            self._async_client = self._async_http_client(
                 headers=self._headers, timeout=self.timeout
             )
         return self._async_client
@@ -258,13 +257,6 @@ class BlackForestImgGenModel(ImageGenBase):
         finally:
             await self._close_async_client()
 
-    def __del__(self):
-        """Cleanup method to ensure clients are closed."""
-        self._client.close()
-        if self._async_client is not None and not self._async_client.is_closed:
-            with contextlib.suppress(Exception):
-                asyncio.run(self._close_async_client())
-
     def get_allowed_models(self) -> List[str]:
         """
         Queries the LLMProvider API endpoint to get the list of allowed models.
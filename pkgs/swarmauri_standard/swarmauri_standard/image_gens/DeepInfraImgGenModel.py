@@ -1,10 +1,9 @@
 import asyncio
-import contextlib
 from typing import List, Literal
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.image_gens.ImageGenBase import ImageGenBase
 
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
@@ -27,8 +26,8 @@ class DeepInfraImgGenModel(ImageGenBase):
     """
 
     _BASE_URL: str = PrivateAttr("https://api.deepinfra.com/v1/inference")
-    _client: httpx.Client = PrivateAttr()
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr()
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     timeout: float = 600.0
     api_key: SecretStr
     allowed_models: List[str] = [
@@ -55,16 +54,16 @@ class DeepInfraImgGenModel(ImageGenBase):
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key.get_secret_value()}",
         }
-        self._client = httpx.Client(headers=self._headers, timeout=self.timeout)
+        self._client = self._http_client(headers=self._headers, timeout=self.timeout)
         self.allowed_models = self.allowed_models or self.get_allowed_models()
         self.name = self.allowed_models[0]
 
-    async def _get_async_client(self) -> httpx.AsyncClient:
+    async def _get_async_client(self) -> AsyncPooledClient:
         """
         Gets or creates an async client instance.
         """
         if self._async_client is None or self._async_client.is_closed:
-            self._async_client = httpx.AsyncClient(
+            self._async_client = self._async_http_client(
                 headers=self._headers, timeout=self.timeout
             )
         return self._async_client
@@ -192,15 +191,6 @@ class DeepInfraImgGenModel(ImageGenBase):
         finally:
             await self._close_async_client()
 
-    def __del__(self):
-        """
-        Cleanup method to ensure clients are closed.
-        """
-        self._client.close()
-        if self._async_client is not None and not self._async_client.is_closed:
-            with contextlib.suppress(Exception):
-                asyncio.run(self._close_async_client())
-
     def get_allowed_models(self) -> List[str]:
         """
         Queries the LLMProvider API endpoint to get the list of allowed models.
@@ -2,9 +2,9 @@ import asyncio
 import time
 from typing import Dict, List, Literal, Optional
 
-import httpx
 from pydantic import Field, PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.image_gens.ImageGenBase import ImageGenBase
 
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
@@ -26,8 +26,8 @@ class FalAIImgGenModel(ImageGenBase):
     """
 
     _BASE_URL: str = PrivateAttr("https://queue.fal.run")
-    _client: httpx.Client = PrivateAttr()
-    _async_client: Optional[httpx.AsyncClient] = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr()
+    _async_client: Optional[AsyncPooledClient] = PrivateAttr(default=None)
 
     allowed_models: List[str] = [
         "fal-ai/flux-pro/v1.1-ultra-finetuned",
@@ -118,17 +118,17 @@ class FalAIImgGenModel(ImageGenBase):
             "Content-Type": "application/json",
             "Authorization": f"Key {self.api_key.get_secret_value()}",
         }
-        self._client = httpx.Client(headers=self._headers, timeout=self.timeout)
+        self._client = self._http_client(headers=self._headers, timeout=self.timeout)
 
-    async def _get_async_client(self) -> httpx.AsyncClient:
+    async def _get_async_client(self) -> AsyncPooledClient:
         """
         Get or create the async client.
 
         Returns:
-            httpx.AsyncClient: The async HTTP client instance.
+            AsyncPooledClient: The async HTTP client instance.
         """
         if self._async_client is None or self._async_client.is_closed:
-            self._async_client = httpx.AsyncClient(
+            self._async_client = self._async_http_client(
                 headers=self._headers, timeout=self.timeout
             )
         return self._async_client
@@ -388,10 +388,6 @@ class FalAIImgGenModel(ImageGenBase):
         finally:
             await self._close_async_client()
 
-    def __del__(self):
-        """Cleanup method to close HTTP clients."""
-        self._client.close()
-
     def get_allowed_models(self) -> List[str]:
         """
         Queries the LLMProvider API endpoint to get the list of allowed models.
@@ -1,10 +1,9 @@
 import asyncio
-import contextlib
 from typing import List, Literal
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.image_gens.ImageGenBase import ImageGenBase
 
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
@@ -33,8 +32,8 @@ class HyperbolicImgGenModel(ImageGenBase):
     """
 
     _BASE_URL: str = PrivateAttr("https://api.hyperbolic.xyz/v1/image/generation")
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
 
     api_key: SecretStr
     allowed_models: List[str] = [
@@ -72,14 +71,16 @@ class HyperbolicImgGenModel(ImageGenBase):
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key.get_secret_value()}",
         }
-        self._client = httpx.Client(headers=self._headers, timeout=30)
+        self._client = self._http_client(headers=self._headers, timeout=30)
 
-    async def _get_async_client(self) -> httpx.AsyncClient:
+    async def _get_async_client(self) -> AsyncPooledClient:
         """
         Gets or creates an async client instance.
         """
         if self._async_client is None or self._async_client.is_closed:
-            self._async_client = httpx.AsyncClient(headers=self._headers, timeout=30)
+            self._async_client = self._async_http_client(
+                headers=self._headers, timeout=30
+            )
         return self._async_client
 
     async def _close_async_client(self):
@@ -205,15 +206,6 @@ class HyperbolicImgGenModel(ImageGenBase):
         finally:
             await self._close_async_client()
 
-    def __del__(self):
-        """
-        Cleanup method to ensure clients are closed.
-        """
-        self._client.close()
-        if self._async_client is not None and not self._async_client.is_closed:
-            with contextlib.suppress(Exception):
-                asyncio.run(self._close_async_client())
-
     def get_allowed_models(self) -> List[str]:
         """
         Queries the LLMProvider API endpoint to get the list of allowed models.
@@ -81,7 +81,7 @@ class OpenAIImgGenModel(ImageGenBase):
             payload["style"] = style
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
+            with self._http_client(timeout=self.timeout) as client:
                 response = client.post(
                     self._BASE_URL, headers=self._headers, json=payload
                 )
@@ -127,7 +127,7 @@ class OpenAIImgGenModel(ImageGenBase):
             payload["style"] = style
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._async_http_client(timeout=self.timeout) as client:
                 response = await client.post(
                     self._BASE_URL, headers=self._headers, json=payload
                 )
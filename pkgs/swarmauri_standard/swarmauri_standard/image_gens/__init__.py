@@ -1,17 +1,13 @@
-# from swarmauri_standard.utils._lazy_import import _lazy_import
+from swarmauri_standard.utils._lazy_import import _lazy_package
 
-# # List of llms names (file names without the ".py" extension) and corresponding class names
-# llms_files = [
-#     ("swarmauri_standard.llms.BlackForestImgGenModel", "BlackForestImgGenModel"),
-#     ("swarmauri_standard.llms.DeepInfraImgGenModel", "DeepInfraImgGenModel"),
-#     ("swarmauri_standard.llms.FalAIImgGenModel", "FalAIImgGenModel"),
-#     ("swarmauri_standard.llms.HyperbolicImgGenModel", "HyperbolicImgGenModel"),
-#     ("swarmauri_standard.llms.OpenAIImgGenModel", "OpenAIImgGenModel"),
-# ]
+# List of image gens modules and the class each one exports
+image_gens_files = [
+    ("swarmauri_standard.image_gens.BlackForestImgGenModel", "BlackForestImgGenModel"),
+    ("swarmauri_standard.image_gens.DeepInfraImgGenModel", "DeepInfraImgGenModel"),
+    ("swarmauri_standard.image_gens.FalAIImgGenModel", "FalAIImgGenModel"),
+    ("swarmauri_standard.image_gens.HyperbolicImgGenModel", "HyperbolicImgGenModel"),
+    ("swarmauri_standard.image_gens.OpenAIImgGenModel", "OpenAIImgGenModel"),
+]
 
-# # Lazy loading of llms classes, storing them in variables
-# for module_name, class_name in llms_files:
-#     globals()[class_name] = _lazy_import(module_name, class_name)
-
-# # Adding the lazy-loaded llms classes to __all__
-# __all__ = [class_name for _, class_name in llms_files]
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, image_gens_files)
@@ -0,0 +1,37 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of inner products modules and the class each one exports
+inner_products_files = [
+    (
+        "swarmauri_standard.inner_products.EuclideanInnerProduct",
+        "EuclideanInnerProduct",
+    ),
+    (
+        "swarmauri_standard.inner_products.FrobeniusComplexInnerProduct",
+        "FrobeniusComplexInnerProduct",
+    ),
+    (
+        "swarmauri_standard.inner_products.FrobeniusRealInnerProduct",
+        "FrobeniusRealInnerProduct",
+    ),
+    (
+        "swarmauri_standard.inner_products.HermitianInnerProduct",
+        "HermitianInnerProduct",
+    ),
+    ("swarmauri_standard.inner_products.RKHSInnerProduct", "RKHSInnerProduct"),
+    (
+        "swarmauri_standard.inner_products.SobolevH1InnerProduct",
+        "SobolevH1InnerProduct",
+    ),
+    (
+        "swarmauri_standard.inner_products.TraceFormWeightedInnerProduct",
+        "TraceFormWeightedInnerProduct",
+    ),
+    (
+        "swarmauri_standard.inner_products.WeightedL2InnerProduct",
+        "WeightedL2InnerProduct",
+    ),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, inner_products_files)
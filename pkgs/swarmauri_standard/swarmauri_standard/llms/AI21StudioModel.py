@@ -1,17 +1,18 @@
-import asyncio
-import json
 from typing import AsyncIterator, Iterator, List, Literal, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.duration_manager import DurationManager
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(LLMBase, "AI21StudioModel")
@@ -36,8 +37,8 @@ class AI21StudioModel(LLMBase):
     allowed_models: List[str] = ["jamba-1.5-large", "jamba-1.5-mini"]
     name: str = "jamba-1.5-large"
     type: Literal["AI21StudioModel"] = "AI21StudioModel"
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     _BASE_URL: str = PrivateAttr(
         default="https://api.ai21.com/studio/v1/chat/completions"
     )
@@ -50,12 +51,12 @@ class AI21StudioModel(LLMBase):
             **data: Arbitrary keyword arguments for initialization.
         """
         super().__init__(**data)
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -97,9 +98,11 @@ class AI21StudioModel(LLMBase):
             prompt_time=prompt_time,
             completion_time=completion_time,
             total_time=total_time,
+            time_to_first_token=usage_data.get("time_to_first_token"),
         )
         return usage
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -124,7 +127,7 @@ class AI21StudioModel(LLMBase):
         Returns:
             Conversation: Updated conversation with generated message.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -152,6 +155,8 @@ class AI21StudioModel(LLMBase):
             conversation.add_message(AgentMessage(content=message_content))
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -176,7 +181,7 @@ class AI21StudioModel(LLMBase):
         Returns:
             Conversation: Updated conversation with generated message.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -204,6 +209,7 @@ class AI21StudioModel(LLMBase):
             conversation.add_message(AgentMessage(content=message_content))
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self,
@@ -226,7 +232,7 @@ class AI21StudioModel(LLMBase):
         Yields:
             Iterator[str]: Chunks of the response content as they are generated.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -239,40 +245,19 @@ class AI21StudioModel(LLMBase):
             "stream": True,
         }
 
-        with DurationManager() as prompt_timer:
-            response = self._client.post(self._BASE_URL, json=payload)
-            response.raise_for_status()
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, self._BASE_URL, json=payload)
 
-            usage_data = {}
-            message_content = ""
-
-        with DurationManager() as completion_timer:
-            for line in response.iter_lines():
-                json_str = line.replace("data: ", "")
-                try:
-                    if json_str:
-                        chunk = json.loads(json_str)
-                        if (
-                            chunk["choices"][0]["delta"]
-                            and "content" in chunk["choices"][0]["delta"]
-                        ):
-                            delta = chunk["choices"][0]["delta"]["content"]
-                            message_content += delta
-                            yield delta
-                        if "usage" in chunk:
-                            usage_data = chunk.get("usage", {})
-                except json.JSONDecodeError:
-                    pass
-
-        # Prepare usage data if tracking is enabled
+        usage_data = reader.usage_data()
         if self.include_usage and usage_data:
             usage = self._prepare_usage_data(
-                usage_data, prompt_timer.duration, completion_timer.duration
+                usage_data, reader.time_to_first_token, reader.completion_time
             )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
+            conversation.add_message(AgentMessage(content=reader.content, usage=usage))
         else:
-            conversation.add_message(AgentMessage(content=message_content))
+            conversation.add_message(AgentMessage(content=reader.content))
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self,
@@ -295,7 +280,7 @@ class AI21StudioModel(LLMBase):
         Yields:
             AsyncIterator[str]: Chunks of the response content as they are generated.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -308,39 +293,20 @@ class AI21StudioModel(LLMBase):
             "stream": True,
         }
 
-        with DurationManager() as prompt_timer:
-            response = await self._async_client.post(self._BASE_URL, json=payload)
-            response.raise_for_status()
-
-        usage_data = {}
-        message_content = ""
-
-        with DurationManager() as completion_timer:
-            async for line in response.aiter_lines():
-                json_str = line.replace("data: ", "")
-                try:
-                    if json_str:
-                        chunk = json.loads(json_str)
-                        if (
-                            chunk["choices"][0]["delta"]
-                            and "content" in chunk["choices"][0]["delta"]
-                        ):
-                            delta = chunk["choices"][0]["delta"]["content"]
-                            message_content += delta
-                            yield delta
-                        if "usage" in chunk:
-                            usage_data = chunk.get("usage", {})
-                except json.JSONDecodeError:
-                    pass
+        reader = ChatCompletionStream()
+        async for delta in reader.astream(
+            self._async_client, self._BASE_URL, json=payload
+        ):
+            yield delta
 
-        # Prepare usage data if tracking is enabled
+        usage_data = reader.usage_data()
         if self.include_usage and usage_data:
             usage = self._prepare_usage_data(
-                usage_data, prompt_timer.duration, completion_timer.duration
+                usage_data, reader.time_to_first_token, reader.completion_time
             )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
+            conversation.add_message(AgentMessage(content=reader.content, usage=usage))
         else:
-            conversation.add_message(AgentMessage(content=message_content))
+            conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -402,21 +368,19 @@ class AI21StudioModel(LLMBase):
         Returns:
             List[Conversation]: List of updated conversations.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    top_p=top_p,
-                    stop=stop,
-                    n=n,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict(
+                conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                stop=stop,
+                n=n,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
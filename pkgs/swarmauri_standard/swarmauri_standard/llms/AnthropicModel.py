@@ -1,16 +1,17 @@
-import asyncio
 import json
 from typing import AsyncIterator, Dict, Iterator, List, Literal, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.duration_manager import DurationManager
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
 
 
@@ -30,8 +31,8 @@ class AnthropicModel(LLMBase):
     """
 
     _BASE_URL: str = PrivateAttr("https://api.anthropic.com/v1")
-    _client: httpx.Client = PrivateAttr()
-    _async_client: httpx.AsyncClient = PrivateAttr()
+    _client: PooledClient = PrivateAttr()
+    _async_client: AsyncPooledClient = PrivateAttr()
     api_key: SecretStr
     allowed_models: List[str] = [
         "claude-3-7-sonnet-latest",
@@ -58,10 +59,10 @@ class AnthropicModel(LLMBase):
             "x-api-key": self.api_key.get_secret_value(),
             "anthropic-version": "2023-06-01",
         }
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=headers, base_url=self._BASE_URL, timeout=self.timeout
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers=headers, base_url=self._BASE_URL, timeout=self.timeout
         )
 
@@ -133,6 +134,7 @@ class AnthropicModel(LLMBase):
             total_time=total_time,
         )
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self, conversation: Conversation, temperature=0.7, max_tokens=256
@@ -149,7 +151,7 @@ class AnthropicModel(LLMBase):
             Conversation: The updated conversation object with the generated response added.
         """
         system_context = self._get_system_context(conversation.history)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -181,6 +183,7 @@ class AnthropicModel(LLMBase):
 
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self, conversation: Conversation, temperature=0.7, max_tokens=256
@@ -197,7 +200,7 @@ class AnthropicModel(LLMBase):
             str: Incremental parts of the model's response as they are received.
         """
         system_context = self._get_system_context(conversation.history)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -265,6 +268,8 @@ class AnthropicModel(LLMBase):
         else:
             conversation.add_message(AgentMessage(content=message_content))
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self, conversation: Conversation, temperature=0.7, max_tokens=256
@@ -281,7 +286,7 @@ class AnthropicModel(LLMBase):
             Conversation: The updated conversation including the model's response.
         """
         system_context = self._get_system_context(conversation.history)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -313,6 +318,7 @@ class AnthropicModel(LLMBase):
 
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self, conversation: Conversation, temperature=0.7, max_tokens=256
@@ -329,7 +335,7 @@ class AnthropicModel(LLMBase):
             str: Incremental parts of the model's response as they are received.
         """
         system_context = self._get_system_context(conversation.history)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -437,16 +443,14 @@ class AnthropicModel(LLMBase):
         Returns:
             List[Conversation]: A list of updated conversations including the model's responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv, temperature=temperature, max_tokens=max_tokens
-                )
+            return await self.apredict(
+                conv, temperature=temperature, max_tokens=max_tokens
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
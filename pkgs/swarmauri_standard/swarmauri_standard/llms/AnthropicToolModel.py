@@ -1,12 +1,11 @@
-import asyncio
 import json
 import logging
 import warnings
 from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
@@ -46,8 +45,8 @@ class AnthropicToolModel(LLMBase):
     """
 
     _BASE_URL: str = PrivateAttr("https://api.anthropic.com/v1")
-    _client: httpx.Client = PrivateAttr()
-    _async_client: httpx.AsyncClient = PrivateAttr()
+    _client: PooledClient = PrivateAttr()
+    _async_client: AsyncPooledClient = PrivateAttr()
 
     api_key: SecretStr
     allowed_models: List[str] = [
@@ -75,10 +74,10 @@ class AnthropicToolModel(LLMBase):
             "x-api-key": self.api_key.get_secret_value(),
             "anthropic-version": "2023-06-01",
         }
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=headers, base_url=self._BASE_URL, timeout=self.timeout
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers=headers, base_url=self._BASE_URL, timeout=self.timeout
         )
         self.allowed_models = self.allowed_models or self.get_allowed_models()
@@ -141,7 +140,7 @@ class AnthropicToolModel(LLMBase):
         Returns:
             The conversation object updated with the assistant's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -202,7 +201,7 @@ class AnthropicToolModel(LLMBase):
         Returns:
             The conversation object updated with the assistant's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         logging.info(f"formatted_messages: {formatted_messages}")
 
         payload = {
@@ -262,7 +261,7 @@ class AnthropicToolModel(LLMBase):
         Yields:
             Iterator[str]: Chunks of text received from the streaming response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -336,7 +335,7 @@ class AnthropicToolModel(LLMBase):
         Yields:
             AsyncIterator[str]: Chunks of text received from the streaming response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         logging.info(formatted_messages)
 
         payload = {
@@ -451,20 +450,18 @@ class AnthropicToolModel(LLMBase):
             List: A list of conversation objects updated with the assistant's responses.
         """
 
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    tool_choice=tool_choice,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                tool_choice=tool_choice,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
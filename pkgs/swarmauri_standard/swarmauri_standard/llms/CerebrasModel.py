@@ -1,18 +1,19 @@
 # File: swarmauri_standard/llms/CerebrasModel.py
 
-import asyncio
-import json
 from typing import Any, AsyncGenerator, Dict, Generator, List, Literal, Optional, Type
 
-import httpx
 from pydantic import SecretStr, PrivateAttr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(LLMBase, "CerebrasModel")
@@ -31,8 +32,8 @@ class CerebrasModel(LLMBase):
     name: str = "llama3.1-8b"
     type: Literal["CerebrasModel"] = "CerebrasModel"
 
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     _BASE_URL: str = PrivateAttr(default="https://api.cerebras.ai/v1/chat/completions")
     timeout: float = 600.0
 
@@ -41,12 +42,12 @@ class CerebrasModel(LLMBase):
         Initialize the CerebrasModel with the provided API key.
         """
         super().__init__(**data)
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -77,6 +78,7 @@ class CerebrasModel(LLMBase):
         """
         return UsageData.model_validate(usage)
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -93,7 +95,7 @@ class CerebrasModel(LLMBase):
         """
         payload = {
             "model": self.name,
-            "messages": self._format_messages(conversation.history),
+            "messages": self._format_history(conversation),
             "temperature": temperature,
             "max_completion_tokens": max_completion_tokens,
             "top_p": top_p,
@@ -117,6 +119,8 @@ class CerebrasModel(LLMBase):
             conversation.add_message(AgentMessage(content=content))
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -133,7 +137,7 @@ class CerebrasModel(LLMBase):
         """
         payload = {
             "model": self.name,
-            "messages": self._format_messages(conversation.history),
+            "messages": self._format_history(conversation),
             "temperature": temperature,
             "max_completion_tokens": max_completion_tokens,
             "top_p": top_p,
@@ -157,6 +161,7 @@ class CerebrasModel(LLMBase):
             conversation.add_message(AgentMessage(content=content))
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self,
@@ -173,7 +178,7 @@ class CerebrasModel(LLMBase):
         """
         payload = {
             "model": self.name,
-            "messages": self._format_messages(conversation.history),
+            "messages": self._format_history(conversation),
             "temperature": temperature,
             "max_completion_tokens": max_completion_tokens,
             "top_p": top_p,
@@ -184,25 +189,12 @@ class CerebrasModel(LLMBase):
         if enable_json:
             payload["response_format"] = "json_object"
 
-        response = self._client.post(self._BASE_URL, json=payload)
-        response.raise_for_status()
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, self._BASE_URL, json=payload)
 
-        message = ""
-        for line in response.iter_lines():
-            chunk_str = line.replace("data: ", "")
-            if not chunk_str:
-                continue
-            try:
-                chunk = json.loads(chunk_str)
-                delta = chunk["choices"][0]["delta"].get("content")
-                if delta:
-                    message += delta
-                    yield delta
-            except json.JSONDecodeError:
-                continue
-
-        conversation.add_message(AgentMessage(content=message))
+        conversation.add_message(AgentMessage(content=reader.content))
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self,
@@ -219,7 +211,7 @@ class CerebrasModel(LLMBase):
         """
         payload = {
             "model": self.name,
-            "messages": self._format_messages(conversation.history),
+            "messages": self._format_history(conversation),
             "temperature": temperature,
             "max_completion_tokens": max_completion_tokens,
             "top_p": top_p,
@@ -230,24 +222,13 @@ class CerebrasModel(LLMBase):
         if enable_json:
             payload["response_format"] = "json_object"
 
-        response = await self._async_client.post(self._BASE_URL, json=payload)
-        response.raise_for_status()
-
-        message = ""
-        async for line in response.aiter_lines():
-            chunk_str = line.replace("data: ", "")
-            if not chunk_str:
-                continue
-            try:
-                chunk = json.loads(chunk_str)
-                delta = chunk["choices"][0]["delta"].get("content")
-                if delta:
-                    message += delta
-                    yield delta
-            except json.JSONDecodeError:
-                continue
+        reader = ChatCompletionStream()
+        async for delta in reader.astream(
+            self._async_client, self._BASE_URL, json=payload
+        ):
+            yield delta
 
-        conversation.add_message(AgentMessage(content=message))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -290,22 +271,20 @@ class CerebrasModel(LLMBase):
         """
         Processes a batch of conversations concurrently.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conv(conv: Conversation) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    temperature=temperature,
-                    max_completion_tokens=max_completion_tokens,
-                    top_p=top_p,
-                    seed=seed,
-                    enable_json=enable_json,
-                    stop=stop,
-                )
+            return await self.apredict(
+                conv,
+                temperature=temperature,
+                max_completion_tokens=max_completion_tokens,
+                top_p=top_p,
+                seed=seed,
+                enable_json=enable_json,
+                stop=stop,
+            )
 
-        tasks = [process_conv(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conv, max_concurrent, max_completion_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
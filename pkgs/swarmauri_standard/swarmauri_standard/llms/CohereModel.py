@@ -1,15 +1,17 @@
-import asyncio
 import json
 from typing import AsyncIterator, Dict, Iterator, List, Literal
 
 import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.duration_manager import DurationManager
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
 
 
@@ -30,7 +32,7 @@ class CohereModel(LLMBase):
     """
 
     _BASE_URL: str = PrivateAttr("https://api.cohere.ai/v1")
-    _client: httpx.Client = PrivateAttr()
+    _client: PooledClient = PrivateAttr()
 
     api_key: SecretStr
     allowed_models: List[str] = [
@@ -61,7 +63,7 @@ class CohereModel(LLMBase):
             "content-type": "application/json",
             "authorization": f"Bearer {self.api_key.get_secret_value()}",
         }
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=headers, base_url=self._BASE_URL, timeout=self.timeout
         )
 
@@ -145,6 +147,7 @@ class CohereModel(LLMBase):
         )
         return usage
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(self, conversation, temperature=0.7, max_tokens=256):
         """
@@ -202,6 +205,8 @@ class CohereModel(LLMBase):
 
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(self, conversation, temperature=0.7, max_tokens=256):
         """
@@ -239,7 +244,7 @@ class CohereModel(LLMBase):
         if system_message:
             payload["preamble"] = system_message
 
-        async with httpx.AsyncClient(
+        async with self._async_http_client(
             headers=self.get_headers(), base_url=self._BASE_URL
         ) as client:
             with DurationManager() as prompt_timer:
@@ -262,6 +267,7 @@ class CohereModel(LLMBase):
 
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(self, conversation, temperature=0.7, max_tokens=256) -> Iterator[str]:
         """
@@ -332,6 +338,7 @@ class CohereModel(LLMBase):
         else:
             conversation.add_message(AgentMessage(content=message_content))
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self, conversation, temperature=0.7, max_tokens=256
@@ -383,7 +390,7 @@ class CohereModel(LLMBase):
         collected_content = []
         usage_data = {}
 
-        async with httpx.AsyncClient(
+        async with self._async_http_client(
             headers=self.get_headers(), base_url=self._BASE_URL
         ) as client:
             with DurationManager() as prompt_timer:
@@ -446,16 +453,14 @@ class CohereModel(LLMBase):
         Returns:
             List of updated conversation objects with model responses added
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv, temperature=temperature, max_tokens=max_tokens
-                )
+            return await self.apredict(
+                conv, temperature=temperature, max_tokens=max_tokens
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
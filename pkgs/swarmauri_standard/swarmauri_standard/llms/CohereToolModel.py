@@ -1,11 +1,10 @@
-import asyncio
 import json
 import warnings
 from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type, Union
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
@@ -47,8 +46,8 @@ class CohereToolModel(LLMBase):
     """
 
     _BASE_URL: str = PrivateAttr("https://api.cohere.ai/v1")
-    _client: httpx.Client = PrivateAttr()
-    _async_client: httpx.AsyncClient = PrivateAttr()
+    _client: PooledClient = PrivateAttr()
+    _async_client: AsyncPooledClient = PrivateAttr()
 
     api_key: SecretStr
     allowed_models: List[str] = [
@@ -78,10 +77,10 @@ class CohereToolModel(LLMBase):
             "content-type": "application/json",
             "authorization": f"Bearer {self.api_key.get_secret_value()}",
         }
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=headers, base_url=self._BASE_URL, timeout=self.timeout
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers=headers, base_url=self._BASE_URL, timeout=self.timeout
         )
 
@@ -293,7 +292,7 @@ class CohereToolModel(LLMBase):
             The updated conversation with the model's response
         """
         conversation = self._ensure_conversation_has_message(conversation)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         tools = self._schema_convert_tools(toolkit.tools) if toolkit else None
 
         with DurationManager() as tool_timer:
@@ -356,7 +355,7 @@ class CohereToolModel(LLMBase):
             Iterator[str]: An iterator yielding response chunks
         """
         conversation = self._ensure_conversation_has_message(conversation)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         tools = self._schema_convert_tools(toolkit.tools) if toolkit else None
 
         # Handle tool call first
@@ -426,7 +425,7 @@ class CohereToolModel(LLMBase):
             The updated conversation with the model's response
         """
         conversation = self._ensure_conversation_has_message(conversation)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         tools = self._schema_convert_tools(toolkit.tools) if toolkit else None
 
         with DurationManager() as tool_timer:
@@ -489,7 +488,7 @@ class CohereToolModel(LLMBase):
             AsyncIterator[str]: An async iterator yielding response chunks
         """
         conversation = self._ensure_conversation_has_message(conversation)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         tools = self._schema_convert_tools(toolkit.tools) if toolkit else None
 
         # Handle tool call first
@@ -609,19 +608,17 @@ class CohereToolModel(LLMBase):
             while still allowing for parallel processing of multiple conversations.
 
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
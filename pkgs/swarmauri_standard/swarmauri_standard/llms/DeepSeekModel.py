@@ -1,15 +1,16 @@
-import asyncio
-import json
 from typing import AsyncIterator, Dict, Iterator, List, Literal
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase, SubclassUnion
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
 from swarmauri_standard.messages.AgentMessage import AgentMessage
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(LLMBase, "DeepSeekModel")
@@ -38,20 +39,20 @@ class DeepSeekModel(LLMBase):
     name: str = "deepseek-chat"
 
     type: Literal["DeepSeekModel"] = "DeepSeekModel"
-    _client: httpx.Client = PrivateAttr()
-    _async_client: httpx.AsyncClient = PrivateAttr()
+    _client: PooledClient = PrivateAttr()
+    _async_client: AsyncPooledClient = PrivateAttr()
 
     timeout: float = 600.0
 
     def __init__(self, **data):
         super().__init__(**data)
 
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers={"Authorization": f"Bearer {self.api_key}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -75,6 +76,7 @@ class DeepSeekModel(LLMBase):
         ]
         return formatted_messages
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -101,7 +103,7 @@ class DeepSeekModel(LLMBase):
         Returns:
             Updated conversation object with the generated response added.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "messages": formatted_messages,
             "model": self.name,
@@ -119,6 +121,8 @@ class DeepSeekModel(LLMBase):
         conversation.add_message(AgentMessage(content=message_content))
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -145,7 +149,7 @@ class DeepSeekModel(LLMBase):
         Returns:
             Updated conversation object with the generated response added.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "messages": formatted_messages,
             "model": self.name,
@@ -163,6 +167,7 @@ class DeepSeekModel(LLMBase):
         conversation.add_message(AgentMessage(content=message_content))
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self,
@@ -189,7 +194,7 @@ class DeepSeekModel(LLMBase):
         Yields:
             str: Token of the response being streamed.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "messages": formatted_messages,
             "model": self.name,
@@ -202,24 +207,12 @@ class DeepSeekModel(LLMBase):
             "top_p": top_p,
             "stream": True,
         }
-        with self._client.stream("POST", "/chat/completions", json=payload) as response:
-            response.raise_for_status()
-            collected_content = []
-            for line in response.iter_lines():
-                json_str = line.replace("data: ", "")
-                if json_str:
-                    try:
-                        chunk = json.loads(json_str)
-                        if chunk["choices"][0]["delta"]["content"]:
-                            content = chunk["choices"][0]["delta"]["content"]
-                            collected_content.append(content)
-                            yield content
-                    except json.JSONDecodeError:
-                        pass
-
-            full_content = "".join(collected_content)
-            conversation.add_message(AgentMessage(content=full_content))
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, "/chat/completions", json=payload)
 
+        conversation.add_message(AgentMessage(content=reader.content))
+
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self,
@@ -246,7 +239,7 @@ class DeepSeekModel(LLMBase):
         Yields:
             str: Token of the response being streamed.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "messages": formatted_messages,
             "model": self.name,
@@ -259,25 +252,13 @@ class DeepSeekModel(LLMBase):
             "top_p": top_p,
             "stream": True,
         }
-        async with self._async_client.stream(
-            "POST", "/chat/completions", json=payload
-        ) as response:
-            response.raise_for_status()
-            collected_content = []
-            async for line in response.aiter_lines():
-                json_str = line.replace("data: ", "")
-                if json_str:
-                    try:
-                        chunk = json.loads(json_str)
-                        if chunk["choices"][0]["delta"]["content"]:
-                            content = chunk["choices"][0]["delta"]["content"]
-                            collected_content.append(content)
-                            yield content
-                    except json.JSONDecodeError:
-                        pass
-
-            full_content = "".join(collected_content)
-            conversation.add_message(AgentMessage(content=full_content))
+        reader = ChatCompletionStream()
+        async for delta in reader.astream(
+            self._async_client, "/chat/completions", json=payload
+        ):
+            yield delta
+
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -344,22 +325,20 @@ class DeepSeekModel(LLMBase):
         Returns:
             List: List of updated conversation objects with responses added.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    frequency_penalty=frequency_penalty,
-                    presence_penalty=presence_penalty,
-                    stop=stop,
-                    top_p=top_p,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict(
+                conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                frequency_penalty=frequency_penalty,
+                presence_penalty=presence_penalty,
+                stop=stop,
+                top_p=top_p,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -1,16 +1,18 @@
-import asyncio
 import json
 from typing import AsyncIterator, Dict, Iterator, List, Literal, Type
 
 import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.duration_manager import DurationManager
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
 
 
@@ -42,8 +44,8 @@ class GeminiProModel(LLMBase):
     timeout: float = 600.0
 
     type: Literal["GeminiProModel"] = "GeminiProModel"
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
 
     _safety_settings: List[Dict[str, str]] = PrivateAttr(
         [
@@ -75,13 +77,13 @@ class GeminiProModel(LLMBase):
         """
         super().__init__(api_key=api_key, **kwargs)
 
-        self._client = httpx.Client(
+        self._client = self._http_client(
             base_url="https://generativelanguage.googleapis.com/v1beta",
             headers={"Content-Type": "application/json"},
             timeout=self.timeout,
         )
 
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             base_url="https://generativelanguage.googleapis.com/v1beta",
             headers={"Content-Type": "application/json"},
             timeout=self.timeout,
@@ -157,6 +159,7 @@ class GeminiProModel(LLMBase):
 
         return usage
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -186,7 +189,7 @@ class GeminiProModel(LLMBase):
         }
 
         system_context = self._get_system_context(conversation.history)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         next_message = formatted_messages.pop()
 
         payload = {
@@ -218,6 +221,8 @@ class GeminiProModel(LLMBase):
 
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -247,7 +252,7 @@ class GeminiProModel(LLMBase):
         }
 
         system_context = self._get_system_context(conversation.history)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         next_message = formatted_messages.pop()
 
         payload = {
@@ -277,6 +282,7 @@ class GeminiProModel(LLMBase):
 
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self,
@@ -307,7 +313,7 @@ class GeminiProModel(LLMBase):
         }
 
         system_context = self._get_system_context(conversation.history)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         next_message = formatted_messages.pop()
 
@@ -350,6 +356,7 @@ class GeminiProModel(LLMBase):
         else:
             conversation.add_message(AgentMessage(content=full_response))
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self,
@@ -380,7 +387,7 @@ class GeminiProModel(LLMBase):
         }
 
         system_context = self._get_system_context(conversation.history)
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         next_message = formatted_messages.pop()
 
@@ -467,18 +474,16 @@ class GeminiProModel(LLMBase):
         Returns:
             List: A list of results from the `apredict` method for each conversation.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict(
+                conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -1,10 +1,8 @@
-import asyncio
 import json
 import logging
 import warnings
 from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
 from swarmauri_base.llms.LLMBase import LLMBase
@@ -230,7 +228,7 @@ class GeminiToolModel(LLMBase):
             "function_calling_config": {"mode": "ANY"},
         }
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         tools = self._schema_convert_tools(toolkit.tools)
 
         payload = {
@@ -246,7 +244,7 @@ class GeminiToolModel(LLMBase):
         if system_context:
             payload["system_instruction"] = system_context
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(
                 f"{self._BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -266,7 +264,7 @@ class GeminiToolModel(LLMBase):
         payload.pop("tools", None)
         payload.pop("tool_config", None)
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(
                 f"{self._BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -316,7 +314,7 @@ class GeminiToolModel(LLMBase):
             "function_calling_config": {"mode": "ANY"},
         }
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         tools = self._schema_convert_tools(toolkit.tools)
 
         payload = {
@@ -332,7 +330,7 @@ class GeminiToolModel(LLMBase):
         if system_context:
             payload["system_instruction"] = system_context
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 f"{self._BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -352,7 +350,7 @@ class GeminiToolModel(LLMBase):
         payload.pop("tools", None)
         payload.pop("tool_config", None)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 f"{self._BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -402,7 +400,7 @@ class GeminiToolModel(LLMBase):
             "function_calling_config": {"mode": "ANY"},
         }
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         tools = self._schema_convert_tools(toolkit.tools)
 
         payload = {
@@ -418,7 +416,7 @@ class GeminiToolModel(LLMBase):
         if system_context:
             payload["system_instruction"] = system_context
 
-        with httpx.Client(timeout=10.0) as client:
+        with self._http_client(timeout=10.0) as client:
             response = client.post(
                 f"{self._BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -438,7 +436,7 @@ class GeminiToolModel(LLMBase):
         payload.pop("tools", None)
         payload.pop("tool_config", None)
 
-        with httpx.Client(timeout=10.0) as client:
+        with self._http_client(timeout=10.0) as client:
             response = client.post(
                 f"{self._BASE_URL}/{self.name}:streamGenerateContent?alt=sse&key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -488,7 +486,7 @@ class GeminiToolModel(LLMBase):
             "function_calling_config": {"mode": "ANY"},
         }
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         tools = self._schema_convert_tools(toolkit.tools)
 
         payload = {
@@ -504,7 +502,7 @@ class GeminiToolModel(LLMBase):
         if system_context:
             payload["system_instruction"] = system_context
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 f"{self._BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -524,7 +522,7 @@ class GeminiToolModel(LLMBase):
         payload.pop("tools", None)
         payload.pop("tool_config", None)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 f"{self._BASE_URL}/{self.name}:streamGenerateContent?alt=sse&key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -593,19 +591,17 @@ class GeminiToolModel(LLMBase):
         Returns:
             List[Conversation]: List of updated conversations with model responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -6,6 +6,7 @@ import aiofiles
 import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
@@ -42,8 +43,8 @@ class GroqAIAudio(LLMBase):
 
     name: str = "whisper-large-v3-turbo"
     type: Literal["GroqAIAudio"] = "GroqAIAudio"
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     _BASE_URL: str = PrivateAttr(default="https://api.groq.com/openai/v1/audio/")
 
     timeout: float = 600.0
@@ -56,12 +57,12 @@ class GroqAIAudio(LLMBase):
             **data: Arbitrary keyword arguments containing initialization data.
         """
         super().__init__(**data)
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -1,11 +1,10 @@
-import asyncio
 import json
 import warnings
 from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
@@ -15,6 +14,7 @@ from swarmauri_standard.schema_converters.GroqSchemaConverter import (
     GroqSchemaConverter,
 )
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 warnings.warn(
     "Importing GroqToolModel from swarmauri.llms is deprecated and will be "
@@ -56,8 +56,8 @@ class GroqToolModel(LLMBase):
     name: str = "qwen-2.5-32b"
 
     type: Literal["GroqToolModel"] = "GroqToolModel"
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     _BASE_URL: str = PrivateAttr(
         default="https://api.groq.com/openai/v1/chat/completions"
     )
@@ -72,12 +72,12 @@ class GroqToolModel(LLMBase):
             **data: Arbitrary keyword arguments containing initialization data.
         """
         super().__init__(**data)
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -168,7 +168,7 @@ class GroqToolModel(LLMBase):
         Returns:
             Conversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         if toolkit and not tool_choice:
             tool_choice = "auto"
@@ -229,7 +229,7 @@ class GroqToolModel(LLMBase):
         Returns:
             Conversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         if toolkit and not tool_choice:
             tool_choice = "auto"
@@ -291,7 +291,7 @@ class GroqToolModel(LLMBase):
             Iterator[str]: Streamed response content.
         """
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -316,24 +316,10 @@ class GroqToolModel(LLMBase):
         payload["stream"] = True
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, self._BASE_URL, json=payload)
 
-        response = self._client.post(self._BASE_URL, json=payload)
-        response.raise_for_status()
-        message_content = ""
-
-        for line in response.iter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
@@ -357,7 +343,7 @@ class GroqToolModel(LLMBase):
         Yields:
             AsyncIterator[str]: Streamed response content.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -383,22 +369,13 @@ class GroqToolModel(LLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        response = self._client.post(self._BASE_URL, json=payload)
-        response.raise_for_status()
-        message_content = ""
-
-        async for line in response.aiter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-        conversation.add_message(AgentMessage(content=message_content))
+        reader = ChatCompletionStream()
+        async for delta in reader.astream(
+            self._async_client, self._BASE_URL, json=payload
+        ):
+            yield delta
+
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -463,20 +440,18 @@ class GroqToolModel(LLMBase):
         if toolkit and not tool_choice:
             tool_choice = "auto"
 
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    tool_choice=tool_choice,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                tool_choice=tool_choice,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -1,17 +1,18 @@
-import asyncio
-import json
 import warnings
 from typing import Any, AsyncGenerator, Dict, Generator, List, Literal, Optional, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_base.ComponentBase import ComponentBase
 
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 warnings.warn(
     "Importing GroqVisionModel from swarmauri.llms is deprecated and will be "
@@ -45,8 +46,8 @@ class GroqVisionModel(LLMBase):
     ]
     name: str = "llama-3.2-90b-vision-preview"
     type: Literal["GroqVisionModel"] = "GroqVisionModel"
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     _BASE_URL: str = PrivateAttr(
         default="https://api.groq.com/openai/v1/chat/completions"
     )
@@ -61,12 +62,12 @@ class GroqVisionModel(LLMBase):
             **data: Arbitrary keyword arguments containing initialization data.
         """
         super().__init__(**data)
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -113,6 +114,7 @@ class GroqVisionModel(LLMBase):
         """
         return UsageData.model_validate(usage_data)
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -137,7 +139,7 @@ class GroqVisionModel(LLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -162,6 +164,8 @@ class GroqVisionModel(LLMBase):
         conversation.add_message(AgentMessage(content=message_content, usage=usage))
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -186,7 +190,7 @@ class GroqVisionModel(LLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -210,6 +214,7 @@ class GroqVisionModel(LLMBase):
         conversation.add_message(AgentMessage(content=message_content, usage=usage))
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self,
@@ -235,7 +240,7 @@ class GroqVisionModel(LLMBase):
             str: Partial response content from the model.
         """
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -248,24 +253,12 @@ class GroqVisionModel(LLMBase):
         if enable_json:
             payload["response_format"] = "json_object"
 
-        response = self._client.post(self._BASE_URL, json=payload)
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, self._BASE_URL, json=payload)
 
-        response.raise_for_status()
-        message_content = ""
-        for line in response.iter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self,
@@ -291,7 +284,7 @@ class GroqVisionModel(LLMBase):
             str: Partial response content from the model.
         """
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -304,23 +297,13 @@ class GroqVisionModel(LLMBase):
         if enable_json:
             payload["response_format"] = "json_object"
 
-        response = await self._async_client.post(self._BASE_URL, json=payload)
+        reader = ChatCompletionStream()
+        async for delta in reader.astream(
+            self._async_client, self._BASE_URL, json=payload
+        ):
+            yield delta
 
-        response.raise_for_status()
-        message_content = ""
-        async for line in response.aiter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -383,21 +366,19 @@ class GroqVisionModel(LLMBase):
         Returns:
             List[Conversation]: List of updated conversations with model responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv: Conversation) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    top_p=top_p,
-                    enable_json=enable_json,
-                    stop=stop,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict(
+                conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                enable_json=enable_json,
+                stop=stop,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -4,7 +4,6 @@ import os
 import warnings
 from typing import Dict, List, Literal, Optional
 
-import httpx
 from pydantic import Field, PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
 from swarmauri_base.llms.LLMBase import LLMBase
@@ -93,7 +92,7 @@ class HyperbolicAudioTTS(LLMBase):
         """
         payload = self._prepare_payload(text)
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(self._BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
 
@@ -111,7 +110,7 @@ class HyperbolicAudioTTS(LLMBase):
         """
         payload = self._prepare_payload(text)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 self._BASE_URL, headers=self._headers, json=payload
             )
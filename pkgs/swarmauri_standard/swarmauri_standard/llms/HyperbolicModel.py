@@ -1,8 +1,5 @@
-import asyncio
-import json
 from typing import Any, AsyncGenerator, Dict, Generator, List, Literal, Optional, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
 from swarmauri_base.llms.LLMBase import LLMBase
@@ -11,7 +8,10 @@ from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.duration_manager import DurationManager
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(LLMBase, "HyperbolicModel")
@@ -56,7 +56,7 @@ class HyperbolicModel(LLMBase):
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=self._headers,
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -153,6 +153,7 @@ class HyperbolicModel(LLMBase):
         ]
         return chat_models
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -179,7 +180,7 @@ class HyperbolicModel(LLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -209,6 +210,8 @@ class HyperbolicModel(LLMBase):
             conversation.add_message(AgentMessage(content=message_content))
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -225,7 +228,7 @@ class HyperbolicModel(LLMBase):
 
         Args are same as predict method.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -241,7 +244,7 @@ class HyperbolicModel(LLMBase):
             payload["stop"] = stop
 
         with DurationManager() as promt_timer:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._async_http_client(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self._BASE_URL}chat/completions",
                     headers=self._headers,
@@ -260,6 +263,7 @@ class HyperbolicModel(LLMBase):
             conversation.add_message(AgentMessage(content=message_content))
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self,
@@ -279,7 +283,7 @@ class HyperbolicModel(LLMBase):
         Yields:
             str: Partial response content from the model.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -294,34 +298,19 @@ class HyperbolicModel(LLMBase):
         if stop is not None:
             payload["stop"] = stop
 
-        with DurationManager() as promt_timer:
-            response = self._client.post("chat/completions", json=payload)
-            response.raise_for_status()
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, "chat/completions", json=payload)
 
-        message_content = ""
-        usage_data = {}
-        with DurationManager() as completion_timer:
-            for line in response.iter_lines():
-                json_str = line.replace("data: ", "")
-                try:
-                    if json_str:
-                        chunk = json.loads(json_str)
-                        if chunk["choices"] and chunk["choices"][0]["delta"]:
-                            delta = chunk["choices"][0]["delta"]["content"]
-                            message_content += delta
-                            yield delta
-                        if "usage" in chunk and chunk["usage"] is not None:
-                            usage_data = chunk["usage"]
-                except json.JSONDecodeError:
-                    pass
+        usage_data = reader.usage_data()
         if self.include_usage and usage_data:
             usage = self._prepare_usage_data(
-                usage_data, promt_timer.duration, completion_timer.duration
+                usage_data, reader.time_to_first_token, reader.completion_time
             )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
+            conversation.add_message(AgentMessage(content=reader.content, usage=usage))
         else:
-            conversation.add_message(AgentMessage(content=message_content))
+            conversation.add_message(AgentMessage(content=reader.content))
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self,
@@ -341,7 +330,7 @@ class HyperbolicModel(LLMBase):
         Yields:
             str: Partial response content from the model.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -356,39 +345,24 @@ class HyperbolicModel(LLMBase):
         if stop is not None:
             payload["stop"] = stop
 
-        with DurationManager() as promt_timer:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self._BASE_URL}chat/completions",
-                    headers=self._headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-
-        message_content = ""
-        usage_data = {}
-        with DurationManager() as completion_timer:
-            async for line in response.aiter_lines():
-                json_str = line.replace("data: ", "")
-                try:
-                    if json_str:
-                        chunk = json.loads(json_str)
-                        if chunk["choices"] and chunk["choices"][0]["delta"]:
-                            delta = chunk["choices"][0]["delta"]["content"]
-                            message_content += delta
-                            yield delta
-                        if "usage" in chunk and chunk["usage"] is not None:
-                            usage_data = chunk["usage"]
-                except json.JSONDecodeError:
-                    pass
-
+        reader = ChatCompletionStream()
+        async with self._async_http_client(timeout=self.timeout) as client:
+            async for delta in reader.astream(
+                client,
+                f"{self._BASE_URL}chat/completions",
+                headers=self._headers,
+                json=payload,
+            ):
+                yield delta
+
+        usage_data = reader.usage_data()
         if self.include_usage and usage_data:
             usage = self._prepare_usage_data(
-                usage_data, promt_timer.duration, completion_timer.duration
+                usage_data, reader.time_to_first_token, reader.completion_time
             )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
+            conversation.add_message(AgentMessage(content=reader.content, usage=usage))
         else:
-            conversation.add_message(AgentMessage(content=message_content))
+            conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -436,19 +410,17 @@ class HyperbolicModel(LLMBase):
         Args are same as predict method, with additional arg:
             max_concurrent (int): Maximum number of concurrent requests.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv: Conversation) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    top_p=top_p,
-                    top_k=top_k,
-                    enable_json=enable_json,
-                    stop=stop,
-                )
+            return await self.apredict(
+                conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                top_k=top_k,
+                enable_json=enable_json,
+                stop=stop,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
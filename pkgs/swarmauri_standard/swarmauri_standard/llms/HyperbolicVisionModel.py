@@ -1,19 +1,20 @@
-import asyncio
-import json
 import logging
 import warnings
 from typing import Any, AsyncGenerator, Dict, Generator, List, Literal, Optional, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.file_path_to_base64 import file_path_to_base64
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 warnings.warn(
     "Importing HyperbolicVisionModel from swarmauri.llms is deprecated and will be "
@@ -50,7 +51,7 @@ class HyperbolicVisionModel(LLMBase):
     type: Literal["HyperbolicVisionModel"] = "HyperbolicVisionModel"
     timeout: float = 600.0
     _headers: Dict[str, str] = PrivateAttr(default=None)
-    _client: httpx.Client = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
     _BASE_URL: str = PrivateAttr(default="https://api.hyperbolic.xyz/v1/")
 
     def __init__(self, **data):
@@ -65,7 +66,7 @@ class HyperbolicVisionModel(LLMBase):
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key.get_secret_value()}",
         }
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=self._headers,
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -143,6 +144,7 @@ class HyperbolicVisionModel(LLMBase):
         logging.info(f"Allowed models: {chat_models}")
         return chat_models
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -165,7 +167,7 @@ class HyperbolicVisionModel(LLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -187,6 +189,8 @@ class HyperbolicVisionModel(LLMBase):
         conversation.add_message(AgentMessage(content=message_content, usage=usage))
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -209,7 +213,7 @@ class HyperbolicVisionModel(LLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -219,7 +223,7 @@ class HyperbolicVisionModel(LLMBase):
             "stop": stop or [],
         }
 
-        async with httpx.AsyncClient() as async_client:
+        async with self._async_http_client() as async_client:
             response = await async_client.post(
                 f"{self._BASE_URL}chat/completions", json=payload, headers=self._headers
             )
@@ -234,6 +238,7 @@ class HyperbolicVisionModel(LLMBase):
         conversation.add_message(AgentMessage(content=message_content, usage=usage))
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self,
@@ -256,7 +261,7 @@ class HyperbolicVisionModel(LLMBase):
         Yields:
             str: Partial response content from the model.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -267,24 +272,12 @@ class HyperbolicVisionModel(LLMBase):
             "stop": stop or [],
         }
 
-        response = self._client.post(self._BASE_URL, json=payload)
-        response.raise_for_status()
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, self._BASE_URL, json=payload)
 
-        message_content = ""
-        for line in response.iter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self,
@@ -307,7 +300,7 @@ class HyperbolicVisionModel(LLMBase):
         Yields:
             str: Partial response content from the model.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -318,26 +311,17 @@ class HyperbolicVisionModel(LLMBase):
             "stop": stop or [],
         }
 
-        async with httpx.AsyncClient as async_client:
-            response = await async_client.post(
-                f"{self._BASE_URL}chat/completions", json=payload, headers=self._headers
-            )
-            response.raise_for_status()
+        reader = ChatCompletionStream()
+        async with self._async_http_client(timeout=self.timeout) as async_client:
+            async for delta in reader.astream(
+                async_client,
+                f"{self._BASE_URL}chat/completions",
+                json=payload,
+                headers=self._headers,
+            ):
+                yield delta
 
-        message_content = ""
-        async for line in response.aiter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -395,17 +379,15 @@ class HyperbolicVisionModel(LLMBase):
         Returns:
             List[Conversation]: List of updated conversations with model responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv: Conversation) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    top_p=top_p,
-                    stop=stop,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict(
+                conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                stop=stop,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
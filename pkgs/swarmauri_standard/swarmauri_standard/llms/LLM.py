@@ -1,8 +1,5 @@
-import asyncio
-import json
 from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Type
 
-import httpx
 from swarmauri_base.ComponentBase import ComponentBase
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
@@ -10,7 +7,10 @@ from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.duration_manager import DurationManager
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type()
@@ -109,10 +109,12 @@ class LLM(LLMBase):
             prompt_time=prompt_time,
             completion_time=completion_time,
             total_time=total_time,
+            time_to_first_token=usage_data.get("time_to_first_token"),
         )
 
         return usage
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=3)
     def predict(
         self,
@@ -137,7 +139,7 @@ class LLM(LLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         # Prepare the payload
         payload = {
@@ -155,7 +157,7 @@ class LLM(LLMBase):
 
         # Make the API request and measure time
         with DurationManager() as prompt_timer:
-            with httpx.Client(timeout=self.timeout) as client:
+            with self._http_client(timeout=self.timeout) as client:
                 response = client.post(
                     self.BASE_URL, headers=self._headers, json=payload
                 )
@@ -174,6 +176,8 @@ class LLM(LLMBase):
             conversation.add_message(AgentMessage(content=message_content))
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=3)
     async def apredict(
         self,
@@ -198,7 +202,7 @@ class LLM(LLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         # Prepare the payload
         payload = {
@@ -216,7 +220,7 @@ class LLM(LLMBase):
 
         # Make the async API request and measure time
         with DurationManager() as prompt_timer:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._async_http_client(timeout=self.timeout) as client:
                 response = await client.post(
                     self.BASE_URL, headers=self._headers, json=payload
                 )
@@ -236,6 +240,7 @@ class LLM(LLMBase):
 
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=3)
     def stream(
         self,
@@ -260,7 +265,7 @@ class LLM(LLMBase):
         Yields:
             str: Partial response content from the model.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         # Prepare the payload with stream flag
         payload = {
@@ -279,60 +284,22 @@ class LLM(LLMBase):
         if self.include_usage:
             payload["stream_options"] = {"include_usage": True}
 
-        # Start timing for prompt processing
-        with DurationManager() as prompt_timer:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    self.BASE_URL, headers=self._headers, json=payload
-                )
-                response.raise_for_status()
-
-        # Process the streaming response
-        message_content = ""
-        usage_data = {}
-
-        with DurationManager() as completion_timer:
-            for line in response.iter_lines():
-                if line.startswith("data: "):
-                    json_str = line.replace("data: ", "")  # Remove 'data: ' prefix
-
-                    if json_str.strip() == "[DONE]":
-                        break
-
-                    try:
-                        if json_str:
-                            chunk = json.loads(json_str)
-                            if (
-                                "choices" in chunk
-                                and chunk["choices"]
-                                and "delta" in chunk["choices"][0]
-                            ):
-                                delta = chunk["choices"][0]["delta"]
-                                if "content" in delta:
-                                    content = delta["content"]
-                                    message_content += content
-                                    yield content
-
-                            # Collect usage data if available
-                            if (
-                                self.include_usage
-                                and "usage" in chunk
-                                and chunk["usage"] is not None
-                            ):
-                                usage_data = chunk["usage"]
-
-                    except json.JSONDecodeError:
-                        pass
+        reader = ChatCompletionStream()
+        with self._http_client(timeout=self.timeout) as client:
+            yield from reader.stream(
+                client, self.BASE_URL, headers=self._headers, json=payload
+            )
 
         # Add the complete message to the conversation
         if self.include_usage:
             usage = self._prepare_usage_data(
-                usage_data, prompt_timer.duration, completion_timer.duration
+                reader.usage_data(), reader.time_to_first_token, reader.completion_time
             )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
+            conversation.add_message(AgentMessage(content=reader.content, usage=usage))
         else:
-            conversation.add_message(AgentMessage(content=message_content))
+            conversation.add_message(AgentMessage(content=reader.content))
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=3)
     async def astream(
         self,
@@ -357,7 +324,7 @@ class LLM(LLMBase):
         Yields:
             str: Partial response content from the model.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         # Prepare the payload with stream flag
         payload = {
@@ -376,59 +343,21 @@ class LLM(LLMBase):
         if self.include_usage:
             payload["stream_options"] = {"include_usage": True}
 
-        # Start timing for prompt processing
-        with DurationManager() as prompt_timer:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.BASE_URL, headers=self._headers, json=payload
-                )
-                response.raise_for_status()
-
-        # Process the streaming response asynchronously
-        message_content = ""
-        usage_data = {}
-
-        with DurationManager() as completion_timer:
-            async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    json_str = line[6:]  # Remove 'data: ' prefix
-
-                    if json_str.strip() == "[DONE]":
-                        break
-
-                    try:
-                        if json_str:
-                            chunk = json.loads(json_str)
-                            if (
-                                "choices" in chunk
-                                and chunk["choices"]
-                                and "delta" in chunk["choices"][0]
-                            ):
-                                delta = chunk["choices"][0]["delta"]
-                                if "content" in delta:
-                                    content = delta["content"]
-                                    message_content += content
-                                    yield content
-
-                            # Collect usage data if available
-                            if (
-                                self.include_usage
-                                and "usage" in chunk
-                                and chunk["usage"] is not None
-                            ):
-                                usage_data = chunk["usage"]
-
-                    except json.JSONDecodeError:
-                        pass
+        reader = ChatCompletionStream()
+        async with self._async_http_client(timeout=self.timeout) as client:
+            async for delta in reader.astream(
+                client, self.BASE_URL, headers=self._headers, json=payload
+            ):
+                yield delta
 
         # Add the complete message to the conversation
         if self.include_usage:
             usage = self._prepare_usage_data(
-                usage_data, prompt_timer.duration, completion_timer.duration
+                reader.usage_data(), reader.time_to_first_token, reader.completion_time
             )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
+            conversation.add_message(AgentMessage(content=reader.content, usage=usage))
         else:
-            conversation.add_message(AgentMessage(content=message_content))
+            conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -491,21 +420,19 @@ class LLM(LLMBase):
         Returns:
             List[Conversation]: List of updated conversations with model responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv: Conversation) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    top_p=top_p,
-                    enable_json=enable_json,
-                    stop=stop,
-                )
+            return await self.apredict(
+                conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                enable_json=enable_json,
+                stop=stop,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -1,15 +1,16 @@
-import asyncio
-import json
 from typing import AsyncIterator, Dict, Iterator, List
 
-import httpx
 from pydantic import PrivateAttr
 from swarmauri_base.ComponentBase import ComponentBase, SubclassUnion
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
 from swarmauri_standard.messages.AgentMessage import AgentMessage
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(LLMBase, "LlamaCppModel")
@@ -37,8 +38,8 @@ class LlamaCppModel(LLMBase):
     """
 
     _BASE_URL: str = PrivateAttr("http://localhost:8080/v1")
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
 
     def __init__(self, **data):
         """
@@ -56,10 +57,10 @@ class LlamaCppModel(LLMBase):
             }
         else:
             headers = {"Content-Type": "application/json"}
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=headers, base_url=self._BASE_URL, timeout=self.timeout
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers=headers, base_url=self._BASE_URL, timeout=self.timeout
         )
 
@@ -126,6 +127,7 @@ class LlamaCppModel(LLMBase):
 
         return payload
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -148,7 +150,7 @@ class LlamaCppModel(LLMBase):
         Returns:
             Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = self._create_request_payload(
             formatted_messages, temperature, max_tokens, enable_json, stop
         )
@@ -162,6 +164,8 @@ class LlamaCppModel(LLMBase):
 
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -184,7 +188,7 @@ class LlamaCppModel(LLMBase):
         Returns:
             Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = self._create_request_payload(
             formatted_messages, temperature, max_tokens, enable_json, stop
         )
@@ -198,6 +202,7 @@ class LlamaCppModel(LLMBase):
 
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self,
@@ -218,32 +223,17 @@ class LlamaCppModel(LLMBase):
         Yields:
             str: Chunks of content from the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = self._create_request_payload(
             formatted_messages, temperature, max_tokens, False, stop, stream=True
         )
 
-        with self._client.stream("POST", "/chat/completions", json=payload) as response:
-            response.raise_for_status()
-            collected_content = []
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, "/chat/completions", json=payload)
 
-            for line in response.iter_lines():
-                # Convert bytes to string if necessary
-                if isinstance(line, bytes):
-                    line = line.decode("utf-8")
-
-                if line.startswith("data: "):
-                    line = line[6:]  # Remove 'data: ' prefix
-                    if line != "[DONE]":
-                        chunk = json.loads(line)
-                        if chunk["choices"][0]["delta"].get("content"):
-                            content = chunk["choices"][0]["delta"]["content"]
-                            collected_content.append(content)
-                            yield content
-
-        full_content = "".join(collected_content)
-        conversation.add_message(AgentMessage(content=full_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self,
@@ -264,29 +254,18 @@ class LlamaCppModel(LLMBase):
         Yields:
             str: Chunks of content from the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = self._create_request_payload(
             formatted_messages, temperature, max_tokens, False, stop, stream=True
         )
 
-        async with self._async_client.stream(
-            "POST", "/chat/completions", json=payload
-        ) as response:
-            response.raise_for_status()
-            collected_content = []
-
-            async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    line = line[6:]  # Remove 'data: ' prefix
-                    if line != "[DONE]":
-                        chunk = json.loads(line)
-                        if chunk["choices"][0]["delta"].get("content"):
-                            content = chunk["choices"][0]["delta"]["content"]
-                            collected_content.append(content)
-                            yield content
-
-        full_content = "".join(collected_content)
-        conversation.add_message(AgentMessage(content=full_content))
+        reader = ChatCompletionStream()
+        async for delta in reader.astream(
+            self._async_client, "/chat/completions", json=payload
+        ):
+            yield delta
+
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -343,20 +322,18 @@ class LlamaCppModel(LLMBase):
         Returns:
             List: List of updated conversations with model responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    enable_json=enable_json,
-                    stop=stop,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict(
+                conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                enable_json=enable_json,
+                stop=stop,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -1,17 +1,18 @@
-import asyncio
-import json
 from typing import AsyncIterator, Dict, Iterator, List, Type
 
-import httpx
 from pydantic import PrivateAttr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.duration_manager import DurationManager
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(LLMBase, "MistralModel")
@@ -31,8 +32,8 @@ class MistralModel(LLMBase):
     Provider resources: https://docs.mistral.ai/getting-started/models/
     """
 
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     _BASE_URL: str = PrivateAttr(default="https://api.mistral.ai/v1/")
 
     def __init__(self, **data):
@@ -43,12 +44,12 @@ class MistralModel(LLMBase):
             **data: Arbitrary keyword arguments containing initialization data.
         """
         super().__init__(**data)
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -100,6 +101,7 @@ class MistralModel(LLMBase):
             prompt_time=prompt_time,
             completion_time=completion_time,
             total_time=total_time,
+            time_to_first_token=usage_data.get("time_to_first_token"),
         )
         return usage
 
@@ -123,6 +125,7 @@ class MistralModel(LLMBase):
 
         return chat_models
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -147,7 +150,7 @@ class MistralModel(LLMBase):
         Returns:
             Conversation: Updated conversation with the model response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -179,6 +182,8 @@ class MistralModel(LLMBase):
 
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -203,7 +208,7 @@ class MistralModel(LLMBase):
         Returns:
             Conversation: Updated conversation with the model response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -235,6 +240,7 @@ class MistralModel(LLMBase):
 
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self,
@@ -257,7 +263,7 @@ class MistralModel(LLMBase):
         Yields:
             str: Chunks of response content.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -269,39 +275,19 @@ class MistralModel(LLMBase):
             "stream": True,
         }
 
-        with DurationManager() as prompt_timer:
-            response = self._client.post("chat/completions", json=payload)
-            response.raise_for_status()
-
-        usage_data = {}
-        message_content = ""
-
-        with DurationManager() as completion_timer:
-            for line in response.iter_lines():
-                json_str = line.replace("data: ", "")
-                try:
-                    if json_str:
-                        chunk = json.loads(json_str)
-                        if (
-                            chunk["choices"][0]["delta"]
-                            and "content" in chunk["choices"][0]["delta"]
-                        ):
-                            delta = chunk["choices"][0]["delta"]["content"]
-                            message_content += delta
-                            yield delta
-                        if "usage" in chunk:
-                            usage_data = chunk.get("usage", {})
-                except json.JSONDecodeError:
-                    pass
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, "chat/completions", json=payload)
 
+        usage_data = reader.usage_data()
         if self.include_usage and usage_data:
             usage = self._prepare_usage_data(
-                usage_data, prompt_timer.duration, completion_timer.duration
+                usage_data, reader.time_to_first_token, reader.completion_time
             )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
+            conversation.add_message(AgentMessage(content=reader.content, usage=usage))
         else:
-            conversation.add_message(AgentMessage(content=message_content))
+            conversation.add_message(AgentMessage(content=reader.content))
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self,
@@ -324,7 +310,7 @@ class MistralModel(LLMBase):
         Yields:
             str: Chunks of response content.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -336,38 +322,20 @@ class MistralModel(LLMBase):
             "stream": True,
         }
 
-        with DurationManager() as prompt_timer:
-            response = await self._async_client.post("chat/completions", json=payload)
-            response.raise_for_status()
-
-        usage_data = {}
-        message_content = ""
-
-        with DurationManager() as completion_timer:
-            async for line in response.aiter_lines():
-                json_str = line.replace("data: ", "")
-                try:
-                    if json_str:
-                        chunk = json.loads(json_str)
-                        if (
-                            chunk["choices"][0]["delta"]
-                            and "content" in chunk["choices"][0]["delta"]
-                        ):
-                            delta = chunk["choices"][0]["delta"]["content"]
-                            message_content += delta
-                            yield delta
-                        if "usage" in chunk:
-                            usage_data = chunk.get("usage", {})
-                except json.JSONDecodeError:
-                    pass
+        reader = ChatCompletionStream()
+        async for delta in reader.astream(
+            self._async_client, "chat/completions", json=payload
+        ):
+            yield delta
 
+        usage_data = reader.usage_data()
         if self.include_usage and usage_data:
             usage = self._prepare_usage_data(
-                usage_data, prompt_timer.duration, completion_timer.duration
+                usage_data, reader.time_to_first_token, reader.completion_time
             )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
+            conversation.add_message(AgentMessage(content=reader.content, usage=usage))
         else:
-            conversation.add_message(AgentMessage(content=message_content))
+            conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -429,18 +397,16 @@ class MistralModel(LLMBase):
         Returns:
             List[Conversation]: List of updated conversations with generated responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    top_p=top_p,
-                    enable_json=enable_json,
-                    safe_prompt=safe_prompt,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict(
+                conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                enable_json=enable_json,
+                safe_prompt=safe_prompt,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
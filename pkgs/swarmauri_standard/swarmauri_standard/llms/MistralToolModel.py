@@ -1,11 +1,10 @@
-import asyncio
 import json
 import logging
 import warnings
 from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_base.ComponentBase import ComponentBase
@@ -16,6 +15,7 @@ from swarmauri_standard.schema_converters.MistralSchemaConverter import (
     MistralSchemaConverter,
 )
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 warnings.warn(
     "Importing MistralToolModel from swarmauri.llms is deprecated and will be "
@@ -48,8 +48,8 @@ class MistralToolModel(LLMBase):
     name: str = ""
     type: Literal["MistralToolModel"] = "MistralToolModel"
     timeout: float = 600.0
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     _BASE_URL: str = PrivateAttr(default="https://api.mistral.ai/v1/")
 
     def __init__(self, **data) -> None:
@@ -60,12 +60,12 @@ class MistralToolModel(LLMBase):
             **data: Arbitrary keyword arguments for initialization.
         """
         super().__init__(**data)
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -148,7 +148,7 @@ class MistralToolModel(LLMBase):
         Returns:
             Conversation: The updated conversation object.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         if toolkit and not tool_choice:
             tool_choice = "auto"
@@ -225,7 +225,7 @@ class MistralToolModel(LLMBase):
         Returns:
             Conversation: The updated conversation object.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         if toolkit and not tool_choice:
             tool_choice = "auto"
 
@@ -306,7 +306,7 @@ class MistralToolModel(LLMBase):
             for response_text in model.stream(conversation):
                 print(response_text)
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         if toolkit and not tool_choice:
             tool_choice = "auto"
@@ -352,24 +352,10 @@ class MistralToolModel(LLMBase):
 
         logging.info(f"messages: {messages}")
 
-        response = self._client.post(self._BASE_URL, json=payload)
-        response.raise_for_status()
-
-        message_content = ""
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, self._BASE_URL, json=payload)
 
-        for line in response.iter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
@@ -402,7 +388,7 @@ class MistralToolModel(LLMBase):
             async for response_text in model.astream(conversation):
                 print(response_text)
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         if toolkit and not tool_choice:
             tool_choice = "auto"
@@ -448,24 +434,13 @@ class MistralToolModel(LLMBase):
 
         logging.info(f"messages: {messages}")
 
-        response = await self._async_client.post(self._BASE_URL, json=payload)
-        response.raise_for_status()
-
-        message_content = ""
+        reader = ChatCompletionStream()
+        async for delta in reader.astream(
+            self._async_client, self._BASE_URL, json=payload
+        ):
+            yield delta
 
-        async for line in response.aiter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -527,18 +502,16 @@ class MistralToolModel(LLMBase):
         Returns:
             List[Conversation]: List of updated conversations with generated responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    tool_choice=tool_choice,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    safe_prompt=safe_prompt,
-                )
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                tool_choice=tool_choice,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                safe_prompt=safe_prompt,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
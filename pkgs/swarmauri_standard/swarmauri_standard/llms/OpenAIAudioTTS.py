@@ -98,7 +98,7 @@ class OpenAIAudioTTS(LLMBase):
         """
         payload = {"model": self.name, "voice": self.voice, "input": text}
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(self._BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
 
@@ -118,7 +118,7 @@ class OpenAIAudioTTS(LLMBase):
         """
         payload = {"model": self.name, "voice": self.voice, "input": text}
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 self._BASE_URL, headers=self._headers, json=payload
             )
@@ -146,7 +146,7 @@ class OpenAIAudioTTS(LLMBase):
         }
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
+            with self._http_client(timeout=self.timeout) as client:
                 response = client.post(
                     self._BASE_URL, headers=self._headers, json=payload
                 )
@@ -178,7 +178,7 @@ class OpenAIAudioTTS(LLMBase):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._async_http_client(timeout=self.timeout) as client:
                 response = await client.post(
                     self._BASE_URL, headers=self._headers, json=payload
                 )
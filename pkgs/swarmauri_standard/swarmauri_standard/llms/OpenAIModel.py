@@ -1,8 +1,5 @@
-import asyncio
-import json
 from typing import Any, AsyncGenerator, Dict, Generator, List, Literal, Optional, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
 from swarmauri_base.llms.LLMBase import LLMBase
@@ -11,7 +8,10 @@ from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.duration_manager import DurationManager
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(LLMBase, "OpenAIModel")
@@ -145,6 +145,24 @@ class OpenAIModel(LLMBase):
 
         return usage
 
+    def _add_streamed_message(
+        self, conversation: Conversation, reader: ChatCompletionStream
+    ) -> None:
+        """
+        Adds the message read by ``reader`` to the conversation, with usage
+        data timed from the stream: the prompt time is the time to the first
+        token.
+        """
+        usage_data = reader.usage_data()
+        if self.include_usage and usage_data:
+            usage = self._prepare_usage_data(
+                usage_data, reader.time_to_first_token, reader.completion_time
+            )
+            conversation.add_message(AgentMessage(content=reader.content, usage=usage))
+        else:
+            conversation.add_message(AgentMessage(content=reader.content))
+
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -169,7 +187,7 @@ class OpenAIModel(LLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -182,7 +200,7 @@ class OpenAIModel(LLMBase):
             payload["response_format"] = "json_object"
 
         with DurationManager() as promt_timer:
-            with httpx.Client(timeout=self.timeout) as client:
+            with self._http_client(timeout=self.timeout) as client:
                 response = client.post(
                     self._BASE_URL, headers=self._headers, json=payload
                 )
@@ -201,6 +219,8 @@ class OpenAIModel(LLMBase):
 
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -225,7 +245,7 @@ class OpenAIModel(LLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -238,7 +258,7 @@ class OpenAIModel(LLMBase):
             payload["response_format"] = "json_object"
 
         with DurationManager() as promt_timer:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._async_http_client(timeout=self.timeout) as client:
                 response = await client.post(
                     self._BASE_URL, headers=self._headers, json=payload
                 )
@@ -257,6 +277,7 @@ class OpenAIModel(LLMBase):
 
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self,
@@ -282,7 +303,7 @@ class OpenAIModel(LLMBase):
             str: Partial response content from the model.
         """
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -296,39 +317,15 @@ class OpenAIModel(LLMBase):
         if enable_json:
             payload["response_format"] = "json_object"
 
-        with DurationManager() as prompt_timer:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    self._BASE_URL, headers=self._headers, json=payload
-                )
-                response.raise_for_status()
-
-        message_content = ""
-        usage_data = {}
-        with DurationManager() as completion_timer:
-            for line in response.iter_lines():
-                json_str = line.replace("data: ", "")
-                try:
-                    if json_str:
-                        chunk = json.loads(json_str)
-                        if chunk["choices"] and chunk["choices"][0]["delta"]:
-                            delta = chunk["choices"][0]["delta"]["content"]
-                            message_content += delta
-                            yield delta
-                        if "usage" in chunk and chunk["usage"] is not None:
-                            usage_data = chunk["usage"]
-
-                except json.JSONDecodeError:
-                    pass
-
-        if self.include_usage and usage_data:
-            usage = self._prepare_usage_data(
-                usage_data, prompt_timer.duration, completion_timer.duration
+        reader = ChatCompletionStream()
+        with self._http_client(timeout=self.timeout) as client:
+            yield from reader.stream(
+                client, self._BASE_URL, headers=self._headers, json=payload
             )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
-        else:
-            conversation.add_message(AgentMessage(content=message_content))
 
+        self._add_streamed_message(conversation, reader)
+
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self,
@@ -354,7 +351,7 @@ class OpenAIModel(LLMBase):
             str: Partial response content from the model.
         """
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -368,37 +365,14 @@ class OpenAIModel(LLMBase):
         if enable_json:
             payload["response_format"] = "json_object"
 
-        with DurationManager() as prompt_timer:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self._BASE_URL, headers=self._headers, json=payload
-                )
-                response.raise_for_status()
+        reader = ChatCompletionStream()
+        async with self._async_http_client(timeout=self.timeout) as client:
+            async for delta in reader.astream(
+                client, self._BASE_URL, headers=self._headers, json=payload
+            ):
+                yield delta
 
-        message_content = ""
-        usage_data = {}
-        with DurationManager() as completion_timer:
-            async for line in response.aiter_lines():
-                json_str = line.replace("data: ", "")
-                try:
-                    if json_str:
-                        chunk = json.loads(json_str)
-                        if chunk["choices"] and chunk["choices"][0]["delta"]:
-                            delta = chunk["choices"][0]["delta"]["content"]
-                            message_content += delta
-                            yield delta
-                        if "usage" in chunk and chunk["usage"] is not None:
-                            usage_data = chunk["usage"]
-                except json.JSONDecodeError:
-                    pass
-
-        if self.include_usage and usage_data:
-            usage = self._prepare_usage_data(
-                usage_data, prompt_timer.duration, completion_timer.duration
-            )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
-        else:
-            conversation.add_message(AgentMessage(content=message_content))
+        self._add_streamed_message(conversation, reader)
 
     def batch(
         self,
@@ -461,21 +435,19 @@ class OpenAIModel(LLMBase):
         Returns:
             List[Conversation]: List of updated conversations with model responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv: Conversation) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    top_p=top_p,
-                    enable_json=enable_json,
-                    stop=stop,
-                )
+            return await self.apredict(
+                conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                enable_json=enable_json,
+                stop=stop,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
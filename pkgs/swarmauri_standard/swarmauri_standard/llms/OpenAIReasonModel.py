@@ -1,7 +1,6 @@
 import logging
 from typing import Any, Dict, List, Optional, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
 from swarmauri_base.llms.LLMBase import LLMBase
@@ -11,6 +10,8 @@ from typing_extensions import Literal
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.duration_manager import DurationManager
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
 
 
@@ -137,6 +138,7 @@ class OpenAIReasonModel(LLMBase):
 
         return usage
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -157,7 +159,7 @@ class OpenAIReasonModel(LLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -168,7 +170,7 @@ class OpenAIReasonModel(LLMBase):
             payload["response_format"] = "json_object"
 
         with DurationManager() as promt_timer:
-            with httpx.Client(timeout=self.timeout) as client:
+            with self._http_client(timeout=self.timeout) as client:
                 logging.info(f"headers: {self._headers}")
                 response = client.post(
                     self._BASE_URL, headers=self._headers, json=payload
@@ -188,6 +190,8 @@ class OpenAIReasonModel(LLMBase):
 
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -210,7 +214,7 @@ class OpenAIReasonModel(LLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -221,7 +225,7 @@ class OpenAIReasonModel(LLMBase):
             payload["response_format"] = "json_object"
 
         with DurationManager() as prompt_timer:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._async_http_client(timeout=self.timeout) as client:
                 response = await client.post(
                     self._BASE_URL, headers=self._headers, json=payload
                 )
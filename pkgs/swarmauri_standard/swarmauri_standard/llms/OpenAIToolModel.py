@@ -1,9 +1,7 @@
-import asyncio
 import json
 import warnings
 from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
 from swarmauri_base.llms.LLMBase import LLMBase
@@ -15,6 +13,7 @@ from swarmauri_standard.schema_converters.OpenAISchemaConverter import (
     OpenAISchemaConverter,
 )
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 warnings.warn(
     "Importing OpenAIToolModel from swarmauri.llms is deprecated and will be "
@@ -145,7 +144,7 @@ class OpenAIToolModel(LLMBase):
         Returns:
             Conversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -155,7 +154,7 @@ class OpenAIToolModel(LLMBase):
             "tool_choice": tool_choice or "auto",
         }
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(self._BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
             tool_response = response.json()
@@ -169,7 +168,7 @@ class OpenAIToolModel(LLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(self._BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
 
@@ -203,7 +202,7 @@ class OpenAIToolModel(LLMBase):
         Returns:
             Conversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -213,7 +212,7 @@ class OpenAIToolModel(LLMBase):
             "tool_choice": tool_choice or "auto",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 self._BASE_URL, headers=self._headers, json=payload
             )
@@ -228,7 +227,7 @@ class OpenAIToolModel(LLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 self._BASE_URL, headers=self._headers, json=payload
             )
@@ -265,7 +264,7 @@ class OpenAIToolModel(LLMBase):
             Iterator[str]: Streamed response content.
         """
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -276,7 +275,7 @@ class OpenAIToolModel(LLMBase):
             "tool_choice": tool_choice or "auto",
         }
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(self._BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
 
@@ -292,25 +291,14 @@ class OpenAIToolModel(LLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(self._BASE_URL, headers=self._headers, json=payload)
-            response.raise_for_status()
-
-        message_content = ""
-
-        for line in response.iter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
+        reader = ChatCompletionStream()
+        with self._http_client(timeout=self.timeout) as client:
+            yield from reader.stream(
+                client, self._BASE_URL, headers=self._headers, json=payload
+            )
 
-        conversation.add_message(AgentMessage(content=message_content))
+        # Add the final agent message to the conversation
+        conversation.add_message(AgentMessage(content=reader.content))
 
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
@@ -334,7 +322,7 @@ class OpenAIToolModel(LLMBase):
         Yields:
             AsyncIterator[str]: Streamed response content.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -345,7 +333,7 @@ class OpenAIToolModel(LLMBase):
             "tool_choice": tool_choice or "auto",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 self._BASE_URL, headers=self._headers, json=payload
             )
@@ -363,25 +351,15 @@ class OpenAIToolModel(LLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            agent_response = await client.post(
-                self._BASE_URL, headers=self._headers, json=payload
-            )
-            agent_response.raise_for_status()
-
-        message_content = ""
-        async for line in agent_response.aiter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-        conversation.add_message(AgentMessage(content=message_content))
+        reader = ChatCompletionStream()
+        async with self._async_http_client(timeout=self.timeout) as client:
+            async for delta in reader.astream(
+                client, self._BASE_URL, headers=self._headers, json=payload
+            ):
+                yield delta
+
+        # Add the final agent message to the conversation
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -440,20 +418,18 @@ class OpenAIToolModel(LLMBase):
         Returns:
             List[Conversation]: List of updated conversations with model responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    tool_choice=tool_choice,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                tool_choice=tool_choice,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -1,17 +1,18 @@
-import asyncio
-import json
 from typing import AsyncIterator, Dict, Iterator, List, Literal, Optional, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.messages.MessageBase import MessageBase
 
 from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.duration_manager import DurationManager
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.single_flight import coalesce_predictions
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(LLMBase, "PerplexityModel")
@@ -42,8 +43,8 @@ class PerplexityModel(LLMBase):
     name: str = "sonar"
     type: Literal["PerplexityModel"] = "PerplexityModel"
     timeout: float = 600.0
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     _BASE_URL: str = PrivateAttr(default="https://api.perplexity.ai/chat/completions")
 
     def __init__(self, **data):
@@ -54,12 +55,12 @@ class PerplexityModel(LLMBase):
             **data: Arbitrary keyword arguments containing initialization data.
         """
         super().__init__(**data)
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -111,10 +112,12 @@ class PerplexityModel(LLMBase):
             prompt_time=prompt_time,
             completion_time=completion_time,
             total_time=total_time,
+            time_to_first_token=usage_data.get("time_to_first_token"),
         )
 
         return usage
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -147,7 +150,7 @@ class PerplexityModel(LLMBase):
         if top_p and top_k:
             raise ValueError("Do not set top_p and top_k")
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -183,6 +186,8 @@ class PerplexityModel(LLMBase):
 
         return conversation
 
+    @coalesce_predictions
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def apredict(
         self,
@@ -215,7 +220,7 @@ class PerplexityModel(LLMBase):
         if top_p and top_k:
             raise ValueError("Do not set top_p and top_k")
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -254,6 +259,7 @@ class PerplexityModel(LLMBase):
 
         return conversation
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     def stream(
         self,
@@ -285,7 +291,7 @@ class PerplexityModel(LLMBase):
         if top_p and top_k:
             raise ValueError("Do not set top_p and top_k")
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         url = "https://api.perplexity.ai/chat/completions"
 
@@ -307,35 +313,19 @@ class PerplexityModel(LLMBase):
             "authorization": f"Bearer {self.api_key.get_secret_value()}",
         }
 
-        with DurationManager() as prompt_timer:
-            response = self._client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-
-        message_content = ""
-
-        with DurationManager() as completion_timer:
-            for chunk in response.iter_lines():
-                json_string = chunk.replace("data: ", "", 1)
-                if json_string:
-                    chunk_data = json.loads(json_string)
-                    delta_content = (
-                        chunk_data.get("choices", [{}])[0]
-                        .get("delta", {})
-                        .get("content", "")
-                    )
-                    message_content += delta_content
-                    yield delta_content
-                    if chunk_data["usage"]:
-                        usage_data = chunk_data["usage"]
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, url, json=payload, headers=headers)
 
+        usage_data = reader.usage_data()
         if self.include_usage and usage_data:
             usage = self._prepare_usage_data(
-                usage_data, prompt_timer.duration, completion_timer.duration
+                usage_data, reader.time_to_first_token, reader.completion_time
             )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
+            conversation.add_message(AgentMessage(content=reader.content, usage=usage))
         else:
-            conversation.add_message(AgentMessage(content=message_content))
+            conversation.add_message(AgentMessage(content=reader.content))
 
+    @cache_response
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
         self,
@@ -367,7 +357,7 @@ class PerplexityModel(LLMBase):
         if top_p and top_k:
             raise ValueError("Do not set top_p and top_k")
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
@@ -382,34 +372,20 @@ class PerplexityModel(LLMBase):
             "stream": True,
         }
 
-        with DurationManager() as prompt_timer:
-            response = await self._async_client.post(self._BASE_URL, json=payload)
-            response.raise_for_status()
-
-        message_content = ""
-        usage_data = {}
-
-        with DurationManager() as completion_timer:
-            async for line in response.aiter_lines():
-                json_string = line.replace("data: ", "", 1)
-                if json_string:  # Ensure it's not empty
-                    chunk_data = json.loads(json_string)
-                    delta_content = (
-                        chunk_data.get("choices", [{}])[0]
-                        .get("delta", {})
-                        .get("content", "")
-                    )
-                    message_content += delta_content
-                    yield delta_content
-                    usage_data = chunk_data.get("usage", usage_data)
+        reader = ChatCompletionStream()
+        async for delta in reader.astream(
+            self._async_client, self._BASE_URL, json=payload
+        ):
+            yield delta
 
+        usage_data = reader.usage_data()
         if self.include_usage and usage_data:
             usage = self._prepare_usage_data(
-                usage_data, prompt_timer.duration, completion_timer.duration
+                usage_data, reader.time_to_first_token, reader.completion_time
             )
-            conversation.add_message(AgentMessage(content=message_content, usage=usage))
+            conversation.add_message(AgentMessage(content=reader.content, usage=usage))
         else:
-            conversation.add_message(AgentMessage(content=message_content))
+            conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -481,23 +457,21 @@ class PerplexityModel(LLMBase):
         Returns:
             List[Conversation]: List of updated conversation objects after processing asynchronously.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv) -> Conversation:
-            async with semaphore:
-                return await self.apredict(
-                    conversation=conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    top_p=top_p,
-                    top_k=top_k,
-                    return_citations=return_citations,
-                    presence_penalty=presence_penalty,
-                    frequency_penalty=frequency_penalty,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict(
+                conversation=conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                top_k=top_k,
+                return_citations=return_citations,
+                presence_penalty=presence_penalty,
+                frequency_penalty=frequency_penalty,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -104,7 +104,7 @@ class PlayHTModel(LLMBase):
 
         self._headers["accept"] = "application/json"
 
-        with httpx.Client(base_url=self._BASE_URL, timeout=self.timeout) as client:
+        with self._http_client(base_url=self._BASE_URL, timeout=self.timeout) as client:
             voice_response = client.get("/voices", headers=self._headers)
             voice_response.raise_for_status()
 
@@ -179,7 +179,7 @@ class PlayHTModel(LLMBase):
         }
 
         try:
-            with httpx.Client(
+            with self._http_client(
                 base_url=self._BASE_URL, timeout=self.timeout
             ) as self._client:
                 response = self._client.post(
@@ -214,7 +214,7 @@ class PlayHTModel(LLMBase):
         }
 
         try:
-            async with httpx.AsyncClient(
+            async with self._async_http_client(
                 base_url=self._BASE_URL, timeout=self.timeout
             ) as async_client:
                 response = await async_client.post(
@@ -281,7 +281,7 @@ class PlayHTModel(LLMBase):
         self._headers["accept"] = "application/json"
 
         try:
-            with httpx.Client(base_url=self._BASE_URL) as client:
+            with self._http_client(base_url=self._BASE_URL) as client:
                 response = client.post(
                     "/cloned-voices/instant",
                     data=payload,
@@ -316,7 +316,9 @@ class PlayHTModel(LLMBase):
         self._headers["accept"] = "application/json"
 
         try:
-            with httpx.Client(base_url=self._BASE_URL, timeout=self.timeout) as client:
+            with self._http_client(
+                base_url=self._BASE_URL, timeout=self.timeout
+            ) as client:
                 response = client.post(
                     "/cloned-voices/instant", data=payload, headers=self._headers
                 )
@@ -340,7 +342,9 @@ class PlayHTModel(LLMBase):
         self._headers["accept"] = "application/json"
 
         try:
-            with httpx.Client(base_url=self._BASE_URL, timeout=self.timeout) as client:
+            with self._http_client(
+                base_url=self._BASE_URL, timeout=self.timeout
+            ) as client:
                 response = client.delete(
                     "/cloned-voices", json=payload, headers=self._headers
                 )
@@ -361,7 +365,9 @@ class PlayHTModel(LLMBase):
         self._headers["accept"] = "application/json"
 
         try:
-            with httpx.Client(base_url=self._BASE_URL, timeout=self.timeout) as client:
+            with self._http_client(
+                base_url=self._BASE_URL, timeout=self.timeout
+            ) as client:
                 response = client.get("/cloned-voices", headers=self._headers)
                 response.raise_for_status()
 
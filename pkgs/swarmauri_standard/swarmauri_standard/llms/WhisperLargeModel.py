@@ -4,6 +4,7 @@ from typing import Dict, List, Literal
 
 import httpx
 from pydantic import PrivateAttr, SecretStr
+from swarmauri_base.HttpClientMixin import PooledClient
 from swarmauri_base.llms.LLMBase import LLMBase
 from swarmauri_base.ComponentBase import ComponentBase
 
@@ -49,7 +50,7 @@ class WhisperLargeModel(LLMBase):
     _BASE_URL: str = PrivateAttr(
         "https://api-inference.huggingface.co/models/openai/whisper-large-v3"
     )
-    _client: httpx.Client = PrivateAttr()
+    _client: PooledClient = PrivateAttr()
     _header: Dict[str, str] = PrivateAttr(default=None)
 
     def __init__(self, **data):
@@ -65,7 +66,7 @@ class WhisperLargeModel(LLMBase):
         """
         super().__init__(**data)
         self._header = {"Authorization": f"Bearer {self.api_key.get_secret_value()}"}
-        self._client = httpx.Client(headers=self._header, timeout=self.timeout)
+        self._client = self._http_client(headers=self._header, timeout=self.timeout)
 
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
@@ -151,7 +152,7 @@ class WhisperLargeModel(LLMBase):
         if task == "translation":
             params["language"] = "en"
 
-        async with httpx.AsyncClient(headers=self._header) as client:
+        async with self._async_http_client(headers=self._header) as client:
             response = await client.post(self._BASE_URL, data=data, params=params)
             response.raise_for_status()
             result = response.json()
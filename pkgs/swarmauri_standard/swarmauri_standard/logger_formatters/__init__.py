@@ -0,0 +1,17 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of logger formatters modules and the class each one exports
+logger_formatters_files = [
+    ("swarmauri_standard.logger_formatters.BorderFormatter", "BorderFormatter"),
+    ("swarmauri_standard.logger_formatters.ColorFormatter", "ColorFormatter"),
+    ("swarmauri_standard.logger_formatters.ContextualFormatter", "ContextualFormatter"),
+    ("swarmauri_standard.logger_formatters.HTMLFormatter", "HTMLFormatter"),
+    ("swarmauri_standard.logger_formatters.IndentedFormatter", "IndentedFormatter"),
+    ("swarmauri_standard.logger_formatters.JSONFormatter", "JSONFormatter"),
+    ("swarmauri_standard.logger_formatters.KeyValueFormatter", "KeyValueFormatter"),
+    ("swarmauri_standard.logger_formatters.LoggerFormatter", "LoggerFormatter"),
+    ("swarmauri_standard.logger_formatters.MultilineFormatter", "MultilineFormatter"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, logger_formatters_files)
@@ -0,0 +1,26 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of logger handlers modules and the class each one exports
+logger_handlers_files = [
+    ("swarmauri_standard.logger_handlers.EmailLoggingHandler", "EmailLoggingHandler"),
+    ("swarmauri_standard.logger_handlers.FileLoggingHandler", "FileLoggingHandler"),
+    ("swarmauri_standard.logger_handlers.HTTPLoggingHandler", "HTTPLoggingHandler"),
+    ("swarmauri_standard.logger_handlers.HTTPSLoggingHandler", "HTTPSLoggingHandler"),
+    ("swarmauri_standard.logger_handlers.MemoryLoggingHandler", "MemoryLoggingHandler"),
+    ("swarmauri_standard.logger_handlers.NullLoggingHandler", "NullLoggingHandler"),
+    ("swarmauri_standard.logger_handlers.QueueLoggingHandler", "QueueLoggingHandler"),
+    ("swarmauri_standard.logger_handlers.RichLoggingHandler", "RichLoggingHandler"),
+    (
+        "swarmauri_standard.logger_handlers.RotatingFileLoggingHandler",
+        "RotatingFileLoggingHandler",
+    ),
+    ("swarmauri_standard.logger_handlers.StreamLoggingHandler", "StreamLoggingHandler"),
+    ("swarmauri_standard.logger_handlers.SysLogLoggingHandler", "SysLogLoggingHandler"),
+    (
+        "swarmauri_standard.logger_handlers.TimedRotatingFileLoggingHandler",
+        "TimedRotatingFileLoggingHandler",
+    ),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, logger_handlers_files)
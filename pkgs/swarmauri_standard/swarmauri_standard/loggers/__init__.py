@@ -0,0 +1,9 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of loggers modules and the class each one exports
+loggers_files = [
+    ("swarmauri_standard.loggers.Logger", "Logger"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, loggers_files)
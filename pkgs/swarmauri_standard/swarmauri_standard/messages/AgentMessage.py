@@ -13,6 +13,8 @@ class UsageData(BaseModel):
     prompt_time: Optional[float] = None
     completion_time: Optional[float] = None
     total_time: Optional[float] = None
+    time_to_first_token: Optional[float] = None
+    cached: Optional[bool] = None
     model_config = ConfigDict(extra="allow")
 
 
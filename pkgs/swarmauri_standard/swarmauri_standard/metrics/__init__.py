@@ -0,0 +1,17 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of metrics modules and the class each one exports
+metrics_files = [
+    ("swarmauri_standard.metrics.AbsoluteValueMetric", "AbsoluteValueMetric"),
+    ("swarmauri_standard.metrics.DiscreteMetric", "DiscreteMetric"),
+    ("swarmauri_standard.metrics.EuclideanMetric", "EuclideanMetric"),
+    ("swarmauri_standard.metrics.FrobeniusMetric", "FrobeniusMetric"),
+    ("swarmauri_standard.metrics.HammingMetric", "HammingMetric"),
+    ("swarmauri_standard.metrics.LevenshteinMetric", "LevenshteinMetric"),
+    ("swarmauri_standard.metrics.LpMetric", "LpMetric"),
+    ("swarmauri_standard.metrics.SobolevMetric", "SobolevMetric"),
+    ("swarmauri_standard.metrics.SupremumMetric", "SupremumMetric"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, metrics_files)
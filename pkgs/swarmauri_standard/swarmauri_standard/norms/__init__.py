@@ -0,0 +1,14 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of norms modules and the class each one exports
+norms_files = [
+    ("swarmauri_standard.norms.GeneralLpNorm", "GeneralLpNorm"),
+    ("swarmauri_standard.norms.L1ManhattanNorm", "L1ManhattanNorm"),
+    ("swarmauri_standard.norms.L2EuclideanNorm", "L2EuclideanNorm"),
+    ("swarmauri_standard.norms.LInfNorm", "LInfNorm"),
+    ("swarmauri_standard.norms.SobolevNorm", "SobolevNorm"),
+    ("swarmauri_standard.norms.SupremumComplexNorm", "SupremumComplexNorm"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, norms_files)
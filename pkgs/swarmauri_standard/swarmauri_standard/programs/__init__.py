@@ -0,0 +1,9 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of programs modules and the class each one exports
+programs_files = [
+    ("swarmauri_standard.programs.Program", "Program"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, programs_files)
@@ -0,0 +1,9 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of prompt templates modules and the class each one exports
+prompt_templates_files = [
+    ("swarmauri_standard.prompt_templates.PromptTemplate", "PromptTemplate"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, prompt_templates_files)
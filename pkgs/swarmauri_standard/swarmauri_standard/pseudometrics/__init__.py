@@ -0,0 +1,22 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of pseudometrics modules and the class each one exports
+pseudometrics_files = [
+    (
+        "swarmauri_standard.pseudometrics.EquivalenceRelationPseudometric",
+        "EquivalenceRelationPseudometric",
+    ),
+    (
+        "swarmauri_standard.pseudometrics.FunctionDifferencePseudometric",
+        "FunctionDifferencePseudometric",
+    ),
+    ("swarmauri_standard.pseudometrics.LpPseudometric", "LpPseudometric"),
+    (
+        "swarmauri_standard.pseudometrics.ProjectionPseudometricR2",
+        "ProjectionPseudometricR2",
+    ),
+    ("swarmauri_standard.pseudometrics.ZeroPseudometric", "ZeroPseudometric"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, pseudometrics_files)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import time
+from typing import Literal, Optional, Tuple
+
+from pydantic import PrivateAttr
+from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.rate_limits.RateLimitBase import RateLimitBase
+
+
+@ComponentBase.register_type(RateLimitBase, "SharedTokenBucketRateLimit")
+class SharedTokenBucketRateLimit(RateLimitBase):
+    """
+    Token bucket shared by every process using the same SQLite file.
+
+    The bucket state lives in one row of a database in WAL mode and is
+    read, refilled and updated inside a single write transaction, so
+    concurrent workers draw from one quota instead of one each. Several
+    buckets can share a file under different ``bucket`` names.
+
+    Example:
+        >>> limit = SharedTokenBucketRateLimit(
+        ...     path="/tmp/openai.ratelimit", capacity=60, refill_rate=1.0
+        ... )
+        >>> limit.acquire()
+        True
+    """
+
+    type: Literal["SharedTokenBucketRateLimit"] = "SharedTokenBucketRateLimit"
+    path: str
+    bucket: str = "default"
+
+    _db: Optional[sqlite3.Connection] = PrivateAttr(default=None)
+    _pid: Optional[int] = PrivateAttr(default=None)
+    _granted_at: Optional[float] = PrivateAttr(default=None)
+
+    @property
+    def last_granted_at(self) -> Optional[float]:
+        """
+        Wall-clock time at which the tokens last granted to this instance
+        became available, as computed inside the bucket's transaction; None
+        before the first grant.
+        """
+        return self._granted_at
+
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections must not cross a fork.
+        if self._db is None or self._pid != os.getpid():
+            db = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            db.execute(
+                "INSERT OR IGNORE INTO buckets VALUES (?, ?, ?)",
+                (self.bucket, float(self.capacity), time.time()),
+            )
+            self._db, self._pid = db, os.getpid()
+        return self._db
+
+    def _update(
+        self, tokens: float, timeout: Optional[float]
+    ) -> Tuple[float, float, float]:
+        """
+        Refills the shared bucket and takes ``tokens`` from it when the debt
+        would be repaid within ``timeout``. Returns the tokens left before
+        taking, the seconds until ``tokens`` are covered and the time of the
+        transaction.
+        """
+        with self._lock:
+            db = self._connection()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                stored, updated = db.execute(
+                    "SELECT tokens, updated FROM buckets WHERE name = ?",
+                    (self.bucket,),
+                ).fetchone()
+                now = time.time()
+                elapsed = max(0.0, now - updated)
+                available = min(self.capacity, stored + elapsed * self.refill_rate)
+                wait = max(0.0, (tokens - available) / self.refill_rate)
+                if tokens and timeout is not None and wait > timeout:
+                    tokens = 0
+                db.execute(
+                    "UPDATE buckets SET tokens = ?, updated = ? WHERE name = ?",
+                    (available - tokens, now, self.bucket),
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            return available, wait, now
+
+    def refill(self) -> None:
+        """Refill the shared bucket according to elapsed time."""
+        self._tokens = self._update(0, None)[0]
+
+    def allow(self, tokens: int = 1) -> bool:
+        """Attempt to consume tokens from the shared bucket."""
+        available, wait, now = self._update(tokens, 0.0)
+        if wait:
+            self._tokens = available
+            return False
+        self._tokens = available - tokens
+        self._granted_at = now
+        return True
+
+    def available_tokens(self) -> int:
+        """Return the number of tokens currently available to all processes."""
+        self.refill()
+        return max(0, int(self._tokens))
+
+    def _reserve(self, tokens: int, timeout: Optional[float]) -> Optional[float]:
+        available, wait, now = self._update(tokens, timeout)
+        if timeout is not None and wait > timeout:
+            return None
+        self._tokens = available - tokens
+        self._granted_at = now + wait
+        return wait
+
+    async def _areserve(
+        self, tokens: int, timeout: Optional[float]
+    ) -> Optional[float]:
+        # The transaction waits up to 30 s for other processes holding the
+        # database lock; keep that wait off the event loop.
+        return await asyncio.to_thread(self._reserve, tokens, timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
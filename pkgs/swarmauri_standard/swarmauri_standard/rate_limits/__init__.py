@@ -0,0 +1,13 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of rate limits modules and the class each one exports
+rate_limits_files = [
+    ("swarmauri_standard.rate_limits.TokenBucketRateLimit", "TokenBucketRateLimit"),
+    (
+        "swarmauri_standard.rate_limits.SharedTokenBucketRateLimit",
+        "SharedTokenBucketRateLimit",
+    ),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, rate_limits_files)
@@ -0,0 +1,17 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of seminorms modules and the class each one exports
+seminorms_files = [
+    (
+        "swarmauri_standard.seminorms.CoordinateProjectionSeminorm",
+        "CoordinateProjectionSeminorm",
+    ),
+    ("swarmauri_standard.seminorms.LpSeminorm", "LpSeminorm"),
+    ("swarmauri_standard.seminorms.PartialSumSeminorm", "PartialSumSeminorm"),
+    ("swarmauri_standard.seminorms.PointEvaluationSeminorm", "PointEvaluationSeminorm"),
+    ("swarmauri_standard.seminorms.TraceSeminorm", "TraceSeminorm"),
+    ("swarmauri_standard.seminorms.ZeroSeminorm", "ZeroSeminorm"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, seminorms_files)
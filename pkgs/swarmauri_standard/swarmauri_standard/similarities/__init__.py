@@ -0,0 +1,33 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of similarities modules and the class each one exports
+similarities_files = [
+    (
+        "swarmauri_standard.similarities.BhattacharyyaCoefficientSimilarity",
+        "BhattacharyyaCoefficientSimilarity",
+    ),
+    ("swarmauri_standard.similarities.BrayCurtisSimilarity", "BrayCurtisSimilarity"),
+    ("swarmauri_standard.similarities.CosineSimilarity", "CosineSimilarity"),
+    ("swarmauri_standard.similarities.DiceSimilarity", "DiceSimilarity"),
+    ("swarmauri_standard.similarities.GaussianRBFSimilarity", "GaussianRBFSimilarity"),
+    (
+        "swarmauri_standard.similarities.HellingerAffinitySimilarity",
+        "HellingerAffinitySimilarity",
+    ),
+    (
+        "swarmauri_standard.similarities.JaccardIndexSimilarity",
+        "JaccardIndexSimilarity",
+    ),
+    (
+        "swarmauri_standard.similarities.OverlapCoefficientSimilarity",
+        "OverlapCoefficientSimilarity",
+    ),
+    ("swarmauri_standard.similarities.TanimotoSimilarity", "TanimotoSimilarity"),
+    (
+        "swarmauri_standard.similarities.TriangleCosineSimilarity",
+        "TriangleCosineSimilarity",
+    ),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, similarities_files)
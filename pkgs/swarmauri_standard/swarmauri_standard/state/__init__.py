@@ -1,13 +1,9 @@
-# from swarmauri_standard.utils._lazy_import import _lazy_import
+from swarmauri_standard.utils._lazy_import import _lazy_package
 
-# # List of state names (file names without the ".py" extension) and corresponding class names
-# state_files = [
-#     ("swarmauri_standard.state.DictState", "DictState"),
-# ]
+# List of state modules and the class each one exports
+state_files = [
+    ("swarmauri_standard.state.DictState", "DictState"),
+]
 
-# # Lazy loading of state classes, storing them in variables
-# for module_name, class_name in state_files:
-#     globals()[class_name] = _lazy_import(module_name, class_name)
-
-# # Adding the lazy-loaded state classes to __all__
-# __all__ = [class_name for _, class_name in state_files]
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, state_files)
@@ -4,6 +4,7 @@ from typing import Dict, List, Literal
 import aiofiles
 import httpx
 from pydantic import PrivateAttr, SecretStr
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.stt.STTBase import STTBase
 from swarmauri_base.ComponentBase import ComponentBase
 
@@ -31,8 +32,8 @@ class OpenaiSTT(STTBase):
 
     name: str = "whisper-1"
     type: Literal["OpenaiSTT"] = "OpenaiSTT"
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     _BASE_URL: str = PrivateAttr(default="https://api.openai.com/v1/audio/")
 
     def __init__(self, **data):
@@ -43,11 +44,11 @@ class OpenaiSTT(STTBase):
             **data: Arbitrary keyword arguments containing initialization data.
         """
         super().__init__(**data)
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers={"Authorization": f"Bearer {self.api_key.get_secret_value()}"},
             base_url=self._BASE_URL,
         )
@@ -3,6 +3,7 @@ from typing import Dict, List, Literal
 
 import httpx
 from pydantic import PrivateAttr, SecretStr
+from swarmauri_base.HttpClientMixin import PooledClient
 from swarmauri_base.stt.STTBase import STTBase
 from swarmauri_base.ComponentBase import ComponentBase
 
@@ -39,7 +40,7 @@ class WhisperLargeSTT(STTBase):
     _BASE_URL: str = PrivateAttr(
         "https://api-inference.huggingface.co/models/openai/whisper-large-v3"
     )
-    _client: httpx.Client = PrivateAttr()
+    _client: PooledClient = PrivateAttr()
     _header: Dict[str, str] = PrivateAttr(default=None)
 
     def __init__(self, **data):
@@ -55,7 +56,7 @@ class WhisperLargeSTT(STTBase):
         """
         super().__init__(**data)
         self._header = {"Authorization": f"Bearer {self.api_key.get_secret_value()}"}
-        self._client = httpx.Client(headers=self._header, timeout=30)
+        self._client = self._http_client(headers=self._header, timeout=30)
         self.allowed_models = self.allowed_models or self.get_allowed_models()
         self.name = self.allowed_models[0]
 
@@ -143,7 +144,7 @@ class WhisperLargeSTT(STTBase):
         if task == "translation":
             params["language"] = "en"
 
-        async with httpx.AsyncClient(headers=self._header) as client:
+        async with self._async_http_client(headers=self._header) as client:
             response = await client.post(self._BASE_URL, data=data, params=params)
             response.raise_for_status()
             result = response.json()
@@ -0,0 +1,11 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of stt modules and the class each one exports
+stt_files = [
+    ("swarmauri_standard.stt.GroqSTT", "GroqSTT"),
+    ("swarmauri_standard.stt.OpenaiSTT", "OpenaiSTT"),
+    ("swarmauri_standard.stt.WhisperLargeSTT", "WhisperLargeSTT"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, stt_files)
@@ -1,3 +1,4 @@
+import inspect
 from typing import Any, List, Literal, Type
 
 from pydantic import Field
@@ -17,3 +18,11 @@ class Swarm(SwarmBase):
     def _create_agent(self) -> Any:
         """Create new agent instance"""
         return self.agent_class()
+
+    async def _execute_task(self, task: Any, agent_id: int, **kwargs) -> Any:
+        """Run the task on the agent's ``process`` method, or else ``exec``"""
+        agent = self._agents[agent_id]
+        method = getattr(agent, "process", None) or agent.exec
+        if inspect.iscoroutinefunction(method):
+            return await method(task, **kwargs)
+        return await self._run_sync(method, task, **kwargs)
@@ -1,12 +1,21 @@
-import asyncio
 import json
 import logging
-from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+)
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_base.schema_converters.SchemaConverterBase import SchemaConverterBase
 from swarmauri_base.tool_llms.ToolLLMBase import ToolLLMBase
@@ -42,8 +51,8 @@ class AnthropicToolModel(ToolLLMBase):
     """
 
     BASE_URL: str = "https://api.anthropic.com/v1"
-    _client: httpx.Client = PrivateAttr()
-    _async_client: httpx.AsyncClient = PrivateAttr()
+    _client: PooledClient = PrivateAttr()
+    _async_client: AsyncPooledClient = PrivateAttr()
     api_key: SecretStr
     allowed_models: List[str] = [
         "claude-3-7-sonnet-latest",
@@ -68,10 +77,10 @@ class AnthropicToolModel(ToolLLMBase):
             "x-api-key": self.api_key.get_secret_value(),
             "anthropic-version": "2023-06-01",
         }
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=self._headers, base_url=self.BASE_URL, timeout=self.timeout
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers=self._headers, base_url=self.BASE_URL, timeout=self.timeout
         )
 
@@ -92,14 +101,12 @@ class AnthropicToolModel(ToolLLMBase):
         Converts a toolkit's tools to the Anthropic-compatible schema format.
 
         Args:
-            tools (Dict): A dictionary of tools to be converted.
+            tools (Dict): The toolkit, or a dictionary of tools to be converted.
 
         Returns:
             List[Dict[str, Any]]: A list of tool schemas converted to the Anthropic format.
         """
-        schema_result = [
-            AnthropicSchemaConverter().convert(tools[tool]) for tool in tools
-        ]
+        schema_result = AnthropicSchemaConverter().convert_tools(tools)
         logging.info(schema_result)
         return schema_result
 
@@ -123,7 +130,19 @@ class AnthropicToolModel(ToolLLMBase):
         ]
         return formatted_messages
 
-    def _process_tool_calls(self, tool_calls, toolkit, messages) -> List[MessageBase]:
+    def _tool_invocations(self, tool_calls, toolkit) -> List[Tuple[Any, Dict]]:
+        """
+        Returns the tool and the input of each ``tool_use`` block, in order.
+        """
+        return [
+            (toolkit.get_tool_by_name(tool_call["name"]), tool_call["input"])
+            for tool_call in tool_calls or []
+            if tool_call["type"] == "tool_use"
+        ]
+
+    def _process_tool_calls(
+        self, tool_calls, toolkit, messages, results: Optional[List[Any]] = None
+    ) -> List[MessageBase]:
         """
         Processes tool calls from Anthropic API response and adds the results to messages.
 
@@ -131,6 +150,8 @@ class AnthropicToolModel(ToolLLMBase):
             tool_calls (List): The tool calls from Anthropic response.
             toolkit: The toolkit containing the tools to call.
             messages (List): The current list of messages.
+            results (List, optional): The results of the tool calls, when already run.
+                The tools are run concurrently otherwise.
 
         Returns:
             List[MessageBase]: Updated list of messages with tool responses.
@@ -138,36 +159,38 @@ class AnthropicToolModel(ToolLLMBase):
         if not tool_calls:
             return messages
 
+        if results is None:
+            results = self._run_tools(self._tool_invocations(tool_calls, toolkit))
+        tool_uses = [
+            tool_call for tool_call in tool_calls if tool_call["type"] == "tool_use"
+        ]
+
         tool_messages = []
-        for tool_call in tool_calls:
-            if tool_call["type"] == "tool_use":
-                func_name = tool_call["name"]
-                func_call = toolkit.get_tool_by_name(func_name)
-                func_args = tool_call["input"]
-                func_result = func_call(**func_args)
-
-                # Create a function message for the tool response
-                tool_message = FunctionMessage(
-                    content=json.dumps(func_result),
-                    name=func_name,
-                    tool_call_id=tool_call["id"],
-                )
-
-                tool_messages.append(tool_message)
-
-                # Also add to the messages list for API calls
-                messages.append(
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "content": json.dumps(func_result),
-                                "tool_use_id": tool_call["id"],
-                            }
-                        ],
-                    }
-                )
+        for tool_call, func_result in zip(tool_uses, results):
+            func_name = tool_call["name"]
+
+            # Create a function message for the tool response
+            tool_message = FunctionMessage(
+                content=json.dumps(func_result),
+                name=func_name,
+                tool_call_id=tool_call["id"],
+            )
+
+            tool_messages.append(tool_message)
+
+            # Also add to the messages list for API calls
+            messages.append(
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "tool_result",
+                            "content": json.dumps(func_result),
+                            "tool_use_id": tool_call["id"],
+                        }
+                    ],
+                }
+            )
 
         return messages, tool_messages
 
@@ -194,14 +217,14 @@ class AnthropicToolModel(ToolLLMBase):
         Returns:
             IConversation: The updated conversation with the assistant's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice if toolkit and tool_choice else {"type": "auto"},
         }
 
@@ -287,7 +310,7 @@ class AnthropicToolModel(ToolLLMBase):
         Returns:
             IConversation: The updated conversation with the assistant's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         logging.info(f"formatted_messages: {formatted_messages}")
 
         payload = {
@@ -295,7 +318,7 @@ class AnthropicToolModel(ToolLLMBase):
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice if toolkit and tool_choice else {"type": "auto"},
         }
 
@@ -321,7 +344,7 @@ class AnthropicToolModel(ToolLLMBase):
             }
         )
 
-        messages, tool_messages = self._process_tool_calls(
+        messages, tool_messages = await self._aprocess_tool_calls(
             tool_calls, toolkit, messages
         )
 
@@ -377,7 +400,7 @@ class AnthropicToolModel(ToolLLMBase):
         Yields:
             Iterator[str]: Chunks of text received from the streaming response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         # First, handle any tool calls that might be needed
         tool_payload = {
@@ -385,7 +408,7 @@ class AnthropicToolModel(ToolLLMBase):
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice if toolkit and tool_choice else {"type": "auto"},
         }
 
@@ -483,14 +506,14 @@ class AnthropicToolModel(ToolLLMBase):
         Yields:
             AsyncIterator[str]: Chunks of text received from the streaming response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         tool_payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice if toolkit and tool_choice else {"type": "auto"},
         }
 
@@ -511,7 +534,7 @@ class AnthropicToolModel(ToolLLMBase):
                 }
             )
 
-            messages, tool_messages = self._process_tool_calls(
+            messages, tool_messages = await self._aprocess_tool_calls(
                 tool_calls, toolkit, messages
             )
             conversation.add_messages(tool_messages)
@@ -617,20 +640,18 @@ class AnthropicToolModel(ToolLLMBase):
         Returns:
             List[IConversation]: A list of conversation objects updated with the assistant's responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    tool_choice=tool_choice,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                tool_choice=tool_choice,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
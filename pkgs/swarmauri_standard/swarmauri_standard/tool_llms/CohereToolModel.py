@@ -1,13 +1,22 @@
-import asyncio
 import json
 import logging
 import uuid
-from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Tuple,
+    Type,
+    Union,
+)
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_base.schema_converters.SchemaConverterBase import SchemaConverterBase
 from swarmauri_base.tool_llms.ToolLLMBase import ToolLLMBase
@@ -43,8 +52,8 @@ class CohereToolModel(ToolLLMBase):
     """
 
     BASE_URL: str = "https://api.cohere.ai/v1"
-    _client: httpx.Client = PrivateAttr()
-    _async_client: httpx.AsyncClient = PrivateAttr()
+    _client: PooledClient = PrivateAttr()
+    _async_client: AsyncPooledClient = PrivateAttr()
     api_key: SecretStr
     allowed_models: List[str] = [
         "command-a-03-2025",
@@ -73,10 +82,10 @@ class CohereToolModel(ToolLLMBase):
             "content-type": "application/json",
             "authorization": f"Bearer {self.api_key.get_secret_value()}",
         }
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=self._headers, base_url=self.BASE_URL, timeout=self.timeout
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers=self._headers, base_url=self.BASE_URL, timeout=self.timeout
         )
 
@@ -94,14 +103,14 @@ class CohereToolModel(ToolLLMBase):
         Convert tool definitions to Cohere's expected schema format.
 
         Args:
-            tools: Dictionary of tools to convert
+            tools: The toolkit, or dictionary of tools to convert
 
         Returns:
             List[Dict[str, Any]]: List of converted tool definitions
         """
         if not tools:
             return []
-        return [CohereSchemaConverter().convert(tools[tool]) for tool in tools]
+        return CohereSchemaConverter().convert_tools(tools)
 
     def _extract_text_content(self, content: Union[str, List[contentItem]]) -> str:
         """
@@ -215,13 +224,27 @@ class CohereToolModel(ToolLLMBase):
             )
         return conversation
 
-    def _process_tool_calls(self, response_data, toolkit):
+    def _tool_invocations(self, response_data, toolkit) -> List[Tuple[Any, Dict]]:
+        """
+        Returns the tool and the parameters of each tool call in the response, in order.
+        """
+        return [
+            (
+                toolkit.get_tool_by_name(tool_call.get("name")),
+                tool_call.get("parameters", {}),
+            )
+            for tool_call in response_data.get("tool_calls") or []
+        ]
+
+    def _process_tool_calls(self, response_data, toolkit, results=None):
         """
         Process tool calls from the model's response and execute them using the provided toolkit.
 
         Args:
             response_data: The response data containing tool calls
             toolkit: The toolkit containing the tools to execute
+            results: The results of the tool calls, when already run. The tools are
+                run concurrently otherwise.
 
         Returns:
             List[Dict[str, Any]]: Results of the tool executions
@@ -232,11 +255,11 @@ class CohereToolModel(ToolLLMBase):
 
         tool_messages = []
         if tool_calls:
-            for tool_call in tool_calls:
+            if results is None:
+                invocations = self._tool_invocations(response_data, toolkit)
+                results = self._run_tools(invocations)
+            for tool_call, func_results in zip(tool_calls, results):
                 func_name = tool_call.get("name")
-                func_call = toolkit.get_tool_by_name(func_name)
-                func_args = tool_call.get("parameters", {})
-                func_results = func_call(**func_args)
                 tool_results.append(
                     {"call": tool_call, "outputs": [{"result": func_results}]}
                 )
@@ -314,8 +337,8 @@ class CohereToolModel(ToolLLMBase):
             The updated conversation with the model's response
         """
         conversation = self._ensure_conversation_has_message(conversation)
-        formatted_messages = self._format_messages(conversation.history)
-        tools = self._schema_convert_tools(toolkit.tools) if toolkit else None
+        formatted_messages = self._format_history(conversation)
+        tools = self._schema_convert_tools(toolkit) if toolkit else None
 
         with DurationManager() as tool_timer:
             tool_payload = self._prepare_chat_payload(
@@ -381,8 +404,8 @@ class CohereToolModel(ToolLLMBase):
             Iterator[str]: An iterator yielding response chunks
         """
         conversation = self._ensure_conversation_has_message(conversation)
-        formatted_messages = self._format_messages(conversation.history)
-        tools = self._schema_convert_tools(toolkit.tools) if toolkit else None
+        formatted_messages = self._format_history(conversation)
+        tools = self._schema_convert_tools(toolkit) if toolkit else None
 
         # Handle tool call first
         tool_payload = self._prepare_chat_payload(
@@ -458,8 +481,8 @@ class CohereToolModel(ToolLLMBase):
             The updated conversation with the model's response
         """
         conversation = self._ensure_conversation_has_message(conversation)
-        formatted_messages = self._format_messages(conversation.history)
-        tools = self._schema_convert_tools(toolkit.tools) if toolkit else None
+        formatted_messages = self._format_history(conversation)
+        tools = self._schema_convert_tools(toolkit) if toolkit else None
 
         with DurationManager() as tool_timer:
             tool_payload = self._prepare_chat_payload(
@@ -475,7 +498,9 @@ class CohereToolModel(ToolLLMBase):
             tool_response.raise_for_status()
             tool_data = tool_response.json()
 
-        tool_results, tool_messages = self._process_tool_calls(tool_data, toolkit)
+        tool_results, tool_messages = await self._aprocess_tool_calls(
+            tool_data, toolkit
+        )
 
         conversation.add_messages(tool_messages)
 
@@ -524,8 +549,8 @@ class CohereToolModel(ToolLLMBase):
             AsyncIterator[str]: An async iterator yielding response chunks
         """
         conversation = self._ensure_conversation_has_message(conversation)
-        formatted_messages = self._format_messages(conversation.history)
-        tools = self._schema_convert_tools(toolkit.tools) if toolkit else None
+        formatted_messages = self._format_history(conversation)
+        tools = self._schema_convert_tools(toolkit) if toolkit else None
 
         # Handle tool call first
         tool_payload = self._prepare_chat_payload(
@@ -541,7 +566,9 @@ class CohereToolModel(ToolLLMBase):
             tool_response.raise_for_status()
             tool_data = tool_response.json()
 
-        tool_results, tool_messages = self._process_tool_calls(tool_data, toolkit)
+        tool_results, tool_messages = await self._aprocess_tool_calls(
+            tool_data, toolkit
+        )
 
         conversation.add_messages(tool_messages)
 
@@ -646,19 +673,17 @@ class CohereToolModel(ToolLLMBase):
             while still allowing for parallel processing of multiple conversations.
 
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -1,8 +1,5 @@
-import asyncio
-import json
 from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type
 
-import httpx
 from swarmauri_base.ComponentBase import ComponentBase
 from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_base.schema_converters.SchemaConverterBase import SchemaConverterBase
@@ -15,6 +12,7 @@ from swarmauri_standard.schema_converters.OpenAISchemaConverter import (
     OpenAISchemaConverter,
 )
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(ToolLLMBase, "DeepInfraToolModel")
@@ -72,13 +70,12 @@ class DeepInfraToolModel(ToolLLMBase):
         Converts a toolkit's tools to the DeepInfra-compatible schema format.
 
         Args:
-            tools (Dict): A dictionary of tools to be converted.
+            tools (Dict): The toolkit, or a dictionary of tools to be converted.
 
         Returns:
             List[Dict[str, Any]]: A list of tool schemas in OpenAI format.
         """
-        converter = self.get_schema_converter()()
-        return [converter.convert(tools[tool]) for tool in tools]
+        return self.get_schema_converter()().convert_tools(tools)
 
     def _format_messages(
         self, messages: List[Type[MessageBase]]
@@ -99,35 +96,6 @@ class DeepInfraToolModel(ToolLLMBase):
             if m.role != "tool"
         ]
 
-    def _process_tool_calls(self, tool_calls, toolkit, messages) -> List[MessageBase]:
-        """
-        Processes a list of tool calls and appends the results to the messages list.
-
-        Args:
-            tool_calls (list): Tool calls from the LLM response.
-            toolkit: Toolkit containing tools to be called.
-            messages (list): Message list to append tool responses to.
-
-        Returns:
-            List[MessageBase]: Updated list of messages with tool responses added.
-        """
-        if tool_calls:
-            for tool_call in tool_calls:
-                func_name = tool_call["function"]["name"]
-                func_call = toolkit.get_tool_by_name(func_name)
-                func_args = json.loads(tool_call["function"]["arguments"])
-                func_result = func_call(**func_args)
-
-                messages.append(
-                    {
-                        "tool_call_id": tool_call["id"],
-                        "role": "tool",
-                        "name": func_name,
-                        "content": json.dumps(func_result),
-                    }
-                )
-        return messages
-
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -152,17 +120,17 @@ class DeepInfraToolModel(ToolLLMBase):
         Returns:
             IConversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice or "auto",
         }
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(self.BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
             tool_response = response.json()
@@ -196,7 +164,7 @@ class DeepInfraToolModel(ToolLLMBase):
             payload.pop("tools", None)
             payload.pop("tool_choice", None)
 
-            with httpx.Client(timeout=self.timeout) as client:
+            with self._http_client(timeout=self.timeout) as client:
                 response = client.post(
                     self.BASE_URL, headers=self._headers, json=payload
                 )
@@ -236,17 +204,17 @@ class DeepInfraToolModel(ToolLLMBase):
         Returns:
             IConversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice or "auto",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 self.BASE_URL, headers=self._headers, json=payload
             )
@@ -262,7 +230,7 @@ class DeepInfraToolModel(ToolLLMBase):
 
             # Process tool calls if any
             tool_calls = assistant_message.get("tool_calls", [])
-            messages = self._process_tool_calls(tool_calls, toolkit, messages)
+            messages = await self._aprocess_tool_calls(tool_calls, toolkit, messages)
 
             # Extract tool messages for the conversation
             tool_messages = [
@@ -282,7 +250,7 @@ class DeepInfraToolModel(ToolLLMBase):
             payload.pop("tools", None)
             payload.pop("tool_choice", None)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._async_http_client(timeout=self.timeout) as client:
                 response = await client.post(
                     self.BASE_URL, headers=self._headers, json=payload
                 )
@@ -320,7 +288,7 @@ class DeepInfraToolModel(ToolLLMBase):
         Yields:
             Iterator[str]: Streamed response content.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         # First, make a non-streaming request to handle tool calls
         payload = {
@@ -328,11 +296,11 @@ class DeepInfraToolModel(ToolLLMBase):
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice or "auto",
         }
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(self.BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
             tool_response = response.json()
@@ -365,27 +333,14 @@ class DeepInfraToolModel(ToolLLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        message_content = ""
-
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(self.BASE_URL, headers=self._headers, json=payload)
-            response.raise_for_status()
-
-        message_content = ""
-
-        for line in response.iter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
+        reader = ChatCompletionStream()
+        with self._http_client(timeout=self.timeout) as client:
+            yield from reader.stream(
+                client, self.BASE_URL, headers=self._headers, json=payload
+            )
 
-        conversation.add_message(AgentMessage(content=message_content))
+        # Add the final agent message to the conversation
+        conversation.add_message(AgentMessage(content=reader.content))
 
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
@@ -409,7 +364,7 @@ class DeepInfraToolModel(ToolLLMBase):
         Yields:
             AsyncIterator[str]: Streamed response content.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         # First, make a non-streaming request to handle tool calls
         payload = {
@@ -417,11 +372,11 @@ class DeepInfraToolModel(ToolLLMBase):
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice or "auto",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 self.BASE_URL, headers=self._headers, json=payload
             )
@@ -436,7 +391,7 @@ class DeepInfraToolModel(ToolLLMBase):
             messages.append(assistant_message)
 
             tool_calls = assistant_message.get("tool_calls", [])
-            messages = self._process_tool_calls(tool_calls, toolkit, messages)
+            messages = await self._aprocess_tool_calls(tool_calls, toolkit, messages)
 
             # Extract tool messages for the conversation
             tool_messages = [
@@ -456,27 +411,15 @@ class DeepInfraToolModel(ToolLLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        message_content = ""
+        reader = ChatCompletionStream()
+        async with self._async_http_client(timeout=self.timeout) as client:
+            async for delta in reader.astream(
+                client, self.BASE_URL, headers=self._headers, json=payload
+            ):
+                yield delta
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            agent_response = await client.post(
-                self.BASE_URL, headers=self._headers, json=payload
-            )
-            agent_response.raise_for_status()
-
-        message_content = ""
-        async for line in agent_response.aiter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-        conversation.add_message(AgentMessage(content=message_content))
+        # Add the final agent message to the conversation
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -534,20 +477,18 @@ class DeepInfraToolModel(ToolLLMBase):
         Returns:
             List[IConversation]: List of updated conversations with responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    tool_choice=tool_choice,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                tool_choice=tool_choice,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
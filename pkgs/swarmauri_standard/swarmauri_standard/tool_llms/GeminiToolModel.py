@@ -1,9 +1,17 @@
-import asyncio
 import json
 import logging
-from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+)
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
 from swarmauri_base.messages.MessageBase import MessageBase
@@ -97,7 +105,7 @@ class GeminiToolModel(ToolLLMBase):
         Converts toolkit tools into a format compatible with the Gemini schema.
 
         Args:
-            tools (dict): A dictionary of tools to convert.
+            tools (dict): The toolkit, or a dictionary of tools to convert.
 
         Returns:
             Dict[str, List[Dict[str, Any]]]: Dictionary containing converted tool definitions.
@@ -105,8 +113,7 @@ class GeminiToolModel(ToolLLMBase):
         if not tools:
             return {"function_declarations": []}
 
-        converter = self.get_schema_converter()()
-        response = [converter.convert(tools[tool]) for tool in tools]
+        response = self.get_schema_converter()().convert_tools(tools)
         return {"function_declarations": response}
 
     def _format_messages(
@@ -140,7 +147,34 @@ class GeminiToolModel(ToolLLMBase):
 
         return sanitized_messages
 
-    def _process_tool_calls(self, tool_calls, toolkit, messages) -> tuple:
+    def _function_calls(self, tool_calls, toolkit) -> List[Tuple[Dict, Any]]:
+        """
+        Returns each function call of ``tool_calls`` whose tool is in the toolkit,
+        with that tool.
+        """
+        calls = []
+        for tool_call in tool_calls or []:
+            if "functionCall" in tool_call:
+                try:
+                    func_name = tool_call["functionCall"]["name"]
+                    func_call = toolkit.get_tool_by_name(func_name)
+                    if not func_call:
+                        logging.warning(f"Tool {func_name} not found in toolkit")
+                        continue
+                    calls.append((tool_call["functionCall"], func_call))
+                except Exception as e:
+                    logging.error(f"Error processing tool call: {str(e)}")
+        return calls
+
+    def _tool_invocations(self, tool_calls, toolkit) -> List[Tuple[Any, Dict]]:
+        return [
+            (func_call, function_call["args"])
+            for function_call, func_call in self._function_calls(tool_calls, toolkit)
+        ]
+
+    def _process_tool_calls(
+        self, tool_calls, toolkit, messages, results: Optional[List[Any]] = None
+    ) -> tuple:
         """
         Executes tool calls and creates appropriate response messages.
 
@@ -148,6 +182,8 @@ class GeminiToolModel(ToolLLMBase):
             tool_calls (List[Dict]): List of tool calls to process.
             toolkit: Toolkit instance for handling tools.
             messages (List): List of messages in the conversation.
+            results (List, optional): The results, or errors, of the tool calls when
+                already run. The tools are run concurrently otherwise.
 
         Returns:
             tuple: A tuple containing (updated messages, tool messages for the conversation)
@@ -155,30 +191,26 @@ class GeminiToolModel(ToolLLMBase):
         if not toolkit or not tool_calls:
             return messages, []
 
+        if results is None:
+            results = self._run_tools(
+                self._tool_invocations(tool_calls, toolkit), return_exceptions=True
+            )
+        function_calls = self._function_calls(tool_calls, toolkit)
+
         tool_results = {}
         tool_messages = []
 
-        for tool_call in tool_calls:
-            if "functionCall" in tool_call:
-                try:
-                    func_name = tool_call["functionCall"]["name"]
-                    func_args = tool_call["functionCall"]["args"]
-
-                    func_call = toolkit.get_tool_by_name(func_name)
-                    if not func_call:
-                        logging.warning(f"Tool {func_name} not found in toolkit")
-                        continue
-
-                    func_result = func_call(**func_args)
-                    tool_results[func_name] = func_result
+        for (function_call, _), func_result in zip(function_calls, results):
+            if isinstance(func_result, Exception):
+                logging.error(f"Error processing tool call: {str(func_result)}")
+                continue
+            func_name = function_call["name"]
+            tool_results[func_name] = func_result
 
-                    # Create a FunctionMessage for each tool call result
-                    tool_messages.append(
-                        FunctionMessage(name=func_name, content=json.dumps(func_result))
-                    )
-                except Exception as e:
-                    logging.error(f"Error processing tool call: {str(e)}")
-                    continue
+            # Create a FunctionMessage for each tool call result
+            tool_messages.append(
+                FunctionMessage(name=func_name, content=json.dumps(func_result))
+            )
 
         # Update messages for Gemini's format
         if tool_results:
@@ -201,6 +233,14 @@ class GeminiToolModel(ToolLLMBase):
 
         return messages, tool_messages
 
+    async def _aprocess_tool_calls(self, tool_calls, toolkit, messages) -> tuple:
+        if not toolkit or not tool_calls:
+            return messages, []
+        results = await self._arun_tools(
+            self._tool_invocations(tool_calls, toolkit), return_exceptions=True
+        )
+        return self._process_tool_calls(tool_calls, toolkit, messages, results)
+
     def _get_system_context(self, messages: List[Type[MessageBase]]) -> str:
         """
         Extracts system context message from message history.
@@ -251,7 +291,7 @@ class GeminiToolModel(ToolLLMBase):
             "function_calling_config": {"mode": "ANY"},
         }
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "contents": formatted_messages,
             "generation_config": generation_config,
@@ -260,7 +300,7 @@ class GeminiToolModel(ToolLLMBase):
 
         # Add tools if toolkit provided
         if toolkit:
-            tools = self._schema_convert_tools(toolkit.tools)
+            tools = self._schema_convert_tools(toolkit)
             payload["tools"] = [tools]
             payload["tool_config"] = tool_config
 
@@ -268,7 +308,7 @@ class GeminiToolModel(ToolLLMBase):
         if system_context:
             payload["system_instruction"] = {"parts": [{"text": system_context}]}
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(
                 f"{self.BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -306,7 +346,7 @@ class GeminiToolModel(ToolLLMBase):
                 if "tool_config" in payload:
                     payload.pop("tool_config")
 
-                with httpx.Client(timeout=self.timeout) as client:
+                with self._http_client(timeout=self.timeout) as client:
                     response = client.post(
                         f"{self.BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                         json=payload,
@@ -363,7 +403,7 @@ class GeminiToolModel(ToolLLMBase):
             "function_calling_config": {"mode": "ANY"},
         }
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "contents": formatted_messages,
             "generation_config": generation_config,
@@ -372,7 +412,7 @@ class GeminiToolModel(ToolLLMBase):
 
         # Add tools if toolkit provided
         if toolkit:
-            tools = self._schema_convert_tools(toolkit.tools)
+            tools = self._schema_convert_tools(toolkit)
             payload["tools"] = [tools]
             payload["tool_config"] = tool_config
 
@@ -380,7 +420,7 @@ class GeminiToolModel(ToolLLMBase):
         if system_context:
             payload["system_instruction"] = {"parts": [{"text": system_context}]}
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 f"{self.BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -404,7 +444,7 @@ class GeminiToolModel(ToolLLMBase):
 
         # Process tool calls if present
         if has_tool_calls and toolkit:
-            messages, tool_messages = self._process_tool_calls(
+            messages, tool_messages = await self._aprocess_tool_calls(
                 tool_calls, toolkit, formatted_messages
             )
             if tool_messages:
@@ -418,7 +458,7 @@ class GeminiToolModel(ToolLLMBase):
                 if "tool_config" in payload:
                     payload.pop("tool_config")
 
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                async with self._async_http_client(timeout=self.timeout) as client:
                     response = await client.post(
                         f"{self.BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                         json=payload,
@@ -473,7 +513,7 @@ class GeminiToolModel(ToolLLMBase):
             "function_calling_config": {"mode": "ANY"},
         }
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "contents": formatted_messages,
             "generation_config": generation_config,
@@ -482,7 +522,7 @@ class GeminiToolModel(ToolLLMBase):
 
         # Add tools if toolkit provided
         if toolkit:
-            tools = self._schema_convert_tools(toolkit.tools)
+            tools = self._schema_convert_tools(toolkit)
             payload["tools"] = [tools]
             payload["tool_config"] = tool_config
 
@@ -491,7 +531,7 @@ class GeminiToolModel(ToolLLMBase):
             payload["system_instruction"] = {"parts": [{"text": system_context}]}
 
         # First, handle tool calls
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(
                 f"{self.BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -528,7 +568,7 @@ class GeminiToolModel(ToolLLMBase):
             if "tool_config" in payload:
                 payload.pop("tool_config")
 
-            with httpx.Client(timeout=self.timeout) as client:
+            with self._http_client(timeout=self.timeout) as client:
                 response = client.post(
                     f"{self.BASE_URL}/{self.name}:streamGenerateContent?alt=sse&key={self.api_key.get_secret_value()}",
                     json=payload,
@@ -604,7 +644,7 @@ class GeminiToolModel(ToolLLMBase):
             "function_calling_config": {"mode": "ANY"},
         }
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "contents": formatted_messages,
             "generation_config": generation_config,
@@ -613,7 +653,7 @@ class GeminiToolModel(ToolLLMBase):
 
         # Add tools if toolkit provided
         if toolkit:
-            tools = self._schema_convert_tools(toolkit.tools)
+            tools = self._schema_convert_tools(toolkit)
             payload["tools"] = [tools]
             payload["tool_config"] = tool_config
 
@@ -622,7 +662,7 @@ class GeminiToolModel(ToolLLMBase):
             payload["system_instruction"] = {"parts": [{"text": system_context}]}
 
         # First, handle tool calls
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 f"{self.BASE_URL}/{self.name}:generateContent?key={self.api_key.get_secret_value()}",
                 json=payload,
@@ -646,7 +686,7 @@ class GeminiToolModel(ToolLLMBase):
 
         # Process tool calls if present
         if has_tool_calls and toolkit:
-            messages, tool_messages = self._process_tool_calls(
+            messages, tool_messages = await self._aprocess_tool_calls(
                 tool_calls, toolkit, formatted_messages
             )
             if tool_messages:
@@ -659,7 +699,7 @@ class GeminiToolModel(ToolLLMBase):
             if "tool_config" in payload:
                 payload.pop("tool_config")
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._async_http_client(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.BASE_URL}/{self.name}:streamGenerateContent?alt=sse&key={self.api_key.get_secret_value()}",
                     json=payload,
@@ -757,20 +797,18 @@ class GeminiToolModel(ToolLLMBase):
         Returns:
             List[IConversation]: List of updated conversations with model responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv) -> IConversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    tool_choice=tool_choice,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                tool_choice=tool_choice,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
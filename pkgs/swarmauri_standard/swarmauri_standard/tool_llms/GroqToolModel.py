@@ -1,10 +1,8 @@
-import asyncio
-import json
 from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_base.schema_converters.SchemaConverterBase import SchemaConverterBase
 from swarmauri_base.tool_llms.ToolLLMBase import ToolLLMBase
@@ -16,6 +14,7 @@ from swarmauri_standard.schema_converters.GroqSchemaConverter import (
     GroqSchemaConverter,
 )
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(ToolLLMBase, "GroqToolModel")
@@ -49,8 +48,8 @@ class GroqToolModel(ToolLLMBase):
     name: str = ""
     type: Literal["GroqToolModel"] = "GroqToolModel"
 
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
     BASE_URL: str = "https://api.groq.com/openai/v1/chat/completions"
 
     def __init__(self, **data):
@@ -65,11 +64,11 @@ class GroqToolModel(ToolLLMBase):
             "Authorization": f"Bearer {self.api_key.get_secret_value()}",
             "Content-Type": "application/json",
         }
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=self._headers,
             timeout=self.timeout,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers=self._headers,
             timeout=self.timeout,
         )
@@ -92,13 +91,12 @@ class GroqToolModel(ToolLLMBase):
         Converts toolkit items to API-compatible schema format.
 
         Parameters:
-            tools: Dictionary of tools to be converted.
+            tools: The toolkit, or dictionary of tools to be converted.
 
         Returns:
             List[Dict[str, Any]]: Formatted list of tool dictionaries.
         """
-        converter = self.get_schema_converter()()
-        return [converter.convert(tools[tool]) for tool in tools]
+        return self.get_schema_converter()().convert_tools(tools)
 
     def _format_messages(
         self, messages: List[Type[MessageBase]]
@@ -120,38 +118,6 @@ class GroqToolModel(ToolLLMBase):
         ]
         return formatted_messages
 
-    def _process_tool_calls(self, tool_calls, toolkit, messages) -> List[MessageBase]:
-        """
-        Processes a list of tool calls and appends the results to the messages list.
-
-        Args:
-            tool_calls (list): A list of dictionaries representing tool calls. Each dictionary should contain
-                               a "function" key with a nested dictionary that includes the "name" and "arguments"
-                               of the function to be called, and an "id" key for the tool call identifier.
-            toolkit (object): An object that provides access to tools via the `get_tool_by_name` method.
-            messages (list): A list of message dictionaries to which the results of the tool calls will be appended.
-
-        Returns:
-            List[MessageBase]: The updated list of messages with the results of the tool calls appended.
-        """
-        if tool_calls:
-            for tool_call in tool_calls:
-                func_name = tool_call["function"]["name"]
-
-                func_call = toolkit.get_tool_by_name(func_name)
-                func_args = json.loads(tool_call["function"]["arguments"])
-                func_result = func_call(**func_args)
-
-                messages.append(
-                    {
-                        "tool_call_id": tool_call["id"],
-                        "role": "tool",
-                        "name": func_name,
-                        "content": json.dumps(func_result),
-                    }
-                )
-        return messages
-
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -176,14 +142,14 @@ class GroqToolModel(ToolLLMBase):
         Returns:
             IConversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice or "auto",
         }
 
@@ -256,18 +222,18 @@ class GroqToolModel(ToolLLMBase):
         Returns:
             IConversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice or "auto",
         }
 
-        async with httpx.AsyncClient(
+        async with self._async_http_client(
             headers=self._headers, timeout=self.timeout
         ) as client:
             response = await client.post(self.BASE_URL, json=payload)
@@ -283,7 +249,7 @@ class GroqToolModel(ToolLLMBase):
 
             # Process tool calls if any
             tool_calls = assistant_message.get("tool_calls", [])
-            messages = self._process_tool_calls(tool_calls, toolkit, messages)
+            messages = await self._aprocess_tool_calls(tool_calls, toolkit, messages)
 
             # Extract tool messages for the conversation
             tool_messages = [
@@ -303,7 +269,7 @@ class GroqToolModel(ToolLLMBase):
             payload.pop("tools", None)
             payload.pop("tool_choice", None)
 
-            async with httpx.AsyncClient(
+            async with self._async_http_client(
                 headers=self._headers, timeout=self.timeout
             ) as client:
                 response = await client.post(self.BASE_URL, json=payload)
@@ -340,7 +306,7 @@ class GroqToolModel(ToolLLMBase):
         Yields:
             Iterator[str]: Streamed response content.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         # First, make a non-streaming request to handle tool calls
         payload = {
@@ -348,7 +314,7 @@ class GroqToolModel(ToolLLMBase):
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice or "auto",
         }
 
@@ -384,36 +350,11 @@ class GroqToolModel(ToolLLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        response = self._client.post(self.BASE_URL, json=payload)
-        response.raise_for_status()
-        message_content = ""
-
-        for line in response.iter_lines():
-            # Convert bytes to string if needed
-            line_str = line.decode("utf-8") if isinstance(line, bytes) else line
-
-            if not line_str or line_str == "data: [DONE]":
-                continue
-
-            if line_str.startswith("data: "):
-                json_str = line_str.replace("data: ", "")
-                try:
-                    if json_str:
-                        chunk = json.loads(json_str)
-                        if (
-                            "choices" in chunk
-                            and chunk["choices"]
-                            and "delta" in chunk["choices"][0]
-                            and "content" in chunk["choices"][0]["delta"]
-                        ):
-                            delta = chunk["choices"][0]["delta"]["content"]
-                            message_content += delta
-                            yield delta
-                except json.JSONDecodeError:
-                    pass
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, self.BASE_URL, json=payload)
 
         # Add the final agent message to the conversation
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
@@ -437,7 +378,7 @@ class GroqToolModel(ToolLLMBase):
         Yields:
             AsyncIterator[str]: Streamed response content.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         # First, make a non-streaming request to handle tool calls
         payload = {
@@ -445,11 +386,11 @@ class GroqToolModel(ToolLLMBase):
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice or "auto",
         }
 
-        async with httpx.AsyncClient(
+        async with self._async_http_client(
             headers=self._headers, timeout=self.timeout
         ) as client:
             response = await client.post(self.BASE_URL, json=payload)
@@ -464,7 +405,7 @@ class GroqToolModel(ToolLLMBase):
             messages.append(assistant_message)
 
             tool_calls = assistant_message.get("tool_calls", [])
-            messages = self._process_tool_calls(tool_calls, toolkit, messages)
+            messages = await self._aprocess_tool_calls(tool_calls, toolkit, messages)
 
             # Extract tool messages for the conversation
             tool_messages = [
@@ -484,37 +425,15 @@ class GroqToolModel(ToolLLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        message_content = ""
-
-        async with httpx.AsyncClient(
+        reader = ChatCompletionStream()
+        async with self._async_http_client(
             headers=self._headers, timeout=self.timeout
         ) as client:
-            response = await client.post(self.BASE_URL, json=payload)
-            response.raise_for_status()
-
-            async for line in response.aiter_lines():
-                if not line or line == "data: [DONE]":
-                    continue
-
-                if line.startswith("data: "):
-                    json_str = line.replace("data: ", "")
-                    try:
-                        if json_str:
-                            chunk = json.loads(json_str)
-                            if (
-                                "choices" in chunk
-                                and chunk["choices"]
-                                and "delta" in chunk["choices"][0]
-                                and "content" in chunk["choices"][0]["delta"]
-                            ):
-                                delta = chunk["choices"][0]["delta"]["content"]
-                                message_content += delta
-                                yield delta
-                    except json.JSONDecodeError:
-                        pass
+            async for delta in reader.astream(client, self.BASE_URL, json=payload):
+                yield delta
 
         # Add the final agent message to the conversation
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -572,20 +491,18 @@ class GroqToolModel(ToolLLMBase):
         Returns:
             List[IConversation]: List of updated conversations with responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    tool_choice=tool_choice,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                tool_choice=tool_choice,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -1,11 +1,9 @@
-import asyncio
-import json
 import logging
 from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type
 
-import httpx
 from pydantic import PrivateAttr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import AsyncPooledClient, PooledClient
 from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_base.schema_converters.SchemaConverterBase import SchemaConverterBase
 from swarmauri_base.tool_llms.ToolLLMBase import ToolLLMBase
@@ -17,6 +15,7 @@ from swarmauri_standard.schema_converters.MistralSchemaConverter import (
     MistralSchemaConverter,
 )
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(ToolLLMBase, "MistralToolModel")
@@ -40,8 +39,8 @@ class MistralToolModel(ToolLLMBase):
     name: str = ""
     type: Literal["MistralToolModel"] = "MistralToolModel"
     BASE_URL: str = "https://api.mistral.ai/v1/chat/completions"
-    _client: httpx.Client = PrivateAttr(default=None)
-    _async_client: httpx.AsyncClient = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
+    _async_client: AsyncPooledClient = PrivateAttr(default=None)
 
     def __init__(self, **data) -> None:
         """
@@ -52,11 +51,11 @@ class MistralToolModel(ToolLLMBase):
         """
         super().__init__(**data)
         self._headers = {"Authorization": f"Bearer {self.api_key.get_secret_value()}"}
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=self._headers,
             timeout=self.timeout,
         )
-        self._async_client = httpx.AsyncClient(
+        self._async_client = self._async_http_client(
             headers=self._headers,
             timeout=self.timeout,
         )
@@ -78,13 +77,12 @@ class MistralToolModel(ToolLLMBase):
         Convert a dictionary of tools to the schema format required by Mistral API.
 
         Args:
-            tools (dict): A dictionary of tool objects.
+            tools (dict): The toolkit, or a dictionary of tool objects.
 
         Returns:
             List[Dict[str, Any]]: A list of converted tool schemas.
         """
-        converter = self.get_schema_converter()()
-        return [converter.convert(tools[tool]) for tool in tools]
+        return self.get_schema_converter()().convert_tools(tools)
 
     def _format_messages(
         self, messages: List[Type[MessageBase]]
@@ -106,35 +104,6 @@ class MistralToolModel(ToolLLMBase):
         ]
         return formatted_messages
 
-    def _process_tool_calls(self, tool_calls, toolkit, messages) -> List[Dict]:
-        """
-        Processes a list of tool calls and appends the results to the messages list.
-
-        Args:
-            tool_calls (list): Tool calls from the LLM response.
-            toolkit: Toolkit containing tools to be called.
-            messages (list): Message list to append tool responses to.
-
-        Returns:
-            List[Dict]: Updated list of messages with tool responses added.
-        """
-        if tool_calls:
-            for tool_call in tool_calls:
-                func_name = tool_call["function"]["name"]
-                func_call = toolkit.get_tool_by_name(func_name)
-                func_args = json.loads(tool_call["function"]["arguments"])
-                func_result = func_call(**func_args)
-
-                messages.append(
-                    {
-                        "tool_call_id": tool_call["id"],
-                        "role": "tool",
-                        "name": func_name,
-                        "content": json.dumps(func_result),
-                    }
-                )
-        return messages
-
     @retry_on_status_codes((429, 529), max_retries=1)
     def get_allowed_models(self) -> List[str]:
         """
@@ -187,7 +156,7 @@ class MistralToolModel(ToolLLMBase):
         Returns:
             IConversation: The updated conversation object.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         if toolkit and not tool_choice:
             tool_choice = "auto"
@@ -197,7 +166,7 @@ class MistralToolModel(ToolLLMBase):
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice,
             "safe_prompt": safe_prompt,
         }
@@ -273,7 +242,7 @@ class MistralToolModel(ToolLLMBase):
         Returns:
             IConversation: The updated conversation object.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         if toolkit and not tool_choice:
             tool_choice = "auto"
 
@@ -282,12 +251,12 @@ class MistralToolModel(ToolLLMBase):
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice,
             "safe_prompt": safe_prompt,
         }
 
-        async with httpx.AsyncClient(
+        async with self._async_http_client(
             headers=self._headers, timeout=self.timeout
         ) as client:
             response = await client.post(self.BASE_URL, json=payload)
@@ -303,7 +272,7 @@ class MistralToolModel(ToolLLMBase):
         messages.append(assistant_message)
 
         tool_calls = assistant_message.get("tool_calls", [])
-        messages = self._process_tool_calls(tool_calls, toolkit, messages)
+        messages = await self._aprocess_tool_calls(tool_calls, toolkit, messages)
 
         # Extract tool messages for the conversation
         tool_messages = [
@@ -323,7 +292,7 @@ class MistralToolModel(ToolLLMBase):
             payload.pop("tools", None)
             payload.pop("tool_choice", None)
 
-            async with httpx.AsyncClient(
+            async with self._async_http_client(
                 headers=self._headers, timeout=self.timeout
             ) as client:
                 response = await client.post(self.BASE_URL, json=payload)
@@ -365,7 +334,7 @@ class MistralToolModel(ToolLLMBase):
         Yields:
             Iterator[str]: A streaming generator that yields the response content as text.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         if toolkit and not tool_choice:
             tool_choice = "auto"
@@ -375,7 +344,7 @@ class MistralToolModel(ToolLLMBase):
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice,
             "safe_prompt": safe_prompt,
         }
@@ -413,37 +382,11 @@ class MistralToolModel(ToolLLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        response = self._client.post(self.BASE_URL, json=payload)
-        response.raise_for_status()
-
-        message_content = ""
-
-        for line in response.iter_lines():
-            # Convert bytes to string if needed
-            line_str = line.decode("utf-8") if isinstance(line, bytes) else line
-
-            if not line_str or line_str == "data: [DONE]":
-                continue
-
-            if line_str.startswith("data: "):
-                json_str = line_str.replace("data: ", "")
-                try:
-                    if json_str:
-                        chunk = json.loads(json_str)
-                        if (
-                            "choices" in chunk
-                            and chunk["choices"]
-                            and "delta" in chunk["choices"][0]
-                            and "content" in chunk["choices"][0]["delta"]
-                        ):
-                            delta = chunk["choices"][0]["delta"]["content"]
-                            message_content += delta
-                            yield delta
-                except json.JSONDecodeError:
-                    pass
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, self.BASE_URL, json=payload)
 
         # Add the final agent message to the conversation
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
@@ -472,7 +415,7 @@ class MistralToolModel(ToolLLMBase):
         Yields:
             AsyncIterator[str]: An asynchronous streaming generator that yields the response content as text.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         if toolkit and not tool_choice:
             tool_choice = "auto"
@@ -482,13 +425,13 @@ class MistralToolModel(ToolLLMBase):
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice,
             "safe_prompt": safe_prompt,
         }
 
         # First request to handle tool calls
-        async with httpx.AsyncClient(
+        async with self._async_http_client(
             headers=self._headers, timeout=self.timeout
         ) as client:
             response = await client.post(self.BASE_URL, json=payload)
@@ -503,7 +446,7 @@ class MistralToolModel(ToolLLMBase):
         messages.append(assistant_message)
 
         tool_calls = assistant_message.get("tool_calls", [])
-        messages = self._process_tool_calls(tool_calls, toolkit, messages)
+        messages = await self._aprocess_tool_calls(tool_calls, toolkit, messages)
 
         # Extract tool messages for the conversation
         tool_messages = [
@@ -523,37 +466,15 @@ class MistralToolModel(ToolLLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        message_content = ""
-
-        async with httpx.AsyncClient(
+        reader = ChatCompletionStream()
+        async with self._async_http_client(
             headers=self._headers, timeout=self.timeout
         ) as client:
-            response = await client.post(self.BASE_URL, json=payload)
-            response.raise_for_status()
-
-            async for line in response.aiter_lines():
-                if not line or line == "data: [DONE]":
-                    continue
-
-                if line.startswith("data: "):
-                    json_str = line.replace("data: ", "")
-                    try:
-                        if json_str:
-                            chunk = json.loads(json_str)
-                            if (
-                                "choices" in chunk
-                                and chunk["choices"]
-                                and "delta" in chunk["choices"][0]
-                                and "content" in chunk["choices"][0]["delta"]
-                            ):
-                                delta = chunk["choices"][0]["delta"]["content"]
-                                message_content += delta
-                                yield delta
-                    except json.JSONDecodeError:
-                        pass
+            async for delta in reader.astream(client, self.BASE_URL, json=payload):
+                yield delta
 
         # Add the final agent message to the conversation
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -616,18 +537,16 @@ class MistralToolModel(ToolLLMBase):
         Returns:
             List[IConversation]: List of updated conversations with generated responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv) -> IConversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    tool_choice=tool_choice,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    safe_prompt=safe_prompt,
-                )
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                tool_choice=tool_choice,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                safe_prompt=safe_prompt,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
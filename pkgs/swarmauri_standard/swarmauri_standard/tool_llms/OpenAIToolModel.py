@@ -1,9 +1,6 @@
-import asyncio
-import json
 import logging
 from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
 from swarmauri_base.messages.MessageBase import MessageBase
@@ -17,6 +14,7 @@ from swarmauri_standard.schema_converters.OpenAISchemaConverter import (
     OpenAISchemaConverter,
 )
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(ToolLLMBase, "OpenAIToolModel")
@@ -91,13 +89,12 @@ class OpenAIToolModel(ToolLLMBase):
         Convert a dictionary of tools to the schema format required by OpenAI API.
 
         Args:
-            tools (dict): A dictionary of tool objects.
+            tools (dict): The toolkit, or a dictionary of tool objects.
 
         Returns:
             List[Dict[str, Any]]: A list of converted tool schemas.
         """
-        converter = self.get_schema_converter()()
-        return [converter.convert(tools[tool]) for tool in tools]
+        return self.get_schema_converter()().convert_tools(tools)
 
     def _format_messages(
         self, messages: List[Type[MessageBase]]
@@ -118,38 +115,6 @@ class OpenAIToolModel(ToolLLMBase):
             if message.role != "tool"
         ]
 
-    def _process_tool_calls(self, tool_calls, toolkit, messages) -> List[Dict]:
-        """
-        Processes a list of tool calls and appends the results to the messages list.
-
-        Args:
-            tool_calls (list): A list of dictionaries representing tool calls. Each dictionary should contain
-                               a "function" key with a nested dictionary that includes the "name" and "arguments"
-                               of the function to be called, and an "id" key for the tool call identifier.
-            toolkit (object): An object that provides access to tools via the `get_tool_by_name` method.
-            messages (list): A list of message dictionaries to which the results of the tool calls will be appended.
-
-        Returns:
-            List[Dict]: The updated list of messages with the results of the tool calls appended.
-        """
-        if tool_calls:
-            for tool_call in tool_calls:
-                func_name = tool_call["function"]["name"]
-
-                func_call = toolkit.get_tool_by_name(func_name)
-                func_args = json.loads(tool_call["function"]["arguments"])
-                func_result = func_call(**func_args)
-
-                messages.append(
-                    {
-                        "tool_call_id": tool_call["id"],
-                        "role": "tool",
-                        "name": func_name,
-                        "content": json.dumps(func_result),
-                    }
-                )
-        return messages
-
     @retry_on_status_codes((429, 529), max_retries=1)
     def predict(
         self,
@@ -174,7 +139,7 @@ class OpenAIToolModel(ToolLLMBase):
         Returns:
             IConversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         logging.info(f"Formatted messages: {formatted_messages}")
 
         payload = {
@@ -182,11 +147,11 @@ class OpenAIToolModel(ToolLLMBase):
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice or "auto",
         }
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(self.BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
             tool_response = response.json()
@@ -216,7 +181,7 @@ class OpenAIToolModel(ToolLLMBase):
             payload.pop("tools", None)
             payload.pop("tool_choice", None)
 
-            with httpx.Client(timeout=self.timeout) as client:
+            with self._http_client(timeout=self.timeout) as client:
                 response = client.post(
                     self.BASE_URL, headers=self._headers, json=payload
                 )
@@ -255,17 +220,17 @@ class OpenAIToolModel(ToolLLMBase):
         Returns:
             IConversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice or "auto",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 self.BASE_URL, headers=self._headers, json=payload
             )
@@ -277,7 +242,7 @@ class OpenAIToolModel(ToolLLMBase):
         messages.append(assistant_message)
 
         tool_calls = assistant_message.get("tool_calls", [])
-        messages = self._process_tool_calls(tool_calls, toolkit, messages)
+        messages = await self._aprocess_tool_calls(tool_calls, toolkit, messages)
 
         # Extract tool messages for the conversation
         tool_messages = [
@@ -297,7 +262,7 @@ class OpenAIToolModel(ToolLLMBase):
             payload.pop("tools", None)
             payload.pop("tool_choice", None)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._async_http_client(timeout=self.timeout) as client:
                 response = await client.post(
                     self.BASE_URL, headers=self._headers, json=payload
                 )
@@ -334,19 +299,19 @@ class OpenAIToolModel(ToolLLMBase):
         Yields:
             Iterator[str]: Streamed response content.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice or "auto",
         }
 
         # First request to handle tool calls
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(self.BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
             tool_response = response.json()
@@ -376,38 +341,14 @@ class OpenAIToolModel(ToolLLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(self.BASE_URL, headers=self._headers, json=payload)
-            response.raise_for_status()
-
-        message_content = ""
-
-        for line in response.iter_lines():
-            # Handle bytes conversion if needed
-            line_str = line.decode("utf-8") if isinstance(line, bytes) else line
-
-            if not line_str or line_str == "data: [DONE]":
-                continue
-
-            if line_str.startswith("data: "):
-                json_str = line_str.replace("data: ", "")
-                try:
-                    if json_str:
-                        chunk = json.loads(json_str)
-                        if (
-                            "choices" in chunk
-                            and chunk["choices"]
-                            and "delta" in chunk["choices"][0]
-                            and "content" in chunk["choices"][0]["delta"]
-                        ):
-                            delta = chunk["choices"][0]["delta"]["content"]
-                            message_content += delta
-                            yield delta
-                except json.JSONDecodeError:
-                    pass
+        reader = ChatCompletionStream()
+        with self._http_client(timeout=self.timeout) as client:
+            yield from reader.stream(
+                client, self.BASE_URL, headers=self._headers, json=payload
+            )
 
         # Add the final agent message to the conversation
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
@@ -431,19 +372,19 @@ class OpenAIToolModel(ToolLLMBase):
         Yields:
             AsyncIterator[str]: Streamed response content.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice or "auto",
         }
 
         # First request to handle tool calls
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 self.BASE_URL, headers=self._headers, json=payload
             )
@@ -455,7 +396,7 @@ class OpenAIToolModel(ToolLLMBase):
         messages.append(assistant_message)
 
         tool_calls = assistant_message.get("tool_calls", [])
-        messages = self._process_tool_calls(tool_calls, toolkit, messages)
+        messages = await self._aprocess_tool_calls(tool_calls, toolkit, messages)
 
         # Extract tool messages for the conversation
         tool_messages = [
@@ -474,38 +415,15 @@ class OpenAIToolModel(ToolLLMBase):
         payload["stream"] = True
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
-
-        message_content = ""
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                self.BASE_URL, headers=self._headers, json=payload
-            )
-            response.raise_for_status()
-
-            async for line in response.aiter_lines():
-                if not line or line == "data: [DONE]":
-                    continue
-
-                if line.startswith("data: "):
-                    json_str = line.replace("data: ", "")
-                    try:
-                        if json_str:
-                            chunk = json.loads(json_str)
-                            if (
-                                "choices" in chunk
-                                and chunk["choices"]
-                                and "delta" in chunk["choices"][0]
-                                and "content" in chunk["choices"][0]["delta"]
-                            ):
-                                delta = chunk["choices"][0]["delta"]["content"]
-                                message_content += delta
-                                yield delta
-                    except json.JSONDecodeError:
-                        pass
+        reader = ChatCompletionStream()
+        async with self._async_http_client(timeout=self.timeout) as client:
+            async for delta in reader.astream(
+                client, self.BASE_URL, headers=self._headers, json=payload
+            ):
+                yield delta
 
         # Add the final agent message to the conversation
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -563,20 +481,18 @@ class OpenAIToolModel(ToolLLMBase):
         Returns:
             List[IConversation]: List of updated conversations with generated responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv) -> IConversation:
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    tool_choice=tool_choice,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                tool_choice=tool_choice,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
@@ -1,8 +1,5 @@
-import asyncio
-import json
 from typing import Any, AsyncIterator, Dict, Iterator, List, Type
 
-import httpx
 from swarmauri_base.ComponentBase import ComponentBase
 from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_base.schema_converters.SchemaConverterBase import SchemaConverterBase
@@ -14,6 +11,7 @@ from swarmauri_standard.messages.FunctionMessage import FunctionMessage
 from swarmauri_standard.schema_converters.OpenAISchemaConverter import (
     OpenAISchemaConverter,
 )
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type()
@@ -36,8 +34,7 @@ class ToolLLM(ToolLLMBase):
         return OpenAISchemaConverter()
 
     def _schema_convert_tools(self, tools) -> List[Dict[str, Any]]:
-        converter = self.get_schema_converter()
-        return [converter.convert(tools[tool]) for tool in tools]
+        return self.get_schema_converter().convert_tools(tools)
 
     def _format_messages(
         self, messages: List[Type[MessageBase]]
@@ -49,38 +46,6 @@ class ToolLLM(ToolLLMBase):
             if m.role != "tool"
         ]
 
-    def _process_tool_calls(self, tool_calls, toolkit, messages) -> List[MessageBase]:
-        """
-        Processes a list of tool calls and appends the results to the messages list.
-
-        Args:
-            tool_calls (list): A list of dictionaries representing tool calls. Each dictionary should contain
-                               a "function" key with a nested dictionary that includes the "name" and "arguments"
-                               of the function to be called, and an "id" key for the tool call identifier.
-            toolkit (object): An object that provides access to tools via the `get_tool_by_name` method.
-            messages (list): A list of message dictionaries to which the results of the tool calls will be appended.
-
-        Returns:
-            List[MessageBase]: The updated list of messages with the results of the tool calls appended.
-        """
-        if tool_calls:
-            for tool_call in tool_calls:
-                func_name = tool_call["function"]["name"]
-
-                func_call = toolkit.get_tool_by_name(func_name)
-                func_args = json.loads(tool_call["function"]["arguments"])
-                func_result = func_call(**func_args)
-
-                messages.append(
-                    {
-                        "tool_call_id": tool_call["id"],
-                        "role": "tool",
-                        "name": func_name,
-                        "content": json.dumps(func_result),
-                    }
-                )
-        return messages
-
     def predict(
         self,
         conversation: IConversation,
@@ -103,17 +68,17 @@ class ToolLLM(ToolLLMBase):
         Returns:
             IConversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice or "auto",
         }
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(self.BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
             tool_response = response.json()
@@ -138,7 +103,7 @@ class ToolLLM(ToolLLMBase):
             payload.pop("tools", None)
             payload.pop("tool_choice", None)
 
-            with httpx.Client(timeout=self.timeout) as client:
+            with self._http_client(timeout=self.timeout) as client:
                 response = client.post(
                     self.BASE_URL, headers=self._headers, json=payload
                 )
@@ -174,17 +139,17 @@ class ToolLLM(ToolLLMBase):
         Returns:
             IConversation: Updated conversation with agent responses and tool calls.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else None,
+            "tools": self._schema_convert_tools(toolkit) if toolkit else None,
             "tool_choice": tool_choice or "auto",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 self.BASE_URL, headers=self._headers, json=payload
             )
@@ -193,7 +158,7 @@ class ToolLLM(ToolLLMBase):
 
         messages = [formatted_messages[-1], tool_response["choices"][0]["message"]]
         tool_calls = tool_response["choices"][0]["message"].get("tool_calls", [])
-        messages = self._process_tool_calls(tool_calls, toolkit, messages)
+        messages = await self._aprocess_tool_calls(tool_calls, toolkit, messages)
 
         # Add tool messages to Conversation to enable Conversation hooks
         tool_messages = [
@@ -211,7 +176,7 @@ class ToolLLM(ToolLLMBase):
             payload.pop("tools", None)
             payload.pop("tool_choice", None)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._async_http_client(timeout=self.timeout) as client:
                 response = await client.post(
                     self.BASE_URL, headers=self._headers, json=payload
                 )
@@ -247,18 +212,18 @@ class ToolLLM(ToolLLMBase):
             Iterator[str]: Streamed response content.
         """
 
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice or "auto",
         }
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with self._http_client(timeout=self.timeout) as client:
             response = client.post(self.BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
 
@@ -274,25 +239,14 @@ class ToolLLM(ToolLLMBase):
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(self.BASE_URL, headers=self._headers, json=payload)
-            response.raise_for_status()
-
-        message_content = ""
-
-        for line in response.iter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
+        reader = ChatCompletionStream()
+        with self._http_client(timeout=self.timeout) as client:
+            yield from reader.stream(
+                client, self.BASE_URL, headers=self._headers, json=payload
+            )
 
-        conversation.add_message(AgentMessage(content=message_content))
+        # Add the final agent message to the conversation
+        conversation.add_message(AgentMessage(content=reader.content))
 
     async def astream(
         self,
@@ -315,18 +269,18 @@ class ToolLLM(ToolLLMBase):
         Yields:
             AsyncIterator[str]: Streamed response content.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
 
         payload = {
             "model": self.name,
             "messages": formatted_messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "tools": self._schema_convert_tools(toolkit.tools) if toolkit else [],
+            "tools": self._schema_convert_tools(toolkit) if toolkit else [],
             "tool_choice": tool_choice or "auto",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._async_http_client(timeout=self.timeout) as client:
             response = await client.post(
                 self.BASE_URL, headers=self._headers, json=payload
             )
@@ -337,32 +291,22 @@ class ToolLLM(ToolLLMBase):
         messages = [formatted_messages[-1], tool_response["choices"][0]["message"]]
         tool_calls = tool_response["choices"][0]["message"].get("tool_calls", [])
 
-        messages = self._process_tool_calls(tool_calls, toolkit, messages)
+        messages = await self._aprocess_tool_calls(tool_calls, toolkit, messages)
 
         payload["messages"] = messages
         payload["stream"] = True
         payload.pop("tools", None)
         payload.pop("tool_choice", None)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            agent_response = await client.post(
-                self.BASE_URL, headers=self._headers, json=payload
-            )
-            agent_response.raise_for_status()
-
-        message_content = ""
-        async for line in agent_response.aiter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-        conversation.add_message(AgentMessage(content=message_content))
+        reader = ChatCompletionStream()
+        async with self._async_http_client(timeout=self.timeout) as client:
+            async for delta in reader.astream(
+                client, self.BASE_URL, headers=self._headers, json=payload
+            ):
+                yield delta
+
+        # Add the final agent message to the conversation
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -421,20 +365,18 @@ class ToolLLM(ToolLLMBase):
         Returns:
             List[IConversation]: List of updated conversations with model responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv):
-            async with semaphore:
-                return await self.apredict(
-                    conv,
-                    toolkit=toolkit,
-                    tool_choice=tool_choice,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+            return await self.apredict(
+                conv,
+                toolkit=toolkit,
+                tool_choice=tool_choice,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
 
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
 
     def get_allowed_models(self) -> List[str]:
         """
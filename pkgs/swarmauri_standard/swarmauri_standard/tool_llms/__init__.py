@@ -0,0 +1,16 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of tool llms modules and the class each one exports
+tool_llms_files = [
+    ("swarmauri_standard.tool_llms.AnthropicToolModel", "AnthropicToolModel"),
+    ("swarmauri_standard.tool_llms.CohereToolModel", "CohereToolModel"),
+    ("swarmauri_standard.tool_llms.DeepInfraToolModel", "DeepInfraToolModel"),
+    ("swarmauri_standard.tool_llms.GeminiToolModel", "GeminiToolModel"),
+    ("swarmauri_standard.tool_llms.GroqToolModel", "GroqToolModel"),
+    ("swarmauri_standard.tool_llms.MistralToolModel", "MistralToolModel"),
+    ("swarmauri_standard.tool_llms.OpenAIToolModel", "OpenAIToolModel"),
+    ("swarmauri_standard.tool_llms.ToolLLM", "ToolLLM"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, tool_llms_files)
@@ -1,14 +1,10 @@
-# from swarmauri_standard.utils._lazy_import import _lazy_import
+from swarmauri_standard.utils._lazy_import import _lazy_package
 
-# # List of toolkit names (file names without the ".py" extension) and corresponding class names
-# toolkit_files = [
-#     ("swarmauri_standard.toolkits.AccessibilityToolkit", "AccessibilityToolkit"),
-#     ("swarmauri_standard.toolkits.Toolkit", "Toolkit"),
-# ]
+# List of toolkits modules and the class each one exports
+toolkits_files = [
+    ("swarmauri_standard.toolkits.AccessibilityToolkit", "AccessibilityToolkit"),
+    ("swarmauri_standard.toolkits.Toolkit", "Toolkit"),
+]
 
-# # Lazy loading of toolkit modules, storing them in variables
-# for module_name, class_name in toolkit_files:
-#     globals()[class_name] = _lazy_import(module_name, class_name)
-
-# # Adding the lazy-loaded toolkit modules to __all__
-# __all__ = [class_name for _, class_name in toolkit_files]
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, toolkits_files)
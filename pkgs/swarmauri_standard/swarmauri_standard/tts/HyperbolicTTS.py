@@ -1,6 +1,5 @@
 import base64
 import os
-import httpx
 import asyncio
 from typing import List, Literal, Dict, Optional
 from pydantic import PrivateAttr, Field, SecretStr
@@ -82,7 +81,7 @@ class HyperbolicTTS(TTSBase):
         """
         payload = self._prepare_payload(text)
 
-        with httpx.Client(timeout=30) as client:
+        with self._http_client(timeout=30) as client:
             response = client.post(self._BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
 
@@ -100,7 +99,7 @@ class HyperbolicTTS(TTSBase):
         """
         payload = self._prepare_payload(text)
 
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._async_http_client(timeout=30) as client:
             response = await client.post(
                 self._BASE_URL, headers=self._headers, json=payload
             )
@@ -88,7 +88,7 @@ class OpenaiTTS(TTSBase):
         """
         payload = {"model": self.name, "voice": self.voice, "input": text}
 
-        with httpx.Client(timeout=30) as client:
+        with self._http_client(timeout=30) as client:
             response = client.post(self._BASE_URL, headers=self._headers, json=payload)
             response.raise_for_status()
 
@@ -108,7 +108,7 @@ class OpenaiTTS(TTSBase):
         """
         payload = {"model": self.name, "voice": self.voice, "input": text}
 
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._async_http_client(timeout=30) as client:
             response = await client.post(
                 self._BASE_URL, headers=self._headers, json=payload
             )
@@ -136,7 +136,7 @@ class OpenaiTTS(TTSBase):
         }
 
         try:
-            with httpx.Client(timeout=30) as client:
+            with self._http_client(timeout=30) as client:
                 response = client.post(
                     self._BASE_URL, headers=self._headers, json=payload
                 )
@@ -168,7 +168,7 @@ class OpenaiTTS(TTSBase):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with self._async_http_client(timeout=30) as client:
                 response = await client.post(
                     self._BASE_URL, headers=self._headers, json=payload
                 )
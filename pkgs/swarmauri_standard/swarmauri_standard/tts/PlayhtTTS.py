@@ -96,7 +96,7 @@ class PlayhtTTS(TTSBase):
 
         self._headers["accept"] = "application/json"
 
-        with httpx.Client(base_url=self._BASE_URL, timeout=30) as client:
+        with self._http_client(base_url=self._BASE_URL, timeout=30) as client:
             voice_response = client.get("/voices", headers=self._headers)
 
         for item in json.loads(voice_response.text):
@@ -170,7 +170,7 @@ class PlayhtTTS(TTSBase):
         }
 
         try:
-            with httpx.Client(base_url=self._BASE_URL, timeout=30) as self._client:
+            with self._http_client(base_url=self._BASE_URL, timeout=30) as self._client:
                 response = self._client.post(
                     "/tts/stream", json=payload, headers=self._headers
                 )
@@ -203,7 +203,7 @@ class PlayhtTTS(TTSBase):
         }
 
         try:
-            async with httpx.AsyncClient(
+            async with self._async_http_client(
                 base_url=self._BASE_URL, timeout=30
             ) as async_client:
                 response = await async_client.post(
@@ -270,7 +270,7 @@ class PlayhtTTS(TTSBase):
         self._headers["accept"] = "application/json"
 
         try:
-            with httpx.Client(base_url=self._BASE_URL) as client:
+            with self._http_client(base_url=self._BASE_URL) as client:
                 response = client.post(
                     "/cloned-voices/instant",
                     data=payload,
@@ -305,7 +305,7 @@ class PlayhtTTS(TTSBase):
         self._headers["accept"] = "application/json"
 
         try:
-            with httpx.Client(base_url=self._BASE_URL) as client:
+            with self._http_client(base_url=self._BASE_URL) as client:
                 response = client.post(
                     "/cloned-voices/instant", data=payload, headers=self._headers
                 )
@@ -329,7 +329,7 @@ class PlayhtTTS(TTSBase):
         self._headers["accept"] = "application/json"
 
         try:
-            with httpx.Client(base_url=self._BASE_URL) as client:
+            with self._http_client(base_url=self._BASE_URL) as client:
                 response = client.delete(
                     "/cloned-voices", json=payload, headers=self._headers
                 )
@@ -350,7 +350,7 @@ class PlayhtTTS(TTSBase):
         self._headers["accept"] = "application/json"
 
         try:
-            with httpx.Client(base_url=self._BASE_URL) as client:
+            with self._http_client(base_url=self._BASE_URL) as client:
                 response = client.get("/cloned-voices", headers=self._headers)
                 response.raise_for_status()
 
@@ -0,0 +1,11 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of tts modules and the class each one exports
+tts_files = [
+    ("swarmauri_standard.tts.HyperbolicTTS", "HyperbolicTTS"),
+    ("swarmauri_standard.tts.OpenaiTTS", "OpenaiTTS"),
+    ("swarmauri_standard.tts.PlayhtTTS", "PlayhtTTS"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, tts_files)
@@ -1,5 +1,7 @@
 import importlib
 
+from swarmauri_standard.utils._lazy_import import _lazy_export
+
 
 def get_classes_from_module(module_name: str):
     """
@@ -23,7 +25,8 @@ def get_classes_from_module(module_name: str):
 
         # Create a dictionary with class names and their corresponding class objects
         classes_dict = {
-            class_name: getattr(module, class_name) for class_name in class_names
+            class_name: _lazy_export(module, class_name)
+            for class_name in class_names
         }
 
         return classes_dict
@@ -60,7 +63,7 @@ def get_class_from_module(module_name: str, class_name: str):
 
         for cls_name in class_names:
             if cls_name == class_name:
-                return getattr(module, class_name)
+                return _lazy_export(module, class_name)
         return None
 
     except ImportError as e:
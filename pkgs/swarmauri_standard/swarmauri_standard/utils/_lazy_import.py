@@ -1,4 +1,8 @@
 import importlib
+import pkgutil
+import sys
+from types import ModuleType
+from typing import Any, Dict, List, Tuple
 
 
 # Define a lazy loader function with a warning message if the module or class is not found
@@ -20,3 +24,78 @@ def _lazy_import(module_name, class_name):
             f"Warning: The class '{class_name}' was not found in module '{module_name}'."
         )
         return None
+
+
+def _lazy_package(package_name: str, files: List[Tuple[str, str]]) -> None:
+    """
+    Makes ``package_name`` export ``files``, a list of (module name, class
+    name) pairs, through a module-level ``__getattr__`` (PEP 562), and sets
+    its ``__all__``.
+
+    Each exported class is looked up in ``_lazy_exports`` (class name ->
+    module name) and its module is only imported, and its class registered
+    with ``DynamicBase``, on first attribute access. The class is then bound
+    on the package, as an eager ``from .Name import Name`` would bind it. A
+    submodule imported directly (``import package.Name``) keeps the binding
+    the import system gives it, so ``package.Name`` is then the module.
+    """
+    package = sys.modules[package_name]
+    exports: Dict[str, str] = {
+        class_name: module_name for module_name, class_name in files
+    }
+
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+        value = _lazy_export(package, name)
+        # Cache it so that later lookups skip __getattr__.
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(package)) | set(exports))
+
+    package.__getattr__ = __getattr__
+    package.__dir__ = __dir__
+    package._lazy_exports = exports
+    package.__all__ = list(exports)
+
+
+def _lazy_export(package: ModuleType, name: str) -> Any:
+    """
+    Returns the class ``package`` exports as ``name``.
+
+    Unlike ``getattr(package, name)``, this still returns the class after
+    ``package.name`` has been bound to the submodule of the same name.
+    """
+    module_name = getattr(package, "_lazy_exports", {}).get(name)
+    if module_name is None:
+        return getattr(package, name)
+    return getattr(importlib.import_module(module_name), name)
+
+
+def _load_type(type_name: str) -> bool:
+    """
+    Imports every ``swarmauri_standard`` class exported as ``type_name``.
+
+    Registered with ``DynamicBase`` as a type resolver, so that a
+    discriminated union can load a component it has not seen yet.
+
+    Returns:
+        bool: True if a class was imported.
+    """
+    import swarmauri_standard
+
+    loaded = False
+    for info in pkgutil.iter_modules(swarmauri_standard.__path__):
+        if not info.ispkg:
+            continue
+        package = importlib.import_module(f"swarmauri_standard.{info.name}")
+        if type_name not in getattr(package, "_lazy_exports", {}):
+            continue
+        try:
+            _lazy_export(package, type_name)
+        except ImportError:
+            continue
+        loaded = True
+    return loaded
@@ -0,0 +1,155 @@
+import inspect
+import re
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
+
+_CHUNK = re.compile(r"\S+\s*|\s+")
+
+
+def describe_request(
+    self, signature: inspect.Signature, args: tuple, kwargs: dict
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Returns the conversation of a call and the request it describes: the
+    formatted messages and the sampling parameters.
+    """
+    bound = signature.bind(self, *args, **kwargs)
+    bound.apply_defaults()
+    params = dict(bound.arguments)
+    params.pop(next(iter(signature.parameters)))
+    conversation = params.pop(next(iter(params)), None)
+    for name, parameter in signature.parameters.items():
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            params.update(params.pop(name, None) or {})
+    # An unset option and its falsy default describe the same request, so
+    # predict and stream share entries.
+    params = {k: v for k, v in params.items() if v is not None and v is not False}
+    history = getattr(conversation, "history", None) or []
+    try:
+        if history and hasattr(self, "_format_history"):
+            # Reuses the payloads the conversation cached for earlier turns.
+            messages = self._format_history(conversation)
+        else:
+            messages = self._format_messages(history)
+    except (AttributeError, TypeError):
+        messages = [
+            message.model_dump(include={"role", "content", "name"})
+            for message in history
+        ]
+    return conversation, {"messages": messages, "params": params}
+
+
+def _lookup(self, signature: inspect.Signature, args: tuple, kwargs: dict):
+    if getattr(self, "response_cache", None) is None:
+        return None, None, None
+    conversation, request = describe_request(self, signature, args, kwargs)
+    if not self._cacheable(request["params"].get("temperature")):
+        return conversation, None, None
+    key = self._response_cache_key(request)
+    return conversation, key, self.response_cache.get(key)
+
+
+def _add_cached_message(conversation, entry: Dict[str, Any]) -> None:
+    usage = dict(entry.get("usage") or {})
+    usage.update(prompt_time=0.0, completion_time=0.0, total_time=0.0)
+    usage.pop("time_to_first_token", None)
+    conversation.add_message(
+        AgentMessage(content=entry["content"], usage=UsageData(**usage, cached=True))
+    )
+
+
+def _store(self, key: str, conversation, length: int) -> None:
+    history = conversation.history
+    if len(history) <= length or not isinstance(history[-1], AgentMessage):
+        return
+    message = history[-1]
+    if not isinstance(message.content, str):
+        return
+    usage = message.usage.model_dump(exclude_none=True) if message.usage else None
+    self.response_cache.set(key, {"content": message.content, "usage": usage})
+
+
+def _chunks(text: str) -> List[str]:
+    return _CHUNK.findall(text)
+
+
+def cache_response(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Serves ``predict``, ``apredict``, ``stream`` and ``astream`` of an
+    ``LLMBase`` from its ``response_cache``.
+
+    The cache key covers the provider, the model, the formatted messages
+    and the sampling parameters. A hit appends an ``AgentMessage`` whose
+    usage is marked ``cached``; stream methods replay the cached text in
+    word-sized chunks. Apply it above ``retry_on_status_codes`` so that
+    hits skip the retry logic.
+    """
+    signature = inspect.signature(func)
+    original = inspect.unwrap(func)
+
+    if inspect.isasyncgenfunction(original):
+
+        @wraps(func)
+        async def astream_wrapper(self, *args: Any, **kwargs: Any):
+            conversation, key, entry = _lookup(self, signature, args, kwargs)
+            if entry is not None:
+                for chunk in _chunks(entry["content"]):
+                    yield chunk
+                _add_cached_message(conversation, entry)
+                return
+            length = len(conversation.history) if key else 0
+            async for chunk in func(self, *args, **kwargs):
+                yield chunk
+            if key:
+                _store(self, key, conversation, length)
+
+        return astream_wrapper
+
+    if inspect.isgeneratorfunction(original):
+
+        @wraps(func)
+        def stream_wrapper(self, *args: Any, **kwargs: Any) -> Iterator[str]:
+            conversation, key, entry = _lookup(self, signature, args, kwargs)
+            if entry is not None:
+                yield from _chunks(entry["content"])
+                _add_cached_message(conversation, entry)
+                return
+            length = len(conversation.history) if key else 0
+            yield from func(self, *args, **kwargs)
+            if key:
+                _store(self, key, conversation, length)
+
+        return stream_wrapper
+
+    if inspect.iscoroutinefunction(original):
+
+        @wraps(func)
+        async def apredict_wrapper(self, *args: Any, **kwargs: Any):
+            conversation, key, entry = _lookup(self, signature, args, kwargs)
+            if entry is not None:
+                _add_cached_message(conversation, entry)
+                return conversation
+            length = len(conversation.history) if key else 0
+            result = await func(self, *args, **kwargs)
+            if key:
+                _store(self, key, conversation, length)
+            return result
+
+        return apredict_wrapper
+
+    @wraps(func)
+    def predict_wrapper(self, *args: Any, **kwargs: Any):
+        conversation, key, entry = _lookup(self, signature, args, kwargs)
+        if entry is not None:
+            _add_cached_message(conversation, entry)
+            return conversation
+        length = len(conversation.history) if key else 0
+        result = func(self, *args, **kwargs)
+        if key:
+            _store(self, key, conversation, length)
+        return result
+
+    return predict_wrapper
+
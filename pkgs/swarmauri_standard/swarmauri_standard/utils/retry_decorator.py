@@ -1,94 +1,138 @@
-import time
+import inspect
 import logging
-import httpx
+import threading
 from functools import wraps
-from typing import List, Callable, Any
-import asyncio
-import inspect
+from typing import Any, Callable, Dict, List, Tuple
+
+from swarmauri_base.RetryPolicyMixin import RetryPolicy
+
+# One policy per set of declared settings, shared by every decorated method,
+# so that its budgets and counters are kept per host rather than per method.
+_default_policies: Dict[Tuple[Any, ...], RetryPolicy] = {}
+_default_policies_lock = threading.Lock()
+
+
+def _default_policy(
+    status_codes: List[int], max_retries: int, retry_delay: float
+) -> RetryPolicy:
+    key = (frozenset(status_codes), max_retries, retry_delay)
+    with _default_policies_lock:
+        policy = _default_policies.get(key)
+        if policy is None:
+            policy = _default_policies[key] = RetryPolicy(
+                max_retries=max(max_retries - 1, 0),
+                base_delay=retry_delay,
+                retry_statuses=status_codes,
+                retry_transport_errors=False,
+                failure_threshold=None,
+            )
+        return policy
 
 
 def retry_on_status_codes(
     status_codes: List[int] = [429], max_retries: int = 3, retry_delay: int = 2
 ):
     """
-    A decorator to retry both sync and async functions when specific status codes are encountered,
-    with exponential backoff.
+    A decorator to retry both sync and async functions when specific status codes
+    are encountered.
+
+    ``max_retries`` counts attempts, the first included. Retries wait for the
+    provider's ``Retry-After`` hint or a decorrelated jitter delay starting at
+    ``retry_delay`` seconds, within a per-host retry budget; see
+    ``RetryPolicy``. When the decorated method belongs to a model with a
+    ``retry_policy``, that policy is used instead, including its circuit
+    breaker and counters. The last failure is raised unchanged.
+
+    Generator functions, sync or async, are retried until they yield their
+    first item; a failure after that is raised to the caller, since the
+    items already yielded cannot be taken back.
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        def resolve(args: tuple):
+            model = args[0] if args else None
+            policy = getattr(model, "retry_policy", None)
+            if not isinstance(policy, RetryPolicy):
+                policy = _default_policy(status_codes, max_retries, retry_delay)
+            host_of = getattr(model, "_retry_host", None)
+            host = host_of() if callable(host_of) else func.__qualname__
+            return policy, host
+
+        def log_failure(error: Exception) -> None:
+            logging.error(f"Request to {func.__name__} failed: {error}")
+
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            last_exception = None
-            attempt = 0
-            while attempt < max_retries:
-                try:
-                    return await func(*args, **kwargs)
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code in status_codes:
-                        attempt += 1
-                        last_exception = e
-                        if attempt == max_retries:
-                            break
-                        backoff_time = retry_delay * (2 ** (attempt - 1))
-                        logging.warning(
-                            f"Retry attempt {attempt}/{max_retries}: "
-                            f"Received HTTP {e.response.status_code} for {func.__name__}. "
-                            f"Retrying in {backoff_time:.2f} seconds. "
-                            f"Original error: {str(e)}"
-                        )
-                        await asyncio.sleep(backoff_time)
-                    else:
-                        raise
-
-            if last_exception:
-                error_message = (
-                    f"Request to {func.__name__} failed after {max_retries} retries. "
-                    f"Last encountered status code: {last_exception.response.status_code}. "
-                    f"Last error details: {str(last_exception)}"
-                )
-                logging.error(error_message)
-                raise Exception(error_message)
-            raise RuntimeError(
-                f"Unexpected error in retry mechanism for {func.__name__}"
-            )
+            policy, host = resolve(args)
+            try:
+                return await policy.acall(lambda: func(*args, **kwargs), host)
+            except Exception as e:
+                log_failure(e)
+                raise
 
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            last_exception = None
-            attempt = 0
-            while attempt < max_retries:
+            policy, host = resolve(args)
+            try:
+                return policy.call(lambda: func(*args, **kwargs), host)
+            except Exception as e:
+                log_failure(e)
+                raise
+
+        @wraps(func)
+        async def async_generator_wrapper(*args: Any, **kwargs: Any) -> Any:
+            async def start():
+                iterator = func(*args, **kwargs)
                 try:
-                    return func(*args, **kwargs)
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code in status_codes:
-                        attempt += 1
-                        last_exception = e
-                        if attempt == max_retries:
-                            break
-                        backoff_time = retry_delay * (2 ** (attempt - 1))
-                        logging.warning(
-                            f"Retry attempt {attempt}/{max_retries}: "
-                            f"Received HTTP {e.response.status_code} for {func.__name__}. "
-                            f"Retrying in {backoff_time:.2f} seconds. "
-                            f"Original error: {str(e)}"
-                        )
-                        time.sleep(backoff_time)
-                    else:
-                        raise
-
-            if last_exception:
-                error_message = (
-                    f"Request to {func.__name__} failed after {max_retries} retries. "
-                    f"Last encountered status code: {last_exception.response.status_code}. "
-                    f"Last error details: {str(last_exception)}"
-                )
-                logging.error(error_message)
-                raise Exception(error_message)
-            raise RuntimeError(
-                f"Unexpected error in retry mechanism for {func.__name__}"
-            )
+                    return iterator, [await iterator.__anext__()]
+                except StopAsyncIteration:
+                    return iterator, []
+
+            policy, host = resolve(args)
+            try:
+                iterator, head = await policy.acall(start, host)
+            except Exception as e:
+                log_failure(e)
+                raise
+            try:
+                for item in head:
+                    yield item
+                async for item in iterator:
+                    yield item
+            except Exception as e:
+                log_failure(e)
+                raise
+            finally:
+                await iterator.aclose()
+
+        @wraps(func)
+        def generator_wrapper(*args: Any, **kwargs: Any) -> Any:
+            def start():
+                iterator = func(*args, **kwargs)
+                try:
+                    return iterator, [next(iterator)]
+                except StopIteration:
+                    return iterator, []
+
+            policy, host = resolve(args)
+            try:
+                iterator, head = policy.call(start, host)
+            except Exception as e:
+                log_failure(e)
+                raise
+            try:
+                yield from head
+                yield from iterator
+            except Exception as e:
+                log_failure(e)
+                raise
+            finally:
+                iterator.close()
 
-        # Check if the function is async or sync and return appropriate wrapper
+        if inspect.isasyncgenfunction(func):
+            return async_generator_wrapper
+        if inspect.isgeneratorfunction(func):
+            return generator_wrapper
         return async_wrapper if inspect.iscoroutinefunction(func) else sync_wrapper
 
     return decorator
@@ -0,0 +1,85 @@
+import copy
+import inspect
+from functools import wraps
+from typing import Any, Callable
+
+from swarmauri_standard.utils.response_cache import describe_request
+
+
+def coalesce_predictions(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Coalesces concurrent identical calls to ``apredict`` of an ``LLMBase``.
+
+    Calls made while a call with the same formatted messages and sampling
+    parameters is in flight wait for it instead of sending their own
+    request, then append a copy of its answer to their own conversation.
+    Apply it above ``cache_response`` so that followers of a cache miss
+    also skip the cache lookup.
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    async def wrapper(self, *args: Any, **kwargs: Any):
+        if not self.coalesce:
+            return await func(self, *args, **kwargs)
+        conversation, request = describe_request(self, signature, args, kwargs)
+        if conversation is None or not self._coalescable(
+            request["params"].get("temperature")
+        ):
+            return await func(self, *args, **kwargs)
+
+        results = []
+
+        async def leader():
+            length = len(conversation.history)
+            results.append(await func(self, *args, **kwargs))
+            history = conversation.history
+            return history[-1] if len(history) > length else None
+
+        key = self._request_fingerprint(request)
+        message = await self.single_flight.ado(key, leader)
+        if results:
+            return results[0]
+        if message is None:
+            # The leader added nothing that could be shared.
+            return await func(self, *args, **kwargs)
+        conversation.add_message(message.model_copy(deep=True))
+        return conversation
+
+    return wrapper
+
+
+def coalesce_calls(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Coalesces concurrent identical calls to the method of an
+    ``EmbeddingBase`` that sends its upstream request.
+
+    Threads calling with the same arguments while such a call is in flight
+    wait for it and receive a copy of its result.
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(self, *args: Any, **kwargs: Any):
+        if not self._coalescable():
+            return func(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments.pop(next(iter(signature.parameters)))
+        request = {
+            "method": func.__name__,
+            "model": getattr(self, "model", None),
+            "arguments": arguments,
+        }
+        key = self._request_fingerprint(request)
+        calls = []
+
+        def leader():
+            calls.append(True)
+            return func(self, *args, **kwargs)
+
+        result = self.single_flight.do(key, leader)
+        return result if calls else copy.deepcopy(result)
+
+    return wrapper
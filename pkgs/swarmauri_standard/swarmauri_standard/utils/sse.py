@@ -0,0 +1,207 @@
+import json
+import time
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+DONE = "[DONE]"
+
+
+class SSEDecoder:
+    """
+    Incremental decoder for server-sent events.
+
+    Text is fed in chunks of any size, for example as it arrives from the
+    network; ``feed`` returns the ``data`` of every event the chunk
+    completes. A line may be split across chunks, ``\\r\\n``, ``\\r`` and
+    ``\\n`` line endings are accepted, the ``data`` lines of one event are
+    joined with ``\\n``, and comments and other fields are ignored. The
+    ``[DONE]`` sentinel of OpenAI-compatible APIs ends the stream.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._data: List[str] = []
+        self.done = False
+
+    def feed(self, text: str) -> List[str]:
+        if self.done:
+            return []
+        self._buffer += text
+        events = []
+        while True:
+            end = self._line_end()
+            if end is None:
+                break
+            line = self._buffer[:end]
+            skip = 2 if self._buffer.startswith("\r\n", end) else 1
+            self._buffer = self._buffer[end + skip :]
+            event = self._line(line)
+            if event is not None:
+                if event == DONE:
+                    self.done = True
+                    break
+                events.append(event)
+        return events
+
+    def flush(self) -> List[str]:
+        """
+        Completes the event left open when the stream ends without a
+        trailing blank line.
+        """
+        events = self.feed("\n") if self._buffer else []
+        if self._data:
+            # The blank line that dispatches the event.
+            events.extend(self.feed("\n"))
+        self._buffer = ""
+        self._data = []
+        return events
+
+    def _line_end(self) -> Optional[int]:
+        positions = [
+            i for i in (self._buffer.find("\n"), self._buffer.find("\r")) if i >= 0
+        ]
+        if not positions:
+            return None
+        end = min(positions)
+        # A trailing "\r" may be the first half of a "\r\n" still in flight.
+        if end == len(self._buffer) - 1 and self._buffer[end] == "\r":
+            return None
+        return end
+
+    def _line(self, line: str) -> Optional[str]:
+        if not line:
+            if not self._data:
+                return None
+            event = "\n".join(self._data)
+            self._data = []
+            return event
+        if line.startswith(":"):
+            return None
+        field, _, value = line.partition(":")
+        if field == "data":
+            self._data.append(value[1:] if value.startswith(" ") else value)
+        return None
+
+
+def iter_sse_data(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Yields the ``data`` of each event as soon as the chunk completing it
+    arrives.
+    """
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+        if decoder.done:
+            return
+    yield from decoder.flush()
+
+
+async def aiter_sse_data(chunks: AsyncIterable[str]) -> AsyncIterator[str]:
+    """
+    Asynchronous counterpart of ``iter_sse_data``.
+    """
+    decoder = SSEDecoder()
+    async for chunk in chunks:
+        for event in decoder.feed(chunk):
+            yield event
+        if decoder.done:
+            return
+    for event in decoder.flush():
+        yield event
+
+
+class ChatCompletionStream:
+    """
+    Reads a streamed OpenAI-compatible chat completion.
+
+    ``stream`` and ``astream`` send the request with ``client.stream`` and
+    yield each content delta as soon as its event arrives. Meanwhile the
+    reader accumulates the content and the usage reported by the provider,
+    and measures the time to the first token and the time from it to the
+    end of the stream.
+
+    Attributes:
+        content (str): The content received so far.
+        usage (Dict[str, Any]): The last ``usage`` object received.
+        time_to_first_token (Optional[float]): Seconds from sending the
+            request to the first content delta.
+        completion_time (Optional[float]): Seconds from the first content
+            delta to the end of the stream.
+    """
+
+    def __init__(self):
+        # Deltas are joined on demand, not appended to one growing string.
+        self._parts: List[str] = []
+        self.usage: Dict[str, Any] = {}
+        self.time_to_first_token: Optional[float] = None
+        self.completion_time: Optional[float] = None
+        self._start = 0.0
+
+    def stream(self, client: Any, url: str, **kwargs: Any) -> Iterator[str]:
+        self._start = time.perf_counter()
+        with client.stream("POST", url, **kwargs) as response:
+            response.raise_for_status()
+            for data in iter_sse_data(response.iter_text()):
+                delta = self._handle(data)
+                if delta:
+                    yield delta
+        self._finish()
+
+    async def astream(
+        self, client: Any, url: str, **kwargs: Any
+    ) -> AsyncIterator[str]:
+        self._start = time.perf_counter()
+        async with client.stream("POST", url, **kwargs) as response:
+            response.raise_for_status()
+            async for data in aiter_sse_data(response.aiter_text()):
+                delta = self._handle(data)
+                if delta:
+                    yield delta
+        self._finish()
+
+    @property
+    def content(self) -> str:
+        if len(self._parts) > 1:
+            self._parts[:] = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def usage_data(self) -> Dict[str, Any]:
+        """
+        The provider's usage with the measured ``time_to_first_token``, or an
+        empty dict if the provider reported no usage.
+        """
+        if not self.usage:
+            return {}
+        return {**self.usage, "time_to_first_token": self.time_to_first_token}
+
+    def _handle(self, data: str) -> Optional[str]:
+        try:
+            chunk = json.loads(data)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(chunk, dict):
+            return None
+        if chunk.get("usage"):
+            self.usage = chunk["usage"]
+        choices = chunk.get("choices") or []
+        delta = (choices[0].get("delta") or {}).get("content") if choices else None
+        if delta:
+            if self.time_to_first_token is None:
+                self.time_to_first_token = time.perf_counter() - self._start
+            self._parts.append(delta)
+        return delta
+
+    def _finish(self) -> None:
+        elapsed = time.perf_counter() - self._start
+        if self.time_to_first_token is None:
+            self.time_to_first_token = elapsed
+        self.completion_time = elapsed - self.time_to_first_token
+        self._parts = ["".join(self._parts)]
@@ -1,4 +1,11 @@
-from typing import List, Union, Literal
+import bisect
+import heapq
+import math
+from collections import Counter
+from typing import Dict, List, Union, Literal
+
+from pydantic import PrivateAttr
+
 from swarmauri_standard.documents.Document import Document
 from swarmauri_standard.embeddings.TfidfEmbedding import TfidfEmbedding
 from swarmauri_standard.distances.CosineDistance import CosineDistance
@@ -17,23 +24,98 @@ from swarmauri_base.ComponentBase import ComponentBase
 class TfidfVectorStore(
     VectorStoreSaveLoadMixin, VectorStoreRetrieveMixin, VectorStoreBase
 ):
+    """
+    In-memory TF-IDF vector store backed by an incrementally maintained
+    inverted index.
+
+    Each document is assigned a slot; the index keeps, per term, the postings
+    (slot -> term count) so that document frequencies are available as
+    ``len(postings[term])``. Adding, updating or deleting a document only
+    touches the postings of its own terms, and ``retrieve`` only scores the
+    documents that share at least one term with the query.
+
+    Scores are computed exactly as if ``TfidfEmbedding`` were fitted on the
+    query plus the whole corpus and compared with ``CosineDistance``, so the
+    ranking matches a full re-fit.
+    """
+
     type: Literal["TfidfVectorStore"] = "TfidfVectorStore"
 
+    _postings: Dict[str, Dict[int, int]] = PrivateAttr(default_factory=dict)
+    _doc_terms: Dict[int, Counter] = PrivateAttr(default_factory=dict)
+    _doc_lengths: Dict[int, int] = PrivateAttr(default_factory=dict)
+    _slots: List[int] = PrivateAttr(default_factory=list)
+    _next_slot: int = PrivateAttr(default=0)
+    _indexed_documents: List[Document] = PrivateAttr(default=None)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._embedder = TfidfEmbedding()
         self._distance = CosineDistance()
         self.documents = []
+        self._reset_index()
+
+    # ------------------------------------------------------------------
+    # Inverted index maintenance
+    # ------------------------------------------------------------------
+    def _reset_index(self) -> None:
+        self._postings = {}
+        self._doc_terms = {}
+        self._doc_lengths = {}
+        self._slots = []
+        self._next_slot = 0
+        self._indexed_documents = self.documents
+
+    def _index_document(self, document: Document, slot: int) -> None:
+        tokens = self._embedder.tokenize(document.content or "")
+        terms = Counter(tokens)
+        self._doc_terms[slot] = terms
+        self._doc_lengths[slot] = len(tokens)
+        for term, count in terms.items():
+            self._postings.setdefault(term, {})[slot] = count
+
+    def _unindex_document(self, slot: int) -> None:
+        for term in self._doc_terms.pop(slot, ()):
+            postings = self._postings[term]
+            del postings[slot]
+            if not postings:
+                del self._postings[term]
+        self._doc_lengths.pop(slot, None)
 
+    def _append_to_index(self, document: Document) -> None:
+        slot = self._next_slot
+        self._next_slot += 1
+        self._slots.append(slot)
+        self._index_document(document, slot)
+
+    def _ensure_index(self) -> None:
+        """
+        Rebuilds the index if ``documents`` was replaced or modified outside
+        of the store API (e.g. ``clear_documents`` or ``load_store``).
+        """
+        if self.documents is self._indexed_documents and len(self.documents) == len(
+            self._slots
+        ):
+            return
+        documents = self.documents
+        self._reset_index()
+        self._indexed_documents = documents
+        for document in documents:
+            self._append_to_index(document)
+
+    # ------------------------------------------------------------------
+    # Document management
+    # ------------------------------------------------------------------
     def add_document(self, document: Document) -> None:
+        self._ensure_index()
         self.documents.append(document)
-        # Recalculate TF-IDF matrix for the current set of documents
-        self._embedder.fit([doc.content for doc in self.documents])
+        self._append_to_index(document)
 
     def add_documents(self, documents: List[Document]) -> None:
-        self.documents.extend(documents)
-        # Recalculate TF-IDF matrix for the current set of documents
-        self._embedder.fit([doc.content for doc in self.documents])
+        self._ensure_index()
+        for document in documents:
+            self.documents.append(document)
+            self._append_to_index(document)
 
     def get_document(self, id: str) -> Union[Document, None]:
         for document in self.documents:
@@ -45,32 +127,96 @@ class TfidfVectorStore(
         return self.documents
 
     def delete_document(self, id: str) -> None:
-        self.documents = [doc for doc in self.documents if doc.id != id]
-        # Recalculate TF-IDF matrix for the current set of documents
-        self._embedder.fit([doc.content for doc in self.documents])
+        self._ensure_index()
+        for i in reversed(range(len(self.documents))):
+            if self.documents[i].id == id:
+                del self.documents[i]
+                self._unindex_document(self._slots.pop(i))
 
     def update_document(self, id: str, updated_document: Document) -> None:
+        self._ensure_index()
         for i, document in enumerate(self.documents):
             if document.id == id:
                 self.documents[i] = updated_document
+                # Reuse the slot so the document keeps its position in ties.
+                slot = self._slots[i]
+                self._unindex_document(slot)
+                self._index_document(updated_document, slot)
                 break
 
-        # Recalculate TF-IDF matrix for the current set of documents
-        self._embedder.fit([doc.content for doc in self.documents])
+    def clear_documents(self) -> None:
+        super().clear_documents()
+        self._reset_index()
 
+    # ------------------------------------------------------------------
+    # Retrieval
+    # ------------------------------------------------------------------
     def retrieve(self, query: str, top_k: int = 5) -> List[Document]:
-        documents = [query]
-        documents.extend([doc.content for doc in self.documents])
-        transform_matrix = self._embedder.fit_transform(documents)
-
-        # The inferred vector is the last vector in the transformed_matrix
-        # The rest of the matrix is what we are comparing
-        distances = self._distance.distances(
-            transform_matrix[-1], transform_matrix[:-1]
-        )
-
-        # Get the indices of the top_k most similar (least distant) documents
-        top_k_indices = sorted(range(len(distances)), key=lambda i: distances[i])[
-            :top_k
+        self._ensure_index()
+        if top_k <= 0 or not self.documents:
+            return []
+
+        query_tokens = self._embedder.tokenize(query)
+        query_terms = Counter(query_tokens)
+        # The query counts as one more document of the fitted corpus.
+        num_documents = len(self.documents) + 1
+
+        idf_cache: Dict[str, float] = {}
+
+        def idf(term: str) -> float:
+            value = idf_cache.get(term)
+            if value is None:
+                df = len(self._postings.get(term, ())) + (term in query_terms)
+                value = math.log(num_documents / df)
+                idf_cache[term] = value
+            return value
+
+        query_weights = {
+            term: count / len(query_tokens) * idf(term)
+            for term, count in query_terms.items()
+        }
+        query_norm = math.sqrt(sum(w * w for w in query_weights.values()))
+
+        ranked_slots: List[int] = []
+        if query_norm >= 1e-10:
+            dots: Dict[int, float] = {}
+            for term, weight in query_weights.items():
+                if weight == 0.0:
+                    continue
+                term_idf = idf(term)
+                for slot, count in self._postings.get(term, {}).items():
+                    tfidf = count / self._doc_lengths[slot] * term_idf
+                    dots[slot] = dots.get(slot, 0.0) + tfidf * weight
+
+            scored = []
+            for slot, dot in dots.items():
+                length = self._doc_lengths[slot]
+                doc_norm = math.sqrt(
+                    sum(
+                        (count / length * idf(term)) ** 2
+                        for term, count in self._doc_terms[slot].items()
+                    )
+                )
+                if doc_norm < 1e-10:
+                    continue
+                distance = 1 - dot / (query_norm * doc_norm)
+                if distance < 1.0:
+                    scored.append((distance, slot))
+            ranked_slots = [slot for _, slot in heapq.nsmallest(top_k, scored)]
+
+        # Every document without a shared term sits at the maximum distance of
+        # 1.0; ties are broken by insertion order, as with a stable sort.
+        # Slots are handed out in increasing order, so ``_slots`` stays sorted.
+        results = [
+            self.documents[bisect.bisect_left(self._slots, slot)]
+            for slot in ranked_slots
         ]
-        return [self.documents[i] for i in top_k_indices]
+        if len(results) < top_k:
+            chosen = set(ranked_slots)
+            for slot, document in zip(self._slots, self.documents):
+                if slot in chosen:
+                    continue
+                results.append(document)
+                if len(results) == top_k:
+                    break
+        return results
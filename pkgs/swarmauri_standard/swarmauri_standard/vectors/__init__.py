@@ -1,13 +1,9 @@
-# from swarmauri_standard.utils._lazy_import import _lazy_import
+from swarmauri_standard.utils._lazy_import import _lazy_package
 
-# # List of vectors names (file names without the ".py" extension) and corresponding class names
-# vectors_files = [
-#     ("swarmauri_standard.vectors.Vector", "Vector"),
-# ]
+# List of vectors modules and the class each one exports
+vectors_files = [
+    ("swarmauri_standard.vectors.Vector", "Vector"),
+]
 
-# # Lazy loading of vectorss, storing them in variables
-# for module_name, class_name in vectors_files:
-#     globals()[class_name] = _lazy_import(module_name, class_name)
-
-# # Adding the lazy-loaded vectorss to __all__
-# __all__ = [class_name for _, class_name in vectors_files]
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, vectors_files)
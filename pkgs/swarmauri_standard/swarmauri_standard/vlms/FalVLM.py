@@ -2,9 +2,9 @@ import asyncio
 import time
 from typing import Dict, List, Literal
 
-import httpx
 from pydantic import Field, PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import PooledClient
 from swarmauri_base.vlms.VLMBase import VLMBase
 
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
@@ -30,7 +30,7 @@ class FalVLM(VLMBase):
     """
 
     _BASE_URL: str = PrivateAttr("https://queue.fal.run")
-    _client: httpx.Client = PrivateAttr()
+    _client: PooledClient = PrivateAttr()
     _header: Dict[str, str] = PrivateAttr()
 
     allowed_models: List[str] = [
@@ -71,7 +71,7 @@ class FalVLM(VLMBase):
             "Content-Type": "application/json",
             "Authorization": f"Key {self.api_key.get_secret_value()}",
         }
-        self._client = httpx.Client(headers=self._headers, timeout=30)
+        self._client = self._http_client(headers=self._headers, timeout=30)
 
     @retry_on_status_codes((429, 529), max_retries=1)
     def _send_request(self, image_url: str, prompt: str, **kwargs) -> Dict:
@@ -113,7 +113,7 @@ class FalVLM(VLMBase):
         """
         url = f"{self._BASE_URL}/{self.name}"
         payload = {"image_url": image_url, "prompt": prompt, **kwargs}
-        async with httpx.AsyncClient(headers=self._headers, timeout=30) as client:
+        async with self._async_http_client(headers=self._headers, timeout=30) as client:
             response = await client.post(url, json=payload)
             response.raise_for_status()
             response_data = response.json()
@@ -150,7 +150,7 @@ class FalVLM(VLMBase):
             Dict: The status response.
         """
         url = f"{self._BASE_URL}/{self.name}/requests/{request_id}/status"
-        async with httpx.AsyncClient(headers=self._headers, timeout=30) as client:
+        async with self._async_http_client(headers=self._headers, timeout=30) as client:
             response = await client.get(url)
             response.raise_for_status()
             return response.json()
@@ -177,7 +177,7 @@ class FalVLM(VLMBase):
         for _ in range(self.max_retries):
             status_data = await self._async_check_status(request_id)
             if status_data.get("status") == "COMPLETED":
-                async with httpx.AsyncClient(
+                async with self._async_http_client(
                     headers=self._headers, timeout=30
                 ) as client:
                     response = await client.get(status_data.get("response_url"))
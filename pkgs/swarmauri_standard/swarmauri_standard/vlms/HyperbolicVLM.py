@@ -1,10 +1,8 @@
-import asyncio
-import json
 from typing import Any, AsyncGenerator, Dict, Generator, List, Literal, Optional, Type
 
-import httpx
 from pydantic import PrivateAttr, SecretStr
 from swarmauri_base.ComponentBase import ComponentBase
+from swarmauri_base.HttpClientMixin import PooledClient
 from swarmauri_base.messages.MessageBase import MessageBase
 from swarmauri_base.vlms.VLMBase import VLMBase
 
@@ -12,6 +10,7 @@ from swarmauri_standard.conversations.Conversation import Conversation
 from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
 from swarmauri_standard.utils.file_path_to_base64 import file_path_to_base64
 from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+from swarmauri_standard.utils.sse import ChatCompletionStream
 
 
 @ComponentBase.register_type(VLMBase, "HyperbolicVLM")
@@ -40,7 +39,7 @@ class HyperbolicVLM(VLMBase):
     type: Literal["HyperbolicVisionModel"] = "HyperbolicVisionModel"
     timeout: float = 600.0
     _headers: Dict[str, str] = PrivateAttr(default=None)
-    _client: httpx.Client = PrivateAttr(default=None)
+    _client: PooledClient = PrivateAttr(default=None)
     _BASE_URL: str = PrivateAttr(default="https://api.hyperbolic.xyz/v1/")
 
     def __init__(self, **data):
@@ -55,7 +54,7 @@ class HyperbolicVLM(VLMBase):
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key.get_secret_value()}",
         }
-        self._client = httpx.Client(
+        self._client = self._http_client(
             headers=self._headers,
             base_url=self._BASE_URL,
             timeout=self.timeout,
@@ -155,7 +154,7 @@ class HyperbolicVLM(VLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -199,7 +198,7 @@ class HyperbolicVLM(VLMBase):
         Returns:
             Conversation: Updated conversation with the model's response.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -209,7 +208,7 @@ class HyperbolicVLM(VLMBase):
             "stop": stop or [],
         }
 
-        async with httpx.AsyncClient() as async_client:
+        async with self._async_http_client() as async_client:
             response = await async_client.post(
                 f"{self._BASE_URL}chat/completions", json=payload, headers=self._headers
             )
@@ -246,7 +245,7 @@ class HyperbolicVLM(VLMBase):
         Yields:
             str: Partial response content from the model.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -257,23 +256,10 @@ class HyperbolicVLM(VLMBase):
             "stop": stop or [],
         }
 
-        response = self._client.post(self._BASE_URL, json=payload)
-        response.raise_for_status()
+        reader = ChatCompletionStream()
+        yield from reader.stream(self._client, self._BASE_URL, json=payload)
 
-        message_content = ""
-        for line in response.iter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     @retry_on_status_codes((429, 529), max_retries=1)
     async def astream(
@@ -297,7 +283,7 @@ class HyperbolicVLM(VLMBase):
         Yields:
             str: Partial response content from the model.
         """
-        formatted_messages = self._format_messages(conversation.history)
+        formatted_messages = self._format_history(conversation)
         payload = {
             "model": self.name,
             "messages": formatted_messages,
@@ -308,26 +294,17 @@ class HyperbolicVLM(VLMBase):
             "stop": stop or [],
         }
 
-        async with httpx.AsyncClient as async_client:
-            response = await async_client.post(
-                f"{self._BASE_URL}chat/completions", json=payload, headers=self._headers
-            )
-            response.raise_for_status()
+        reader = ChatCompletionStream()
+        async with self._async_http_client(timeout=self.timeout) as async_client:
+            async for delta in reader.astream(
+                async_client,
+                f"{self._BASE_URL}chat/completions",
+                json=payload,
+                headers=self._headers,
+            ):
+                yield delta
 
-        message_content = ""
-        async for line in response.aiter_lines():
-            json_str = line.replace("data: ", "")
-            try:
-                if json_str:
-                    chunk = json.loads(json_str)
-                    if chunk["choices"][0]["delta"]:
-                        delta = chunk["choices"][0]["delta"]["content"]
-                        message_content += delta
-                        yield delta
-            except json.JSONDecodeError:
-                pass
-
-        conversation.add_message(AgentMessage(content=message_content))
+        conversation.add_message(AgentMessage(content=reader.content))
 
     def batch(
         self,
@@ -385,17 +362,15 @@ class HyperbolicVLM(VLMBase):
         Returns:
             List[Conversation]: List of updated conversations with model responses.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def process_conversation(conv: Conversation) -> Conversation:
-            async with semaphore:
-                return await self.apredict_vision(
-                    conv,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    top_p=top_p,
-                    stop=stop,
-                )
-
-        tasks = [process_conversation(conv) for conv in conversations]
-        return await asyncio.gather(*tasks)
+            return await self.apredict_vision(
+                conv,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                stop=stop,
+            )
+
+        return await self._schedule(
+            conversations, process_conversation, max_concurrent, max_tokens
+        )
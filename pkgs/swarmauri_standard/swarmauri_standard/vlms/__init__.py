@@ -0,0 +1,11 @@
+from swarmauri_standard.utils._lazy_import import _lazy_package
+
+# List of vlms modules and the class each one exports
+vlms_files = [
+    ("swarmauri_standard.vlms.FalVLM", "FalVLM"),
+    ("swarmauri_standard.vlms.GroqVLM", "GroqVLM"),
+    ("swarmauri_standard.vlms.HyperbolicVLM", "HyperbolicVLM"),
+]
+
+# Each class is imported, and registered, only when it is first accessed
+_lazy_package(__name__, vlms_files)
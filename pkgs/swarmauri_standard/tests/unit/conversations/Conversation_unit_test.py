@@ -54,3 +54,37 @@ def test_remove_message():
     conversation.add_message(message2)
     conversation.remove_message(message1)
     assert message1 not in conversation.history
+
+
+@pytest.mark.unit
+def test_formatted_history_formats_each_message_once():
+    conversation = Conversation()
+    formatted = []
+
+    def format_messages(messages):
+        formatted.extend(messages)
+        return [m.model_dump(include=["content", "role"]) for m in messages]
+
+    first = HumanMessage(content="first")
+    second = HumanMessage(content="second")
+    conversation.add_messages([first, second])
+    assert conversation.formatted_history("provider", format_messages) == [
+        {"content": "first", "role": "user"},
+        {"content": "second", "role": "user"},
+    ]
+
+    conversation.add_message(HumanMessage(content="third"))
+    payload = conversation.formatted_history("provider", format_messages)
+    assert [p["content"] for p in payload] == ["first", "second", "third"]
+    assert len(formatted) == 3
+
+    # Payloads handed out are copies of the cached ones.
+    payload[0]["content"] = "changed"
+    second.content = "edited"
+    conversation.remove_message(first)
+    payload = conversation.formatted_history("provider", format_messages)
+    assert [p["content"] for p in payload] == ["edited", "third"]
+    assert len(formatted) == 4
+
+    conversation.formatted_history("other", format_messages)
+    assert len(formatted) == 6
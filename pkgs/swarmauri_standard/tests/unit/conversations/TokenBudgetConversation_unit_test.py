@@ -0,0 +1,96 @@
+import pytest
+from swarmauri_standard.messages.AgentMessage import AgentMessage
+from swarmauri_standard.messages.HumanMessage import HumanMessage
+from swarmauri_standard.messages.SystemMessage import SystemMessage
+
+from swarmauri_standard.conversations.TokenBudgetConversation import (
+    TokenBudgetConversation,
+)
+from swarmauri_base.ComponentBase import ResourceTypes
+
+
+@pytest.mark.unit
+def test_ubc_resource():
+    conversation = TokenBudgetConversation()
+    assert conversation.resource == ResourceTypes.CONVERSATION
+
+
+@pytest.mark.unit
+def test_ubc_type():
+    conversation = TokenBudgetConversation()
+    assert conversation.type == "TokenBudgetConversation"
+
+
+@pytest.mark.unit
+def test_serialization():
+    conversation = TokenBudgetConversation(max_tokens=100)
+    assert (
+        conversation.id
+        == TokenBudgetConversation.model_validate_json(
+            conversation.model_dump_json()
+        ).id
+    )
+
+
+@pytest.mark.unit
+def test_evicts_by_token_budget():
+    # Each message below is 2 content tokens plus 1 of overhead.
+    conversation = TokenBudgetConversation(max_tokens=9, message_overhead=1)
+    messages = [
+        HumanMessage(content="q1 q1 "),
+        AgentMessage(content="a1 a1 "),
+        HumanMessage(content="q2 q2 "),
+    ]
+    conversation.add_messages(messages)
+    assert list(conversation.history) == messages
+    assert conversation.total_tokens == 9
+
+    conversation.add_message(AgentMessage(content="a2 a2 "))
+    assert [m.content for m in conversation.history] == ["q2 q2 ", "a2 a2 "]
+    assert conversation.total_tokens == 6
+
+
+@pytest.mark.unit
+def test_window_starts_with_user_message_after_eviction():
+    conversation = TokenBudgetConversation(max_tokens=4, message_overhead=0)
+    conversation.add_message(HumanMessage(content="q" * 8))
+    conversation.add_message(AgentMessage(content="a" * 8))
+    conversation.add_message(AgentMessage(content="b" * 8))
+    # The latest user message and its replies are kept over the budget.
+    assert [m.content for m in conversation.history] == ["q" * 8, "a" * 8, "b" * 8]
+    assert conversation.total_tokens == 6
+
+    conversation.add_message(HumanMessage(content="q" * 40))
+    assert [m.content for m in conversation.history] == ["q" * 40]
+
+
+@pytest.mark.unit
+def test_system_context_counts_against_budget():
+    conversation = TokenBudgetConversation(
+        max_tokens=6, message_overhead=0, system_context="s" * 8
+    )
+    assert isinstance(conversation.history[0], SystemMessage)
+    conversation.add_messages(
+        [HumanMessage(content="q" * 8), AgentMessage(content="a" * 8)]
+    )
+    history = conversation.history
+    assert len(history) == 3
+    assert history[-1].content == "a" * 8
+    assert [m.content for m in reversed(history)][-1] == "s" * 8
+
+    conversation.add_message(HumanMessage(content="q" * 8))
+    assert [m.content for m in conversation.history[1:]] == ["q" * 8]
+    with pytest.raises(ValueError):
+        conversation.add_message(SystemMessage(content="system"))
+
+
+@pytest.mark.unit
+def test_remove_and_clear_update_token_count():
+    conversation = TokenBudgetConversation(message_overhead=0)
+    first = HumanMessage(content="q" * 8)
+    conversation.add_messages([first, AgentMessage(content="a" * 4)])
+    conversation.remove_message(first)
+    assert conversation.total_tokens == 1
+    conversation.clear_history()
+    assert conversation.total_tokens == 0
+    assert list(conversation.history) == []
@@ -27,3 +27,10 @@ def test_distance():
     assert (
         CanberraDistance().distance(Vector(value=[1, 2]), Vector(value=[1, 2])) == 0.0
     )
+
+
+@pytest.mark.unit
+def test_distance_skips_dimensions_that_are_zero_in_both_vectors():
+    assert CanberraDistance().distance(
+        Vector(value=[1, 0]), Vector(value=[3, 0])
+    ) == pytest.approx(0.5)
@@ -0,0 +1,50 @@
+import pytest
+from swarmauri_standard.distances.CanberraDistance import CanberraDistance
+from swarmauri_standard.distances.ChebyshevDistance import ChebyshevDistance
+from swarmauri_standard.distances.ChiSquaredDistance import ChiSquaredDistance
+from swarmauri_standard.distances.CosineDistance import CosineDistance
+from swarmauri_standard.distances.EuclideanDistance import EuclideanDistance
+from swarmauri_standard.distances.HaversineDistance import HaversineDistance
+from swarmauri_standard.distances.JaccardIndexDistance import JaccardIndexDistance
+from swarmauri_standard.distances.LevenshteinDistance import LevenshteinDistance
+from swarmauri_standard.distances.ManhattanDistance import ManhattanDistance
+from swarmauri_standard.distances.SorensenDiceDistance import SorensenDiceDistance
+from swarmauri_standard.distances.SquaredEuclideanDistance import (
+    SquaredEuclideanDistance,
+)
+from swarmauri_standard.vectors.Vector import Vector
+
+NUMERIC = ([[1, 2, 0], [0, 0, 0]], [[1, 2, 0], [3, -1, 2], [0, 0, 0], [2, 4, 1]])
+COORDINATES = (
+    [[52.2296756, 21.0122287], [41.8919300, 12.5113300]],
+    [[41.8919300, 12.5113300], [48.8566, 2.3522], [52.2296756, 21.0122287]],
+)
+STRINGS = ([[72, 105], [72, 101, 121]], [[72, 105], [104, 105], [72, 101, 121, 33]])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "distance_class, values",
+    [
+        (CanberraDistance, NUMERIC),
+        (ChebyshevDistance, NUMERIC),
+        (ChiSquaredDistance, NUMERIC),
+        (CosineDistance, NUMERIC),
+        (EuclideanDistance, NUMERIC),
+        (HaversineDistance, COORDINATES),
+        (JaccardIndexDistance, NUMERIC),
+        (LevenshteinDistance, STRINGS),
+        (ManhattanDistance, NUMERIC),
+        (SorensenDiceDistance, NUMERIC),
+        (SquaredEuclideanDistance, NUMERIC),
+    ],
+)
+def test_distances_matrix_matches_pairwise_distances(distance_class, values):
+    distance = distance_class()
+    vectors_a, vectors_b = ([Vector(value=v) for v in batch] for batch in values)
+    matrix = distance.distances_matrix(vectors_a, vectors_b)
+    assert matrix.shape == (len(vectors_a), len(vectors_b))
+    expected = [[distance.distance(a, b) for b in vectors_b] for a in vectors_a]
+    for row, expected_row in zip(matrix.tolist(), expected):
+        assert row == pytest.approx(expected_row)
+    assert distance.distances(vectors_a[0], vectors_b) == pytest.approx(expected[0])
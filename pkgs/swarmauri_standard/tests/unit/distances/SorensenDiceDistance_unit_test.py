@@ -28,3 +28,10 @@ def test_distance():
         SorensenDiceDistance().distance(Vector(value=[1, 2]), Vector(value=[1, 2]))
         == 0.0
     )
+
+
+@pytest.mark.unit
+def test_distance_compares_vector_values():
+    assert SorensenDiceDistance().distance(
+        Vector(value=[1, 0, 1]), Vector(value=[1, 1, 0])
+    ) == pytest.approx(0.5)
@@ -42,3 +42,30 @@ def test_infer_vector():
         0.0,
         0.0,
     ]
+
+
+@pytest.mark.unit
+def test_sparse_matches_dense():
+    documents = ["the quick brown fox", "the lazy dog", "quick quick fox", ""]
+    dense = TfidfEmbedding().fit_transform(documents)
+    sparse_embedder = TfidfEmbedding(sparse=True)
+    sparse = sparse_embedder.fit_transform(documents)
+    assert [v.value for v in sparse] == [v.value for v in dense]
+
+    matrix = sparse_embedder.fit_transform_sparse(documents)
+    assert matrix.shape == (4, len(sparse_embedder.extract_features()))
+    assert matrix.to_dense().tolist() == [v.value for v in dense]
+
+
+@pytest.mark.unit
+def test_transform_sparse():
+    embedder = TfidfEmbedding(sparse=True)
+    embedder.fit(["the quick brown fox", "the lazy dog", "quick quick fox"])
+    query = embedder.transform_sparse(["quick dog unknown"])
+    assert query.row(0).tolist() == embedder.transform(["quick dog unknown"])[0].value
+
+    matrix = embedder.fit_transform_sparse(
+        ["the quick brown fox", "the lazy dog", "quick quick fox"]
+    )
+    expected = matrix.to_dense() @ query.row(0)
+    assert matrix.dot(query.row(0)).tolist() == pytest.approx(expected.tolist())
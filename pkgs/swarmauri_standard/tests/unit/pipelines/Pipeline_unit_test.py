@@ -1,3 +1,5 @@
+import asyncio
+import time
 import pytest
 from swarmauri_standard.pipelines.Pipeline import Pipeline
 from swarmauri_core.pipelines.IPipeline import PipelineStatus
@@ -122,3 +124,94 @@ def test_pipeline_without_error_handler(pipeline):
     with pytest.raises(RuntimeError):
         pipeline.execute()
     assert pipeline.get_status() == PipelineStatus.FAILED
+
+
+def test_dag_execution_runs_independent_branches_concurrently():
+    """Test tasks receiving the outputs of the tasks they depend on"""
+
+    def slow(x):
+        time.sleep(0.2)
+        return x
+
+    async def aslow(x):
+        await asyncio.sleep(0.2)
+        return x * 10
+
+    with Pipeline(parallel=True) as pipeline:
+        first = pipeline.add_task(slow, 1)
+        second = pipeline.add_task(slow, 2)
+        third = pipeline.add_task(aslow, 3)
+        both = pipeline.add_task(lambda a, b: a + b, first, second)
+        pipeline.add_task(lambda a, b: a + b, both, b=third)
+        pipeline.add_task(pow, 2, 10).on("process")
+
+        for _ in range(2):
+            started = time.perf_counter()
+            assert pipeline.execute() == [1, 2, 30, 3, 33, 1024]
+            assert time.perf_counter() - started < 0.35
+
+        timings = pipeline.get_results(with_timings=True)
+        assert timings[2]["backend"] == "async"
+        assert timings[5]["backend"] == "process"
+        assert timings[0]["result"] == 1
+        assert timings[0]["duration"] >= 0.2
+
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_results_and_timings_are_set_when_execute_returns(monkeypatch, parallel):
+    """Test results and timings being stored before execute returns"""
+    record = Pipeline._record
+
+    def delayed_record(self, *args):
+        time.sleep(0.01)
+        record(self, *args)
+
+    monkeypatch.setattr(Pipeline, "_record", delayed_record)
+    with Pipeline(parallel=parallel) as pipeline:
+        first = pipeline.add_task(lambda: 1).on("thread")
+        pipeline.add_task(lambda a: a + 1, first).on("thread")
+        assert pipeline.execute() == [1, 2]
+        results = pipeline.get_results(with_timings=True)
+    assert [result["result"] for result in results] == [1, 2]
+    assert all(result["duration"] >= 0 for result in results)
+
+
+def test_streaming_between_tasks():
+    """Test consuming the items of a generator while it produces them"""
+    produced = []
+
+    def produce(n):
+        for i in range(n):
+            produced.append(i)
+            yield i
+
+    def consume(items):
+        seen = []
+        for item in items:
+            # The producer never runs more than the buffer ahead.
+            assert len(produced) - item <= 3
+            seen.append(item)
+        return seen
+
+    with Pipeline(parallel=True) as pipeline:
+        items = pipeline.add_task(produce, 50)
+        pipeline.add_task(consume, items.stream(maxsize=2))
+        pipeline.add_task(sum, items.stream())
+        assert pipeline.execute() == [None, list(range(50)), sum(range(50))]
+
+    sequential = Pipeline()
+    items = sequential.add_task(produce, 5)
+    sequential.add_task(list, items.stream())
+    assert sequential.execute()[1] == [0, 1, 2, 3, 4]
+
+
+def test_streamed_output_cannot_be_used_whole(mock_task):
+    """Test rejecting a task that needs the whole output of a stream"""
+    pipeline = Pipeline(parallel=True)
+    items = pipeline.add_task(range, 3)
+    pipeline.add_task(list, items.stream())
+    pipeline.add_task(mock_task, items)
+    with pytest.raises(RuntimeError):
+        pipeline.execute()
+    assert pipeline.get_status() == PipelineStatus.FAILED
@@ -0,0 +1,151 @@
+import asyncio
+import multiprocessing
+import sqlite3
+import threading
+import time
+
+import pytest
+from swarmauri_base.ComponentBase import ResourceTypes
+from swarmauri_standard.rate_limits.SharedTokenBucketRateLimit import (
+    SharedTokenBucketRateLimit,
+)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "bucket.sqlite")
+
+
+@pytest.fixture
+def rate_limit(path):
+    return SharedTokenBucketRateLimit(path=path, capacity=2, refill_rate=10)
+
+
+def _worker(path, duration, results):
+    limit = SharedTokenBucketRateLimit(path=path, capacity=5, refill_rate=50)
+    stamps = []
+    deadline = time.time() + duration
+    while time.time() < deadline:
+        if limit.acquire(timeout=deadline - time.time()):
+            stamps.append(limit.last_granted_at)
+    results.put(stamps)
+
+
+@pytest.mark.unit
+def test_ubc_resource(rate_limit):
+    assert rate_limit.resource == ResourceTypes.RATE_LIMIT.value
+
+
+@pytest.mark.unit
+def test_ubc_type(rate_limit):
+    assert rate_limit.type == "SharedTokenBucketRateLimit"
+
+
+@pytest.mark.unit
+def test_serialization(rate_limit):
+    assert (
+        rate_limit.id
+        == SharedTokenBucketRateLimit.model_validate_json(
+            rate_limit.model_dump_json()
+        ).id
+    )
+
+
+@pytest.mark.unit
+def test_instances_share_the_bucket(rate_limit, path):
+    other = SharedTokenBucketRateLimit(path=path, capacity=2, refill_rate=10)
+    assert rate_limit.allow()
+    assert other.allow()
+    assert not rate_limit.allow()
+    assert other.available_tokens() == 0
+    time.sleep(0.11)
+    assert other.allow()
+
+
+@pytest.mark.unit
+def test_last_granted_at_is_when_the_tokens_are_covered(rate_limit):
+    assert rate_limit.last_granted_at is None
+    before = time.time()
+    assert rate_limit.acquire(2)
+    assert before <= rate_limit.last_granted_at <= time.time()
+    reserved = time.time()
+    assert rate_limit.acquire()
+    assert rate_limit.last_granted_at == pytest.approx(reserved + 0.1, abs=0.05)
+
+
+@pytest.mark.unit
+def test_acquire_sleeps_until_tokens_are_refilled(rate_limit):
+    assert rate_limit.acquire(2)
+    start = time.monotonic()
+    assert rate_limit.acquire()
+    assert 0.08 <= time.monotonic() - start < 0.5
+    assert not rate_limit.acquire(2, timeout=0.05)
+    with pytest.raises(ValueError):
+        rate_limit.acquire(3)
+
+
+@pytest.mark.unit
+def test_aacquire_serves_waiters_in_turn(rate_limit):
+    async def main():
+        start = time.monotonic()
+        await asyncio.gather(*(rate_limit.aacquire() for _ in range(4)))
+        return time.monotonic() - start
+
+    assert 0.18 <= asyncio.run(main()) < 0.6
+
+
+@pytest.mark.unit
+def test_aacquire_waits_for_the_database_lock_off_the_loop(rate_limit, path):
+    rate_limit.available_tokens()
+    other = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    other.execute("BEGIN IMMEDIATE")
+    release = threading.Timer(0.3, other.execute, ("COMMIT",))
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        release.start()
+        acquired = await rate_limit.aacquire()
+        ticker.cancel()
+        return acquired, ticks
+
+    try:
+        acquired, ticks = asyncio.run(main())
+    finally:
+        release.join()
+        other.close()
+    assert acquired
+    assert ticks >= 10
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(60)
+def test_processes_never_exceed_the_shared_rate(path):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    duration = 1.0
+    workers = [
+        context.Process(target=_worker, args=(path, duration, results))
+        for _ in range(6)
+    ]
+    for worker in workers:
+        worker.start()
+    per_worker = [results.get(timeout=60) for _ in workers]
+    for worker in workers:
+        worker.join()
+
+    stamps = sorted(stamp for worker_stamps in per_worker for stamp in worker_stamps)
+    # Grant times are computed inside the bucket's transaction, so any
+    # window of t seconds holds at most capacity + refill_rate * t grants.
+    # The microsecond only covers the resolution of the float timestamps.
+    for i, start in enumerate(stamps):
+        for j in range(i, len(stamps)):
+            assert j - i + 1 <= 5 + 50 * (stamps[j] - start + 1e-6)
+    assert all(per_worker)
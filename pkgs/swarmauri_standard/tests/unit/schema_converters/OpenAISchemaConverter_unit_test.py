@@ -34,3 +34,29 @@ def test_convert():
     result = [Schema().convert(toolkit.tools[tool]) for tool in toolkit.tools]
     logging.info(result)
     assert json.loads(json.dumps(result))
+
+
+@pytest.mark.unit
+def test_convert_tools_memoized_per_version():
+    calls = []
+
+    class CountingSchema(Schema):
+        def convert(self, tool):
+            calls.append(tool.name)
+            return super().convert(tool)
+
+    toolkit = Toolkit()
+    toolkit.add_tool(AdditionTool())
+    first = CountingSchema().convert_tools(toolkit)
+    assert CountingSchema().convert_tools(toolkit) == first
+    assert len(calls) == 1
+    assert Schema().convert_tools(toolkit) == first
+    assert len(calls) == 1
+
+    toolkit.add_tool(AdditionTool(name="OtherAdditionTool"))
+    assert len(CountingSchema().convert_tools(toolkit)) == 2
+    assert len(calls) == 3
+    assert CountingSchema().convert_tools(toolkit.tools) == Schema().convert_tools(
+        toolkit
+    )
+    assert len(calls) == 5
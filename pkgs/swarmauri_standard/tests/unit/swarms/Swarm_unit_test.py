@@ -3,6 +3,7 @@ from typing import Any
 from pydantic import BaseModel
 import pytest
 import asyncio
+import time
 from swarmauri_base.swarms.SwarmBase import SwarmStatus
 from swarmauri_standard.swarms.Swarm import Swarm
 
@@ -100,3 +101,53 @@ async def test_swarm_status_changes(swarm):
     except asyncio.TimeoutError:
         task_future.cancel()
         raise
+
+
+class SleepingAgent(BaseModel):
+    async def process(self, task: Any, **kwargs) -> str:
+        await asyncio.sleep(0.2 if task % 2 else 0.05)
+        return task * 10
+
+
+class BlockingAgent(BaseModel):
+    def exec(self, task: Any, **kwargs) -> str:
+        time.sleep(0.2)
+        return task
+
+
+@pytest.mark.asyncio
+async def test_exec_runs_agents_concurrently_in_input_order():
+    swarm = Swarm(agent_class=SleepingAgent, num_agents=4, max_queue_size=1)
+    started = time.perf_counter()
+    results = await swarm.exec(list(range(8)))
+    elapsed = time.perf_counter() - started
+
+    assert [r["result"] for r in results] == [i * 10 for i in range(8)]
+    assert all(r["status"] == SwarmStatus.COMPLETED for r in results)
+    # Sequential processing would take 1s.
+    assert elapsed < 0.8
+    metrics = swarm.get_agent_metrics()
+    assert sum(m["tasks"] for m in metrics.values()) == 8
+    assert all(0 < m["utilization"] <= 1 for m in metrics.values())
+
+
+@pytest.mark.asyncio
+async def test_exec_offloads_blocking_agents():
+    swarm = Swarm(agent_class=BlockingAgent, num_agents=4)
+    started = time.perf_counter()
+    results = await swarm.exec(["a", "b", "c", "d"])
+    assert [r["result"] for r in results] == ["a", "b", "c", "d"]
+    assert time.perf_counter() - started < 0.6
+
+
+@pytest.mark.asyncio
+async def test_exec_reports_timeouts_and_errors():
+    swarm = Swarm(agent_class=SleepingAgent, agent_timeout=0.1, max_retries=2)
+    results = await swarm.exec([1, 2, "x"])
+    assert results[0]["status"] == SwarmStatus.FAILED
+    assert "timed out" in results[0]["error"]
+    assert results[1]["result"] == 20
+    assert results[2]["status"] == SwarmStatus.FAILED
+    metrics = swarm.get_agent_metrics()
+    assert sum(m["timeouts"] for m in metrics.values()) == 2
+    assert sum(m["failures"] for m in metrics.values()) == 2
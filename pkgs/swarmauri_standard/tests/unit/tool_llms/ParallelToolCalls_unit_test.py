@@ -0,0 +1,150 @@
+import asyncio
+import json
+import time
+from typing import Literal
+
+import pytest
+from swarmauri_base.tool_llms.ToolLLMBase import ToolLLMBase
+
+
+def lookup(query: str, delay: float = 0.1):
+    time.sleep(delay)
+    return f"result for {query}"
+
+
+async def alookup(query: str, delay: float = 0.1):
+    await asyncio.sleep(delay)
+    return f"async result for {query}"
+
+
+class DummyToolkit:
+    tools = {"lookup": lookup, "alookup": alookup}
+
+    def get_tool_by_name(self, name):
+        return self.tools[name]
+
+
+class DummyToolModel(ToolLLMBase):
+    type: Literal["DummyToolModel"] = "DummyToolModel"
+
+    def get_schema_converter(self):
+        raise NotImplementedError
+
+    def predict(self, *args, **kwargs):
+        raise NotImplementedError
+
+    async def apredict(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def stream(self, *args, **kwargs):
+        raise NotImplementedError
+
+    async def astream(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def batch(self, *args, **kwargs):
+        raise NotImplementedError
+
+    async def abatch(self, *args, **kwargs):
+        raise NotImplementedError
+
+
+def _tool_calls(name="lookup", count=4, delay=0.1):
+    return [
+        {
+            "id": f"call_{i}",
+            "function": {
+                "name": name,
+                "arguments": json.dumps({"query": f"q{i}", "delay": delay}),
+            },
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+def test_tool_calls_run_concurrently_in_call_order():
+    model = DummyToolModel(max_parallel_tools=4)
+    start = time.monotonic()
+    messages = model._process_tool_calls(_tool_calls(), DummyToolkit(), [])
+    assert time.monotonic() - start < 0.3
+    assert [m["tool_call_id"] for m in messages] == [f"call_{i}" for i in range(4)]
+    assert json.loads(messages[2]["content"]) == "result for q2"
+
+
+@pytest.mark.unit
+def test_tools_run_one_at_a_time_by_default():
+    model = DummyToolModel()
+    start = time.monotonic()
+    model._process_tool_calls(_tool_calls(count=3), DummyToolkit(), [])
+    assert time.monotonic() - start >= 0.3
+
+
+@pytest.mark.unit
+async def test_async_tools_are_awaited_alongside_sync_tools():
+    model = DummyToolModel(max_parallel_tools=4)
+    tool_calls = _tool_calls("alookup", 2) + _tool_calls("lookup", 2)
+    start = time.monotonic()
+    messages = await model._aprocess_tool_calls(tool_calls, DummyToolkit(), [])
+    assert time.monotonic() - start < 0.3
+    contents = [json.loads(m["content"]) for m in messages]
+    assert contents == [
+        "async result for q0",
+        "async result for q1",
+        "result for q0",
+        "result for q1",
+    ]
+
+
+@pytest.mark.unit
+async def test_slow_tools_time_out():
+    model = DummyToolModel(tool_timeout=0.05)
+    with pytest.raises(TimeoutError):
+        model._process_tool_calls(_tool_calls(count=2), DummyToolkit(), [])
+    with pytest.raises(TimeoutError):
+        await model._aprocess_tool_calls(
+            _tool_calls("alookup", 2), DummyToolkit(), []
+        )
+
+
+@pytest.mark.unit
+def test_each_tool_times_out_from_its_own_start():
+    model = DummyToolModel(tool_timeout=0.2)
+    results = model._run_tools(
+        [
+            (lookup, {"query": "q0", "delay": 0.15}),
+            (lookup, {"query": "q1", "delay": 0.3}),
+        ],
+        return_exceptions=True,
+    )
+    assert results[0] == "result for q0"
+    assert isinstance(results[1], TimeoutError)
+
+
+@pytest.mark.unit
+async def test_awaitable_results_are_bounded_by_the_timeout():
+    model = DummyToolModel(tool_timeout=0.05)
+
+    def deferred(query: str):
+        return alookup(query, delay=0.3)
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await model._arun_tools([(deferred, {"query": "q0"})])
+    assert time.monotonic() - start < 0.2
+
+
+@pytest.mark.unit
+def test_timed_out_tool_does_not_hold_up_queued_tools():
+    model = DummyToolModel(max_parallel_tools=1, tool_timeout=0.1)
+    start = time.monotonic()
+    results = model._run_tools(
+        [
+            (lookup, {"query": "q0", "delay": 0.5}),
+            (lookup, {"query": "q1", "delay": 0.05}),
+        ],
+        return_exceptions=True,
+    )
+    assert time.monotonic() - start < 0.3
+    assert isinstance(results[0], TimeoutError)
+    assert results[1] == "result for q1"
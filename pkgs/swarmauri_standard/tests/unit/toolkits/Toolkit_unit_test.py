@@ -33,3 +33,18 @@ def test_add_tool():
     tool = Tool()
     toolkit.add_tool(tool)
     assert len(toolkit.get_tools()) == 1
+
+
+@pytest.mark.unit
+def test_version_changes_with_tools():
+    toolkit = Toolkit()
+    version = toolkit.tools_version
+    toolkit.add_tool(Tool())
+    assert toolkit.tools_version > version
+    version = toolkit.tools_version
+    toolkit.remove_tool("AdditionTool")
+    assert toolkit.tools_version > version
+    version = toolkit.tools_version
+    with pytest.raises(ValueError):
+        toolkit.remove_tool("AdditionTool")
+    assert toolkit.tools_version == version
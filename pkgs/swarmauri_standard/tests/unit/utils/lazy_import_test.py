@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code: str) -> str:
+    """Runs ``code`` in a fresh interpreter and returns its stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.mark.unit
+def test_subpackage_import_is_lazy():
+    output = _run(
+        "import sys\n"
+        "import swarmauri_standard.llms as llms\n"
+        "loaded = [m for m in sys.modules if m.startswith('swarmauri_standard.llms.')]\n"
+        "print(len(loaded), 'OpenAIModel' in llms.__all__)"
+    )
+    assert output == "0 True"
+
+
+@pytest.mark.unit
+def test_class_loaded_on_first_access():
+    output = _run(
+        "import sys\n"
+        "from swarmauri_standard.distances import CosineDistance\n"
+        "from swarmauri_standard.distances import CosineDistance as again\n"
+        "print(CosineDistance.__name__, again is CosineDistance,\n"
+        "      'swarmauri_standard.distances.ManhattanDistance' in sys.modules)"
+    )
+    assert output == "CosineDistance True False"
+
+
+@pytest.mark.unit
+def test_directly_imported_submodule_stays_a_module():
+    output = _run(
+        "import types\n"
+        "import swarmauri_standard.distances.CosineDistance as module\n"
+        "import swarmauri_standard.distances as distances\n"
+        "from swarmauri_standard.utils._lazy_import import _lazy_export\n"
+        "print(isinstance(module, types.ModuleType),\n"
+        "      distances.CosineDistance is module,\n"
+        "      _lazy_export(distances, 'CosineDistance') is module.CosineDistance)"
+    )
+    assert output == "True True True"
+
+
+@pytest.mark.unit
+def test_union_loads_missing_type():
+    output = _run(
+        "from swarmauri_standard.conversations.Conversation import Conversation\n"
+        "from swarmauri_standard.agents.SimpleConversationAgent import (\n"
+        "    SimpleConversationAgent,\n"
+        ")\n"
+        "import swarmauri_standard.llms.GroqModel\n"
+        "agent = SimpleConversationAgent.model_validate(\n"
+        "    {'llm': {'type': 'DeepSeekModel', 'api_key': 'key'},\n"
+        "     'conversation': {'type': 'MaxSystemContextConversation'}}\n"
+        ")\n"
+        "print(type(agent.llm).__name__, type(agent.conversation).__name__)"
+    )
+    assert output == "DeepSeekModel MaxSystemContextConversation"
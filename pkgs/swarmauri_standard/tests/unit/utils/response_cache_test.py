@@ -0,0 +1,146 @@
+from typing import Literal
+
+import pytest
+from swarmauri_base.llms.LLMBase import LLMBase
+from swarmauri_base.ResponseCacheMixin import ResponseCache
+from swarmauri_standard.conversations.Conversation import Conversation
+from swarmauri_standard.messages.AgentMessage import AgentMessage, UsageData
+from swarmauri_standard.messages.HumanMessage import HumanMessage
+from swarmauri_standard.utils.response_cache import cache_response
+from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+
+
+class EchoModel(LLMBase):
+    """Answers with the last message and counts the upstream calls."""
+
+    type: Literal["EchoModel"] = "EchoModel"
+    calls: int = 0
+
+    def _format_messages(self, messages):
+        return [{"role": m.role, "content": m.content} for m in messages]
+
+    def _answer(self, conversation, max_tokens):
+        self.calls += 1
+        content = f"echo {conversation.history[-1].content} ({max_tokens})"
+        usage = UsageData(prompt_tokens=3, completion_tokens=4, total_tokens=7)
+        return AgentMessage(content=content, usage=usage)
+
+    @cache_response
+    @retry_on_status_codes((429,), max_retries=1)
+    def predict(self, conversation, temperature=0.0, max_tokens=16):
+        conversation.add_message(self._answer(conversation, max_tokens))
+        return conversation
+
+    @cache_response
+    async def apredict(self, conversation, temperature=0.0, max_tokens=16):
+        conversation.add_message(self._answer(conversation, max_tokens))
+        return conversation
+
+    @cache_response
+    @retry_on_status_codes((429,), max_retries=1)
+    def stream(self, conversation, temperature=0.0, max_tokens=16):
+        message = self._answer(conversation, max_tokens)
+        yield message.content
+        conversation.add_message(message)
+
+    @cache_response
+    async def astream(self, conversation, temperature=0.0, max_tokens=16):
+        message = self._answer(conversation, max_tokens)
+        yield message.content
+        conversation.add_message(message)
+
+    def batch(self, conversations, **kwargs):
+        return [self.predict(conversation, **kwargs) for conversation in conversations]
+
+    async def abatch(self, conversations, **kwargs):
+        return [await self.apredict(c, **kwargs) for c in conversations]
+
+
+def _conversation(text="hello there"):
+    conversation = Conversation()
+    conversation.add_message(HumanMessage(content=text))
+    return conversation
+
+
+@pytest.fixture
+def model():
+    return EchoModel(
+        name="echo", allowed_models=["echo"], response_cache=ResponseCache()
+    )
+
+
+@pytest.mark.unit
+def test_hit_appends_message_marked_cached(model):
+    first = model.predict(_conversation())
+    second = model.predict(_conversation())
+    assert model.calls == 1
+    assert second.history[-1].content == first.history[-1].content
+    assert second.history[-1].usage.cached is True
+    assert second.history[-1].usage.total_tokens == 7
+    assert first.history[-1].usage.cached is None
+
+
+@pytest.mark.unit
+def test_key_covers_messages_and_sampling_parameters(model):
+    model.predict(_conversation())
+    model.predict(_conversation("something else"))
+    model.predict(_conversation(), max_tokens=32)
+    assert model.calls == 3
+
+
+@pytest.mark.unit
+def test_sampled_requests_bypass_the_cache_unless_forced(model):
+    model.predict(_conversation(), temperature=0.7)
+    model.predict(_conversation(), temperature=0.7)
+    assert model.calls == 2
+    model.cache_sampled_responses = True
+    model.predict(_conversation(), temperature=0.7)
+    model.predict(_conversation(), temperature=0.7)
+    assert model.calls == 3
+
+
+@pytest.mark.unit
+def test_disabled_without_cache():
+    model = EchoModel(name="echo", allowed_models=["echo"])
+    model.predict(_conversation())
+    model.predict(_conversation())
+    assert model.calls == 2
+
+
+@pytest.mark.unit
+def test_stream_replays_cached_text(model):
+    model.predict(_conversation())
+    conversation = _conversation()
+    chunks = list(model.stream(conversation))
+    assert model.calls == 1
+    assert len(chunks) > 1
+    assert "".join(chunks) == "echo hello there (16)"
+    assert conversation.history[-1].usage.cached is True
+
+
+@pytest.mark.unit
+async def test_async_methods_share_the_cache(model):
+    list(model.stream(_conversation()))
+    conversation = await model.apredict(_conversation())
+    chunks = [chunk async for chunk in model.astream(_conversation())]
+    assert model.calls == 1
+    assert conversation.history[-1].usage.cached is True
+    assert "".join(chunks) == "echo hello there (16)"
+
+
+@pytest.mark.unit
+def test_key_reuses_the_formatted_history(model, monkeypatch):
+    formatted = []
+    format_messages = model._format_messages
+
+    def counting(messages):
+        formatted.append(len(messages))
+        return format_messages(messages)
+
+    monkeypatch.setattr(model, "_format_messages", counting)
+    conversation = _conversation()
+    model.predict(conversation)
+    conversation.add_message(HumanMessage(content="and again"))
+    model.predict(conversation)
+    # Earlier turns are not formatted again for the second key.
+    assert formatted == [1, 1, 1]
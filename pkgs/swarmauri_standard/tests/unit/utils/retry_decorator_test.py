@@ -0,0 +1,132 @@
+import httpx
+import pytest
+from swarmauri_base.RetryPolicyMixin import RetryPolicy, RetryPolicyMixin
+from swarmauri_standard.utils.retry_decorator import retry_on_status_codes
+
+
+def _status_error(status):
+    request = httpx.Request("GET", "https://api.example.com")
+    response = httpx.Response(status, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class FlakyClient(RetryPolicyMixin):
+    failures: int = 0
+    calls: int = 0
+
+    @retry_on_status_codes((429,), max_retries=1)
+    def fetch(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise _status_error(503)
+        return "ok"
+
+
+@pytest.mark.unit
+def test_final_failure_is_raised_unchanged():
+    calls = []
+
+    @retry_on_status_codes((429,), max_retries=3, retry_delay=0)
+    def fetch():
+        calls.append(1)
+        raise _status_error(429)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        fetch()
+    assert len(calls) == 3
+
+
+@pytest.mark.unit
+async def test_async_functions_are_retried():
+    calls = []
+
+    @retry_on_status_codes((429,), max_retries=2, retry_delay=0)
+    async def fetch():
+        calls.append(1)
+        if len(calls) == 1:
+            raise _status_error(429)
+        return "ok"
+
+    assert await fetch() == "ok"
+    assert len(calls) == 2
+
+
+@pytest.mark.unit
+def test_attached_policy_replaces_the_declared_settings():
+    client = FlakyClient(failures=1)
+    with pytest.raises(httpx.HTTPStatusError):
+        client.fetch()
+
+    policy = RetryPolicy(base_delay=0.0)
+    client = FlakyClient(failures=1, retry_policy=policy)
+    assert client.fetch() == "ok"
+    assert (policy.retries, policy.successes) == (1, 1)
+
+
+class Streamer(RetryPolicyMixin):
+    calls: int = 0
+
+    @retry_on_status_codes((429,), max_retries=2, retry_delay=0)
+    def stream(self):
+        self.calls += 1
+        if self.calls == 1:
+            raise _status_error(429)
+        yield "a"
+        yield "b"
+
+    @retry_on_status_codes((429,), max_retries=2, retry_delay=0)
+    async def astream(self):
+        self.calls += 1
+        if self.calls == 1:
+            raise _status_error(429)
+        yield "a"
+        yield "b"
+
+
+@pytest.mark.unit
+def test_generators_are_retried_until_their_first_item():
+    policy = RetryPolicy(base_delay=0.0)
+    streamer = Streamer(retry_policy=policy)
+    stream = streamer.stream()
+    assert streamer.calls == 0
+    assert list(stream) == ["a", "b"]
+    assert streamer.calls == 2
+    assert (policy.retries, policy.successes) == (1, 1)
+
+
+@pytest.mark.unit
+async def test_async_generators_are_retried_until_their_first_item():
+    policy = RetryPolicy(base_delay=0.0)
+    streamer = Streamer(retry_policy=policy)
+    assert [item async for item in streamer.astream()] == ["a", "b"]
+    assert streamer.calls == 2
+    assert (policy.retries, policy.successes) == (1, 1)
+
+
+class BudgetSharingClient(RetryPolicyMixin):
+    calls: int = 0
+
+    @retry_on_status_codes((418,), max_retries=8, retry_delay=0)
+    def first(self):
+        self.calls += 1
+        raise _status_error(418)
+
+    @retry_on_status_codes((418,), max_retries=8, retry_delay=0)
+    def second(self):
+        self.calls += 1
+        raise _status_error(418)
+
+
+@pytest.mark.unit
+def test_declared_settings_share_one_budget_per_host():
+    client = BudgetSharingClient()
+    with pytest.raises(httpx.HTTPStatusError):
+        client.first()
+    assert client.calls == 8
+
+    # Seven of the host's ten retries are spent; the second method gets the
+    # rest of the budget, not a budget of its own.
+    client.calls = 0
+    with pytest.raises(httpx.HTTPStatusError):
+        client.second()
+    assert client.calls < 8
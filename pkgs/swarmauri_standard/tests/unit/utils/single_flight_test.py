@@ -0,0 +1,142 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Literal
+
+import pytest
+from swarmauri_base.embeddings.EmbeddingBase import EmbeddingBase
+from swarmauri_base.llms.LLMBase import LLMBase
+from swarmauri_standard.conversations.Conversation import Conversation
+from swarmauri_standard.messages.AgentMessage import AgentMessage
+from swarmauri_standard.messages.HumanMessage import HumanMessage
+from swarmauri_standard.utils.single_flight import (
+    coalesce_calls,
+    coalesce_predictions,
+)
+from swarmauri_standard.vectors.Vector import Vector
+
+
+class SlowEchoModel(LLMBase):
+    """Answers with the last message after a delay and counts the calls."""
+
+    type: Literal["SlowEchoModel"] = "SlowEchoModel"
+    calls: int = 0
+
+    def _format_messages(self, messages):
+        return [{"role": m.role, "content": m.content} for m in messages]
+
+    def predict(self, conversation, temperature=0.0, max_tokens=16):
+        raise NotImplementedError
+
+    @coalesce_predictions
+    async def apredict(self, conversation, temperature=0.0, max_tokens=16):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        content = f"echo {conversation.history[-1].content}"
+        conversation.add_message(AgentMessage(content=content))
+        return conversation
+
+    def stream(self, conversation, temperature=0.0, max_tokens=16):
+        raise NotImplementedError
+
+    async def astream(self, conversation, temperature=0.0, max_tokens=16):
+        raise NotImplementedError
+
+    def batch(self, conversations, **kwargs):
+        raise NotImplementedError
+
+    async def abatch(self, conversations, **kwargs):
+        tasks = (self.apredict(c, **kwargs) for c in conversations)
+        return await asyncio.gather(*tasks)
+
+
+class SlowEmbedding(EmbeddingBase):
+    type: Literal["SlowEmbedding"] = "SlowEmbedding"
+    model: str = "slow"
+    calls: int = 0
+
+    @coalesce_calls
+    def infer_vector(self, data: List[str]) -> List[Vector]:
+        self.calls += 1
+        time.sleep(0.05)
+        return [Vector(value=[float(len(text))]) for text in data]
+
+    def transform(self, data):
+        return self.infer_vector(data)
+
+    def fit(self, documents, labels=None):
+        raise NotImplementedError
+
+    def fit_transform(self, documents, **kwargs):
+        raise NotImplementedError
+
+    def extract_features(self):
+        raise NotImplementedError
+
+    def save_model(self, path):
+        raise NotImplementedError
+
+    def load_model(self, path):
+        raise NotImplementedError
+
+
+def _conversation(text="hello there"):
+    conversation = Conversation()
+    conversation.add_message(HumanMessage(content=text))
+    return conversation
+
+
+@pytest.fixture
+def model():
+    return SlowEchoModel(name="echo", allowed_models=["echo"], coalesce=True)
+
+
+@pytest.mark.unit
+async def test_identical_concurrent_requests_share_one_call(model):
+    deduplicated = model.single_flight.deduplicated
+    conversations = [_conversation() for _ in range(4)]
+    results = await model.abatch(conversations)
+    assert model.calls == 1
+    assert model.single_flight.deduplicated - deduplicated == 3
+    for conversation, result in zip(conversations, results):
+        assert result is conversation
+        assert conversation.history[-1].content == "echo hello there"
+    assert conversations[0].history[-1] is not conversations[1].history[-1]
+
+
+@pytest.mark.unit
+async def test_distinct_requests_are_not_coalesced(model):
+    await model.abatch([_conversation(), _conversation("other")])
+    await asyncio.gather(
+        model.apredict(_conversation()), model.apredict(_conversation(), max_tokens=8)
+    )
+    assert model.calls == 4
+
+
+@pytest.mark.unit
+async def test_sampled_requests_are_coalesced_only_when_opted_in(model):
+    await model.abatch([_conversation(), _conversation()], temperature=0.7)
+    assert model.calls == 2
+    model.coalesce_sampled = True
+    await model.abatch([_conversation(), _conversation()], temperature=0.7)
+    assert model.calls == 3
+    model.coalesce = False
+    await model.abatch([_conversation(), _conversation()])
+    assert model.calls == 5
+
+
+@pytest.mark.unit
+def test_concurrent_embedding_calls_share_one_request():
+    embedding = SlowEmbedding(coalesce=True)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(embedding.infer_vector, [["abc"]] * 4))
+    assert embedding.calls == 1
+    assert all(result[0].value == [3.0] for result in results)
+    assert results[0][0] is not results[1][0]
+
+
+@pytest.mark.unit
+async def test_requests_are_not_coalesced_by_default():
+    model = SlowEchoModel(name="echo", allowed_models=["echo"])
+    await model.abatch([_conversation(), _conversation()])
+    assert model.calls == 2
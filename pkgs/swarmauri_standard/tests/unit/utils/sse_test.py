@@ -0,0 +1,154 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from swarmauri_standard.utils.sse import (
+    ChatCompletionStream,
+    SSEDecoder,
+    aiter_sse_data,
+    iter_sse_data,
+)
+
+DELAY = 0.2
+
+
+def _event(payload) -> bytes:
+    return f"data: {json.dumps(payload)}\n\n".encode()
+
+
+class _TrickleHandler(BaseHTTPRequestHandler):
+    """Streams three deltas and a usage chunk, pausing after the first."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        parts = [
+            _event({"choices": [{"delta": {"role": "assistant"}}]}),
+            _event({"choices": [{"delta": {"content": "Hel"}}]}),
+            b": keep-alive\n\n",
+            _event({"choices": [{"delta": {"content": "lo"}}]}),
+            _event({"choices": [{"delta": {"content": "!"}}]}),
+            _event({"choices": [], "usage": {"total_tokens": 3}}),
+            b"data: [DONE]\n\n",
+        ]
+        for i, part in enumerate(parts):
+            self.wfile.write(part)
+            self.wfile.flush()
+            if i == 1:
+                time.sleep(DELAY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TrickleHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/chat/completions"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.unit
+def test_decoder_joins_lines_split_across_chunks():
+    decoder = SSEDecoder()
+    assert decoder.feed("da") == []
+    assert decoder.feed('ta: {"a"') == []
+    assert decoder.feed(": 1}\n") == []
+    assert decoder.feed("\n") == ['{"a": 1}']
+
+
+@pytest.mark.unit
+def test_decoder_line_endings_and_multiline_data():
+    decoder = SSEDecoder()
+    events = decoder.feed("data: a\r\ndata: b\r\n\r\ndata: c\r")
+    assert events == ["a\nb"]
+    # The trailing "\r" is held back until it is known not to be "\r\n".
+    assert decoder.feed("\n\r\n") == ["c"]
+    assert decoder.feed("data: d\r\rdata: e\n\n") == ["d", "e"]
+
+
+@pytest.mark.unit
+def test_decoder_ignores_comments_and_other_fields():
+    decoder = SSEDecoder()
+    assert decoder.feed(": ping\nevent: message\nid: 1\ndata:x\n\n") == ["x"]
+
+
+@pytest.mark.unit
+def test_decoder_stops_at_done():
+    decoder = SSEDecoder()
+    assert decoder.feed("data: 1\n\ndata: [DONE]\n\ndata: 2\n\n") == ["1"]
+    assert decoder.done
+    assert decoder.feed("data: 3\n\n") == []
+
+
+@pytest.mark.unit
+def test_flush_completes_unterminated_event():
+    assert list(iter_sse_data(["data: 1\n\n", "data: 2"])) == ["1", "2"]
+
+
+@pytest.mark.unit
+async def test_aiter_sse_data():
+    async def chunks():
+        for chunk in ["data: 1\n", "\ndata: 2\n\n", "data: [DONE]\n\n"]:
+            yield chunk
+
+    assert [event async for event in aiter_sse_data(chunks())] == ["1", "2"]
+
+
+@pytest.mark.unit
+def test_stream_yields_first_delta_before_the_stream_ends(url):
+    reader = ChatCompletionStream()
+    arrivals = []
+    start = time.perf_counter()
+    with httpx.Client() as client:
+        for delta in reader.stream(client, url, json={}):
+            arrivals.append((delta, time.perf_counter() - start))
+
+    assert [delta for delta, _ in arrivals] == ["Hel", "lo", "!"]
+    assert arrivals[0][1] < DELAY <= arrivals[1][1]
+    assert reader.content == "Hello!"
+    assert reader.time_to_first_token < DELAY
+    assert reader.completion_time >= DELAY * 0.9
+    assert reader.usage_data() == {
+        "total_tokens": 3,
+        "time_to_first_token": reader.time_to_first_token,
+    }
+
+
+@pytest.mark.unit
+async def test_astream_yields_first_delta_before_the_stream_ends(url):
+    reader = ChatCompletionStream()
+    arrivals = []
+    start = time.perf_counter()
+    async with httpx.AsyncClient() as client:
+        async for delta in reader.astream(client, url, json={}):
+            arrivals.append((delta, time.perf_counter() - start))
+
+    assert [delta for delta, _ in arrivals] == ["Hel", "lo", "!"]
+    assert arrivals[0][1] < DELAY <= arrivals[1][1]
+    assert reader.content == "Hello!"
+    assert reader.time_to_first_token < DELAY
+    assert reader.usage["total_tokens"] == 3
+
+
+@pytest.mark.unit
+def test_usage_data_is_empty_without_usage():
+    reader = ChatCompletionStream()
+    for delta in ("H", "i"):
+        reader._handle(json.dumps({"choices": [{"delta": {"content": delta}}]}))
+    reader._finish()
+    assert reader.usage_data() == {}
+    assert reader.content == "Hi"
+    assert reader.time_to_first_token is not None
@@ -1,6 +1,7 @@
 import pytest
 from swarmauri_standard.documents.Document import Document
 from swarmauri_standard.vector_stores.TfidfVectorStore import TfidfVectorStore
+from swarmauri_standard.vectors.Vector import Vector
 
 
 @pytest.mark.unit
@@ -34,3 +35,133 @@ def test_top_k():
 
     vs.add_documents(documents)
     assert len(vs.retrieve(query="test", top_k=2)) == 2
+
+
+def _refit_ranking(documents, query, top_k):
+    from swarmauri_standard.distances.CosineDistance import CosineDistance
+    from swarmauri_standard.embeddings.TfidfEmbedding import TfidfEmbedding
+
+    matrix = TfidfEmbedding().fit_transform([query] + [d.content for d in documents])
+    distances = CosineDistance().distances(matrix[0], matrix[1:])
+    order = sorted(range(len(distances)), key=lambda i: distances[i])
+    return [documents[i].id for i in order[:top_k]]
+
+
+@pytest.mark.unit
+def test_retrieve_matches_refit_ranking():
+    vs = TfidfVectorStore()
+    documents = [
+        Document(content="the quick brown fox"),
+        Document(content="the lazy dog sleeps"),
+        Document(content="quick quick fox jumps"),
+        Document(content="a brown dog and a fox"),
+        Document(content=""),
+        Document(content="unrelated words only"),
+    ]
+    vs.add_documents(documents)
+
+    for query in ["quick fox", "dog", "the", "missing", "", "brown dog fox"]:
+        expected = _refit_ranking(vs.get_all_documents(), query, 4)
+        assert [d.id for d in vs.retrieve(query, top_k=4)] == expected
+
+
+@pytest.mark.unit
+def test_index_updates_incrementally():
+    vs = TfidfVectorStore()
+    fox = Document(content="quick brown fox")
+    dog = Document(content="lazy dog")
+    vs.add_document(fox)
+    vs.add_document(dog)
+
+    vs.update_document(dog.id, Document(id=dog.id, content="quick fox"))
+    assert vs.get_document(dog.id).content == "quick fox"
+    expected = _refit_ranking(vs.get_all_documents(), "fox", 2)
+    assert [d.id for d in vs.retrieve("fox", top_k=2)] == expected
+
+    vs.delete_document(fox.id)
+    assert [d.id for d in vs.retrieve("brown", top_k=2)] == [dog.id]
+
+    vs.clear_documents()
+    assert vs.retrieve("fox") == []
+
+
+def _saved_documents():
+    return [
+        Document(content="cats purr", metadata={"lang": "en"}),
+        Document(content="chats ronronnent é", embedding=Vector(value=[0.5, 2.0])),
+        Document(content=""),
+    ]
+
+
+@pytest.mark.unit
+def test_save_and_load_store(tmp_path):
+    from swarmauri_base.vector_stores.MappedDocuments import MappedDocuments
+
+    vs = TfidfVectorStore()
+    vs.add_documents(_saved_documents())
+    vs.save_store(str(tmp_path))
+
+    loaded = TfidfVectorStore()
+    loaded.load_store(str(tmp_path))
+    assert isinstance(loaded.documents, MappedDocuments)
+    assert [(d.id, d.content, d.metadata) for d in loaded.documents] == [
+        (d.id, d.content, d.metadata) for d in vs.documents
+    ]
+    assert loaded.documents[0].embedding is None
+    assert loaded.documents[1].embedding.value == [0.5, 2.0]
+    assert [d.id for d in loaded.retrieve("cats", top_k=1)] == [vs.documents[0].id]
+
+    loaded.add_document(Document(content="cats again"))
+    assert len(loaded.retrieve("cats", top_k=5)) == 4
+
+
+@pytest.mark.unit
+def test_save_and_load_parts(tmp_path):
+    vs = TfidfVectorStore()
+    vs.add_documents(_saved_documents())
+    vs.save_parts(str(tmp_path), chunk_size=16)
+    assert not (tmp_path / "content.bin").exists()
+    assert (tmp_path / "parts" / "content.bin.part001").exists()
+
+    loaded = TfidfVectorStore()
+    loaded.load_parts(str(tmp_path))
+    assert [d.content for d in loaded.documents] == [d.content for d in vs.documents]
+
+
+@pytest.mark.unit
+def test_save_store_to_the_directory_it_was_loaded_from(tmp_path):
+    vs = TfidfVectorStore()
+    documents = _saved_documents()
+    documents[0].embedding = Vector(value=[1.0, 1.0])
+    documents[1].embedding = Vector(value=[2.0, 3.0])
+    vs.add_documents(documents)
+    vs.save_store(str(tmp_path))
+
+    loaded = TfidfVectorStore()
+    loaded.load_store(str(tmp_path))
+    loaded.save_store(str(tmp_path))
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith(".")]
+
+    reloaded = TfidfVectorStore()
+    reloaded.load_store(str(tmp_path))
+    assert [d.embedding.value for d in reloaded.documents[:2]] == [
+        [1.0, 1.0],
+        [2.0, 3.0],
+    ]
+    assert [d.content for d in reloaded.documents] == [d.content for d in documents]
+
+
+@pytest.mark.unit
+def test_save_parts_replaces_earlier_parts(tmp_path):
+    vs = TfidfVectorStore()
+    vs.add_documents([Document(content="d" * 40)])
+    vs.save_parts(str(tmp_path), chunk_size=16)
+
+    vs = TfidfVectorStore()
+    vs.add_documents([Document(content="x")])
+    vs.save_parts(str(tmp_path), chunk_size=16)
+    assert not (tmp_path / "parts" / "content.bin.part001").exists()
+
+    loaded = TfidfVectorStore()
+    loaded.load_parts(str(tmp_path))
+    assert [d.content for d in loaded.documents] == ["x"]
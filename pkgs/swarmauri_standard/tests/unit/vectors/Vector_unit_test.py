@@ -30,3 +30,48 @@ def test_value():
 def test_shape():
     vector = Vector(value=[1, 2])
     assert vector.shape == (2,)
+
+
+@pytest.mark.unit
+def test_to_numpy_is_cached_read_only_view():
+    vector = Vector(value=[1, 2, 3])
+    array = vector.to_numpy()
+    assert array.tolist() == [1.0, 2.0, 3.0]
+    assert vector.to_numpy() is array
+    assert not array.flags.writeable
+
+    vector.value = [4, 5]
+    assert vector.to_numpy().tolist() == [4.0, 5.0]
+
+
+@pytest.mark.unit
+def test_from_numpy():
+    import numpy as np
+
+    array = np.array([0.5, 1.5, 2.5], dtype=np.float32)
+    vector = Vector.from_numpy(array)
+    assert vector.value == [0.5, 1.5, 2.5]
+    assert vector.shape == (3,)
+    assert not np.shares_memory(vector.to_numpy(), array)
+    assert vector.to_numpy().dtype == np.float32
+
+    restored = Vector.model_validate_json(vector.model_dump_json())
+    assert restored.value == vector.value
+    assert restored == Vector.from_numpy(array, id=vector.id)
+
+    array[0] = 9.0
+    assert vector.to_numpy().tolist() == vector.value == [0.5, 1.5, 2.5]
+
+    with pytest.raises(ValueError):
+        Vector.from_numpy(np.zeros((2, 2)))
+
+
+@pytest.mark.unit
+def test_value_is_held_once_in_the_buffer():
+    vector = Vector(value=[1, 2, 3])
+    assert "value" not in vector.__dict__
+    assert vector.value == [1.0, 2.0, 3.0]
+    assert "value" not in vector.__dict__
+    assert vector.model_dump()["value"] == [1.0, 2.0, 3.0]
+    assert "value" not in vector.model_dump(exclude={"value"})
+    assert len(vector) == 3